@@ -0,0 +1,31 @@
+"""Helpers shared by the benchmark scripts (CPU pinning, traced memory peaks)."""
+
+from __future__ import annotations
+
+import os
+import tracemalloc
+from itertools import repeat
+
+
+def pin_cpu() -> None:
+    """Keep the benchmark on one CPU (Linux) so runs don't migrate mid-loop."""
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {min(os.sched_getaffinity(0))})
+
+
+def peak_traced_kb(fn, *args, n: int) -> float:
+    """
+    Peak traced memory (KiB) during n calls of fn(*args).
+
+    tracemalloc hooks every allocation and slows the calls several-fold, but the
+    peak does not grow with n once each call's temporaries are freed, so the
+    scripts run far fewer memory iterations than timing iterations.
+    """
+    tracemalloc.start()
+    if hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+    for _ in repeat(None, n):
+        fn(*args)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024.0
@@ -12,9 +12,14 @@ Or from this directory:
 
 from __future__ import annotations
 
+import gc
 import os
 import sys
 import time
+from functools import partial
+from itertools import repeat
+
+from _common import pin_cpu
 
 # Ensure both packages are importable: cycrypto from this repo, picocrypto from sibling.
 _REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -47,17 +52,25 @@ ED25519_MSG = b"bench message for ed25519"
 
 
 def _time_it(name: str, fn, *args, n: int = 200, **kwargs):
+    call = partial(fn, *args, **kwargs)
     # Warmup
-    for _ in range(10):
-        fn(*args, **kwargs)
-    start = time.perf_counter()
-    for _ in range(n):
-        fn(*args, **kwargs)
-    elapsed = time.perf_counter() - start
-    return elapsed / n
+    for _ in repeat(None, 10):
+        call()
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        for _ in repeat(None, n):
+            call()
+        elapsed_ns = time.perf_counter_ns() - start
+    finally:
+        if was_enabled:
+            gc.enable()
+    return elapsed_ns / (n * 1e9)
 
 
 def main() -> None:
+    pin_cpu()
     n = 100  # iterations for fast ops
     n_slow = 10  # iterations for sign_recoverable (slow in pure Python)
     print("Benchmark: cycrypto (Cython) vs picocrypto (pure Python)")
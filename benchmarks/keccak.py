@@ -13,10 +13,13 @@ Or after pip install -e .:
 
 from __future__ import annotations
 
+import gc
 import os
 import sys
 import time
-import tracemalloc
+from itertools import repeat
+
+from _common import peak_traced_kb, pin_cpu
 
 # Prefer repo src on path so we use local code
 _root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -37,7 +40,7 @@ SAMPLES = [
 ]
 
 N_TIME = 5000
-N_MEM = 2000  # iterations for memory run
+N_MEM = 200  # iterations for memory run
 
 
 # Fewer iterations for larger payloads so run stays quick
@@ -51,34 +54,30 @@ def _n_time(data_len: int) -> int:
 
 def _n_mem(data_len: int) -> int:
     if data_len <= 256:
-        return 2000
+        return 200
     if data_len <= 1024:
-        return 500
-    return max(100, 2000 // (1 + data_len // 1024))
+        return 50
+    return max(10, 200 // (1 + data_len // 1024))
 
 
 def _time_per_call(fn, data: bytes, n: int = N_TIME, warmup: int = 50) -> float:
-    for _ in range(warmup):
-        fn(data)
-    start = time.perf_counter()
-    for _ in range(n):
-        fn(data)
-    return (time.perf_counter() - start) / n
-
-
-def _peak_memory_kb(fn, data: bytes, n: int = N_MEM) -> float:
-    """Peak traced memory (KiB) during n calls. Resets peak before run if available."""
-    tracemalloc.start()
-    if hasattr(tracemalloc, "reset_peak"):
-        tracemalloc.reset_peak()
-    for _ in range(n):
+    for _ in repeat(None, warmup):
         fn(data)
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    return peak / 1024.0
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        for _ in repeat(None, n):
+            fn(data)
+        elapsed_ns = time.perf_counter_ns() - start
+    finally:
+        if was_enabled:
+            gc.enable()
+    return elapsed_ns / (n * 1e9)
 
 
 def main() -> None:
+    pin_cpu()
     print("Benchmark: Keccak-256  pure Python vs Cython")
     print("  (keccak.keccak256 vs keccak_cy.keccak256)")
     print()
@@ -119,8 +118,8 @@ def main() -> None:
     mem_results: list[tuple[str, float, float, float]] = []
     for data, label in SAMPLES:
         n = _n_mem(len(data))
-        mem_py = _peak_memory_kb(keccak256_py, data, n=n)
-        mem_cy = _peak_memory_kb(keccak256_cy, data, n=n)
+        mem_py = peak_traced_kb(keccak256_py, data, n=n)
+        mem_cy = peak_traced_kb(keccak256_cy, data, n=n)
         ratio = mem_py / mem_cy if mem_cy > 0 else 0
         mem_results.append((label, mem_py, mem_cy, ratio))
         print(f"  {label:<10} {n:<8} {mem_py:<14.2f} {mem_cy:<14.2f} {ratio:.2f}x")
@@ -23,7 +23,9 @@ import gc
 import os
 import sys
 import time
-import tracemalloc
+from itertools import repeat
+
+from _common import peak_traced_kb, pin_cpu
 
 _root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 _src = os.path.join(_root, "src")
@@ -66,7 +68,7 @@ SAMPLES: list[tuple[object, str]] = [
 ]
 
 N_TIME = 2000
-N_MEM = 500
+N_MEM = 100
 WARMUP_DEFAULT = 200
 TIMING_RUNS_DEFAULT = 5
 
@@ -84,7 +86,7 @@ def _time_per_call_median(
     Runs warmup, then `runs` timing loops of `n` iterations each; median of per-run
     mean time is used to reduce impact of outliers (GC, scheduling).
     """
-    for _ in range(warmup):
+    for _ in repeat(None, warmup):
         fn(payload)
     run_times: list[float] = []
     was_enabled = gc.isenabled()
@@ -92,11 +94,11 @@ def _time_per_call_median(
         gc.disable()
     try:
         for _ in range(runs):
-            start = time.perf_counter()
-            for _ in range(n):
+            start = time.perf_counter_ns()
+            for _ in repeat(None, n):
                 fn(payload)
-            elapsed = time.perf_counter() - start
-            run_times.append(elapsed / n)
+            elapsed_ns = time.perf_counter_ns() - start
+            run_times.append(elapsed_ns / (n * 1e9))
     finally:
         if disable_gc and was_enabled:
             gc.enable()
@@ -108,17 +110,6 @@ def _time_per_call_median(
     return median, std
 
 
-def _peak_memory_kb(fn: object, payload: object, n: int) -> float:
-    tracemalloc.start()
-    if hasattr(tracemalloc, "reset_peak"):
-        tracemalloc.reset_peak()
-    for _ in range(n):
-        fn(payload)
-    _current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    return peak / 1024.0
-
-
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Benchmark msgpack_pack implementations"
@@ -161,6 +152,7 @@ def main() -> None:
         help="Show ± std in time table (spread across runs)",
     )
     args = parser.parse_args()
+    pin_cpu()
     n_time = max(1, args.iter)
     warmup = max(0, args.warmup)
     runs = max(1, args.runs)
@@ -249,7 +241,7 @@ def main() -> None:
         n = N_MEM
         row_mem = []
         for fn in fns:
-            row_mem.append(_peak_memory_kb(fn, payload, n))
+            row_mem.append(peak_traced_kb(fn, payload, n=n))
         mem_results.append(row_mem)
         mem_baseline = row_mem[0]
         row_str = f"  {sample_label:<16} {n:<6}"
@@ -271,7 +263,11 @@ def main() -> None:
             else 1.0
         )
         mem_ratio = (
-            sum(mem_results[r][0] / mem_results[r][idx] for r in range(n_payloads))
+            sum(
+                mem_results[r][0] / mem_results[r][idx]
+                for r in range(n_payloads)
+                if mem_results[r][idx] > 0
+            )
             / n_payloads
             if idx > 0
             else 1.0
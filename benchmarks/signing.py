@@ -13,10 +13,14 @@ Or after pip install -e .:
 
 from __future__ import annotations
 
+import gc
 import os
 import sys
 import time
-import tracemalloc
+from functools import partial
+from itertools import repeat
+
+from _common import peak_traced_kb, pin_cpu
 
 _root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 _src = os.path.join(_root, "src")
@@ -67,26 +71,24 @@ EIP712_FULL = {
 
 
 def _time_per_call(fn, *args, n: int = N_TIME, **kwargs) -> float:
-    for _ in range(20):
-        fn(*args, **kwargs)
-    start = time.perf_counter()
-    for _ in range(n):
-        fn(*args, **kwargs)
-    return (time.perf_counter() - start) / n
-
-
-def _peak_kb(fn, *args, n: int = N_MEM, **kwargs) -> float:
-    tracemalloc.start()
-    if hasattr(tracemalloc, "reset_peak"):
-        tracemalloc.reset_peak()
-    for _ in range(n):
-        fn(*args, **kwargs)
-    _, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    return peak / 1024.0
+    call = partial(fn, *args, **kwargs)
+    for _ in repeat(None, 20):
+        call()
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        for _ in repeat(None, n):
+            call()
+        elapsed_ns = time.perf_counter_ns() - start
+    finally:
+        if was_enabled:
+            gc.enable()
+    return elapsed_ns / (n * 1e9)
 
 
 def main() -> None:
+    pin_cpu()
     if not HAS_CY:
         print(
             "Cython signing not available (bip137 / eip712 extensions not built). Run: make build install"
@@ -161,15 +163,17 @@ def main() -> None:
 
     # Memory
     print("  --- Peak memory (KiB) ---")
-    m_py = _peak_kb(bip137_sign_py, PRIV, MSG, n=N_MEM)
-    m_cy = _peak_kb(bip137_sign_cy, PRIV, MSG, n=N_MEM)
+    m_py = peak_traced_kb(bip137_sign_py, PRIV, MSG, n=N_MEM)
+    m_cy = peak_traced_kb(bip137_sign_cy, PRIV, MSG, n=N_MEM)
+    ratio = m_py / m_cy if m_cy > 0 else 0
     print(
-        f"  bip137_sign_message   Python {m_py:.2f}  Cython {m_cy:.2f}  ratio {m_py/m_cy:.2f}x"
+        f"  bip137_sign_message   Python {m_py:.2f}  Cython {m_cy:.2f}  ratio {ratio:.2f}x"
     )
-    m_py = _peak_kb(eip712_full_py, EIP712_FULL, n=N_MEM)
-    m_cy = _peak_kb(eip712_full_cy, EIP712_FULL, n=N_MEM)
+    m_py = peak_traced_kb(eip712_full_py, EIP712_FULL, n=N_MEM)
+    m_cy = peak_traced_kb(eip712_full_cy, EIP712_FULL, n=N_MEM)
+    ratio = m_py / m_cy if m_cy > 0 else 0
     print(
-        f"  eip712_hash_full      Python {m_py:.2f}  Cython {m_cy:.2f}  ratio {m_py/m_cy:.2f}x"
+        f"  eip712_hash_full      Python {m_py:.2f}  Cython {m_cy:.2f}  ratio {ratio:.2f}x"
     )
 
 
@@ -1,49 +1,66 @@
+import os
+
 from picobuild import Extension, cythonize, find_packages, get_cython_build_dir, setup
 
+# -flto lets GCC inline the small field/permutation helpers across the Cython
+# module and its headers; -fno-plt / -fno-semantic-interposition drop PLT
+# indirection on calls into libcrypto and within the module.
+_COMPILE_ARGS = [
+    "-O3",
+    "-march=native",
+    "-flto",
+    "-fno-plt",
+    "-fno-semantic-interposition",
+    "-Wno-unused-function",
+    "-Wno-unused-variable",
+]
+_LINK_ARGS = ["-flto"]
+
+# Two-stage PGO (opt-in): build with PICOCRYPTO_PGO=generate, run the training
+# workload (python benchmarks/profile_curves.py --workload-only), then rebuild
+# from clean with PICOCRYPTO_PGO=use. Profiles go to PICOCRYPTO_PGO_DIR.
+_PGO = os.environ.get("PICOCRYPTO_PGO", "")
+_PGO_DIR = os.path.abspath(os.environ.get("PICOCRYPTO_PGO_DIR", "build/pgo"))
+if _PGO == "generate":
+    _COMPILE_ARGS.append(f"-fprofile-generate={_PGO_DIR}")
+    _LINK_ARGS.append(f"-fprofile-generate={_PGO_DIR}")
+elif _PGO == "use":
+    _COMPILE_ARGS += [f"-fprofile-use={_PGO_DIR}", "-fprofile-correction"]
+    _LINK_ARGS.append(f"-fprofile-use={_PGO_DIR}")
+elif _PGO:
+    raise ValueError(f"PICOCRYPTO_PGO must be 'generate' or 'use', not {_PGO!r}")
+
 cythonized_extensions = cythonize(
     [
         Extension(
             "picocrypto.curves.*",
             ["src/picocrypto/curves/*.pyx"],
-            extra_compile_args=[
-                "-O3",
-                "-march=native",
-                "-Wno-unused-function",
-                "-Wno-unused-variable",
-            ],
+            include_dirs=["src/picocrypto/curves"],
+            extra_compile_args=_COMPILE_ARGS,
+            extra_link_args=_LINK_ARGS,
             language="c",
         ),
         Extension(
             "picocrypto.hashes.*",
             ["src/picocrypto/hashes/*.pyx"],
-            extra_compile_args=[
-                "-O3",
-                "-march=native",
-                "-Wno-unused-function",
-                "-Wno-unused-variable",
-            ],
+            include_dirs=["src/picocrypto/hashes"],
+            extra_compile_args=_COMPILE_ARGS,
+            extra_link_args=_LINK_ARGS,
+            libraries=["crypto"],
             language="c",
         ),
         Extension(
             "picocrypto.serde.*",
             ["src/picocrypto/serde/*.pyx"],
-            extra_compile_args=[
-                "-O3",
-                "-march=native",
-                "-Wno-unused-function",
-                "-Wno-unused-variable",
-            ],
+            extra_compile_args=_COMPILE_ARGS,
+            extra_link_args=_LINK_ARGS,
             language="c",
         ),
         Extension(
             "picocrypto.signing.*",
             ["src/picocrypto/signing/*.pyx"],
-            extra_compile_args=[
-                "-O3",
-                "-march=native",
-                "-Wno-unused-function",
-                "-Wno-unused-variable",
-            ],
+            extra_compile_args=_COMPILE_ARGS,
+            extra_link_args=_LINK_ARGS,
             libraries=["crypto"],
             language="c",
         ),
@@ -4,15 +4,19 @@ Ethereum-style crypto: keccak256, secp256k1, EIP-712. Curves in Cython.
 
 from .__about__ import __version__
 from .curves import (
+    batch_privkey_to_pubkey,
+    ed25519_clear_cache,
     ed25519_public_key,
     ed25519_sign,
+    ed25519_sign_many,
     ed25519_verify,
     privkey_to_address,
     privkey_to_pubkey,
     recover_pubkey,
     sign_recoverable,
+    sign_recoverable_mv,
 )
-from .hashes import keccak256
+from .hashes import keccak256, keccak256_batch
 from .serde import msgpack_pack
 from .signing import (
     bip137_sign_message,
@@ -27,16 +31,21 @@ __all__: tuple[str, ...] = (
     "__version__",
     # Hashes
     "keccak256",
+    "keccak256_batch",
     # Serde
     "msgpack_pack",
     # Curves: secp256k1 (Ethereum / Bitcoin)
+    "batch_privkey_to_pubkey",
     "privkey_to_address",
     "privkey_to_pubkey",
     "recover_pubkey",
     "sign_recoverable",
+    "sign_recoverable_mv",
     # Curves: Ed25519 (Solana etc.)
+    "ed25519_clear_cache",
     "ed25519_public_key",
     "ed25519_sign",
+    "ed25519_sign_many",
     "ed25519_verify",
     # Signing: EIP-712 (Ethereum typed data)
     "eip712_hash_agent_message",
@@ -1,19 +1,31 @@
 """Elliptic-curve crypto: secp256k1 (Ethereum/Bitcoin), Ed25519 (Solana etc.)."""
 
-from .ed25519 import ed25519_public_key, ed25519_sign, ed25519_verify
+from .ed25519 import (
+    ed25519_clear_cache,
+    ed25519_public_key,
+    ed25519_sign,
+    ed25519_sign_many,
+    ed25519_verify,
+)
 from .secp256k1 import (
+    batch_privkey_to_pubkey,
     privkey_to_address,
     privkey_to_pubkey,
     recover_pubkey,
     sign_recoverable,
+    sign_recoverable_mv,
 )
 
 __all__: tuple[str, ...] = (
+    "batch_privkey_to_pubkey",
+    "ed25519_clear_cache",
     "ed25519_public_key",
     "ed25519_sign",
+    "ed25519_sign_many",
     "ed25519_verify",
     "privkey_to_address",
     "privkey_to_pubkey",
     "recover_pubkey",
     "sign_recoverable",
+    "sign_recoverable_mv",
 )
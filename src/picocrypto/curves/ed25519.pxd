@@ -2,4 +2,6 @@
 # Declarations for cycrypto.curves.ed25519
 cpdef bytes ed25519_public_key(bytes seed)
 cpdef bytes ed25519_sign(bytes message, bytes seed)
+cpdef list ed25519_sign_many(object messages, bytes seed)
 cpdef bint ed25519_verify(bytes message, bytes signature, bytes public_key)
+cpdef void ed25519_clear_cache()
@@ -1,4 +1,8 @@
 # Stubs for cycrypto.curves.ed25519 (Cython extension)
+from collections.abc import Iterable
+
 def ed25519_public_key(seed: bytes) -> bytes: ...
 def ed25519_sign(message: bytes, seed: bytes) -> bytes: ...
+def ed25519_sign_many(messages: Iterable[bytes], seed: bytes) -> list[bytes]: ...
 def ed25519_verify(message: bytes, signature: bytes, public_key: bytes) -> bool: ...
+def ed25519_clear_cache() -> None: ...
@@ -1,125 +1,389 @@
 """Ed25519 (RFC 8032): key generation, sign, verify."""
 
-import hashlib
-
-
-cdef object _P = 2**255 - 19
-cdef object _L = 2**252 + 27742317777372353535851937790883648493
-cdef object _D = (-121665 * pow(121666, _P - 2, _P)) % _P
-
-cdef inline object _modp_inv(object x):
-    return pow(x, _P - 2, _P)
-
-cdef object _sha512_modq(bytes data):
-    h = hashlib.sha512(data).digest()
-    return int.from_bytes(h, "little") % _L
-
-cdef object _recover_x(object y, int sign):
-    if y >= _P:
-        return None
-    x2 = (y * y - 1) * _modp_inv(_D * y * y + 1) % _P
-    if x2 == 0:
-        return 0 if sign == 0 else None
-    x = pow(x2, (_P + 3) // 8, _P)
-    if (x * x - x2) % _P != 0:
-        x = x * pow(2, (_P - 1) // 4, _P) % _P
-    if (x * x - x2) % _P != 0:
-        return None
-    if (x & 1) != sign:
-        x = (_P - x) % _P
-    return x
-
-cdef object _Gy = (4 * _modp_inv(5)) % _P
-cdef object _Gx = _recover_x(_Gy, 0)
-cdef tuple _G
-if _Gx is None:
-    raise RuntimeError("Ed25519 base point x recovery failed")
-_G = (_Gx, _Gy, 1, (_Gx * _Gy) % _P)
-
-cdef inline tuple _point_add(tuple P, tuple Q):
-    A = (P[1] - P[0]) * (Q[1] - Q[0]) % _P
-    B = (P[1] + P[0]) * (Q[1] + Q[0]) % _P
-    C = (2 * P[3] * Q[3] * _D) % _P
-    D = (2 * P[2] * Q[2]) % _P
-    E = (B - A) % _P
-    F = (D - C) % _P
-    G = (D + C) % _P
-    H = (B + A) % _P
-    return (E * F % _P, G * H % _P, F * G % _P, E * H % _P)
-
-cdef inline tuple _point_mul(object s, tuple P):
-    s = s % _L
-    Q = (0, 1, 1, 0)
-    while s > 0:
-        if s & 1:
-            Q = _point_add(Q, P)
-        P = _point_add(P, P)
-        s >>= 1
-    return Q
-
-cdef inline bint _point_equal(tuple P, tuple Q):
-    if (P[0] * Q[2] - Q[0] * P[2]) % _P != 0:
-        return False
-    if (P[1] * Q[2] - Q[1] * P[2]) % _P != 0:
-        return False
-    return True
-
-cdef inline bytes _point_compress(tuple P):
-    zinv = _modp_inv(P[2])
-    x = P[0] * zinv % _P
-    y = P[1] * zinv % _P
-    return (y | ((x & 1) << 255)).to_bytes(32, "little")
-
-cdef object _point_decompress(bytes s):
-    if len(s) != 32:
-        return None
-    y = int.from_bytes(s, "little")
-    sign = y >> 255
-    y = y & ((1 << 255) - 1)
-    x = _recover_x(y, sign)
-    if x is None:
-        return None
-    return (x, y, 1, (x * y) % _P)
+from cpython.bytes cimport (
+    PyBytes_AS_STRING,
+    PyBytes_FromStringAndSize,
+    PyBytes_GET_SIZE,
+)
+from cpython.mem cimport PyMem_Free, PyMem_Malloc
+from libc.string cimport memcmp, memcpy
+
+from ..hashes.sha512 cimport _sha512, _sha512_parts
+
+
+# Field and group arithmetic on 5x51-bit limbs live in ed25519_field.h.
+cdef extern from "ed25519_field.h" nogil:
+    ctypedef struct ed25519_fe:
+        pass
+    ctypedef struct ed25519_ge:
+        pass
+    ctypedef struct ed25519_ge_cached:
+        pass
+    ctypedef struct ed25519_ge_precomp:
+        pass
+    void ed25519_ge_identity(ed25519_ge* r)
+    void ed25519_ge_to_cached(ed25519_ge_cached* r, const ed25519_ge* p)
+    void ed25519_ge_to_precomp(ed25519_ge_precomp* r, const ed25519_ge* p)
+    void ed25519_ge_add(ed25519_ge* r, const ed25519_ge* p, const ed25519_ge_cached* q)
+    void ed25519_ge_madd(ed25519_ge* r, const ed25519_ge* p, const ed25519_ge_precomp* q)
+    void ed25519_ge_sub(ed25519_ge* r, const ed25519_ge* p, const ed25519_ge_cached* q)
+    void ed25519_ge_msub(ed25519_ge* r, const ed25519_ge* p, const ed25519_ge_precomp* q)
+    void ed25519_ge_neg(ed25519_ge* r, const ed25519_ge* p)
+    void ed25519_ge_dbl(ed25519_ge* r, const ed25519_ge* p)
+    void ed25519_select(ed25519_ge_precomp* t, const ed25519_ge_precomp* row, int b)
+    void ed25519_ge_tobytes(unsigned char* s, const ed25519_ge* p)
+    void ed25519_ge_tobytes_batch(unsigned char* s, const ed25519_ge* p, ed25519_fe* acc, size_t n)
+    int ed25519_ge_frombytes(ed25519_ge* r, const unsigned char* s)
+
+
+# Scalar reduction mod L (Barrett, 4x64-bit limbs) lives in ed25519_scalar.h.
+cdef extern from "ed25519_scalar.h" nogil:
+    void ed25519_sc_reduce64(unsigned char* out, const unsigned char* digest)
+    void ed25519_sc_muladd(
+        unsigned char* out, const unsigned char* a, const unsigned char* b, const unsigned char* c
+    )
+    int ed25519_sc_is_canonical(const unsigned char* s)
+
+cdef int _sha512_modq_into(
+    unsigned char* out,
+    const unsigned char* a,
+    size_t na,
+    const unsigned char* b,
+    size_t nb,
+    const unsigned char* m,
+    size_t nm,
+) noexcept nogil:
+    """out = SHA-512(a || b || m) mod L, 32 little-endian bytes; 0 if SHA-512 failed."""
+    cdef const unsigned char* parts[3]
+    cdef size_t n[3]
+    cdef unsigned char digest[64]
+    parts[0] = a
+    parts[1] = b
+    parts[2] = m
+    n[0] = na
+    n[1] = nb
+    n[2] = nm
+    if not _sha512_parts(parts, n, 3, digest):
+        return 0
+    ed25519_sc_reduce64(out, digest)
+    return 1
+
+# Basepoint table shared by key derivation and signing, a static const array in
+# ed25519_base_table.h: entry [i][j - 1] = j * 16**i * B, j = 1..8, i = 0..63.
+# Scalars are recoded into 64 signed base-16 digits in [-8, 8]; each digit costs
+# one constant-time row scan and one mixed addition, and there are no doublings.
+cdef extern from "ed25519_base_table.h" nogil:
+    const ed25519_ge_precomp ed25519_base_table[64][8]
+
+cdef void _scalarmult_base(ed25519_ge* r, const unsigned char* k) noexcept nogil:
+    """r = [k]B for a little-endian k < 2**255."""
+    cdef signed char e[64]
+    cdef int i, carry = 0
+    cdef ed25519_ge_precomp t
+    for i in range(32):
+        e[2 * i] = k[i] & 15
+        e[2 * i + 1] = k[i] >> 4
+    for i in range(63):
+        e[i] += carry
+        carry = (e[i] + 8) >> 4
+        e[i] -= carry << 4
+    e[63] += carry
+    ed25519_ge_identity(r)
+    for i in range(64):
+        ed25519_select(&t, ed25519_base_table[i], e[i])
+        ed25519_ge_madd(r, r, &t)
+
+# Odd multiples B, 3B, ..., 15B for the B half of verify's double-scalar multiply.
+cdef ed25519_ge_precomp _B_ODD[8]
+
+cdef void _build_b_odd() noexcept nogil:
+    cdef ed25519_ge b, b2, acc
+    cdef ed25519_ge_cached b2_c
+    cdef int i
+    ed25519_ge_identity(&b)
+    ed25519_ge_madd(&b, &b, &ed25519_base_table[0][0])
+    ed25519_ge_dbl(&b2, &b)
+    ed25519_ge_to_cached(&b2_c, &b2)
+    acc = b
+    for i in range(8):
+        ed25519_ge_to_precomp(&_B_ODD[i], &acc)
+        ed25519_ge_add(&acc, &acc, &b2_c)
+
+_build_b_odd()
+
+cdef void _slide(signed char* r, const unsigned char* a) noexcept nogil:
+    """Sliding-window recoding of a 256-bit LE scalar into odd digits in [-15, 15]."""
+    cdef int i, b, k
+    for i in range(256):
+        r[i] = (a[i >> 3] >> (i & 7)) & 1
+    for i in range(256):
+        if not r[i]:
+            continue
+        b = 1
+        while b <= 6 and i + b < 256:
+            if r[i + b]:
+                if r[i] + (r[i + b] << b) <= 15:
+                    r[i] += r[i + b] << b
+                    r[i + b] = 0
+                elif r[i] - (r[i + b] << b) >= -15:
+                    r[i] -= r[i + b] << b
+                    for k in range(i + b, 256):
+                        if not r[k]:
+                            r[k] = 1
+                            break
+                        r[k] = 0
+                else:
+                    break
+            b += 1
+
+cdef void _double_scalarmult_vartime(
+    ed25519_ge* r, const unsigned char* a, const ed25519_ge* A, const unsigned char* b
+) noexcept nogil:
+    """r = [a]A + [b]B with one shared doubling chain (Straus); a, b are public."""
+    cdef signed char aslide[256]
+    cdef signed char bslide[256]
+    cdef ed25519_ge_cached Ai[8]
+    cdef ed25519_ge t, A2
+    cdef ed25519_ge_cached A2_c
+    cdef int i
+    _slide(aslide, a)
+    _slide(bslide, b)
+    ed25519_ge_dbl(&A2, A)
+    ed25519_ge_to_cached(&A2_c, &A2)
+    t = A[0]
+    ed25519_ge_to_cached(&Ai[0], &t)
+    for i in range(1, 8):
+        ed25519_ge_add(&t, &t, &A2_c)
+        ed25519_ge_to_cached(&Ai[i], &t)
+    ed25519_ge_identity(r)
+    i = 255
+    while i >= 0 and not aslide[i] and not bslide[i]:
+        i -= 1
+    while i >= 0:
+        ed25519_ge_dbl(r, r)
+        if aslide[i] > 0:
+            ed25519_ge_add(r, r, &Ai[aslide[i] >> 1])
+        elif aslide[i] < 0:
+            ed25519_ge_sub(r, r, &Ai[(-aslide[i]) >> 1])
+        if bslide[i] > 0:
+            ed25519_ge_madd(r, r, &_B_ODD[bslide[i] >> 1])
+        elif bslide[i] < 0:
+            ed25519_ge_msub(r, r, &_B_ODD[(-bslide[i]) >> 1])
+        i -= 1
+
+cdef bytes _point_mul_base_compressed(bytes k):
+    """Compressed [k]B for a 32-byte little-endian scalar k."""
+    cdef unsigned char out[32]
+    cdef ed25519_ge p
+    _scalarmult_base(&p, <const unsigned char*>PyBytes_AS_STRING(k))
+    ed25519_ge_tobytes(out, &p)
+    return PyBytes_FromStringAndSize(<char*>out, 32)
+
+# RFC 8032 base point B (y = 4/5, x even); guards against a corrupted table.
+if _point_mul_base_compressed(b"\x01" + bytes(31)) != bytes.fromhex(
+    "5866666666666666666666666666666666666666666666666666666666666666"
+):
+    raise RuntimeError("Ed25519 basepoint table does not match B")
 
 cdef tuple _secret_expand(bytes secret):
+    """(clamped scalar a, prefix), both 32 bytes little-endian, from SHA-512(secret)."""
     if len(secret) != 32:
         raise ValueError("Ed25519 secret must be 32 bytes")
-    h = hashlib.sha512(secret).digest()
-    a = int.from_bytes(h[:32], "little")
-    a = a & ((1 << 254) - 8)
-    a = a | (1 << 254)
-    return (a, h[32:64])
+    cdef unsigned char digest[64]
+    if not _sha512(<const unsigned char*>PyBytes_AS_STRING(secret), 32, digest):
+        raise RuntimeError("OpenSSL SHA-512 failed")
+    digest[0] &= 248
+    digest[31] &= 127
+    digest[31] |= 64
+    return (
+        PyBytes_FromStringAndSize(<char*>digest, 32),
+        PyBytes_FromStringAndSize(<char*>digest + 32, 32),
+    )
+
+cdef int _sign_finish(
+    unsigned char* sig,
+    const unsigned char* R_enc,
+    const unsigned char* A_enc,
+    const unsigned char* a,
+    const unsigned char* r,
+    const unsigned char* m,
+    size_t nm,
+) noexcept nogil:
+    """sig = R_enc || (r + H(R_enc || A_enc || m) * a mod L); 0 if SHA-512 failed."""
+    cdef unsigned char h[32]
+    if not _sha512_modq_into(h, R_enc, 32, A_enc, 32, m, nm):
+        return 0
+    memcpy(sig, R_enc, 32)
+    ed25519_sc_muladd(sig + 32, h, a, r)
+    return 1
+
+# Per-seed (a, prefix, A_enc): repeat signers skip the public-key scalar
+# multiplication. Insertion-ordered; the oldest seed is dropped past
+# _SEED_CACHE_MAX. Entries hold secret-derived values; see ed25519_clear_cache.
+cdef dict _seed_cache = {}
+cdef Py_ssize_t _SEED_CACHE_MAX = 256
+
+cdef void _cache_seed(bytes seed, tuple entry):
+    if len(_seed_cache) >= _SEED_CACHE_MAX:
+        _seed_cache.pop(next(iter(_seed_cache)), None)
+    _seed_cache[seed] = entry
+
+cdef tuple _expand_and_pub(bytes seed):
+    entry = _seed_cache.get(seed)
+    if entry is None:
+        a, prefix = _secret_expand(seed)
+        entry = (a, prefix, _point_mul_base_compressed(a))
+        _cache_seed(seed, entry)
+    return entry
+
+cpdef void ed25519_clear_cache():
+    """Drop every cached seed expansion (e.g. after rotating or wiping keys)."""
+    _seed_cache.clear()
 
 cpdef bytes ed25519_public_key(bytes seed):
-    a, _ = _secret_expand(seed)
-    return _point_compress(_point_mul(a, _G))
+    if seed is None:
+        raise TypeError("ed25519_public_key: seed must be bytes, not None")
+    return _expand_and_pub(seed)[2]
 
 cpdef bytes ed25519_sign(bytes message, bytes seed):
-    a, prefix = _secret_expand(seed)
-    A_enc = _point_compress(_point_mul(a, _G))
-    r = _sha512_modq(prefix + message)
-    R = _point_mul(r, _G)
-    R_enc = _point_compress(R)
-    h = _sha512_modq(R_enc + A_enc + message)
-    s = (r + h * a) % _L
-    return R_enc + s.to_bytes(32, "little")
+    """Ed25519 signature (64 bytes) of message under the 32-byte seed.
+
+    The seed's expansion (secret scalar, nonce prefix, public key) is cached
+    per seed, up to 256 seeds, so repeat signers skip the key derivation. The
+    cache holds secret-derived values; call ed25519_clear_cache() to drop it.
+    """
+    # cpdef arguments cannot be declared "not None"; the buffers below are read raw.
+    if message is None or seed is None:
+        raise TypeError("ed25519_sign: message and seed must be bytes, not None")
+    cdef ed25519_ge pts[2]
+    cdef ed25519_fe acc[2]
+    cdef unsigned char enc[64]
+    cdef unsigned char r[32]
+    cdef unsigned char sig[64]
+    cdef const unsigned char* m = <const unsigned char*>PyBytes_AS_STRING(message)
+    cdef size_t nm = PyBytes_GET_SIZE(message)
+    cdef bytes a, prefix, A_enc
+    entry = _seed_cache.get(seed)
+    if entry is not None:
+        a, prefix, A_enc = entry
+    else:
+        a, prefix = _secret_expand(seed)
+    if not _sha512_modq_into(r, <const unsigned char*>PyBytes_AS_STRING(prefix), 32, NULL, 0, m, nm):
+        raise RuntimeError("OpenSSL SHA-512 failed")
+    _scalarmult_base(&pts[1], r)
+    if entry is not None:
+        ed25519_ge_tobytes(enc + 32, &pts[1])
+    else:
+        # Cold seed: compress A and R together, sharing one field inversion.
+        _scalarmult_base(&pts[0], <const unsigned char*>PyBytes_AS_STRING(a))
+        ed25519_ge_tobytes_batch(enc, pts, acc, 2)
+        A_enc = PyBytes_FromStringAndSize(<char*>enc, 32)
+        _cache_seed(seed, (a, prefix, A_enc))
+    if not _sign_finish(
+        sig, enc + 32, <const unsigned char*>PyBytes_AS_STRING(A_enc),
+        <const unsigned char*>PyBytes_AS_STRING(a), r, m, nm,
+    ):
+        raise RuntimeError("OpenSSL SHA-512 failed")
+    return PyBytes_FromStringAndSize(<char*>sig, 64)
+
+cpdef list ed25519_sign_many(object messages, bytes seed):
+    """
+    Sign every message in messages under one seed; same result as
+    [ed25519_sign(m, seed) for m in messages].
+
+    Hashing, scalar multiplication and encoding run in one loop without the
+    GIL, and all R points are compressed with a single field inversion.
+    """
+    if seed is None:
+        raise TypeError("ed25519_sign_many: seed must be bytes, not None")
+    cdef tuple msgs = tuple(messages)
+    cdef Py_ssize_t n = len(msgs), i
+    cdef bytes a, prefix, A_enc
+    cdef const unsigned char* pa
+    cdef const unsigned char* pprefix
+    cdef const unsigned char* pA
+    cdef const unsigned char** ms = NULL
+    cdef size_t* ns = NULL
+    cdef ed25519_ge* pts = NULL
+    cdef ed25519_fe* acc = NULL
+    cdef unsigned char* rs = NULL
+    cdef unsigned char* Rs = NULL
+    cdef unsigned char* sigs = NULL
+    cdef int ok = 1
+    for m in msgs:
+        if type(m) is not bytes:
+            raise TypeError(f"ed25519_sign_many: messages must be bytes, not {type(m).__name__}")
+    a, prefix, A_enc = _expand_and_pub(seed)
+    if n == 0:
+        return []
+    pa = <const unsigned char*>PyBytes_AS_STRING(a)
+    pprefix = <const unsigned char*>PyBytes_AS_STRING(prefix)
+    pA = <const unsigned char*>PyBytes_AS_STRING(A_enc)
+    try:
+        ms = <const unsigned char**>PyMem_Malloc(n * sizeof(const unsigned char*))
+        ns = <size_t*>PyMem_Malloc(n * sizeof(size_t))
+        pts = <ed25519_ge*>PyMem_Malloc(n * sizeof(ed25519_ge))
+        acc = <ed25519_fe*>PyMem_Malloc(n * sizeof(ed25519_fe))
+        rs = <unsigned char*>PyMem_Malloc(n * 32)
+        Rs = <unsigned char*>PyMem_Malloc(n * 32)
+        sigs = <unsigned char*>PyMem_Malloc(n * 64)
+        if not (ms and ns and pts and acc and rs and Rs and sigs):
+            raise MemoryError()
+        for i in range(n):
+            ms[i] = <const unsigned char*>PyBytes_AS_STRING(msgs[i])
+            ns[i] = PyBytes_GET_SIZE(msgs[i])
+        with nogil:
+            for i in range(n):
+                if not _sha512_modq_into(rs + 32 * i, pprefix, 32, NULL, 0, ms[i], ns[i]):
+                    ok = 0
+                    break
+                _scalarmult_base(&pts[i], rs + 32 * i)
+            if ok:
+                ed25519_ge_tobytes_batch(Rs, pts, acc, n)
+                for i in range(n):
+                    if not _sign_finish(
+                        sigs + 64 * i, Rs + 32 * i, pA, pa, rs + 32 * i, ms[i], ns[i]
+                    ):
+                        ok = 0
+                        break
+        if not ok:
+            raise RuntimeError("OpenSSL SHA-512 failed")
+        return [PyBytes_FromStringAndSize(<char*>sigs + 64 * i, 64) for i in range(n)]
+    finally:
+        PyMem_Free(ms)
+        PyMem_Free(ns)
+        PyMem_Free(pts)
+        PyMem_Free(acc)
+        PyMem_Free(rs)
+        PyMem_Free(Rs)
+        PyMem_Free(sigs)
 
 cpdef bint ed25519_verify(bytes message, bytes signature, bytes public_key):
+    if message is None or signature is None or public_key is None:
+        raise TypeError(
+            "ed25519_verify: message, signature and public_key must be bytes, not None"
+        )
     if len(signature) != 64 or len(public_key) != 32:
         return False
-    A = _point_decompress(public_key)
-    if A is None:
-        return False
-    R_enc = signature[:32]
-    S_raw = signature[32:]
-    R = _point_decompress(R_enc)
-    if R is None:
+    cdef ed25519_ge A, check
+    cdef unsigned char h[32]
+    cdef unsigned char check_enc[32]
+    # R = sig[:32], S = sig[32:] and A are read in place: no slices or ints per call.
+    cdef const unsigned char* sig = <const unsigned char*>PyBytes_AS_STRING(signature)
+    cdef const unsigned char* pub = <const unsigned char*>PyBytes_AS_STRING(public_key)
+    if not ed25519_ge_frombytes(&A, pub):
         return False
-    s = int.from_bytes(S_raw, "little")
-    if s >= _L:
+    if not ed25519_sc_is_canonical(sig + 32):
         return False
-    h = _sha512_modq(R_enc + public_key + message)
-    sB = _point_mul(s, _G)
-    hA = _point_mul(h, A)
-    R_plus_hA = _point_add(R, hA)
-    return _point_equal(sB, R_plus_hA)
+    if not _sha512_modq_into(
+        h, sig, 32, pub, 32,
+        <const unsigned char*>PyBytes_AS_STRING(message), PyBytes_GET_SIZE(message),
+    ):
+        raise RuntimeError("OpenSSL SHA-512 failed")
+    # [S]B == R + [h]A, checked as encode([h](-A) + [S]B) == R in one doubling
+    # chain. Comparing encodings skips decompressing R (a square root) and
+    # rejects a non-canonical or off-curve R exactly as decoding it would.
+    ed25519_ge_neg(&A, &A)
+    _double_scalarmult_vartime(&check, h, &A, sig + 32)
+    ed25519_ge_tobytes(check_enc, &check)
+    return memcmp(check_enc, sig, 32) == 0
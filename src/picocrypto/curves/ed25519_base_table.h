@@ -0,0 +1,655 @@
+/*
+ * Ed25519 basepoint table: ed25519_base_table[i][j] = (j + 1) * 16^i * B for
+ * i = 0..63, j = 0..7, in affine precomp form (y + x, y - x, 2dxy), each
+ * coordinate as canonical 5x51-bit limbs. Generated once from RFC 8032's B
+ * with Python integers; ed25519.pyx checks [1]B against B at import.
+ */
+#ifndef PICOCRYPTO_ED25519_BASE_TABLE_H
+#define PICOCRYPTO_ED25519_BASE_TABLE_H
+
+#include "ed25519_field.h"
+
+static const ed25519_ge_precomp ed25519_base_table[64][8] = {
+    {
+        {{{0x493c6f58c3b85ULL, 0x0df7181c325f7ULL, 0x0f50b0b3e4cb7ULL, 0x5329385a44c32ULL, 0x07cf9d3a33d4bULL}}, {{0x03905d740913eULL, 0x0ba2817d673a2ULL, 0x23e2827f4e67cULL, 0x133d2e0c21a34ULL, 0x44fd2f9298f81ULL}}, {{0x11205877aaa68ULL, 0x479955893d579ULL, 0x50d66309b67a0ULL, 0x2d42d0dbee5eeULL, 0x6f117b689f0c6ULL}}},
+        {{{0x4e7fc933c71d7ULL, 0x2cf41feb6b244ULL, 0x7581c0a7d1a76ULL, 0x7172d534d32f0ULL, 0x590c063fa87d2ULL}}, {{0x1a56042b4d5a8ULL, 0x189cc159ed153ULL, 0x5b8deaa3cae04ULL, 0x2aaf04f11b5d8ULL, 0x6bb595a669c92ULL}}, {{0x2a8b3a59b7a5fULL, 0x3abb359ef087fULL, 0x4f5a8c4db05afULL, 0x5b9a807d04205ULL, 0x701af5b13ea50ULL}}},
+        {{{0x5b0a84cee9730ULL, 0x61d10c97155e4ULL, 0x4059cc8096a10ULL, 0x47a608da8014fULL, 0x7a164e1b9a80fULL}}, {{0x11fe8a4fcd265ULL, 0x7bcb8374faaccULL, 0x52f5af4ef4d4fULL, 0x5314098f98d10ULL, 0x2ab91587555bdULL}}, {{0x6933f0dd0d889ULL, 0x44386bb4c4295ULL, 0x3cb6d3162508cULL, 0x26368b872a2c6ULL, 0x5a2826af12b9bULL}}},
+        {{{0x351b98efc099fULL, 0x68fbfa4a7050eULL, 0x42a49959d971bULL, 0x393e51a469efdULL, 0x680e910321e58ULL}}, {{0x6050a056818bfULL, 0x62acc1f5532bfULL, 0x28141ccc9fa25ULL, 0x24d61f471e683ULL, 0x27933f4c7445aULL}}, {{0x3fbe9c476ff09ULL, 0x0af6b982e4b42ULL, 0x0ad1251ba78e5ULL, 0x715aeedee7c88ULL, 0x7f9d0cbf63553ULL}}},
+        {{{0x2bc4408a5bb33ULL, 0x078ebdda05442ULL, 0x2ffb112354123ULL, 0x375ee8df5862dULL, 0x2945ccf146e20ULL}}, {{0x182c3a447d6baULL, 0x22964e536eff2ULL, 0x192821f540053ULL, 0x2f9f19e788e5cULL, 0x154a7e73eb1b5ULL}}, {{0x3dbf1812a8285ULL, 0x0fa17ba3f9797ULL, 0x6f69cb49c3820ULL, 0x34d5a0db3858dULL, 0x43aabe696b3bbULL}}},
+        {{{0x4eeeb77157131ULL, 0x1201915f10741ULL, 0x1669cda6c9c56ULL, 0x45ec032db346dULL, 0x51e57bb6a2cc3ULL}}, {{0x006b67b7d8ca4ULL, 0x084fa44e72933ULL, 0x1154ee55d6f8aULL, 0x4425d842e7390ULL, 0x38b64c41ae417ULL}}, {{0x4326702ea4b71ULL, 0x06834376030b5ULL, 0x0ef0512f9c380ULL, 0x0f1a9f2512584ULL, 0x10b8e91a9f0d6ULL}}},
+        {{{0x25cd0944ea3bfULL, 0x75673b81a4d63ULL, 0x150b925d1c0d4ULL, 0x13f38d9294114ULL, 0x461bea69283c9ULL}}, {{0x72c9aaa3221b1ULL, 0x267774474f74dULL, 0x064b0e9b28085ULL, 0x3f04ef53b27c9ULL, 0x1d6edd5d2e531ULL}}, {{0x36dc801b8b3a2ULL, 0x0e0a7d4935e30ULL, 0x1deb7cecc0d7dULL, 0x053a94e20dd2cULL, 0x7a9fbb1c6a0f9ULL}}},
+        {{{0x7596604dd3e8fULL, 0x6fc510e058b36ULL, 0x3670c8db2cc0dULL, 0x297d899ce332fULL, 0x0915e76061bceULL}}, {{0x75dedf39234d9ULL, 0x01c36ab1f3c54ULL, 0x0f08fee58f5daULL, 0x0e19613a0d637ULL, 0x3a9024a1320e0ULL}}, {{0x1f5d9c9a2911aULL, 0x7117994fafcf8ULL, 0x2d8a8cae28dc5ULL, 0x74ab1b2090c87ULL, 0x26907c5c2ecc4ULL}}},
+    },
+    {
+        {{{0x504a52d9021f6ULL, 0x66eb8d7f38645ULL, 0x3482c26e7067cULL, 0x730ac3d1d21a1ULL, 0x143b1cf8aa64fULL}}, {{0x051ca553e2df3ULL, 0x174c90f166fd9ULL, 0x223479e9c4a13ULL, 0x441f35af20c99ULL, 0x4cf210ec5a9a8ULL}}, {{0x67c7d968acaabULL, 0x1c4e124e533f0ULL, 0x06025d57d5096ULL, 0x370e853e9a5f5ULL, 0x21b546a337412ULL}}},
+        {{{0x27a45d185218fULL, 0x708c09266a921ULL, 0x0c787da6854ddULL, 0x4b280307504e6ULL, 0x7e041577f86eeULL}}, {{0x7f858a2888343ULL, 0x2ca627da79529ULL, 0x6fcd3eb383b51ULL, 0x1b8faae1ee7daULL, 0x0a653ca5c9eabULL}}, {{0x2a496ce5b67f3ULL, 0x317aad2f2ccd6ULL, 0x164b343fd524bULL, 0x659281e7614a5ULL, 0x566943650813aULL}}},
+        {{{0x2f9eb1dabb69dULL, 0x6b5fd0a7f8aceULL, 0x65b59b6e9c2d4ULL, 0x13aa3d607ba93ULL, 0x32a5351794117ULL}}, {{0x0db0c26620798ULL, 0x32c0dc6a95703ULL, 0x2a3371d7570c7ULL, 0x16a04c17d2780ULL, 0x17e12bcd4653eULL}}, {{0x644a6df648437ULL, 0x33101f7fbba74ULL, 0x4e86a95c0ed95ULL, 0x23465c292a056ULL, 0x0900b3f78e4c6ULL}}},
+        {{{0x00fbec816ad31ULL, 0x37b1cddfc7da5ULL, 0x3188fd54b6565ULL, 0x49e07f38bb97bULL, 0x4314030b051e2ULL}}, {{0x51b9f679d651bULL, 0x42066685e4150ULL, 0x22cc28f84232dULL, 0x38a6b00fabff4ULL, 0x371f3acaed2ddULL}}, {{0x0005efbf0bcadULL, 0x5da30e18bdaacULL, 0x2139a823adc3cULL, 0x338100fc819e8ULL, 0x4c3a5ae1ce7b6ULL}}},
+        {{{0x075e4c93da0ddULL, 0x4ee372529b75fULL, 0x31b1182e4ca0aULL, 0x0c0c06b1fdbfaULL, 0x6de9c73dea66cULL}}, {{0x0a434dcb8fa95ULL, 0x7ad92d0816827ULL, 0x5efa0b21c33d9ULL, 0x2ad6f1c42ba14ULL, 0x7c814db27262aULL}}, {{0x104d5a04df8f2ULL, 0x15620285a68f1ULL, 0x5742663ebeeb9ULL, 0x0827b645631aaULL, 0x5aac4a412f90bULL}}},
+        {{{0x20d0abd7f5134ULL, 0x65c3a75c8cc07ULL, 0x662f58e022724ULL, 0x11aef92c89cc3ULL, 0x1c145cd274ba0ULL}}, {{0x7326b3ac92908ULL, 0x05ccc7c3c18c9ULL, 0x0692e0d5546caULL, 0x46123b59afaa5ULL, 0x1b9da3fe189f6ULL}}, {{0x0386475f3d743ULL, 0x5ed5cbb3de65dULL, 0x16da078d96e2eULL, 0x2f0c1291c5b1cULL, 0x234929c1167d6ULL}}},
+        {{{0x45cc21d099fcfULL, 0x259851afca902ULL, 0x091f80514d706ULL, 0x1f74073e0f2a4ULL, 0x4a5f28743b297ULL}}, {{0x5ecaba077ade8ULL, 0x5a33d6713b309ULL, 0x5535e50e0fddeULL, 0x53d63f635bf14ULL, 0x59c77b3aeb7c3ULL}}, {{0x5d725225ccf62ULL, 0x03642a58bba75ULL, 0x423e1f64468ceULL, 0x71dec59cfd6adULL, 0x6f05606b4799fULL}}},
+        {{{0x33149f91b6483ULL, 0x4ab4597ec4b68ULL, 0x4a09eceb6d771ULL, 0x46c43fd420931ULL, 0x60895e91ab49fULL}}, {{0x69e92177ba962ULL, 0x3a1bcb95c33ffULL, 0x60c411262bb9cULL, 0x5641ffa574a16ULL, 0x714de12e58533ULL}}, {{0x4f2ed0cf86c18ULL, 0x240e6bbfa9d3dULL, 0x2e5af9ed1b418ULL, 0x135de4ed04c02ULL, 0x73e2e62fd96dcULL}}},
+    },
+    {
+        {{{0x4dd0e632f9c1dULL, 0x2ced12622a5d9ULL, 0x18de9614742daULL, 0x79ca96fdbb5d4ULL, 0x6dd37d49a00eeULL}}, {{0x3635449aa515eULL, 0x3e178d0475dabULL, 0x50b4712a19712ULL, 0x2dcc2860ff4adULL, 0x30d76d6f03d31ULL}}, {{0x444172106e4c7ULL, 0x01251afed2d88ULL, 0x534fc9bed4f5aULL, 0x5d85a39cf5234ULL, 0x10c697112e864ULL}}},
+        {{{0x62aa08358c805ULL, 0x46f440848e194ULL, 0x447b771a8f52bULL, 0x377ba3269d31dULL, 0x03bf9baf55080ULL}}, {{0x3c4277dbe5fdeULL, 0x5a335afd44c92ULL, 0x0c1164099753eULL, 0x70487006fe423ULL, 0x25e61cabed66fULL}}, {{0x3e128cc586604ULL, 0x5968b2e8fc7e2ULL, 0x049a3d5bd61cfULL, 0x116505b1ef6e6ULL, 0x566d78634586eULL}}},
+        {{{0x54285c65a2fd0ULL, 0x55e62ccf87420ULL, 0x46bb961b19044ULL, 0x1153405712039ULL, 0x14fba5f34793bULL}}, {{0x7a49f9cc10834ULL, 0x2b513788a22c6ULL, 0x5ff4b6ef2395bULL, 0x2ec8e5af607bfULL, 0x33975bca5ecc3ULL}}, {{0x746166985f7d4ULL, 0x09939000ae79aULL, 0x5844c7964f97aULL, 0x13617e1f95b3dULL, 0x14829cea83fc5ULL}}},
+        {{{0x70b2f4e71ecb8ULL, 0x728148efc643cULL, 0x0753e03995b76ULL, 0x5bf5fb2ab6767ULL, 0x05fc3bc4535d7ULL}}, {{0x37b8497dd95c2ULL, 0x61549d6b4ffe8ULL, 0x217a22db1d138ULL, 0x0b9cf062eb09eULL, 0x2fd9c71e5f758ULL}}, {{0x0b3ae52afdeddULL, 0x19da76619e497ULL, 0x6fa0654d2558eULL, 0x78219d25e41d4ULL, 0x373767475c651ULL}}},
+        {{{0x095cb14246590ULL, 0x002d82aa6ac68ULL, 0x442f183bc4851ULL, 0x6464f1c0a0644ULL, 0x6bf5905730907ULL}}, {{0x299fd40d1add9ULL, 0x5f2de9a04e5f7ULL, 0x7c0eebacc1c59ULL, 0x4cca1b1f8290aULL, 0x1fbea56c3b18fULL}}, {{0x778f1e1415b8aULL, 0x6f75874efc1f4ULL, 0x28a694019027fULL, 0x52b37a96bdc4dULL, 0x02521cf67a635ULL}}},
+        {{{0x46720772f5ee4ULL, 0x632c0f359d622ULL, 0x2b2092ba3e252ULL, 0x662257c112680ULL, 0x001753d9f7cd6ULL}}, {{0x7ee0b0a9d5294ULL, 0x381fbeb4cca27ULL, 0x7841f3a3e639dULL, 0x676ea30c3445fULL, 0x3fa00a7e71382ULL}}, {{0x1232d963ddb34ULL, 0x35692e70b078dULL, 0x247ca14777a1fULL, 0x6db556be8fcd0ULL, 0x12b5fe2fa048eULL}}},
+        {{{0x37c26ad6f1e92ULL, 0x46a0971227be5ULL, 0x4722f0d2d9b4cULL, 0x3dc46204ee03aULL, 0x6f7e93c20796cULL}}, {{0x0fbc496fce34dULL, 0x575be6b7dae3eULL, 0x4a31585cee609ULL, 0x037e9023930ffULL, 0x749b76f96fb12ULL}}, {{0x2f604aea6ae05ULL, 0x637dc939323ebULL, 0x3fdad9b048d47ULL, 0x0a8b0d4045af7ULL, 0x0fcec10f01e02ULL}}},
+        {{{0x2d29dc4244e45ULL, 0x6927b1bc147beULL, 0x0308534ac0839ULL, 0x4853664033f41ULL, 0x413779166feabULL}}, {{0x558a649fe1e44ULL, 0x44635aeefcc89ULL, 0x1ff434887f2baULL, 0x0f981220e2d44ULL, 0x4901aa7183c51ULL}}, {{0x1b7548c1af8f0ULL, 0x7848c53368116ULL, 0x01b64e7383de9ULL, 0x109fbb0587c8fULL, 0x41bb887b726d1ULL}}},
+    },
+    {
+        {{{0x180e0aa39f7d2ULL, 0x04a58d6a392fbULL, 0x73556a8d740e1ULL, 0x1b13ea1fa4983ULL, 0x56bd36cfb78acULL}}, {{0x7806c567c49d8ULL, 0x1994f23cd524cULL, 0x730e52c19b413ULL, 0x669534fab22f1ULL, 0x5c95b686a0788ULL}}, {{0x519c10d14a954ULL, 0x69296bf520558ULL, 0x7e1e96babd1d2ULL, 0x04a7357c1c154ULL, 0x0dea6db1879beULL}}},
+        {{{0x2eb74d6a8797aULL, 0x63f5882e642b7ULL, 0x22c1715fbd573ULL, 0x67d94800fad1eULL, 0x0ad7cc8752eacULL}}, {{0x6bf547344e5abULL, 0x111e36861354cULL, 0x5592cbf684962ULL, 0x0eeaf43e959feULL, 0x5b2c78885483bULL}}, {{0x51362793408cfULL, 0x06332c7b28a42ULL, 0x0f6519bac3c5cULL, 0x63c5419d97d44ULL, 0x093a7fa775003ULL}}},
+        {{{0x1604460a91286ULL, 0x08eef1a7bd71dULL, 0x62978b5fcff60ULL, 0x29f33e80f18dfULL, 0x7b038a06c27b6ULL}}, {{0x07de63a16d7beULL, 0x3935e6659fca2ULL, 0x02d9dfe8ddfffULL, 0x201b86adf8c22ULL, 0x6a252b19a4a31ULL}}, {{0x119d5d36990f3ULL, 0x77b69d73e53dbULL, 0x2e644d5484ebaULL, 0x72b63847502a6ULL, 0x58ded57f72260ULL}}},
+        {{{0x553265b0fd48bULL, 0x63277f5311b4dULL, 0x755f8a2258208ULL, 0x0a1ebc5649930ULL, 0x79f2942d3a5c8ULL}}, {{0x79dade9413d77ULL, 0x2b2e53ccfaf1cULL, 0x5ea9f9bc95fe7ULL, 0x1ce2cedc88771ULL, 0x6aa11b5bbb9e0ULL}}, {{0x22f25b6c88de9ULL, 0x5559e402d32fbULL, 0x53ad390946e9fULL, 0x6d284da27c3f7ULL, 0x7d90ab1bbc6a7ULL}}},
+        {{{0x7a3f496b3c397ULL, 0x311e9c4a64340ULL, 0x5d46fc0473aa8ULL, 0x4503eca4c6ad3ULL, 0x19ed161f508ddULL}}, {{0x4a683a7016bfeULL, 0x1be58a16db359ULL, 0x390d6aa41417dULL, 0x7cb35b086afe6ULL, 0x19a10d446198fULL}}, {{0x22cd687dce6caULL, 0x090cc99e9aac1ULL, 0x200e8e1fcd5a3ULL, 0x1fe43a0f4a911ULL, 0x483bdab159565ULL}}},
+        {{{0x74d0ab4da80f6ULL, 0x0bf060ffc1ad9ULL, 0x1be76920920f9ULL, 0x3bd02802934d7ULL, 0x1c7052909cf78ULL}}, {{0x00f148734fa49ULL, 0x606c0a69c1f4fULL, 0x78c1ef441bc2dULL, 0x07f11083bb7f1ULL, 0x3286c109dde6aULL}}, {{0x67de2874e98d4ULL, 0x5372fc18c065dULL, 0x1828e28530d8bULL, 0x4202bc0ee6f35ULL, 0x217dd5eaaa7aaULL}}},
+        {{{0x71fb9be8c0ec8ULL, 0x71c614050517bULL, 0x5b13db002eb9fULL, 0x30524b1cc8ed6ULL, 0x07058a6e5df6fULL}}, {{0x7c4d0248e1eb0ULL, 0x429ae97ea53b6ULL, 0x1588d5381da5fULL, 0x4b28f354d8b9eULL, 0x7fa7c21f795a4ULL}}, {{0x302c4db31f67fULL, 0x122179f657d3dULL, 0x17376d3b497f6ULL, 0x5e72364098faeULL, 0x33b21c13a0cb9ULL}}},
+        {{{0x7b9b05ee38c5bULL, 0x1c0e34278f355ULL, 0x4cca42afe74b5ULL, 0x38bc7773736f4ULL, 0x1c3bab17ae109ULL}}, {{0x692f8087d8e31ULL, 0x6fa4e2c7ee6c0ULL, 0x7a9658fd37318ULL, 0x06c92d2731032ULL, 0x659bf72e5ac16ULL}}, {{0x2b216c7cab7b0ULL, 0x680f778798393ULL, 0x1296355f5974dULL, 0x4c8293a23a828ULL, 0x09f2606b131a2ULL}}},
+    },
+    {
+        {{{0x34c597c6691aeULL, 0x7a150b6990fc4ULL, 0x52beb9d922274ULL, 0x70eed7164861aULL, 0x0a871e070c6a9ULL}}, {{0x07d44744346beULL, 0x282b6a564a81dULL, 0x4ed80f875236bULL, 0x6fbbe1d450c50ULL, 0x4eb728c12fcdbULL}}, {{0x1b5994bbc8989ULL, 0x74b7ba84c0660ULL, 0x75678f1cdaeb8ULL, 0x23206b0d6f10cULL, 0x3ee7300f2685dULL}}},
+        {{{0x27947841e7518ULL, 0x32c7388dae87fULL, 0x414add3971be9ULL, 0x01850832f0ef1ULL, 0x7d47c6a2cfb89ULL}}, {{0x255e49e7dd6b7ULL, 0x38c2163d59ebaULL, 0x3861f2a005845ULL, 0x2e11e4ccbaec9ULL, 0x1381576297912ULL}}, {{0x2d0148ef0d6e0ULL, 0x3522a8de787fbULL, 0x2ee055e74f9d2ULL, 0x64038f6310813ULL, 0x148cf58d34c9eULL}}},
+        {{{0x72f7d9ae4756dULL, 0x7711e690ffc4aULL, 0x582a2355b0d16ULL, 0x0dccfe885b6b4ULL, 0x278febad4eaeaULL}}, {{0x492f67934f027ULL, 0x7ded0815528d4ULL, 0x58461511a6612ULL, 0x5ea2e50de1544ULL, 0x3ff2fa1ebd5dbULL}}, {{0x2681f8c933966ULL, 0x3840521931635ULL, 0x674f14a308652ULL, 0x3bd9c88a94890ULL, 0x4104dd02fe9c6ULL}}},
+        {{{0x14e06db096ab8ULL, 0x1219c89e6b024ULL, 0x278abd486a2dbULL, 0x240b292609520ULL, 0x0165b5a48efcaULL}}, {{0x2bf5e1124422aULL, 0x673146756ae56ULL, 0x14ad99a87e830ULL, 0x1eaca65b080fdULL, 0x2c863b00afaf5ULL}}, {{0x0a474a0846a76ULL, 0x099a5ef981e32ULL, 0x2a8ae3c4bbfe6ULL, 0x45c34af14832cULL, 0x591b67d9bffecULL}}},
+        {{{0x1b3719f18b55dULL, 0x754318c83d337ULL, 0x27c17b7919797ULL, 0x145b084089b61ULL, 0x489b4f8670301ULL}}, {{0x70d1c80b49bfaULL, 0x3d57e7d914625ULL, 0x3c0722165e545ULL, 0x5e5b93819e04fULL, 0x3de02ec7ca8f7ULL}}, {{0x2102d3aeb92efULL, 0x68c22d50c3a46ULL, 0x42ea89385894eULL, 0x75f9ebf55f38cULL, 0x49f5fbba496cbULL}}},
+        {{{0x5628c1e9c572eULL, 0x598b108e822abULL, 0x55d8fae29361aULL, 0x0adc8d1a97b28ULL, 0x06a1a6c288675ULL}}, {{0x49a108a5bcfd4ULL, 0x6178c8e7d6612ULL, 0x1f03473710375ULL, 0x73a49614a6098ULL, 0x5604a86dcbfa6ULL}}, {{0x0d1d47c1764b6ULL, 0x01c08316a2e51ULL, 0x2b3db45c95045ULL, 0x1634f818d300cULL, 0x20989e89fe274ULL}}},
+        {{{0x4278b85eaec2eULL, 0x0ef59657be2ceULL, 0x72fd169588770ULL, 0x2e9b205260b30ULL, 0x730b9950f7059ULL}}, {{0x777fd3a2dcc7fULL, 0x594a9fb124932ULL, 0x01f8e80ca15f0ULL, 0x714d13cec3269ULL, 0x0403ed1d0ca67ULL}}, {{0x32d35874ec552ULL, 0x1f3048df1b929ULL, 0x300d73b179b23ULL, 0x6e67be5a37d0bULL, 0x5bd7454308303ULL}}},
+        {{{0x4932115e7792aULL, 0x457b9bbb930b8ULL, 0x68f5d8b193226ULL, 0x4164e8f1ed456ULL, 0x5bb7db123067fULL}}, {{0x2d19528b24cc2ULL, 0x4ac66b8302ff3ULL, 0x701c8d9fdad51ULL, 0x6c1b35c5b3727ULL, 0x133a78007380aULL}}, {{0x1f467c6ca62beULL, 0x2c4232a5dc12cULL, 0x7551dc013b087ULL, 0x0690c11b03bcdULL, 0x740dca6d58f0eULL}}},
+    },
+    {
+        {{{0x6c72aed261ae5ULL, 0x3311c201ee720ULL, 0x4d8065e6ada3fULL, 0x6a3faf482cd79ULL, 0x0e53dc78bf2b6ULL}}, {{0x70bf5d3f0af0bULL, 0x15c65ce3eea16ULL, 0x56ef4d13fabd2ULL, 0x0f6b0742769d2ULL, 0x00ed489b3f50dULL}}, {{0x029bf7971877aULL, 0x46da2fcc63721ULL, 0x09da24d791111ULL, 0x57aa682e2970cULL, 0x27632d9a5a4a4ULL}}},
+        {{{0x285d187eaffdbULL, 0x77b1a150c9530ULL, 0x0998fde96d3eeULL, 0x1415b2c793f81ULL, 0x3bbc2b22d99ceULL}}, {{0x7f05154b260ceULL, 0x1ce5f2a4e1a23ULL, 0x1f304e361b70eULL, 0x666b00fe68693ULL, 0x2b67916429e90ULL}}, {{0x7c952583c0a58ULL, 0x701fc98de7722ULL, 0x37cf03194ffe6ULL, 0x3074d86d3ebdeULL, 0x43a0eeb6ab54dULL}}},
+        {{{0x6322357875fe8ULL, 0x59ebf7971e758ULL, 0x0aed8836753d3ULL, 0x7ee46f742499cULL, 0x50c5eaa14c799ULL}}, {{0x166a46d4a5487ULL, 0x155857677472dULL, 0x0a2c9afe04686ULL, 0x5c93372342dabULL, 0x70a477029d929ULL}}, {{0x6dc8bd6f2fb3cULL, 0x4f398f6f41ba1ULL, 0x2367c695318eaULL, 0x3fdd705819596ULL, 0x6f9ce10760296ULL}}},
+        {{{0x693063520e0b5ULL, 0x7911d407fc272ULL, 0x72566f10dff3dULL, 0x76cfbea6205e9ULL, 0x699154d1f893dULL}}, {{0x054b1cde1c22aULL, 0x0491d665bf5a2ULL, 0x33703ab12a3a4ULL, 0x31f2f9f3d99d6ULL, 0x72364713fc799ULL}}, {{0x55c75b4b27526ULL, 0x5a046db54a62bULL, 0x17fba3b332e10ULL, 0x5f6917864519aULL, 0x73975a617d39dULL}}},
+        {{{0x7f392f4433e46ULL, 0x423eacd630de6ULL, 0x74759883866e6ULL, 0x4a69107dbc50fULL, 0x362a4258a381cULL}}, {{0x24df96375da10ULL, 0x34306190e1c80ULL, 0x6336471e34c94ULL, 0x1c548158ca432ULL, 0x7e18b10b29b74ULL}}, {{0x1d9132b6beb2fULL, 0x5a5083048f20eULL, 0x7b249743c9ba6ULL, 0x16f755c8f64deULL, 0x4be65bc8f48afULL}}},
+        {{{0x0fba257c26234ULL, 0x75bd60cf163aaULL, 0x14e2bd5ef5208ULL, 0x39f61586e3753ULL, 0x5665eec6351daULL}}, {{0x07feba36e7028ULL, 0x003bb19c68f09ULL, 0x4c312257cfc4cULL, 0x515c9a7d896a5ULL, 0x056c244d397f0ULL}}, {{0x6e00943bfb210ULL, 0x0e41001585b67ULL, 0x6f6199d25c806ULL, 0x49c1355aeb0b9ULL, 0x20b209c2ab204ULL}}},
+        {{{0x4a94516bd3289ULL, 0x54828408503f9ULL, 0x2957589123596ULL, 0x66c2ce1dbd90bULL, 0x49992cc64e612ULL}}, {{0x6342ac07fb34bULL, 0x10426e7b26a93ULL, 0x347d59c0b6088ULL, 0x3c25e1316b856ULL, 0x7a92c9fdfbcacULL}}, {{0x51bea70f801deULL, 0x01fc93c514cb7ULL, 0x6cab9286fbedfULL, 0x504d4318366d8ULL, 0x3b7ac0cd265c2ULL}}},
+        {{{0x54e4f22ed39a7ULL, 0x3cac102a15e1aULL, 0x76ba1d68aaba4ULL, 0x4c97a10d974f6ULL, 0x31bc531d6b7deULL}}, {{0x3ee438c01bcecULL, 0x4b81f78e77045ULL, 0x654ffa54c32d4ULL, 0x7ada428c81a60ULL, 0x265cc261e09a0ULL}}, {{0x5134da980f971ULL, 0x224434454fbe7ULL, 0x6ab5b61e93ee3ULL, 0x12f1efbea101aULL, 0x2a14edcc6a1a1ULL}}},
+    },
+    {
+        {{{0x28c570478433cULL, 0x1d8502873a463ULL, 0x7641e7eded49cULL, 0x1ecedd54cf571ULL, 0x2c03f5256c2b0ULL}}, {{0x0ee0752cfce4eULL, 0x660dd8116fbe9ULL, 0x55167130fffebULL, 0x1c682b885955cULL, 0x161d25fa963eaULL}}, {{0x718757b53a47dULL, 0x619e18b0f2f21ULL, 0x5fbdfe4c1ec04ULL, 0x5d798c81ebb92ULL, 0x699468bdbd96bULL}}},
+        {{{0x53de66aa91948ULL, 0x045f81a599b1bULL, 0x3f7a8bd214193ULL, 0x71d4da412331aULL, 0x293e1c4e6c4a2ULL}}, {{0x72f46f4dafecfULL, 0x2948ffadef7a3ULL, 0x11ecdfdf3bc04ULL, 0x3c2e98ffeed25ULL, 0x525219a473905ULL}}, {{0x6134b925112e1ULL, 0x6bb942bb406edULL, 0x070c445c0dde2ULL, 0x411d822c4d7a3ULL, 0x5b605c447f032ULL}}},
+        {{{0x1fec6f0e7f04cULL, 0x3cebc692c477dULL, 0x077986a19a95eULL, 0x6eaaaa1778b0fULL, 0x2f12fef4cc5abULL}}, {{0x5805920c47c89ULL, 0x1924771f9972cULL, 0x38bbddf9fc040ULL, 0x1f7000092b281ULL, 0x24a76dcea8aebULL}}, {{0x522b2dfc0c740ULL, 0x7e8193480e148ULL, 0x33fd9a04341b9ULL, 0x3c863678a20bcULL, 0x5e607b2518a43ULL}}},
+        {{{0x4431ca596cf14ULL, 0x015da7c801405ULL, 0x03c9b6f8f10b5ULL, 0x0346922934017ULL, 0x201f33139e457ULL}}, {{0x31d8f6cdf1818ULL, 0x1f86c4b144b16ULL, 0x39875b8d73e9dULL, 0x2fbf0d9ffa7b3ULL, 0x5067acab6ccddULL}}, {{0x27f6b08039d51ULL, 0x4802f8000dfaaULL, 0x09692a062c525ULL, 0x1baea91075817ULL, 0x397cba8862460ULL}}},
+        {{{0x5c3fbc81379e7ULL, 0x41bbc255e2f02ULL, 0x6a3f756998650ULL, 0x1297fd4e07c42ULL, 0x771b4022c1e1cULL}}, {{0x13093f05959b2ULL, 0x1bd352f2ec618ULL, 0x075789b88ea86ULL, 0x61d1117ea48b9ULL, 0x2339d320766e6ULL}}, {{0x5d986513a2fa7ULL, 0x63f3a99e11b0fULL, 0x28a0ecfd6b26dULL, 0x53b6835e18d8fULL, 0x331a189219971ULL}}},
+        {{{0x12f3a9d7572afULL, 0x10d00e953c4caULL, 0x603df116f2f8aULL, 0x33dc276e0e088ULL, 0x1ac9619ff649aULL}}, {{0x66f45fb4f80c6ULL, 0x3cc38eeb9fea2ULL, 0x107647270db1fULL, 0x710f1ea740dc8ULL, 0x31167c6b83bdfULL}}, {{0x33842524b1068ULL, 0x77dd39d30fe45ULL, 0x189432141a0d0ULL, 0x088fe4eb8c225ULL, 0x612436341f08bULL}}},
+        {{{0x349e31a2d2638ULL, 0x0137a7fa6b16cULL, 0x681ae92777edcULL, 0x222bfc5f8dc51ULL, 0x1522aa3178d90ULL}}, {{0x541db874e898dULL, 0x62d80fb841b33ULL, 0x03e6ef027fa97ULL, 0x7a03c9e9633e8ULL, 0x46ebe2309e5efULL}}, {{0x02f5369614938ULL, 0x356e5ada20587ULL, 0x11bc89f6bf902ULL, 0x036746419c8dbULL, 0x45fe70f505243ULL}}},
+        {{{0x24920c8951491ULL, 0x107ec61944c5eULL, 0x72752e017c01fULL, 0x122b7dda2e97aULL, 0x16619f6db57a2ULL}}, {{0x075a6960c0b8cULL, 0x6dde1c5e41b49ULL, 0x42e3f516da341ULL, 0x16a03fda8e79eULL, 0x428d1623a0e39ULL}}, {{0x74a4401a308fdULL, 0x06ed4b9558109ULL, 0x746f1f6a08867ULL, 0x4636f5c6f2321ULL, 0x1d81592d60bd3ULL}}},
+    },
+    {
+        {{{0x2369a2f89c8a1ULL, 0x3af91bd01a749ULL, 0x3b680558c4de8ULL, 0x01fde5600453cULL, 0x2cb8b3a5b483bULL}}, {{0x3d7beec2a4c38ULL, 0x06159841dbb06ULL, 0x37dd604b2458aULL, 0x540f49d23d549ULL, 0x702d67a3333c4ULL}}, {{0x417cbcb1b90a1ULL, 0x54fe22f29c6dcULL, 0x16f181ccecf76ULL, 0x1069fa8840444ULL, 0x24141dc0e6a80ULL}}},
+        {{{0x25dccbd83157dULL, 0x2645990129232ULL, 0x6435b90f28481ULL, 0x33d9472bf8c1fULL, 0x1a4714cede2e7ULL}}, {{0x73c773fefee9dULL, 0x13839f313ab3eULL, 0x0b9517ecfc7beULL, 0x23e71aefda170ULL, 0x5766120b47a1bULL}}, {{0x0ba0fb8b6b7ffULL, 0x6ceea23f43b64ULL, 0x7c0b626dccb0eULL, 0x2f8d495a8e04cULL, 0x4f3875ad489caULL}}},
+        {{{0x513f6ee73eec0ULL, 0x5ad2221762f3dULL, 0x00e1832971949ULL, 0x4faf2449461c3ULL, 0x722a1446fd705ULL}}, {{0x4762f4932ab22ULL, 0x6e5e9878378ffULL, 0x2a257a1eb03b7ULL, 0x040afb5aad54dULL, 0x3680274dad0a0ULL}}, {{0x59fe9a8cf8819ULL, 0x2108eb5339a12ULL, 0x2c2731742a655ULL, 0x04ab7560b9990ULL, 0x628ecf04331b1ULL}}},
+        {{{0x1acf85c74ccf1ULL, 0x02104ca4a3368ULL, 0x6b6c51ed9ccc6ULL, 0x207cce4957688ULL, 0x7a47d70d34ecbULL}}, {{0x4b118a9d0ddbcULL, 0x6811690057317ULL, 0x29ac413b91278ULL, 0x0aec38449135cULL, 0x685f349a45c79ULL}}, {{0x0c4cbcc43a4f5ULL, 0x146cef7d52c14ULL, 0x7e3d7b5dd719bULL, 0x6e050bd50ba97ULL, 0x11ded9020e01fULL}}},
+        {{{0x795b03bea93b7ULL, 0x28662757a68e3ULL, 0x5f8fdec154b5fULL, 0x5f65ec9b87170ULL, 0x7b120f1db20e5ULL}}, {{0x67809caefe704ULL, 0x5bc61d18d9121ULL, 0x2bac7261ca0a5ULL, 0x18fa62e6951c9ULL, 0x194263d157715ULL}}, {{0x2fb3d86502d7aULL, 0x08a14d26a42faULL, 0x03b5d76d59361ULL, 0x3553ed4b16453ULL, 0x00d0f85b31873ULL}}},
+        {{{0x53c1efd7621c1ULL, 0x4e88ace3eb4ceULL, 0x6c8f045a702d2ULL, 0x3e6cb8fa93a02ULL, 0x387bc74851a8cULL}}, {{0x3142e777c84fdULL, 0x0e0b5180c52f1ULL, 0x7984b1fd00991ULL, 0x519d33d6a8df3ULL, 0x2f7b459698dd6ULL}}, {{0x14b4d4a52a9a8ULL, 0x25ed71065f031ULL, 0x06f58e2b764f8ULL, 0x3668c26c2a45bULL, 0x3f1c62dbd6c9fULL}}},
+        {{{0x53e40148f693dULL, 0x4329d734e47f5ULL, 0x13d38bc14995bULL, 0x0c597a6e5fe8cULL, 0x406f8db1c482eULL}}, {{0x71f0091910c1fULL, 0x417fe5c2585d1ULL, 0x249d0e2937d3fULL, 0x47d30632b0577ULL, 0x6338283facefcULL}}, {{0x30d2c7f191ee4ULL, 0x03787fece13ccULL, 0x3edcf113efe0cULL, 0x7d2bc3ec7273dULL, 0x50d83d5be8f58ULL}}},
+        {{{0x4cf90b4d3b66dULL, 0x4ac2e65cc1815ULL, 0x31ac2ea9c1677ULL, 0x372019e8fbc38ULL, 0x584161cd26d94ULL}}, {{0x03916c11a1897ULL, 0x5fca0da0110adULL, 0x192f404b5a693ULL, 0x3e31cd789bc7bULL, 0x6594213136151ULL}}, {{0x2b1a072d27ca2ULL, 0x33f7bd8e0977eULL, 0x18ae07afce4f1ULL, 0x2c4f4c6dde771ULL, 0x02eebd0b3029bULL}}},
+    },
+    {
+        {{{0x5b69f7b85c5e8ULL, 0x17a2d175650ecULL, 0x4cc3e6dbfc19eULL, 0x73e1d3873be0eULL, 0x3a5f6d51b0af8ULL}}, {{0x68756a60dac5fULL, 0x55d757b8aec26ULL, 0x3383df45f80bdULL, 0x6783f8c9f96a6ULL, 0x20234a7789ecdULL}}, {{0x20db67178b252ULL, 0x73aa3da2c0edaULL, 0x79045c01c70d3ULL, 0x1b37b15251059ULL, 0x7cd682353cffeULL}}},
+        {{{0x5cd6068acf4f3ULL, 0x3079afc7a74ccULL, 0x58097650b64b4ULL, 0x47fabac9c4e99ULL, 0x3ef0253b2b2cdULL}}, {{0x1a45bd887fab6ULL, 0x65748076dc17cULL, 0x5b98000aa11a8ULL, 0x4a1ecc9080974ULL, 0x2838c8863bdc0ULL}}, {{0x3b0cf4a465030ULL, 0x022b8aef57a2dULL, 0x2ad0677e925adULL, 0x4094167d7457aULL, 0x21dcb8a606a82ULL}}},
+        {{{0x500fabe7731baULL, 0x7cc53c3113351ULL, 0x7cf65fe080d81ULL, 0x3c5d966011ba1ULL, 0x5d840dbf6c6f6ULL}}, {{0x004468c9d9fc8ULL, 0x5da8554796b8cULL, 0x3b8be70950025ULL, 0x6d5892da6a609ULL, 0x0bc3d08194a31ULL}}, {{0x6380d309fe18bULL, 0x4d73c2cb8ee0dULL, 0x6b882adbac0b6ULL, 0x36eabdddd4cbeULL, 0x3a4276232ac19ULL}}},
+        {{{0x0c172db447ecbULL, 0x3f8c505b7a77fULL, 0x6a857f97f3f10ULL, 0x4fcc0567fe03aULL, 0x0770c9e824e1aULL}}, {{0x2432c8a7084faULL, 0x47bf73ca8a968ULL, 0x1639176262867ULL, 0x5e8df4f8010ceULL, 0x1ff177cea16deULL}}, {{0x1d99a45b5b5fdULL, 0x523674f2499ecULL, 0x0f8fa26182613ULL, 0x58f7398048c98ULL, 0x39f264fd41500ULL}}},
+        {{{0x34aabfe097be1ULL, 0x43bfc03253a33ULL, 0x29bc7fe91b7f3ULL, 0x0a761e4844a16ULL, 0x65c621272c35fULL}}, {{0x53417dbe7e29cULL, 0x54573827394f5ULL, 0x565eea6f650ddULL, 0x42050748dc749ULL, 0x1712d73468889ULL}}, {{0x389f8ce3193ddULL, 0x2d424b8177ce5ULL, 0x073fa0d3440cdULL, 0x139020cd49e97ULL, 0x22f9800ab19ceULL}}},
+        {{{0x29fdd9a6efdacULL, 0x7c694a9282840ULL, 0x6f7cdeee44b3aULL, 0x55a3207b25cc3ULL, 0x4171a4d38598cULL}}, {{0x2368a3e9ef8cbULL, 0x454aa08e2ac0bULL, 0x490923f8fa700ULL, 0x372aa9ea4582fULL, 0x13f416cd64762ULL}}, {{0x758aa99c94c8cULL, 0x5f6001700ff44ULL, 0x7694e488c01bdULL, 0x0d5fde948eed6ULL, 0x508214fa574bdULL}}},
+        {{{0x215bb53d003d6ULL, 0x1179e792ca8c3ULL, 0x1a0e96ac840a2ULL, 0x22393e2bb3ab6ULL, 0x3a7758a4c86cbULL}}, {{0x269153ed6fe4bULL, 0x72a23aef89840ULL, 0x052be5299699cULL, 0x3a5e5ef132316ULL, 0x22f960ec6fabaULL}}, {{0x111f693ae5076ULL, 0x3e3bfaa94ca90ULL, 0x445799476b887ULL, 0x24a0912464879ULL, 0x5d9fd15f8de7fULL}}},
+        {{{0x44d2aeed7521eULL, 0x50865d2c2a7e4ULL, 0x2705b5238ea40ULL, 0x46c70b25d3b97ULL, 0x3bc187fa47eb9ULL}}, {{0x408d36d63727fULL, 0x5faf8f6a66062ULL, 0x2bb892da8de6bULL, 0x769d4f0c7e2e6ULL, 0x332f35914f8fbULL}}, {{0x70115ea86c20cULL, 0x16d88da24ada8ULL, 0x1980622662adfULL, 0x501ebbc195a9dULL, 0x450d81ce906fbULL}}},
+    },
+    {
+        {{{0x64d66b2cae0b5ULL, 0x67d794caec464ULL, 0x3492b21f6ebb4ULL, 0x28801875f6b78ULL, 0x2a887f78f7635ULL}}, {{0x64d2ad8453902ULL, 0x1dd1b65a3bf15ULL, 0x74b0479c06016ULL, 0x53cd559ccafe3ULL, 0x53b16d2324cccULL}}, {{0x3b9e75c012d4fULL, 0x2395c3e5d4544ULL, 0x575c328325d19ULL, 0x1fa97db1939b3ULL, 0x0ba7250b86440ULL}}},
+        {{{0x3589386f86d9cULL, 0x6dc2750b49bacULL, 0x2a9f55d85a645ULL, 0x6fd972888caa7ULL, 0x32c21b57fb60bULL}}, {{0x518fd029c6421ULL, 0x4312531e05761ULL, 0x4943a5af0b450ULL, 0x0e4c1a3fc7345ULL, 0x7b9f2fe8032d7ULL}}, {{0x023cd319e0780ULL, 0x0312eeeb8bb0fULL, 0x02acfdfbf133fULL, 0x1b8a42a7d894dULL, 0x12c49d417238cULL}}},
+        {{{0x3a01783799542ULL, 0x1f55abdc7e136ULL, 0x5c0527d89b742ULL, 0x264dd005e7775ULL, 0x1421b246a0a44ULL}}, {{0x0b533ffe83769ULL, 0x3b1c3ad7a212aULL, 0x40b9440861870ULL, 0x55a78116c1c09ULL, 0x2509200c6391cULL}}, {{0x43a8e8c24a7c7ULL, 0x01b1e0bdea954ULL, 0x4fae7701307d5ULL, 0x671d6dd2f0605ULL, 0x2ab5504448a49ULL}}},
+        {{{0x7ac631c5d3afaULL, 0x63f3bf18d9b80ULL, 0x5cf8ac1618545ULL, 0x0aeb9503cec4eULL, 0x7301f4ceb4eaeULL}}, {{0x227266f0f5decULL, 0x02bdaa10485daULL, 0x1a350566093b9ULL, 0x11fc03df63e4aULL, 0x7093bae1b521eULL}}, {{0x1e759d6722c41ULL, 0x1ee57ee536c81ULL, 0x08795a699d387ULL, 0x591de0512759eULL, 0x390167d24ebacULL}}},
+        {{{0x3054ba2f2120bULL, 0x5d620b136faf7ULL, 0x703b6fb8ae73aULL, 0x5b49ff45d6479ULL, 0x4cbd40767112cULL}}, {{0x58e3bba353f1cULL, 0x1b7ed486c24feULL, 0x1589941311dd9ULL, 0x22ed7dde272b7ULL, 0x07db2ee6aae1aULL}}, {{0x03cc029c58176ULL, 0x04b962bac216cULL, 0x3c2b63566238eULL, 0x14395db0a09eeULL, 0x7b8eec6c74183ULL}}},
+        {{{0x6e570fc386b73ULL, 0x03b475198e65fULL, 0x25a0d676a2c05ULL, 0x42acbaffe8564ULL, 0x6ee809a1b132aULL}}, {{0x240782cd27cb0ULL, 0x47f7d2cf7bc99ULL, 0x3507a7b6be70cULL, 0x726d94de9a545ULL, 0x72810497626edULL}}, {{0x4bb31fcfd863aULL, 0x147c9c918b288ULL, 0x223e894bf8da4ULL, 0x4976e14e433e8ULL, 0x13bd1e38d1732ULL}}},
+        {{{0x7b5cf1dfac521ULL, 0x62deaa88a0447ULL, 0x645deb0c97094ULL, 0x25e8185cc6bb2ULL, 0x1ed018b64f88aULL}}, {{0x34cd8696149b5ULL, 0x2f03b1556fa65ULL, 0x048ae539564dfULL, 0x4d805e59093d7ULL, 0x41e86fcfb1409ULL}}, {{0x0dfa1b802a6b0ULL, 0x0e855a77aa6c6ULL, 0x3169352203e1dULL, 0x2ec857c86b677ULL, 0x746a247a37cdcULL}}},
+        {{{0x4d85278d941edULL, 0x07a45ef086dd9ULL, 0x6ff36dc8952baULL, 0x271629168173dULL, 0x681e3351bff0eULL}}, {{0x1b8bd2b7b9af6ULL, 0x6a6ff8b6a3aa6ULL, 0x64d51b5401424ULL, 0x7a49197e792e2ULL, 0x20a365142bb40ULL}}, {{0x4b59d83034f45ULL, 0x643f441df716cULL, 0x1954390be2dc7ULL, 0x395b4924a4addULL, 0x539ef98e45d54ULL}}},
+    },
+    {
+        {{{0x4d8961cae743fULL, 0x6bdc38c7dba0eULL, 0x7d3b4a7e1b463ULL, 0x0844bdee2adf3ULL, 0x4cbad279663abULL}}, {{0x3b6a1a6205275ULL, 0x2e82791d06dcfULL, 0x23d72caa93c87ULL, 0x5f0b7ab68aaf4ULL, 0x2de25d4ba6345ULL}}, {{0x19024a0d71fcdULL, 0x15f65115f101aULL, 0x4e99067149708ULL, 0x119d8d1cba5afULL, 0x7d7fbcefe2007ULL}}},
+        {{{0x45dc5f3c29094ULL, 0x3455220b579afULL, 0x070c1631e068aULL, 0x26bc0630e9b21ULL, 0x4f9cd196dcd8dULL}}, {{0x71e6a266b2801ULL, 0x09aae73e2df5dULL, 0x40dd8b219b1a3ULL, 0x546fb4517de0dULL, 0x5975435e87b75ULL}}, {{0x297d86a7b3768ULL, 0x4835a2f4c6332ULL, 0x070305f434160ULL, 0x183dd014e56aeULL, 0x7ccdd084387a0ULL}}},
+        {{{0x484186760cc93ULL, 0x7435665533361ULL, 0x02f686336b801ULL, 0x5225446f64331ULL, 0x3593ca848190cULL}}, {{0x6422c6d260417ULL, 0x212904817bb94ULL, 0x5a319deb854f5ULL, 0x7a9d4e060da7dULL, 0x428bd0ed61d0cULL}}, {{0x3189a5e849aa7ULL, 0x6acbb1f59b242ULL, 0x7f6ef4753630cULL, 0x1f346292a2da9ULL, 0x27398308da2d6ULL}}},
+        {{{0x10e4c0a702453ULL, 0x4daafa37bd734ULL, 0x49f6bdc3e8961ULL, 0x1feffdcecdae6ULL, 0x572c2945492c3ULL}}, {{0x38d28435ed413ULL, 0x4064f19992858ULL, 0x7680fbef543cdULL, 0x1aadd83d58d3cULL, 0x269597aebe8c3ULL}}, {{0x7c745d6cd30beULL, 0x27c7755df78efULL, 0x1776833937fa3ULL, 0x5405116441855ULL, 0x7f985498c05bcULL}}},
+        {{{0x615520fbf6363ULL, 0x0b9e9bf74da6aULL, 0x4fe8308201169ULL, 0x173f76127de43ULL, 0x30f2653cd69b1ULL}}, {{0x1ce889f0be117ULL, 0x36f6a94510709ULL, 0x7f248720016b4ULL, 0x1821ed1e1cf91ULL, 0x76c2ec470a31fULL}}, {{0x0c938aac10c85ULL, 0x41b64ed797141ULL, 0x1beb1c1185e6dULL, 0x1ed5490600f07ULL, 0x2f1273f159647ULL}}},
+        {{{0x08bd755a70bc0ULL, 0x49e3a885ce609ULL, 0x16585881b5ad6ULL, 0x3c27568d34f5eULL, 0x38ac1997edc5fULL}}, {{0x1fc7c8ae01e11ULL, 0x2094d5573e8e7ULL, 0x5ca3cbbf549d2ULL, 0x4f920ecc54143ULL, 0x5d9e572ad85b6ULL}}, {{0x6b517a751b13bULL, 0x0cfd370b180ccULL, 0x5377925d1f41aULL, 0x34e56566008a2ULL, 0x22dfcd9cbfe9eULL}}},
+        {{{0x459b4103be0a1ULL, 0x59a4b3f2d2addULL, 0x7d734c8bb8eebULL, 0x2393cbe594a09ULL, 0x0fe9877824cdeULL}}, {{0x3d2e0c30d0cd9ULL, 0x3f597686671bbULL, 0x0aa587eb63999ULL, 0x0e3c7b592c619ULL, 0x6b2916c05448cULL}}, {{0x334d10aba913bULL, 0x045cdb581cfdbULL, 0x5e3e0553a8f36ULL, 0x50bb3041effb2ULL, 0x4c303f307ff00ULL}}},
+        {{{0x403580dd94500ULL, 0x48df77d92653fULL, 0x38a9fe3b349eaULL, 0x0ea89850aafe1ULL, 0x416b151ab706aULL}}, {{0x23bd617b28c85ULL, 0x6e72ee77d5a61ULL, 0x1a972ff174ddeULL, 0x3e2636373c60fULL, 0x0d61b8f78b2abULL}}, {{0x0d7efe9c136b0ULL, 0x1ab1c89640ad5ULL, 0x55f82aef41f97ULL, 0x46957f317ed0dULL, 0x191a2af74277eULL}}},
+    },
+    {
+        {{{0x4b60b2fe09a14ULL, 0x5fb762e8fc13aULL, 0x2d7f5bb0e13c2ULL, 0x5852c717544bcULL, 0x519ef577b5e09ULL}}, {{0x0095bab6f4985ULL, 0x369f7f5e35aaaULL, 0x031d50013d335ULL, 0x1434ec7176895ULL, 0x2bc24e04b2212ULL}}, {{0x3d7d91124cca9ULL, 0x0b7114e11c30cULL, 0x5c0c7d5eb0205ULL, 0x57295e6b984c2ULL, 0x62337a6e8ab8fULL}}},
+        {{{0x3324e1b3a1273ULL, 0x63020aa681a35ULL, 0x63065b86251f3ULL, 0x7341daecab3d4ULL, 0x7fa00425802e1ULL}}, {{0x6f17f06ffca16ULL, 0x36d255c2d4979ULL, 0x53d0ac3781b87ULL, 0x16803a9b816b0ULL, 0x5f6041b45b921ULL}}, {{0x31574028c2705ULL, 0x53b61aebfcfaaULL, 0x632377600c5f5ULL, 0x4cc187fd67477ULL, 0x7e9de97bb6c3eULL}}},
+        {{{0x4be62a24d40ddULL, 0x2208a5a83fe00ULL, 0x29108d2e81966ULL, 0x377c0e22f70b1ULL, 0x4cb829d8a2226ULL}}, {{0x0967b9e6585a3ULL, 0x4131d317242abULL, 0x2ceb6b65f2673ULL, 0x67d08578a4db7ULL, 0x42181fe8f4d38ULL}}, {{0x4aa8407b86681ULL, 0x3d164cea763b7ULL, 0x0123a04207c00ULL, 0x1161e6be73542ULL, 0x78af11633f25fULL}}},
+        {{{0x1c00e7d65318cULL, 0x39a1d0dbce648ULL, 0x702309b9afb97ULL, 0x6e188c596e17dULL, 0x680d04a7fc603ULL}}, {{0x6ebd40b50babcULL, 0x4c504117dd082ULL, 0x7070db45421c8ULL, 0x6aed18a47d7dcULL, 0x0d07daacd32d7ULL}}, {{0x2414a695aa3ebULL, 0x180b4d1e43f38ULL, 0x64e58fb6a90b1ULL, 0x271be3611cc3fULL, 0x210e8cd30c395ULL}}},
+        {{{0x0f16137fe6c26ULL, 0x30adc809b056aULL, 0x1587daf840af3ULL, 0x648895878a0a6ULL, 0x51b17bc8d028eULL}}, {{0x201f210a71c06ULL, 0x5de77f6043588ULL, 0x4d8cbdda99782ULL, 0x3a15e2161ae1cULL, 0x56ea8db1865f0ULL}}, {{0x5fb4bcf535119ULL, 0x73be221141ffeULL, 0x0ee8c97d26275ULL, 0x3795efe7532cdULL, 0x18a11f1174d1aULL}}},
+        {{{0x63cdad27a5f2cULL, 0x7915420daff7aULL, 0x19290c3c03f12ULL, 0x742a9fdae0d47ULL, 0x04eaabe50c1a2ULL}}, {{0x375ab3f6bba29ULL, 0x31323c905c80eULL, 0x57e4ba67b0edbULL, 0x570cce4074172ULL, 0x307c13b6fb0c0ULL}}, {{0x51021cb8ab5e7ULL, 0x12b8a021d648eULL, 0x1584287f08d11ULL, 0x66aaf8f38bda7ULL, 0x44da5f18c2710ULL}}},
+        {{{0x6fe6b89d8eaccULL, 0x23c4624d4322aULL, 0x513ad3b9ade51ULL, 0x1d75eba31ec9cULL, 0x726373f676720ULL}}, {{0x4c55ff1b82eb5ULL, 0x5a82395ca4067ULL, 0x7eeb34ec56b8dULL, 0x30fdd205b0cc7ULL, 0x768edce1532e8ULL}}, {{0x5ca72eb7ef68aULL, 0x3ee1d5b647c60ULL, 0x3116da198b3ccULL, 0x65e8c78137edaULL, 0x513b5384b5d2eULL}}},
+        {{{0x702878af34cebULL, 0x13728dad5cbc4ULL, 0x2f6144a402c10ULL, 0x7c0b28975fbedULL, 0x61d9b76988258ULL}}, {{0x46280c729989eULL, 0x20a6d14bba8daULL, 0x5d96a252e4fefULL, 0x111b1ef9fc0e8ULL, 0x34cebd64b9a0aULL}}, {{0x5a71349b7d94bULL, 0x3047d7288d4d8ULL, 0x52120d28fcf45ULL, 0x097820b7de93bULL, 0x69d45e6f2c708ULL}}},
+    },
+    {
+        {{{0x62b434f460efbULL, 0x294c6c0fad3fcULL, 0x68368937b4c0fULL, 0x5c9f82910875bULL, 0x237e7dbe00545ULL}}, {{0x6f74bc53c1431ULL, 0x1c40e5dbbd9c2ULL, 0x6c8fb9cae5c97ULL, 0x4845c5ce1b7daULL, 0x7e2e0e450b5ccULL}}, {{0x575ed6701b430ULL, 0x4d3e17fa20026ULL, 0x791fc888c4253ULL, 0x2f1ba99078ac1ULL, 0x71afa699b1115ULL}}},
+        {{{0x23c1c473b50d6ULL, 0x3e7671de21d48ULL, 0x326fa5547a1e8ULL, 0x50e4dc25fafd9ULL, 0x00731fbc78f89ULL}}, {{0x66f9b3953b61dULL, 0x555f4283cccb9ULL, 0x7dd67fb1960e7ULL, 0x14707a1affed4ULL, 0x021142e9c2b1cULL}}, {{0x0c71848f81880ULL, 0x44bd9d8233c86ULL, 0x6e8578efe5830ULL, 0x4045b6d7041b5ULL, 0x4c4d6f3347e15ULL}}},
+        {{{0x4ddfc988f1970ULL, 0x4f6173ea365e1ULL, 0x645daf9ae4588ULL, 0x7d43763db623bULL, 0x38bf9500a88f9ULL}}, {{0x7eccfc17d1fc9ULL, 0x4ca280782831eULL, 0x7b8337db1d7d6ULL, 0x5116def3895fbULL, 0x193fddaaa7e47ULL}}, {{0x2c93c37e8876fULL, 0x3431a28c583faULL, 0x49049da8bd879ULL, 0x4b4a8407ac11cULL, 0x6a6fb99ebf0d4ULL}}},
+        {{{0x122b5b6e423c6ULL, 0x21e50dff1ddd6ULL, 0x73d76324e75c0ULL, 0x588485495418eULL, 0x136fda9f42c5eULL}}, {{0x6c1bb560855ebULL, 0x71f127e13ad48ULL, 0x5c6b304905aecULL, 0x3756b8e889bc7ULL, 0x75f76914a3189ULL}}, {{0x4dfb1a305bdd1ULL, 0x3b3ff05811f29ULL, 0x6ed62283cd92eULL, 0x65d1543ec52e1ULL, 0x022183510be8dULL}}},
+        {{{0x2710143307a7fULL, 0x3d88fb48bf3abULL, 0x249eb4ec18f7aULL, 0x136115dff295fULL, 0x1387c441fd404ULL}}, {{0x766385ead2d14ULL, 0x0194f8b06095eULL, 0x08478f6823b62ULL, 0x6018689d37308ULL, 0x6a071ce17b806ULL}}, {{0x3c3d187978af8ULL, 0x7afe1c88276baULL, 0x51df281c8ad68ULL, 0x64906bda4245dULL, 0x3171b26aaf1edULL}}},
+        {{{0x5b7d8b28a47d1ULL, 0x2c2ee149e34c1ULL, 0x776f5629afc53ULL, 0x1f4ea50fc49a9ULL, 0x6c514a6334424ULL}}, {{0x7319097564ca8ULL, 0x1844ebc233525ULL, 0x21d4543fdeee1ULL, 0x1ad27aaff1bd2ULL, 0x221fd4873cf08ULL}}, {{0x2204f3a156341ULL, 0x537414065a464ULL, 0x43c0c3bedcf83ULL, 0x5557e706ea620ULL, 0x48daa596fb924ULL}}},
+        {{{0x61d5dc84c9793ULL, 0x47de83040c29eULL, 0x189deb26507e7ULL, 0x4d4e6fadc479aULL, 0x58c837fa0e8a7ULL}}, {{0x28e665ca59cc7ULL, 0x165c715940dd9ULL, 0x0785f3aa11c95ULL, 0x57b98d7e38469ULL, 0x676dd6fccad84ULL}}, {{0x1688596fc9058ULL, 0x66f6ad403619fULL, 0x4d759a87772efULL, 0x7856e6173bea4ULL, 0x1c4f73f2c6a57ULL}}},
+        {{{0x6706efc7c3484ULL, 0x6987839ec366dULL, 0x0731f95cf7f26ULL, 0x3ae758ebce4bcULL, 0x70459adb7daf6ULL}}, {{0x24fbd305fa0bbULL, 0x40a98cc75a1cfULL, 0x78ce1220a7533ULL, 0x6217a10e1c197ULL, 0x795ac80d1bf64ULL}}, {{0x1db4991b42bb3ULL, 0x469605b994372ULL, 0x631e3715c9a58ULL, 0x7e9cfefcf728fULL, 0x5fe162848ce21ULL}}},
+    },
+    {
+        {{{0x429c795115389ULL, 0x0f0c5ee99c62bULL, 0x649d0cb5f8394ULL, 0x0f206253b10c2ULL, 0x72de6c984a25aULL}}, {{0x10aae4d077c41ULL, 0x61b6e8d347c4fULL, 0x2f45a8a2e4e09ULL, 0x5b9375b196e45ULL, 0x720814ecaa064ULL}}, {{0x2b553bf6aa310ULL, 0x5300dadc375d3ULL, 0x7fd44e4142942ULL, 0x0c5c95dba01d6ULL, 0x0394d27645be6ULL}}},
+        {{{0x16425b23545a4ULL, 0x7d31f7652dea7ULL, 0x5bf7618569e89ULL, 0x27755b6295e31ULL, 0x79d995a841933ULL}}, {{0x72251857eedf4ULL, 0x3bc33d278a9aaULL, 0x5e5c0d78dc93bULL, 0x3a1c538a10705ULL, 0x3b3c833687abeULL}}, {{0x28ea61195dd75ULL, 0x503bb3505f9b1ULL, 0x561e6da941362ULL, 0x5452a06e540d1ULL, 0x60dd16a379c86ULL}}},
+        {{{0x1d6f8153e47b8ULL, 0x282945ec186a0ULL, 0x576548edea59dULL, 0x5450897745b22ULL, 0x4e62a3c18112eULL}}, {{0x2c8487381e559ULL, 0x4daf0105966b4ULL, 0x69ed94d65bffaULL, 0x342e5cbb8f5edULL, 0x5a08b5019b4daULL}}, {{0x4ac04516ab786ULL, 0x42a52b647b91aULL, 0x408c305656bccULL, 0x0e66b76e91a6dULL, 0x0929efe8825b4ULL}}},
+        {{{0x172b7ad56651dULL, 0x747f57ae2f166ULL, 0x137db9005606dULL, 0x42796e4a6fb21ULL, 0x30376e5d2c292ULL}}, {{0x601d1cbd0f2d3ULL, 0x5ec26576febe0ULL, 0x6377a1dcdb904ULL, 0x29e41b0221911ULL, 0x1e3a5272f5c07ULL}}, {{0x18da78159a59cULL, 0x327e0e27e7a52ULL, 0x3359641af7073ULL, 0x0942b2fbd49a5ULL, 0x53daacec4cb4cULL}}},
+        {{{0x52bc3852cfdb0ULL, 0x2ab3adda17330ULL, 0x56b09ecb304baULL, 0x74cb87cf15fcdULL, 0x4f3b8c117959aULL}}, {{0x73bd79cc8a7d6ULL, 0x1e8fd35364994ULL, 0x3d7f8013529ceULL, 0x3a97a65f894a1ULL, 0x01a13ff9bdbf0ULL}}, {{0x6c9c82ff26412ULL, 0x123f6ccf50ab6ULL, 0x5de2fc86b12a3ULL, 0x1df6a93dfe7f5ULL, 0x303337da7012aULL}}},
+        {{{0x53ccbfad2fdd1ULL, 0x2e6f4c81512edULL, 0x4d32c972e220eULL, 0x69597f8060eb3ULL, 0x269ff4dc789c2ULL}}, {{0x422228c1c9d7cULL, 0x6e3536681f2aaULL, 0x16d235c07eb04ULL, 0x18dbf46c8bbc9ULL, 0x53f8ad5661b3eULL}}, {{0x03fbdc08d678dULL, 0x46fd5a562e180ULL, 0x3960bc53660beULL, 0x522603f35e6d9ULL, 0x296c7291df412ULL}}},
+        {{{0x23205dab8b59eULL, 0x41901244a1bf6ULL, 0x1c97461196baaULL, 0x3e8e899e08c4dULL, 0x2327370261f11ULL}}, {{0x3de2b33daf397ULL, 0x33934c4966f20ULL, 0x56cf86343fc18ULL, 0x3e0450e9295aaULL, 0x2b6d581c52e0bULL}}, {{0x543d3623e7986ULL, 0x0584f146a87a0ULL, 0x1865bd99e5053ULL, 0x55d5721f86639ULL, 0x7836c41f8245eULL}}},
+        {{{0x51e848011937cULL, 0x5cdde8345194cULL, 0x4fe354b1ac311ULL, 0x4fedb810dd3afULL, 0x119dff99ead7bULL}}, {{0x254db49e95a81ULL, 0x2011615ae7cf4ULL, 0x02bf01d464b57ULL, 0x79c269072d8e8ULL, 0x5d55f8012cf25ULL}}, {{0x2dfcbf4b31d4dULL, 0x682229112487dULL, 0x034ec5f1940fdULL, 0x5647f77346283ULL, 0x329293b3dd4a0ULL}}},
+    },
+    {
+        {{{0x1852d5d7cb208ULL, 0x60d0fbe5ce50fULL, 0x5a1e246e37b75ULL, 0x51aee05ffd590ULL, 0x2b44c043677daULL}}, {{0x1214fe194961aULL, 0x0e1ae39a9e9cbULL, 0x543c8b526f9f7ULL, 0x119498067e91dULL, 0x4789d446fc917ULL}}, {{0x487ab074eb78eULL, 0x1d33b5e8ce343ULL, 0x13e419feb1b46ULL, 0x2721f565de6a4ULL, 0x60c52eef2bb9aULL}}},
+        {{{0x3c5c27cae6d11ULL, 0x36a9491956e05ULL, 0x124bac9131da6ULL, 0x3b6f7de202b5dULL, 0x70d77248d9b66ULL}}, {{0x589bc3bfd8bf1ULL, 0x6f93e6aa3416bULL, 0x4c0a3d6c1ae48ULL, 0x55587260b586aULL, 0x10bc9c312ccfcULL}}, {{0x2e84b3ec2a05bULL, 0x69da2f03c1551ULL, 0x23a174661a67bULL, 0x209bca289f238ULL, 0x63755bd3a976fULL}}},
+        {{{0x7101897f1acb7ULL, 0x3d82cb77b07b8ULL, 0x684083d7769f5ULL, 0x52b28472dce07ULL, 0x2763751737c52ULL}}, {{0x7a03e2ad10853ULL, 0x213dcc6ad36abULL, 0x1a6e240d5bdd6ULL, 0x7c24ffcf8fedfULL, 0x0d8cc1c48bc16ULL}}, {{0x402d36eb419a9ULL, 0x7cef68c14a052ULL, 0x0f1255bc2d139ULL, 0x373e7d431186aULL, 0x70c2dd8a7ad16ULL}}},
+        {{{0x4967db8ed7e13ULL, 0x15aeed02f523aULL, 0x6149591d094bcULL, 0x672f204c17006ULL, 0x32b8613816a53ULL}}, {{0x194509f6fec0eULL, 0x528d8ca31acacULL, 0x7826d73b8b9faULL, 0x24acb99e0f9b3ULL, 0x2e0fac6363948ULL}}, {{0x7f7bee448cd64ULL, 0x4e10f10da0f3cULL, 0x3936cb9ab20e9ULL, 0x7a0fc4fea6cd0ULL, 0x4179215c735a4ULL}}},
+        {{{0x633b9286bcd34ULL, 0x6cab3badb9c95ULL, 0x74e387edfbdfaULL, 0x14313c58a0fd9ULL, 0x31fa85662241cULL}}, {{0x094e7d7dced2aULL, 0x068fa738e118eULL, 0x41b640a5fee2bULL, 0x6bb709df019d4ULL, 0x700344a30cd99ULL}}, {{0x26c422e3622f4ULL, 0x0f3066a05b5f0ULL, 0x4e2448f0480a6ULL, 0x244cde0dbf095ULL, 0x24bb2312a9952ULL}}},
+        {{{0x00c2af5f85c6bULL, 0x0609f4cf2883fULL, 0x6e86eb5a1ca13ULL, 0x68b44a2efccd1ULL, 0x0d1d2af9ffeb5ULL}}, {{0x0ed1732de67c3ULL, 0x308c369291635ULL, 0x33ef348f2d250ULL, 0x004475ea1a1bbULL, 0x0fee3e871e188ULL}}, {{0x28aa132621edfULL, 0x42b244caf353bULL, 0x66b064cc2e08aULL, 0x6bb20020cbdd3ULL, 0x16acd79718531ULL}}},
+        {{{0x1c6c57887b6adULL, 0x5abf21fd7592bULL, 0x50bd41253867aULL, 0x3800b71273151ULL, 0x164ed34b18161ULL}}, {{0x772af2d9b1d3dULL, 0x6d486448b4e5bULL, 0x2ce58dd8d18a8ULL, 0x1849f67503c8bULL, 0x123e0ef6b9302ULL}}, {{0x6d94c192fe69aULL, 0x5475222a2690fULL, 0x693789d86b8b3ULL, 0x1f5c3bdfb69dcULL, 0x78da0fc61073fULL}}},
+        {{{0x780f1680c3a94ULL, 0x2a35d3cfcd453ULL, 0x005e5cdc7ddf8ULL, 0x6ee888078ac24ULL, 0x054aa4b316b38ULL}}, {{0x15d28e52bc66aULL, 0x30e1e0351cb7eULL, 0x30a2f74b11f8cULL, 0x39d120cd7de03ULL, 0x2d25deeb256b1ULL}}, {{0x0468d19267cb8ULL, 0x38cdca9b5fbf9ULL, 0x1bbb05c2ca1e2ULL, 0x3b015758e9533ULL, 0x134610a6ab7daULL}}},
+    },
+    {
+        {{{0x430e0dc028c3cULL, 0x50a42f8ee3b22ULL, 0x26687e83ae556ULL, 0x21e2584f0f696ULL, 0x42881af2bd6a7ULL}}, {{0x55ec27c59b23fULL, 0x7c2a9a09e595eULL, 0x50507d266bbb4ULL, 0x05134220eb970ULL, 0x140345133932aULL}}, {{0x6c69aab5cad3dULL, 0x2699659f5af7fULL, 0x4df5a8b08fa33ULL, 0x50c342ee8a5fdULL, 0x0ad6d64415677ULL}}},
+        {{{0x4892847927e9fULL, 0x5e6e1550eef22ULL, 0x4489c0ccf6b5bULL, 0x2c90fc7927d08ULL, 0x5265ac2f2adf9ULL}}, {{0x2439e417becb5ULL, 0x19a21c04ccf03ULL, 0x24ab0912b164eULL, 0x119aed1c28883ULL, 0x11b065a2ade31ULL}}, {{0x7dd309afcb346ULL, 0x0851cc7ea880bULL, 0x596aabb65c8f5ULL, 0x404ca600ef82fULL, 0x43e4dc3ae14c0ULL}}},
+        {{{0x77ac3adc2c6a3ULL, 0x6dd2e2f929d4dULL, 0x117abd743a4a3ULL, 0x5df7169bcf56bULL, 0x46dd8785c51ffULL}}, {{0x2c7f1a938a517ULL, 0x56630165c3782ULL, 0x73495291cc0a2ULL, 0x4879fbc2b8f7dULL, 0x74e534426ff6fULL}}, {{0x001be375c8898ULL, 0x6bc7fb0690e13ULL, 0x48c1c512c1b6aULL, 0x6213ac4067693ULL, 0x2b09468fdd2f4ULL}}},
+        {{{0x7946582ffa02aULL, 0x23fd51ea92b72ULL, 0x5debe6f6825a9ULL, 0x73b5031a89bafULL, 0x1bcfde61201d1ULL}}, {{0x749eeb701cb96ULL, 0x296d46d3872f8ULL, 0x100b3660fd0e3ULL, 0x7bdb14b15c5cdULL, 0x6976c7509888dULL}}, {{0x25490246a59a2ULL, 0x3dd0ffbb20949ULL, 0x48dc7eb58faf7ULL, 0x76b6ca1be3386ULL, 0x69e87308d30f8ULL}}},
+        {{{0x0bf028bc80303ULL, 0x66f4319df61f0ULL, 0x4b35a8daab85aULL, 0x4d56ea3f523ebULL, 0x61943588f4ed3ULL}}, {{0x28bb15656beb0ULL, 0x749e9ab79486bULL, 0x52301d7e3eb26ULL, 0x3115cd93c620aULL, 0x3eb0ef76e892bULL}}, {{0x65c3e91039f85ULL, 0x7bede67553a4dULL, 0x019aa4f03a79dULL, 0x6eef44b462ab8ULL, 0x3c34d1881faaaULL}}},
+        {{{0x30b8f2fffe0d9ULL, 0x207da49f737abULL, 0x1a08711aa8950ULL, 0x1b51563ebde59ULL, 0x605b394b60dcaULL}}, {{0x52b5ea09f9ec0ULL, 0x5f6c4751207f3ULL, 0x3649b1076acedULL, 0x1b6d04dd1f539ULL, 0x374193513fd8bULL}}, {{0x056e45a9d1ed2ULL, 0x6cd92f534569dULL, 0x17bb9f7bfa121ULL, 0x647d88267b20fULL, 0x2f50b81c88a71ULL}}},
+        {{{0x52ca0a7da522aULL, 0x6c893604a056aULL, 0x2e67ee4c8c2ccULL, 0x511796262de52ULL, 0x7b2c674958074ULL}}, {{0x23c61fc6811bbULL, 0x10c423001e62eULL, 0x6655d4e72d141ULL, 0x7e6bb4499e9a3ULL, 0x3491a53502752ULL}}, {{0x165883ed28cdfULL, 0x25a6c5bc73aaaULL, 0x4de393c4b613fULL, 0x73a0543a569f1ULL, 0x000d2b1f7c763ULL}}},
+        {{{0x4778c3e94a8abULL, 0x1dd34f17d92c4ULL, 0x5d0f13c2b5bcfULL, 0x6664a4563c086ULL, 0x76627935aaecfULL}}, {{0x20811d06d4a67ULL, 0x0b21c1ffc67a8ULL, 0x521ef7afbf012ULL, 0x5147c38635bdeULL, 0x6e2a7316319afULL}}, {{0x0ac24d6d59a9fULL, 0x7c612de00cad5ULL, 0x5314a67236dd4ULL, 0x08a23bfa0f347ULL, 0x588d851cf6c86ULL}}},
+    },
+    {
+        {{{0x265e777d1f515ULL, 0x0f1f54c1e39a5ULL, 0x2f01b95522646ULL, 0x4fdd8db9dde6dULL, 0x654878cba97ccULL}}, {{0x38ec78df6b0feULL, 0x13caebea36a22ULL, 0x5ebc6e54e5f6aULL, 0x32804903d0eb8ULL, 0x2102fdba2b20dULL}}, {{0x6e405055ce6a1ULL, 0x5024a35a532d3ULL, 0x1f69054daf29dULL, 0x15d1d0d7a8bd5ULL, 0x0ad725db29ecbULL}}},
+        {{{0x7bc0c9b056f85ULL, 0x51cfebffaffd8ULL, 0x44abbe94df549ULL, 0x7ecbbd7e33121ULL, 0x4f675f5302399ULL}}, {{0x267b1834e2457ULL, 0x6ae19c378bb88ULL, 0x7457b5ed9d512ULL, 0x3280d783d05fbULL, 0x4aefcffb71a03ULL}}, {{0x536360415171eULL, 0x2313309077865ULL, 0x251444334afbcULL, 0x2b0c3853756e8ULL, 0x0bccbb72a2a86ULL}}},
+        {{{0x55e4c50fe1296ULL, 0x05fdd13efc30dULL, 0x1c0c6c380e5eeULL, 0x3e11de3fb62a8ULL, 0x6678fd69108f3ULL}}, {{0x6962feab1a9c8ULL, 0x6aca28fb9a30bULL, 0x56db7ca1b9f98ULL, 0x39f58497018ddULL, 0x4024f0ab59d6bULL}}, {{0x6fa31636863c2ULL, 0x10ae5a67e42b0ULL, 0x27abbf01fda31ULL, 0x380a7b9e64fbcULL, 0x2d42e2108ead4ULL}}},
+        {{{0x17b0d0f537593ULL, 0x16263c0c9842eULL, 0x4ab827e4539a4ULL, 0x6370ddb43d73aULL, 0x420bf3a79b423ULL}}, {{0x5131594dfd29bULL, 0x3a627e98d52feULL, 0x1154041855661ULL, 0x19175d09f8384ULL, 0x676b2608b8d2dULL}}, {{0x0ba651c5b2b47ULL, 0x5862363701027ULL, 0x0c4d6c219c6dbULL, 0x0f03dff8658deULL, 0x745d2ffa9c0cfULL}}},
+        {{{0x6df5721d34e6aULL, 0x4f32f767a0c06ULL, 0x1d5abeac76e20ULL, 0x41ce9e104e1e4ULL, 0x06e15be54c1dcULL}}, {{0x25a1e2bc9c8bdULL, 0x104c8f3b037eaULL, 0x405576fa96c98ULL, 0x2e86a88e3876fULL, 0x1ae23ceb960cfULL}}, {{0x25d871932994aULL, 0x6b9d63b560b6eULL, 0x2df2814c8d472ULL, 0x0fbbee20aa4edULL, 0x58ded861278ecULL}}},
+        {{{0x35ba8b6c2c9a8ULL, 0x1dea58b3185bfULL, 0x4b455cd23bbbeULL, 0x5ec19c04883f8ULL, 0x08ba696b531d5ULL}}, {{0x73793f266c55cULL, 0x0b988a9c93b02ULL, 0x09b0ea32325dbULL, 0x37cae71c17c5eULL, 0x2ff39de85485fULL}}, {{0x53eeec3efc57aULL, 0x2fa9fe9022efdULL, 0x699c72c138154ULL, 0x72a751ebd1ff8ULL, 0x120633b4947cfULL}}},
+        {{{0x531474912100aULL, 0x5afcdf7c0d057ULL, 0x7a9e71b788dedULL, 0x5ef708f3b0c88ULL, 0x07433be3cb393ULL}}, {{0x4987891610042ULL, 0x79d9d7f5d0172ULL, 0x3c293013b9ec4ULL, 0x0c2b85f39cacaULL, 0x35d30a99b4d59ULL}}, {{0x144c05ce997f4ULL, 0x4960b8a347fefULL, 0x1da11f15d74f7ULL, 0x54fac19c0feadULL, 0x2d873ede7af6dULL}}},
+        {{{0x202e14e5df981ULL, 0x2ea02bc3eb54cULL, 0x38875b2883564ULL, 0x1298c513ae9ddULL, 0x0543618a01600ULL}}, {{0x2316443373409ULL, 0x5de95503b22afULL, 0x699201beae2dfULL, 0x3db5849ff737aULL, 0x2e773654707faULL}}, {{0x2bdf4974c23c1ULL, 0x4b3b9c8d261bdULL, 0x26ae8b2a9bc28ULL, 0x3068210165c51ULL, 0x4b1443362d079ULL}}},
+    },
+    {
+        {{{0x31c3f57c5715eULL, 0x3cd6d0db20533ULL, 0x48d6ace5b2e4aULL, 0x7f09802403223ULL, 0x2c435c24a44d9ULL}}, {{0x037f753242cecULL, 0x19808425e48f7ULL, 0x764a31495b712ULL, 0x603f1117dfdf0ULL, 0x48ea295bad8a2ULL}}, {{0x7c97c80f8833fULL, 0x71944bd8b60c0ULL, 0x07aedbc3a1455ULL, 0x4072a7ba2858bULL, 0x7bcb4792a0defULL}}},
+        {{{0x4d0a0045224c2ULL, 0x36d3ca72a439dULL, 0x227da05d5fc6cULL, 0x0a43badbd4929ULL, 0x1b6cc62016736ULL}}, {{0x7e3d02bc73659ULL, 0x0a0b32f3bf090ULL, 0x2b5befd2ebe11ULL, 0x35b68be4bad6eULL, 0x57369f0bdefc9ULL}}, {{0x1990175638698ULL, 0x7ddd54c1a7e35ULL, 0x26e9220d4f746ULL, 0x188c24a3899a6ULL, 0x63fa6e6843adeULL}}},
+        {{{0x5becdd24b5eb7ULL, 0x19819a89f2432ULL, 0x72a7b797907c6ULL, 0x6b3ef9403a220ULL, 0x07073b98f35b7ULL}}, {{0x420536597c168ULL, 0x0131a50f13a2bULL, 0x15ee87e7dcdd0ULL, 0x78a0c5773f899ULL, 0x3418bfda07346ULL}}, {{0x4676c4ce530d4ULL, 0x0e76bbf3e9a07ULL, 0x6ce8c782d9301ULL, 0x164832e77c58cULL, 0x3084d66153310ULL}}},
+        {{{0x4e876760321fdULL, 0x213d6c75b134dULL, 0x3201649ff8ad4ULL, 0x11d0073ea5745ULL, 0x73d86b7abb6f7ULL}}, {{0x6b79ebf8469adULL, 0x09c4cc626bc3eULL, 0x5d0606c560040ULL, 0x39e4d24c19857ULL, 0x3ba2504f049b6ULL}}, {{0x2b5606dba5ab6ULL, 0x1f7763db5616aULL, 0x41298d6a44d3cULL, 0x2ed9854a906cdULL, 0x6813b8f37973eULL}}},
+        {{{0x4ca56f3157e29ULL, 0x60bdea514be32ULL, 0x41666f04db4d5ULL, 0x1f6eea677bbc5ULL, 0x7d5472af24f83ULL}}, {{0x4b054334127c1ULL, 0x7105f7fe4b30aULL, 0x061bd3c417411ULL, 0x4806da4fbfca2ULL, 0x1768e838bed0bULL}}, {{0x7874daf33da47ULL, 0x3b6dc673f3a1dULL, 0x273bb38034ef9ULL, 0x1ad1f954517ceULL, 0x5d1aeb7923524ULL}}},
+        {{{0x7bfaeb61ba775ULL, 0x3fc4c77ffa258ULL, 0x210373ee13988ULL, 0x31a05a3d2e1aeULL, 0x7e83be0bccaf8ULL}}, {{0x66bb319cd63caULL, 0x2443a0d073eb3ULL, 0x5432ad99c3056ULL, 0x151d836ab2d90ULL, 0x20fb199d104f1ULL}}, {{0x43dee6d99c120ULL, 0x5c8c173fc0c32ULL, 0x3a1663618407cULL, 0x2e635d978a8c7ULL, 0x76b76289fcc47ULL}}},
+        {{{0x5f1a1522ec0b3ULL, 0x6454eacada848ULL, 0x286cf01561e16ULL, 0x04f8ea42d12a4ULL, 0x60959eccd58feULL}}, {{0x34cc1756286faULL, 0x2fae942af8f23ULL, 0x1caf79b6f3b4cULL, 0x474bf399210f5ULL, 0x01fe18491131cULL}}, {{0x7eb7ba8ed7a09ULL, 0x77ca04f1387d7ULL, 0x04650a127f70aULL, 0x7a52275e72e9eULL, 0x35e1eb55be947ULL}}},
+        {{{0x56dfa726ccc74ULL, 0x7c5ea772ca29fULL, 0x28b22d0ec2133ULL, 0x335799d727aa9ULL, 0x59aab07a0d401ULL}}, {{0x2e701c5738dd3ULL, 0x6b64de37ddb7bULL, 0x3c57bd3e71bd8ULL, 0x26c30f4b54021ULL, 0x3aa1d11faf60aULL}}, {{0x4ec4c925eac25ULL, 0x08c026ee70ef7ULL, 0x2a7d1446121c6ULL, 0x5232d9ba19bffULL, 0x1865e78ec8e6aULL}}},
+    },
+    {
+        {{{0x454e91c529ccbULL, 0x24c98c6bf72cfULL, 0x0486594c3d89aULL, 0x7ae13a3d7fa3cULL, 0x17038418eaf66ULL}}, {{0x4b7c7b66e1f7aULL, 0x4bea185efd998ULL, 0x4fabc711055f8ULL, 0x1fb9f7836fe38ULL, 0x582f446752da6ULL}}, {{0x17bd320324ce4ULL, 0x51489117898c6ULL, 0x1684d92a0410bULL, 0x6e4d90f78c5a7ULL, 0x0c2a1c4bcda28ULL}}},
+        {{{0x4814869bd6945ULL, 0x7b7c391a45db8ULL, 0x57316ac35b641ULL, 0x641e31de9096aULL, 0x5a6a9b30a314dULL}}, {{0x5c7d06f1f0447ULL, 0x7db70f80b3a49ULL, 0x6cb4a3ec89a78ULL, 0x43be8ad81397dULL, 0x7c558bd1c6f64ULL}}, {{0x41524d396463dULL, 0x1586b449e1a1dULL, 0x2f17e904aed8aULL, 0x7e1d2861d3c8eULL, 0x0404a5ca0afbaULL}}},
+        {{{0x49e1b2a416fd1ULL, 0x51c6a0b316c57ULL, 0x575a59ed71bdcULL, 0x74c021a1fec1eULL, 0x39527516e7f8eULL}}, {{0x740070aa743d6ULL, 0x16b64cbdd1183ULL, 0x23f4b7b32eb43ULL, 0x319aba58235b3ULL, 0x46395bfdcadd9ULL}}, {{0x7db2d1a5d9a9cULL, 0x79a200b85422fULL, 0x355bfaa71dd16ULL, 0x00b77ea5f78aaULL, 0x76579a29e822dULL}}},
+        {{{0x4b51352b434f2ULL, 0x1327bd01c2667ULL, 0x434d73b60c8a1ULL, 0x3e0daa89443baULL, 0x02c514bb2a277ULL}}, {{0x68e7e49c02a17ULL, 0x45795346fe8b6ULL, 0x089306c8f3546ULL, 0x6d89f6b2f88f6ULL, 0x43a384dc9e05bULL}}, {{0x3d5da8bf1b645ULL, 0x7ded6a96a6d09ULL, 0x6c3494fee2f4dULL, 0x02c989c8b6bd4ULL, 0x1160920961548ULL}}},
+        {{{0x05616369b4dcdULL, 0x4ecab86ac6f47ULL, 0x3c60085d700b2ULL, 0x0213ee10dfceaULL, 0x2f637d7491e6eULL}}, {{0x5166929dacfaaULL, 0x190826b31f689ULL, 0x4f55567694a7dULL, 0x705f4f7b1e522ULL, 0x351e125bc5698ULL}}, {{0x49b461af67bbeULL, 0x75915712c3a96ULL, 0x69a67ef580c0dULL, 0x54d38ef70cffcULL, 0x7f182d06e7ce2ULL}}},
+        {{{0x54b728e217522ULL, 0x69a90971b0128ULL, 0x51a40f2a963a3ULL, 0x10be9ac12a6bfULL, 0x44acc043241c5ULL}}, {{0x48e64ab0168ecULL, 0x2a2bdb8a86f4fULL, 0x7343b6b2d6929ULL, 0x1d804aa8ce9a3ULL, 0x67d4ac8c343e9ULL}}, {{0x56bbb4f7a5777ULL, 0x29230627c238fULL, 0x5ad1a122cd7fbULL, 0x0dea56e50e364ULL, 0x556d1c8312ad7ULL}}},
+        {{{0x06756b11be821ULL, 0x462147e7bb03eULL, 0x26519743ebfe0ULL, 0x782fc59682ab5ULL, 0x097abe38cc8c7ULL}}, {{0x740e30c8d3982ULL, 0x7c2b47f4682fdULL, 0x5cd91b8c7dc1cULL, 0x77fa790f9e583ULL, 0x746c6c6d1d824ULL}}, {{0x1c9877ea52da4ULL, 0x2b37b83a86189ULL, 0x733af49310da5ULL, 0x25e81161c04fbULL, 0x577e14a34bee8ULL}}},
+        {{{0x6cebebd4dd72bULL, 0x340c1e442329fULL, 0x32347ffd1a93fULL, 0x14a89252cbbe0ULL, 0x705304b8fb009ULL}}, {{0x268ac61a73b0aULL, 0x206f234bebe1cULL, 0x5b403a7cbebe8ULL, 0x7a160f09f4135ULL, 0x60fa7ee96fd78ULL}}, {{0x51d354d296ec6ULL, 0x7cbf5a63b16c7ULL, 0x2f50bb3cf0c14ULL, 0x1feb385cac65aULL, 0x21398e0ca1635ULL}}},
+    },
+    {
+        {{{0x5fc16861b7e9aULL, 0x0ed44f88a30d8ULL, 0x7a4d65fda8cc1ULL, 0x7f580b33933d0ULL, 0x05ffb9cd6082dULL}}, {{0x2b2ca8da7d2efULL, 0x3b33e8504e42dULL, 0x774f1d4d9ab67ULL, 0x73157325c8027ULL, 0x403a395b53909ULL}}, {{0x7fa9ff53f6139ULL, 0x4a27ccd96d4c2ULL, 0x5122a9183cad7ULL, 0x0c96bd45f77d9ULL, 0x7a2932856f5eaULL}}},
+        {{{0x4444879639302ULL, 0x26a18cfe59713ULL, 0x06be7192b93c6ULL, 0x00bf859aed464ULL, 0x39d0003546871ULL}}, {{0x1d761b02de888ULL, 0x7da4829c3e167ULL, 0x386a5017d5439ULL, 0x5ccd35fd22c11ULL, 0x050a2f7dfd447ULL}}, {{0x43b33a650db77ULL, 0x3b758a576486fULL, 0x6df4c61aebfa0ULL, 0x3677f4ca01696ULL, 0x2b5b7eec372baULL}}},
+        {{{0x4404d613ac8f4ULL, 0x57f52fce594d2ULL, 0x73b08414030f0ULL, 0x47743a082690fULL, 0x1b205fb38604aULL}}, {{0x44bbd83f50eefULL, 0x331924f0cd677ULL, 0x2df99b9423c32ULL, 0x46ca1f3b2c3e4ULL, 0x0f7655a3a47f9ULL}}, {{0x4ad37d24b133cULL, 0x7ac0719216abdULL, 0x0b1bfb9107851ULL, 0x65732b341d0ebULL, 0x0157d5dc87e0eULL}}},
+        {{{0x65514d71eb524ULL, 0x02bbe28b272a4ULL, 0x5379adf980f62ULL, 0x4280a3e6fa086ULL, 0x5293b1730437cULL}}, {{0x7af510354c13dULL, 0x0b546e56c1e54ULL, 0x68f51c35e82c5ULL, 0x0b99434dcb502ULL, 0x6528e42d82460ULL}}, {{0x0e0814bccf226ULL, 0x1b032df72647aULL, 0x550796e4b1d17ULL, 0x4bc45b0bcb62cULL, 0x40a44df0c021fULL}}},
+        {{{0x16e514bc5d095ULL, 0x31f94d00950d9ULL, 0x09ba977c83502ULL, 0x567939b1ec4e4ULL, 0x39ca36565719cULL}}, {{0x069894f20ea6aULL, 0x2298c40c31b55ULL, 0x42fe2fba8528fULL, 0x6783000fe6584ULL, 0x35f4e822947e9ULL}}, {{0x06f2f6f87b75cULL, 0x400695c0e12eaULL, 0x34d375b1892baULL, 0x2c78f642b71d5ULL, 0x055b0be0e440eULL}}},
+        {{{0x2a04b6ea33da2ULL, 0x2bc6c24dba9a2ULL, 0x113659d5f3d30ULL, 0x55648764b3af7ULL, 0x64ca348d2a985ULL}}, {{0x1a17d89735d12ULL, 0x2bccc573e2c8dULL, 0x0e55a076dbc9fULL, 0x792cfe5d19435ULL, 0x363b8004d269aULL}}, {{0x08e19e4c4912dULL, 0x1c394b9cd732bULL, 0x16e6357bf30edULL, 0x40ca29175307dULL, 0x7064bbab1de4aULL}}},
+        {{{0x0c06142542129ULL, 0x5d7d1ab721452ULL, 0x2aff86fcb8b0aULL, 0x35fe7922c6dbbULL, 0x02157ade83d62ULL}}, {{0x1e1515a770641ULL, 0x0e9cff0073723ULL, 0x7c8c426a68b8bULL, 0x3c5ba9392859eULL, 0x756a7330ac27bULL}}, {{0x6972a1b9a038bULL, 0x54fdc07f687c8ULL, 0x36ed328b93b99ULL, 0x2b1c0d1243bb7ULL, 0x1a944ee88ecd0ULL}}},
+        {{{0x0a859182362d6ULL, 0x6f149a3577768ULL, 0x61567dae67d55ULL, 0x1ad468c5a13baULL, 0x26c20fe74d262ULL}}, {{0x11d1151039372ULL, 0x6f33944dbdab5ULL, 0x4d9adacbb4ddeULL, 0x4cad0b901567eULL, 0x0730291bd6901ULL}}, {{0x51d9fe9cc22f5ULL, 0x3251baaef8c91ULL, 0x490e7459af158ULL, 0x5a4a3e9f690b2ULL, 0x49d271acedaf8ULL}}},
+    },
+    {
+        {{{0x0aaf9b4b75601ULL, 0x26b91b5ae44f3ULL, 0x6de808d7ab1c8ULL, 0x6a769675530b0ULL, 0x1bbfb284e98f7ULL}}, {{0x5058a382b33f3ULL, 0x175a91816913eULL, 0x4f6cdb96b8ae8ULL, 0x17347c9da81d2ULL, 0x5aa3ed9d95a23ULL}}, {{0x777e9c7d96561ULL, 0x28e58f006ccacULL, 0x541bbbb2cac49ULL, 0x3e63282994cecULL, 0x4a07e14e5e895ULL}}},
+        {{{0x358cdc477a49bULL, 0x3cc88fe02e481ULL, 0x721aab7f4e36bULL, 0x0408cc9469953ULL, 0x50af7aed84afaULL}}, {{0x412cb980df999ULL, 0x5e78dd8ee29dcULL, 0x171dff68c575dULL, 0x2015dd2f6ef49ULL, 0x3f0bac391d313ULL}}, {{0x7de0115f65be5ULL, 0x4242c21364dc9ULL, 0x6b75b64a66098ULL, 0x0033c0102c085ULL, 0x1921a316baebdULL}}},
+        {{{0x2ad9ad9f3c18bULL, 0x5ec1638339aebULL, 0x5703b6559a83bULL, 0x3fa9f4d05d612ULL, 0x7b049deca062cULL}}, {{0x22f7edfb870fcULL, 0x569eed677b128ULL, 0x30937dcb0a5afULL, 0x758039c78ea1bULL, 0x6458df41e273aULL}}, {{0x3e37a35444483ULL, 0x661fdb7d27b99ULL, 0x317761dd621e4ULL, 0x7323c30026189ULL, 0x6093dccbc2950ULL}}},
+        {{{0x6eebe6084034bULL, 0x6cf01f70a8d7bULL, 0x0b41a54c6670aULL, 0x6c84b99bb55dbULL, 0x6e3180c98b647ULL}}, {{0x39a8585e0706dULL, 0x3167ce72663feULL, 0x63d14ecdb4297ULL, 0x4be21dcf970b8ULL, 0x57d1ea084827aULL}}, {{0x2b6e7a128b071ULL, 0x5b27511755dcfULL, 0x08584c2930565ULL, 0x68c7bda6f4159ULL, 0x363e999ddd97bULL}}},
+        {{{0x048dce24baec6ULL, 0x2b75795ec05e3ULL, 0x3bfa4c5da6dc9ULL, 0x1aac8659e371eULL, 0x231f979bc6f9bULL}}, {{0x043c135ee1fc4ULL, 0x2a11c9919f2d5ULL, 0x6334cc25dbacdULL, 0x295da17b400daULL, 0x48ee9b78693a0ULL}}, {{0x1de4bcc2af3c6ULL, 0x61fc411a3eb86ULL, 0x53ed19ac12ec0ULL, 0x209dbc6b804e0ULL, 0x079bfa9b08792ULL}}},
+        {{{0x1ed80a2d54245ULL, 0x70efec72a5e79ULL, 0x42151d42a822dULL, 0x1b5ebb6d631e8ULL, 0x1ef4fb1594706ULL}}, {{0x03a51da300df4ULL, 0x467b52b561c72ULL, 0x4d5920210e590ULL, 0x0ca769e789685ULL, 0x038c77f684817ULL}}, {{0x65ee65b167becULL, 0x052da19b850a9ULL, 0x0408665656429ULL, 0x7ab39596f9a4cULL, 0x575ee92a4a0bfULL}}},
+        {{{0x6bc450aa4d801ULL, 0x4f4a6773b0ba8ULL, 0x6241b0b0ebc48ULL, 0x40d9c4f1d9315ULL, 0x200a1e7e382f5ULL}}, {{0x080908a182fcfULL, 0x0532913b7ba98ULL, 0x3dccf78c385c3ULL, 0x68002dd5eaba9ULL, 0x43d4e7112cd3fULL}}, {{0x5b967eaf93ac5ULL, 0x360acca580a31ULL, 0x1c65fd5c6f262ULL, 0x71c7f15c2ecabULL, 0x050eca52651e4ULL}}},
+        {{{0x4397660e668eaULL, 0x7c2a75692f2f5ULL, 0x3b29e7e6c66efULL, 0x72ba658bcda9aULL, 0x6151c09fa131aULL}}, {{0x31ade453f0c9cULL, 0x3dfee07737868ULL, 0x611ecf7a7d411ULL, 0x2637e6cbd64f6ULL, 0x4b0ee6c21c58fULL}}, {{0x55c0dfdf05d96ULL, 0x405569dcf475eULL, 0x05c5c277498bbULL, 0x18588d95dc389ULL, 0x1fef24fa800f0ULL}}},
+    },
+    {
+        {{{0x1a66a90166220ULL, 0x5cb7e3c013ff2ULL, 0x6437df3c8954aULL, 0x7dcbeffc2ec3fULL, 0x4f620ffe0c736ULL}}, {{0x6123a6b6c6609ULL, 0x0b0156b271692ULL, 0x709e97e9d43faULL, 0x49e7a38df9cdbULL, 0x507903ce77ac1ULL}}, {{0x10d65dfde3e34ULL, 0x2573f4bf5ac5fULL, 0x05914433ca316ULL, 0x6424ce4377ce3ULL, 0x25d448044a256ULL}}},
+        {{{0x44415c9022b55ULL, 0x03025d63fc58fULL, 0x6d978355a8349ULL, 0x593781750e4ebULL, 0x4180512fd5323ULL}}, {{0x0230ec7e9b16fULL, 0x03838af2bb7adULL, 0x6dac7fc3ac6e7ULL, 0x7af3ca1e4624aULL, 0x2f9faf620bbacULL}}, {{0x73e698a48a5dbULL, 0x0d7b2a807749fULL, 0x756d976e9a8e0ULL, 0x17dcfbe70d7a3ULL, 0x15e087e55939dULL}}},
+        {{{0x4186efb963f38ULL, 0x01b8c737ab112ULL, 0x5b0726522803aULL, 0x330d2740495f4ULL, 0x5a097d54ca573ULL}}, {{0x07543745c1496ULL, 0x7bb470c218244ULL, 0x1c70d3f6bfcf3ULL, 0x6f4f273cb9396ULL, 0x39c07b1934bdeULL}}, {{0x5892b17c9e755ULL, 0x6512611bf05a8ULL, 0x16e2f6740cff5ULL, 0x03cb617f4eca9ULL, 0x2edbecf1c11ccULL}}},
+        {{{0x70fddd087a25fULL, 0x2ab87c69dddc1ULL, 0x6acead671d4c5ULL, 0x1d933062b9747ULL, 0x0854fc44544cdULL}}, {{0x6a4e3c715a0d2ULL, 0x61f0683a9a2c2ULL, 0x7a2672d4d88f2ULL, 0x5534b77a994e3ULL, 0x3d4e8dbba668bULL}}, {{0x3a0c555edad19ULL, 0x7de1507bccc3dULL, 0x6ea97e092d4cfULL, 0x7469dbb821441ULL, 0x678f82b898a47ULL}}},
+        {{{0x1d94057775696ULL, 0x3879b2a3b63c1ULL, 0x2f385bfbb4499ULL, 0x4fa7d4ed61590ULL, 0x0f7f76e0e8d08ULL}}, {{0x11d0bd6900c54ULL, 0x593a264c6d629ULL, 0x4d8af24d4e5c8ULL, 0x4efa6dc944905ULL, 0x4d7cd1fea68b6ULL}}, {{0x1ebc5d485b00cULL, 0x25c95b66ca6dbULL, 0x0467336896592ULL, 0x6afe0b2ca4061ULL, 0x45306349186e0ULL}}},
+        {{{0x414ec2b072491ULL, 0x024f4f6cb72d4ULL, 0x2292bc06ec886ULL, 0x32fb69424acb7ULL, 0x65f3b08ccd277ULL}}, {{0x5d0c1a6cdff1dULL, 0x2bd084275d29bULL, 0x4bf3da957dbc4ULL, 0x0b7b649afc2ccULL, 0x067ee0f54a37fULL}}, {{0x29fff199801f7ULL, 0x3f4541ee5fd96ULL, 0x7f4bd2674d874ULL, 0x7f112f88e91baULL, 0x124cefe80fe10ULL}}},
+        {{{0x0e85b31b16489ULL, 0x6fb6e217f62a3ULL, 0x52b88e63eab72ULL, 0x0609cd85efa50ULL, 0x05f4cbea503d2ULL}}, {{0x26cf9d18df255ULL, 0x5228f4c76c982ULL, 0x724ed7f0751c7ULL, 0x35116369e39f9ULL, 0x6be3a6a2e3ff8ULL}}, {{0x40e9ec04145bcULL, 0x4411ed06999c0ULL, 0x6211e8f1c7fd3ULL, 0x5d2deaa3746d5ULL, 0x64666aa0a4d2aULL}}},
+        {{{0x53bf73337e94cULL, 0x7c23c29e2b618ULL, 0x4c31d41f2d5a5ULL, 0x23425c255d60cULL, 0x28dd4abfe0640ULL}}, {{0x1435a7c06d912ULL, 0x43767f0616d08ULL, 0x72f89e32848f0ULL, 0x0236a59bd93d8ULL, 0x1d753b84c76f5ULL}}, {{0x0b64c44cb9f44ULL, 0x59c724bb7efb8ULL, 0x4115f10628f86ULL, 0x4973d181a4316ULL, 0x4c498bf78a0c8ULL}}},
+    },
+    {
+        {{{0x2aff530976b86ULL, 0x0d85a48c0845aULL, 0x796eb963642e0ULL, 0x60bee50c4b626ULL, 0x28005fe6c8340ULL}}, {{0x653fb1aa73196ULL, 0x607faec8306faULL, 0x4e85ec83e5254ULL, 0x09f56900584fdULL, 0x544d49292fc86ULL}}, {{0x7ba9f34528688ULL, 0x284a20fb42d5dULL, 0x3652cd9706ffeULL, 0x6fd7baddde6b3ULL, 0x72e472930f316ULL}}},
+        {{{0x3f635d32a7627ULL, 0x0cbecacde00feULL, 0x3411141eaa936ULL, 0x21c1e42f3cb94ULL, 0x1fee7f000fe06ULL}}, {{0x5208c9781084fULL, 0x16468a1dc24d2ULL, 0x7bf780ac540a8ULL, 0x1a67eced75301ULL, 0x5a9d2e8c2733aULL}}, {{0x305da03dbf7e5ULL, 0x1228699b7aecaULL, 0x12a23b2936bc9ULL, 0x2a1bda56ae6e9ULL, 0x00f94051ee040ULL}}},
+        {{{0x793bb07af9753ULL, 0x1e7b6ecd4fafdULL, 0x02c7b1560fb43ULL, 0x2296734cc5fb7ULL, 0x47b7ffd25dd40ULL}}, {{0x56b23c3d330b2ULL, 0x37608e360d1a6ULL, 0x10ae0f3c8722eULL, 0x086d9b618b637ULL, 0x07d79c7e8beabULL}}, {{0x3fb9cbc08dd12ULL, 0x75c3dd85370ffULL, 0x47f06fe2819acULL, 0x5db06ab9215edULL, 0x1c3520a35ea64ULL}}},
+        {{{0x06f40216bc059ULL, 0x3a2579b0fd9b5ULL, 0x71c26407eec8cULL, 0x72ada4ab54f0bULL, 0x38750c3b66d12ULL}}, {{0x253a6bccba34aULL, 0x427070433701aULL, 0x20b8e58f9870eULL, 0x337c861db00ccULL, 0x1c3d05775d0eeULL}}, {{0x6f1409422e51aULL, 0x7856bbece2d25ULL, 0x13380a72f031cULL, 0x43e1080a7f3baULL, 0x0621e2c7d3304ULL}}},
+        {{{0x61796b0dbf0f3ULL, 0x73c2f9c32d6f5ULL, 0x6aa8ed1537ebeULL, 0x74e92c91838f4ULL, 0x5d8e589ca1002ULL}}, {{0x060cc8259838dULL, 0x038d3f35b95f3ULL, 0x56078c243a923ULL, 0x2de3293241bb2ULL, 0x0007d6097bd3aULL}}, {{0x71d950842a94bULL, 0x46b11e5c7d817ULL, 0x5478bbecb4f0dULL, 0x7c3054b0a1c5dULL, 0x1583d7783c1cbULL}}},
+        {{{0x34704cc9d28c7ULL, 0x3dee598b1f200ULL, 0x16e1c98746d9eULL, 0x4050b7095afdfULL, 0x4958064e83c55ULL}}, {{0x6a2ef5da27ae1ULL, 0x28aace02e9d9dULL, 0x02459e965f0e8ULL, 0x7b864d3150933ULL, 0x252a5f2e81ed8ULL}}, {{0x094265066e80dULL, 0x0a60f918d61a5ULL, 0x0444bf7f30fdeULL, 0x1c40da9ed3c06ULL, 0x079c170bd843bULL}}},
+        {{{0x6cd50c0d5d056ULL, 0x5b7606ae779baULL, 0x70fbd226bdda1ULL, 0x5661e53391ff9ULL, 0x6768c0d7317b8ULL}}, {{0x6ece464fa6fffULL, 0x3cc40bca460a0ULL, 0x6e3a90afb8d0cULL, 0x5801abca11228ULL, 0x6dec05e34ac9fULL}}, {{0x625e5f155c1b3ULL, 0x4f32f6f723296ULL, 0x5ac980105efceULL, 0x17a61165eee36ULL, 0x51445e14ddcd5ULL}}},
+        {{{0x147ab2bbea455ULL, 0x1f240f2253126ULL, 0x0c3de9e314e89ULL, 0x21ea5a4fca45fULL, 0x12e990086e4fdULL}}, {{0x02b4b3b144951ULL, 0x5688977966aeaULL, 0x18e176e399ffdULL, 0x2e45c5eb4938bULL, 0x13186f31e3929ULL}}, {{0x496b37fdfbb2eULL, 0x3c2439d5f3e21ULL, 0x16e60fe7e6a4dULL, 0x4d7ef889b621dULL, 0x77b2e3f05d3e9ULL}}},
+    },
+    {
+        {{{0x2f48fcc5cd29bULL, 0x7d479c6ce32a6ULL, 0x448a504aea146ULL, 0x279196d655028ULL, 0x478d99d935000ULL}}, {{0x575879cf12657ULL, 0x29ca741c53fa1ULL, 0x6ed2f9fa0bfbeULL, 0x451661a53f82dULL, 0x0b251172a50c3ULL}}, {{0x2d94890bb02c0ULL, 0x621d84a22a3abULL, 0x3c85c09438822ULL, 0x402d1351144a7ULL, 0x4dc923343b524ULL}}},
+        {{{0x3e3ebf36c4975ULL, 0x4a6f0c424a75aULL, 0x096945b5d7496ULL, 0x423f439ca1ed0ULL, 0x6bbc7cb4c411cULL}}, {{0x28c400f8086b6ULL, 0x6f2f3e1b91c70ULL, 0x7d0b2d0fddf9bULL, 0x3c23f7b6f1826ULL, 0x5265797cb6abdULL}}, {{0x79cd1d4a50d56ULL, 0x6f8dfd56fc78dULL, 0x6025cbad89101ULL, 0x67db7fcdfa41aULL, 0x00375883b332aULL}}},
+        {{{0x3ec856c75c99cULL, 0x0001c679e9931ULL, 0x241d8d3910613ULL, 0x4eb8533b5cdddULL, 0x669e2cb571f37ULL}}, {{0x1b2cd28cb0940ULL, 0x40de384992000ULL, 0x35728c58fed46ULL, 0x3305ad6c348eeULL, 0x67238dbd8c450ULL}}, {{0x16b73a49bd308ULL, 0x564724e53d962ULL, 0x55766c4096ab5ULL, 0x5dcda3c9f7d1fULL, 0x72a1056140678ULL}}},
+        {{{0x52909e2e505b6ULL, 0x57805224601b1ULL, 0x6c48c9e6329e2ULL, 0x5a3bbf7aab4d4ULL, 0x7c77897b81439ULL}}, {{0x6812b1cc9249dULL, 0x5c42423eb1456ULL, 0x7c43b398a19bbULL, 0x700165ae2dc2eULL, 0x03a6b259e263aULL}}, {{0x1b5e2de331cb5ULL, 0x1c2bf94841e38ULL, 0x764cac56a7d76ULL, 0x373cfd21c78bdULL, 0x2a381bf01c614ULL}}},
+        {{{0x0be32b534166fULL, 0x48339ee1a9ef8ULL, 0x55e9d649f9b29ULL, 0x15549a6fbebd4ULL, 0x5701461dabdecULL}}, {{0x39879cfc811c1ULL, 0x026eadcacf593ULL, 0x1c3b7f22df4a6ULL, 0x05b286d27303eULL, 0x5dbca62f88440ULL}}, {{0x747402c915c25ULL, 0x50161a681458cULL, 0x6d0fd7c6f7346ULL, 0x1212f2b00de83ULL, 0x2555b4e05539aULL}}},
+        {{{0x09b1d87e463d4ULL, 0x359bf6c73af08ULL, 0x4966e72b536a5ULL, 0x055f6143b9baaULL, 0x69c806e9c3123ULL}}, {{0x09f5266ddd216ULL, 0x4f91c6e090df8ULL, 0x37d8bf7739582ULL, 0x0c97632c9ced1ULL, 0x7a869ae7e52edULL}}, {{0x0f57414bb3f22ULL, 0x495db99910f69ULL, 0x7b602f9a31f3bULL, 0x625f697c9b0bcULL, 0x25d70b885f77bULL}}},
+        {{{0x59d29bb1ae4d4ULL, 0x0e73f2a9d9308ULL, 0x26d2cf95ae713ULL, 0x3c54193a1fb61ULL, 0x21ea8e2798b68ULL}}, {{0x1c3d9762bf4deULL, 0x3e4e8bb05682aULL, 0x48f775420fd0dULL, 0x59214bbad1706ULL, 0x138e3a6269a5dULL}}, {{0x6f4b46a5a7b9cULL, 0x36bf83a0c50f7ULL, 0x4c8592348a674ULL, 0x01ec1204c0c6eULL, 0x5c5abeb1e5a2eULL}}},
+        {{{0x5e6de1306a233ULL, 0x4422df1d8e059ULL, 0x458ed6ded694aULL, 0x321f0e340fa60ULL, 0x241d350660d32ULL}}, {{0x22af4b73c2ddbULL, 0x3eb40a0c1a28eULL, 0x606c0baf11c31ULL, 0x647804a1f5612ULL, 0x0e434b3b1f499ULL}}, {{0x4404d0ebc52c7ULL, 0x77634f23ead7cULL, 0x176d0aeb9188cULL, 0x34a15760b8769ULL, 0x1d8dfd966645dULL}}},
+    },
+    {
+        {{{0x0639c12ddb0a4ULL, 0x6180490cd7ab3ULL, 0x3f3918297467cULL, 0x74568be1781acULL, 0x07a195152e095ULL}}, {{0x7a9c59c2ec4deULL, 0x7e9f09e79652dULL, 0x6a3e422f22d86ULL, 0x2ae8e3b836c8bULL, 0x63b795fc7ad32ULL}}, {{0x68f02389e5fc8ULL, 0x059f1bc877506ULL, 0x504990e410cecULL, 0x09bd7d0feaee2ULL, 0x3e8fe83d032f0ULL}}},
+        {{{0x04c8de8efd13cULL, 0x1c67c06e6210eULL, 0x183378f7f146aULL, 0x64352ceaed289ULL, 0x22d60899a6258ULL}}, {{0x315b90570a294ULL, 0x60ce108a925f1ULL, 0x6eff61253c909ULL, 0x003ef0e2d70b0ULL, 0x75ba3b797fac4ULL}}, {{0x1dbc070cdd196ULL, 0x16d8fb1534c47ULL, 0x500498183fa2aULL, 0x72f59c423de75ULL, 0x0904d07b87779ULL}}},
+        {{{0x22d6648f940b9ULL, 0x197a5a1873e86ULL, 0x207e4c41a54bcULL, 0x5360b3b4bd6d0ULL, 0x6240aacebaf72ULL}}, {{0x61fd4ddba919cULL, 0x7d8e991b55699ULL, 0x61b31473cc76cULL, 0x7039631e631d6ULL, 0x43e2143fbc1ddULL}}, {{0x4749c5ba295a0ULL, 0x37946fa4b5f06ULL, 0x724c5ab5a51f1ULL, 0x65633789dd3f3ULL, 0x56bdaf238db40ULL}}},
+        {{{0x0d36cc19d3bb2ULL, 0x6ec4470d72262ULL, 0x6853d7018a9aeULL, 0x3aa3e4dc2c8ebULL, 0x03aa31507e1e5ULL}}, {{0x2b9e3f53533ebULL, 0x2add727a806c5ULL, 0x56955c8ce15a3ULL, 0x18c4f070a290eULL, 0x1d24a86d83741ULL}}, {{0x47648ffd4ce1fULL, 0x60a9591839e9dULL, 0x424d5f38117abULL, 0x42cc46912c10eULL, 0x43b261dc9aeb4ULL}}},
+        {{{0x13d8b6c951364ULL, 0x4c0017e8f632aULL, 0x53e559e53f9c4ULL, 0x4b20146886eeaULL, 0x02b4d5e242940ULL}}, {{0x31e1988bb79bbULL, 0x7b82f46b3bcabULL, 0x0f7a8ce827b41ULL, 0x5e15816177130ULL, 0x326055cf5b276ULL}}, {{0x155cb28d18df2ULL, 0x0c30d9ca11694ULL, 0x2090e27ab3119ULL, 0x208624e7a49b6ULL, 0x27a6c809ae5d3ULL}}},
+        {{{0x4270ac43d6954ULL, 0x2ed4cd95659a5ULL, 0x75c0db37528f9ULL, 0x2ccbcfd2c9234ULL, 0x221503603d8c2ULL}}, {{0x6ebcd1f0db188ULL, 0x74ceb4b7d1174ULL, 0x7d56168df4f5cULL, 0x0bf79176fd18aULL, 0x2cb67174ff60aULL}}, {{0x6cdf9390be1d0ULL, 0x08e519c7e2b3dULL, 0x253c3d2a50881ULL, 0x21b41448e333dULL, 0x7b1df4b73890fULL}}},
+        {{{0x6221807f8f58cULL, 0x3fa92813a8be5ULL, 0x6da98c38d5572ULL, 0x01ed95554468fULL, 0x68698245d352eULL}}, {{0x2f2e0b3b2a224ULL, 0x0c56aa22c1c92ULL, 0x5fdec39f1b278ULL, 0x4c90af5c7f106ULL, 0x61fcef2658fc5ULL}}, {{0x15d852a18187aULL, 0x270dbb59afb76ULL, 0x7db120bcf92abULL, 0x0e7a25d714087ULL, 0x46cf4c473daf0ULL}}},
+        {{{0x46ea7f1498140ULL, 0x70725690a8427ULL, 0x0a73ae9f079fbULL, 0x2dd924461c62bULL, 0x1065aae50d8ccULL}}, {{0x525ed9ec4e5f9ULL, 0x022d20660684cULL, 0x7972b70397b68ULL, 0x7a03958d3f965ULL, 0x29387bcd14eb5ULL}}, {{0x44525df200d57ULL, 0x2d7f94ce94385ULL, 0x60d00c170ecb7ULL, 0x38b0503f3d8f0ULL, 0x69a198e64f1ceULL}}},
+    },
+    {
+        {{{0x6e56b9e2d4734ULL, 0x57038c2ceaf64ULL, 0x27379ff131c4cULL, 0x1d6f7ae4a92f6ULL, 0x39c80b16e7174ULL}}, {{0x4d613efa9d697ULL, 0x48380cf2b2f5fULL, 0x7eb6a5833116aULL, 0x1b2d2b7f08260ULL, 0x3a73b70472e40ULL}}, {{0x16e0d1b826c68ULL, 0x4492c1c7b61e3ULL, 0x6dd0db3dc7fc3ULL, 0x14130898b3811ULL, 0x0cf0ea5877da7ULL}}},
+        {{{0x2ced43ba6945aULL, 0x43d10380bbc66ULL, 0x19fb4ef782c4dULL, 0x6ae8d6a0784afULL, 0x5da8acdab8c63ULL}}, {{0x480a4ddd4ccbdULL, 0x3b2be5bb3a32dULL, 0x35b1c6c8b9bd5ULL, 0x217e3af19e3a0ULL, 0x7bb51279cb3c0ULL}}, {{0x6664a3a70159fULL, 0x1e15209c29896ULL, 0x025b04dd8653cULL, 0x676d2b0a61cd2ULL, 0x6cd0ff50979feULL}}},
+        {{{0x4fabdb04ba18eULL, 0x7877bb79eeffdULL, 0x5e84c7343f1efULL, 0x530d20ea43702ULL, 0x641a4391f2223ULL}}, {{0x067e78f4428acULL, 0x614c226bc781cULL, 0x018a4d4520d6aULL, 0x24e790e8a799cULL, 0x6390a4c8df048ULL}}, {{0x6b95aa606a8dbULL, 0x3d60d04be38b8ULL, 0x3f27bfe452dfeULL, 0x67e15398fb5a2ULL, 0x30ddf38562705ULL}}},
+        {{{0x6f2bd68bcd52cULL, 0x60d2905de4677ULL, 0x72c6bbb19276eULL, 0x3f2dadb770620ULL, 0x5c294d270212aULL}}, {{0x5cbdad1bff7f9ULL, 0x0440c8ae2e9c7ULL, 0x462755b24463aULL, 0x3345d66675e07ULL, 0x1b4822e9d4467ULL}}, {{0x60a7f25563781ULL, 0x14901ef2b1566ULL, 0x452d38c94488aULL, 0x71563ae8293b0ULL, 0x222d9625d976fULL}}},
+        {{{0x4be7e0a344f85ULL, 0x190fe458701f2ULL, 0x385bc3facbeaaULL, 0x6f54e70f3af27ULL, 0x43e64e5418a08ULL}}, {{0x17f85b372ace1ULL, 0x528c717e3038eULL, 0x7022d62064c39ULL, 0x7fa11ce5682b5ULL, 0x0b34271c87f8fULL}}, {{0x5e2521a35ce63ULL, 0x1bf224051d02aULL, 0x5f773b2f84035ULL, 0x3725ffc05fc52ULL, 0x57342dc96d6bcULL}}},
+        {{{0x3bcb71e707bf6ULL, 0x18e5234ec5e78ULL, 0x35a68ccd4766eULL, 0x03f802817376dULL, 0x522f521f1ec88ULL}}, {{0x6f065c8ce5998ULL, 0x216b97d545dfdULL, 0x2df1162fc0a54ULL, 0x42ac632508310ULL, 0x35134fb231c24ULL}}, {{0x41f46f9a3902bULL, 0x6f32caf7984e5ULL, 0x628703b246e8eULL, 0x0bdd730a59827ULL, 0x7afcaad70b990ULL}}},
+        {{{0x141ecef842b6bULL, 0x0f2f57cd8b510ULL, 0x5e13ff9579ec5ULL, 0x05bc63a47cb81ULL, 0x5b50a1f7afcd0ULL}}, {{0x5ed54a4b8be41ULL, 0x423761c5bb84bULL, 0x7a0aaca40b44fULL, 0x3e5a0fa1919e6ULL, 0x1085faa5c3aaeULL}}, {{0x40f66f1361315ULL, 0x04e02007d3370ULL, 0x2894200611889ULL, 0x19032f6a2fd72ULL, 0x0a2862393fda7ULL}}},
+        {{{0x6737b6ecb9d17ULL, 0x11acf9d5c32c1ULL, 0x5786e27ebc925ULL, 0x4f59bf3d4da6aULL, 0x5cb7173cb46c5ULL}}, {{0x313c8347cbc9dULL, 0x29338247068d5ULL, 0x7592b24e127a3ULL, 0x773a67518a043ULL, 0x1f354134b1a29ULL}}, {{0x1e68b82b7abf0ULL, 0x4f374d6f72951ULL, 0x6361dbfd07364ULL, 0x4e30b73610870ULL, 0x7cacdb0f7f1b0ULL}}},
+    },
+    {
+        {{{0x14434dcc5caedULL, 0x2c7909f667c20ULL, 0x61a839d1fb576ULL, 0x4f23800cabb76ULL, 0x25b2697bd267fULL}}, {{0x2b2e0d91a78bcULL, 0x3990a12ccf20cULL, 0x141c2e11f2622ULL, 0x0dfcefaa53320ULL, 0x7369e6a92493aULL}}, {{0x73ffb13986864ULL, 0x3282bb8f713acULL, 0x49ced78f297efULL, 0x6697027661defULL, 0x1420683db54e4ULL}}},
+        {{{0x6bb6fc1cc5ad0ULL, 0x532c8d591669dULL, 0x1af794da86c33ULL, 0x0e0e9d86d24d3ULL, 0x31e83b4161d08ULL}}, {{0x0bd1e249dd197ULL, 0x00bcb1820568fULL, 0x2eab1718830d4ULL, 0x396fd816997e6ULL, 0x60b63bebf508aULL}}, {{0x0c7129e062b4fULL, 0x1e526415b12fdULL, 0x461a0fd27923dULL, 0x18badf670a5b7ULL, 0x55cf1eb62d550ULL}}},
+        {{{0x6b5e37df58c52ULL, 0x3bcf33986c60eULL, 0x44fb8835ceae7ULL, 0x099dec18e71a4ULL, 0x1a56fbaa62ba0ULL}}, {{0x1101065c23d58ULL, 0x5aa1290338b0fULL, 0x3157e9e2e7421ULL, 0x0ea712017d489ULL, 0x669a656457089ULL}}, {{0x66b505c9dc9ecULL, 0x774ef86e35287ULL, 0x4d1d944c0955eULL, 0x52e4c39d72b20ULL, 0x13c4836799c58ULL}}},
+        {{{0x4fb6a5d8bd080ULL, 0x58ae34908589bULL, 0x3954d977baf13ULL, 0x413ea597441dcULL, 0x50bdc87dc8e5bULL}}, {{0x25d465ab3e1b9ULL, 0x0f8fe27ec2847ULL, 0x2d6e6dbf04f06ULL, 0x3038cfc1b3276ULL, 0x66f80c93a637bULL}}, {{0x537836edfe111ULL, 0x2be02357b2c0dULL, 0x6dcee58c8d4f8ULL, 0x2d732581d6192ULL, 0x1dd56444725fdULL}}},
+        {{{0x7e60008bac89aULL, 0x23d5c387c1852ULL, 0x79e5df1f533a8ULL, 0x2e6f9f1c5f0cfULL, 0x3a3a450f63a30ULL}}, {{0x47ff83362127dULL, 0x08e39af82b1f4ULL, 0x488322ef27dabULL, 0x1973738a2a1a4ULL, 0x0e645912219f7ULL}}, {{0x72f31d8394627ULL, 0x07bd294a200f1ULL, 0x665be00e274c6ULL, 0x43de8f1b6368bULL, 0x318c8d9393a9aULL}}},
+        {{{0x69e29ab1dd398ULL, 0x30685b3c76bacULL, 0x565cf37f24859ULL, 0x57b2ac28efef9ULL, 0x509a41c325950ULL}}, {{0x45d032afffe19ULL, 0x12fe49b6cde4eULL, 0x21663bc327cf1ULL, 0x18a5e4c69f1ddULL, 0x224c7c679a1d5ULL}}, {{0x06edca6f925e9ULL, 0x68c8363e677b8ULL, 0x60cfa25e4fbcfULL, 0x1c4c17609404eULL, 0x05bff02328a11ULL}}},
+        {{{0x1a0dd0dc512e4ULL, 0x10894bf5fcd10ULL, 0x52949013f9c37ULL, 0x1f50fba4735c7ULL, 0x576277cdee01aULL}}, {{0x2137023cae00bULL, 0x15a3599eb26c6ULL, 0x0687221512b3cULL, 0x253cb3a0824e9ULL, 0x780b8cc3fa2a4ULL}}, {{0x38abc234f305fULL, 0x7a280bbc103deULL, 0x398a836695dfeULL, 0x3d0af41528a1aULL, 0x5ff418726271bULL}}},
+        {{{0x347e813b69540ULL, 0x76864c21c3cbbULL, 0x1e049dbcd74a8ULL, 0x5b4d60f93749cULL, 0x29d4db8ca0a0cULL}}, {{0x6080c1789db9dULL, 0x4be7cef1ea731ULL, 0x2f40d769d8080ULL, 0x35f7d4c44a603ULL, 0x106a03dc25a96ULL}}, {{0x50aaf333353d0ULL, 0x4b59a613cbb35ULL, 0x223dfc0e19a76ULL, 0x77d1e2bb2c564ULL, 0x4ab38a51052cbULL}}},
+    },
+    {
+        {{{0x7e2e8809de054ULL, 0x55390575a3ed1ULL, 0x2b6fd178ef025ULL, 0x2cf03b1a9ea05ULL, 0x7b9b1fb5dea19ULL}}, {{0x2cbee4324c0e9ULL, 0x107f2ab76fbfbULL, 0x0c5827c15110aULL, 0x67fef7bd55475ULL, 0x68aee70642287ULL}}, {{0x4c8f17471cc0cULL, 0x6eaf210577e03ULL, 0x791ad7e5490b8ULL, 0x2fd93bbb049e9ULL, 0x2d13d55a28bd8ULL}}},
+        {{{0x19cce7aee7a52ULL, 0x6dc8a9d5a77e0ULL, 0x6a2ec66a37b4aULL, 0x36c1e30cf85c3ULL, 0x3619b5d756091ULL}}, {{0x5d2065b35b8daULL, 0x350ac4976ff58ULL, 0x487343ea36a2aULL, 0x6ac666965489eULL, 0x6b8341ee8bf90ULL}}, {{0x1f26b0282c4b2ULL, 0x649f5fdf5c6afULL, 0x3231f0193564bULL, 0x46bdbe6f6bd94ULL, 0x6a927b6b7173aULL}}},
+        {{{0x040863ece88ebULL, 0x5301dd81191aeULL, 0x5e23f6bc38c1eULL, 0x3c6d611283086ULL, 0x056d92a43a0d4ULL}}, {{0x5b24f986e4656ULL, 0x5da3d220b63edULL, 0x3028dd4408700ULL, 0x2c97c7f9fff96ULL, 0x1d2a6bf8c6c82ULL}}, {{0x5a196fc3da5a1ULL, 0x04876b3da0360ULL, 0x745e461df5ea3ULL, 0x1fb836d1eb14bULL, 0x66fbb494f1235ULL}}},
+        {{{0x70996f12309d6ULL, 0x0bd387aa73adaULL, 0x55490476fec8eULL, 0x706236b01587bULL, 0x270a0b0557843ULL}}, {{0x250b9d85c0fb8ULL, 0x4b179e12f6ea3ULL, 0x426a5a746bf70ULL, 0x32c978b5351c1ULL, 0x14ddff9ee5b00ULL}}, {{0x70640a7862bccULL, 0x34be2357fcc3fULL, 0x744aaee072b02ULL, 0x439c823c1822aULL, 0x19a4bde1945aeULL}}},
+        {{{0x709dec076c49fULL, 0x64fe7ca7ec818ULL, 0x2810b1195efebULL, 0x78220331198f6ULL, 0x14b375487eb4dULL}}, {{0x726f520a6200aULL, 0x079e27d5f1373ULL, 0x0c7b74d920111ULL, 0x6e0c531b39fc3ULL, 0x72bbbce11ed39ULL}}, {{0x53c94ab66dc47ULL, 0x7dbeec5add5d0ULL, 0x6cbdf47ad88d0ULL, 0x1bd7847070c37ULL, 0x4f0b1c02700abULL}}},
+        {{{0x521ccc1b2e23fULL, 0x028a7bea54f3fULL, 0x54521ad2b9f0aULL, 0x29a640b9764e8ULL, 0x68abe9443e0a7ULL}}, {{0x06787d81951faULL, 0x1d65218ef7c2eULL, 0x3599dce8428b2ULL, 0x5aa739c17d01fULL, 0x0a4d84710bcc4ULL}}, {{0x2c6c407831dcbULL, 0x2e9ab8a21bb42ULL, 0x75013843688c3ULL, 0x077a558a98f35ULL, 0x4106b166bcf44ULL}}},
+        {{{0x5ccd539e4ecf2ULL, 0x5a0aab756b490ULL, 0x5f7e0b56a8fceULL, 0x41f8a2f1a1cc9ULL, 0x1238b51e12142ULL}}, {{0x57a421cd23668ULL, 0x3a1d5dedfa05cULL, 0x49112012b67edULL, 0x198caa73393d8ULL, 0x7f792f9d2699fULL}}, {{0x06b925fd4d924ULL, 0x746c4d501a171ULL, 0x62af4498241bdULL, 0x267f669b3da5cULL, 0x2876beb1def34ULL}}},
+        {{{0x4b3333a8a85f8ULL, 0x13cf1afab1ab2ULL, 0x238d47d3a8ddaULL, 0x5da39dfcfa2afULL, 0x5507d7d2bc41eULL}}, {{0x4e93563144691ULL, 0x41ac3e47e9b90ULL, 0x2a6a3558cbfa2ULL, 0x469a655400309ULL, 0x48f9dbfa0e991ULL}}, {{0x32903299572fcULL, 0x452a05a1dc39dULL, 0x73399edf2332aULL, 0x0f3c8dfd21a08ULL, 0x5784481964a83ULL}}},
+    },
+    {
+        {{{0x7d1ef5fddc09cULL, 0x7beeaebb9dad9ULL, 0x058d30ba0acfbULL, 0x5cd92eab5ae90ULL, 0x3041c6bb04ed2ULL}}, {{0x42b256768d593ULL, 0x2e88459427b4fULL, 0x02b3876630701ULL, 0x34878d405eae5ULL, 0x29cdd1adc088aULL}}, {{0x2f2f9d956e148ULL, 0x6b3e6ad65c1feULL, 0x5b00972b79e5dULL, 0x53d8d234c5dafULL, 0x104bbd6814049ULL}}},
+        {{{0x59a5fd67ff163ULL, 0x3a998ead0352bULL, 0x083c95fa4af9aULL, 0x6fadbfc01266fULL, 0x204f2a20fb072ULL}}, {{0x0fd3168f1ed67ULL, 0x1bb0de7784a3eULL, 0x34bcb78b20477ULL, 0x0a4a26e2e2182ULL, 0x5be8cc57092a7ULL}}, {{0x43b3d30ebb079ULL, 0x357aca5c61902ULL, 0x5b570c5d62455ULL, 0x30fb29e1e18c7ULL, 0x2570fb17c2791ULL}}},
+        {{{0x6a9550bb8245aULL, 0x511f20a1a2325ULL, 0x29324d7239beeULL, 0x3343cc37516c4ULL, 0x241c5f91de018ULL}}, {{0x2367f2cb61575ULL, 0x6c39ac04d87dfULL, 0x6d4958bd7e5bdULL, 0x566f4638a1532ULL, 0x3dcb65ea53030ULL}}, {{0x0172940de6caaULL, 0x6045b2e67451bULL, 0x56c07463efcb3ULL, 0x0728b6bfe6e91ULL, 0x08420edd5fcdfULL}}},
+        {{{0x0c34e04f410ceULL, 0x344edc0d0a06bULL, 0x6e45486d84d6dULL, 0x44e2ecb3863f5ULL, 0x04d654f321db8ULL}}, {{0x720ab8362fa4aULL, 0x29c4347cdd9bfULL, 0x0e798ad5f8463ULL, 0x4fef18bcb0bfeULL, 0x0d9a53efbc176ULL}}, {{0x5c116ddbdb5d5ULL, 0x6d1b4bba5abcfULL, 0x4d28a48a5537aULL, 0x56b8e5b040b99ULL, 0x4a7a4f2618991ULL}}},
+        {{{0x3b291af372a4bULL, 0x60e3028fe4498ULL, 0x2267bca4f6a09ULL, 0x719eec242b243ULL, 0x4a96314223e0eULL}}, {{0x718025fb15f95ULL, 0x68d6b8371fe94ULL, 0x3804448f7d97cULL, 0x42466fe784280ULL, 0x11b50c4cddd31ULL}}, {{0x0274408a4ffd6ULL, 0x7d382aedb34ddULL, 0x40acfc9ce385dULL, 0x628bb99a45b1eULL, 0x4f4bce4dce6bcULL}}},
+        {{{0x2616ec49d0b6fULL, 0x1f95d8462e61cULL, 0x1ad3e9b9159c6ULL, 0x79ba475a04df9ULL, 0x3042cee561595ULL}}, {{0x7ce5ae2242584ULL, 0x2d25eb153d4e3ULL, 0x3a8f3d09ba9c9ULL, 0x0f3690d04eb8eULL, 0x73fcdd14b71c0ULL}}, {{0x67079449bac41ULL, 0x5b79c4621484fULL, 0x61069f2156b8dULL, 0x0eb26573b10afULL, 0x389e740c9a9ceULL}}},
+        {{{0x578f6570eac28ULL, 0x644f2339c3937ULL, 0x66e47b7956c2cULL, 0x34832fe1f55d0ULL, 0x25c425e5d6263ULL}}, {{0x4b3ae34dcb9ceULL, 0x47c691a15ac9fULL, 0x318e06e5d400cULL, 0x3c422d9f83eb1ULL, 0x61545379465a6ULL}}, {{0x606a6f1d7de6eULL, 0x4f1c0c46107e7ULL, 0x229b1dcfbe5d8ULL, 0x3acc60a7b1327ULL, 0x6539a08915484ULL}}},
+        {{{0x4dbd414bb4a19ULL, 0x7930849f1dbb8ULL, 0x329c5a466caf0ULL, 0x6c824544feb9bULL, 0x0f65320ef019bULL}}, {{0x21f74c3d2f773ULL, 0x024b88d08bd3aULL, 0x6e678cf054151ULL, 0x43631272e747cULL, 0x11c5e4aac5cd1ULL}}, {{0x6d1b1cafde0c6ULL, 0x462c76a303a90ULL, 0x3ca4e693cff9bULL, 0x3952cd45786fdULL, 0x4cabc7bdec330ULL}}},
+    },
+    {
+        {{{0x0a19c1a54a044ULL, 0x48ef7b3f77ef8ULL, 0x3c8a5c9287178ULL, 0x706d371e508adULL, 0x1819bb953f2e9ULL}}, {{0x2a8fb532f7428ULL, 0x408d49c4e42dfULL, 0x67a92036f50baULL, 0x781a99bb29dc5ULL, 0x4065947223973ULL}}, {{0x7bb795e042e84ULL, 0x34ed316e28931ULL, 0x7f98a55f43762ULL, 0x29245fd85d213ULL, 0x36ba82e721200ULL}}},
+        {{{0x69d0a57274ed5ULL, 0x64c100962f91aULL, 0x1577eb116ea00ULL, 0x19cef9e6d0811ULL, 0x77d221232709bULL}}, {{0x6cbb74245ec41ULL, 0x3c68690e2dac1ULL, 0x08a137bf66fa2ULL, 0x6da6492057f72ULL, 0x4472f648d0531ULL}}, {{0x26d7064ad94d8ULL, 0x7b35ec44c6931ULL, 0x70507d296d723ULL, 0x2c646547682a2ULL, 0x2c63bec3662d3ULL}}},
+        {{{0x18b3a8586f8bfULL, 0x6d97632de134aULL, 0x0e173ca7b9c6bULL, 0x468d50312f351ULL, 0x1deb2176ddd7cULL}}, {{0x60d8bea787955ULL, 0x7d6be8036effcULL, 0x4d5733ae77045ULL, 0x76fc8e3e04d0cULL, 0x22692ef59442bULL}}, {{0x3d19a2066cf6cULL, 0x189b98f9af0acULL, 0x4363d89006ff6ULL, 0x02f6cbb535f66ULL, 0x67cfd773a278bULL}}},
+        {{{0x7a9855a4e586aULL, 0x48937d56fc5abULL, 0x074cf4d97e3deULL, 0x6f75503a6eef9ULL, 0x185cba721bcb9ULL}}, {{0x431faef3ee475ULL, 0x153c45fb251bdULL, 0x09b2ac6676ffeULL, 0x05ca89688aca7ULL, 0x0cde561eec431ULL}}, {{0x69da3f4e3cb41ULL, 0x6a81ef2efd270ULL, 0x118ee0efc0e4bULL, 0x7768131027e68ULL, 0x3ec91a769eec6ULL}}},
+        {{{0x52fb7b0a3402fULL, 0x17f6d3e9501f5ULL, 0x7e3aa9919857bULL, 0x44b7ba2de6462ULL, 0x7a5fa8794a94eULL}}, {{0x5f75bf78166adULL, 0x71d619af5e3d3ULL, 0x7abe62137f6a0ULL, 0x67e5d00176c60ULL, 0x13fedb3e11f33ULL}}, {{0x58faa13cd67a1ULL, 0x0317b76a2ea52ULL, 0x22116ce597b82ULL, 0x5478b72c6d517ULL, 0x357d397d5499dULL}}},
+        {{{0x5acb4194bfbf8ULL, 0x6375cb0532903ULL, 0x44dca8135df8fULL, 0x4f08f7a30973eULL, 0x3a8d867e70ff6ULL}}, {{0x7a05fb0bace6cULL, 0x18395f343c3d7ULL, 0x60ad86b24d188ULL, 0x7f6663b8e620eULL, 0x2d94a16aa5f74ULL}}, {{0x0cd5d55aff958ULL, 0x38eaacee42debULL, 0x59489f6e8faa9ULL, 0x1af3ae091ccc8ULL, 0x69be1343c2f2bULL}}},
+        {{{0x3bdac684b8de3ULL, 0x207f940e31057ULL, 0x25aaaa28bd31fULL, 0x1bb19bfc97df0ULL, 0x200d4d8c63587ULL}}, {{0x11d5ee197c92aULL, 0x3e528a233e1c1ULL, 0x0d3a6713d4406ULL, 0x34b0a1b3cdcf8ULL, 0x7d88112e4d24cULL}}, {{0x2ed4b4893b32bULL, 0x7d7cb372c8411ULL, 0x697941cfbefc8ULL, 0x6ca6bb16f586dULL, 0x69607bd681bd9ULL}}},
+        {{{0x73bd49323a902ULL, 0x2cd658dca676fULL, 0x1e14a9df086d5ULL, 0x70072dd47fa9dULL, 0x28bc77a5838ecULL}}, {{0x6021068de1ce1ULL, 0x4e1db9783fed7ULL, 0x5541697a35463ULL, 0x7e871f7fee80dULL, 0x35f63353d3ec3ULL}}, {{0x278a8e25d8036ULL, 0x0128666920c77ULL, 0x23394c98d9478ULL, 0x292246c179014ULL, 0x3a31abfa36b57ULL}}},
+    },
+    {
+        {{{0x7788f3f78d289ULL, 0x5942809b3f811ULL, 0x5973277f8c29cULL, 0x010f93bc5fe67ULL, 0x7ee498165acb2ULL}}, {{0x69624089c0a2eULL, 0x0075fc8e70473ULL, 0x13e84ab1d2313ULL, 0x2c10bedf6953bULL, 0x639b93f0321c8ULL}}, {{0x508e39111a1c3ULL, 0x290120e912f7aULL, 0x1cbf464acae43ULL, 0x15373e9576157ULL, 0x0edf493c85b60ULL}}},
+        {{{0x7c4d284764113ULL, 0x7fefebf06acecULL, 0x39afb7a824100ULL, 0x1b48e47e7fd65ULL, 0x04c00c54d1dfaULL}}, {{0x48158599b5a68ULL, 0x1fd75bc41d5d9ULL, 0x2d9fc1fa95d3cULL, 0x7da27f20eba11ULL, 0x403b92e3019d4ULL}}, {{0x22f818b465cf8ULL, 0x342901dff09b8ULL, 0x31f595dc683cdULL, 0x37a57745fd682ULL, 0x355bb12ab2617ULL}}},
+        {{{0x1dac75a8c7318ULL, 0x3b679d5423460ULL, 0x6b8fcb7b6400eULL, 0x6c73783be5f9dULL, 0x7518eaf8e052aULL}}, {{0x664cc7493bbf4ULL, 0x33d94761874e3ULL, 0x0179e1796f613ULL, 0x1890535e2867dULL, 0x0f9b8132182ecULL}}, {{0x059c41b7f6c32ULL, 0x79e8706531491ULL, 0x6c747643cb582ULL, 0x2e20c0ad494e4ULL, 0x47c3871bbb175ULL}}},
+        {{{0x65d50c85066b0ULL, 0x6167453361f7cULL, 0x06ba3818bb312ULL, 0x6aff29baa7522ULL, 0x08fea02ce8d48ULL}}, {{0x4539771ec4f48ULL, 0x7b9318badca28ULL, 0x70f19afe016c5ULL, 0x4ee7bb1608d23ULL, 0x00b89b8576469ULL}}, {{0x5dd7668deead0ULL, 0x4096d0ba47049ULL, 0x6275997219114ULL, 0x29bda8a67e6aeULL, 0x473829a74f75dULL}}},
+        {{{0x1533aad3902c9ULL, 0x1dde06b11e47bULL, 0x784bed1930b77ULL, 0x1c80a92b9c867ULL, 0x6c668b4d44e4dULL}}, {{0x2da754679c418ULL, 0x3164c31be105aULL, 0x11fac2b98ef5fULL, 0x35a1aaf779256ULL, 0x2078684c4833cULL}}, {{0x0cf217a78820cULL, 0x65024e7d2e769ULL, 0x23bb5efdda82aULL, 0x19fd4b632d3c6ULL, 0x7411a6054f8a4ULL}}},
+        {{{0x2e53d18b175b4ULL, 0x33e7254204af3ULL, 0x3bcd7d5a1c4c5ULL, 0x4c7c22af65d0fULL, 0x1ec9a872458c3ULL}}, {{0x59d32b99dc86dULL, 0x6ac075e22a9acULL, 0x30b9220113371ULL, 0x27fd9a638966eULL, 0x7c136574fb813ULL}}, {{0x6a4d400a2509bULL, 0x041791056971cULL, 0x655d5866e075cULL, 0x2302bf3e64df8ULL, 0x3add88a5c7cd6ULL}}},
+        {{{0x298d459393046ULL, 0x30bfecb3d90b8ULL, 0x3d9b8ea3df8d6ULL, 0x3900e96511579ULL, 0x61ba1131a406aULL}}, {{0x15770b635dcf2ULL, 0x59ecd83f79571ULL, 0x2db461c0b7fbdULL, 0x73a42a981345fULL, 0x249929fccc879ULL}}, {{0x0a0f116959029ULL, 0x5974fd7b1347aULL, 0x1e0cc1c08edadULL, 0x673bdf8ad1f13ULL, 0x5620310cbbd8eULL}}},
+        {{{0x6b5f477e285d6ULL, 0x4ed91ec326cc8ULL, 0x6d6537503a3fdULL, 0x626d3763988d5ULL, 0x7ec846f3658ceULL}}, {{0x193434934d643ULL, 0x0d4a2445eaa51ULL, 0x7d0708ae76fe0ULL, 0x39847b6c3c7e1ULL, 0x37676a2a4d9d9ULL}}, {{0x68f3f1da22ec7ULL, 0x6ed8039a2736bULL, 0x2627ee04c3c75ULL, 0x6ea90a647e7d1ULL, 0x6daaf723399b9ULL}}},
+    },
+    {
+        {{{0x6bbdd2cd13070ULL, 0x4bf0b41d3d035ULL, 0x37ffb2e58b90cULL, 0x0736f49c8d565ULL, 0x53177fda52c23ULL}}, {{0x64a5610628564ULL, 0x795169be68b23ULL, 0x68e390ca92ee1ULL, 0x2376f1512b973ULL, 0x3cbdabd9fee50ULL}}, {{0x4970650b9de79ULL, 0x7786036b374f7ULL, 0x5ab8e30f44a9fULL, 0x4ee0132973469ULL, 0x79d739835a619ULL}}},
+        {{{0x1d9920d591737ULL, 0x25d368d9ac439ULL, 0x626ff2a6fa907ULL, 0x7fc7107421006ULL, 0x79d99f946eae5ULL}}, {{0x54df64131c1bdULL, 0x430dd8b045b26ULL, 0x167cf09d60252ULL, 0x1412232770972ULL, 0x6c11fce4cb133ULL}}, {{0x3483568673205ULL, 0x507955b2d9e2fULL, 0x3ff8e18e1f7abULL, 0x2ccb0da38feabULL, 0x31741195b745aULL}}},
+        {{{0x0ba683b02a047ULL, 0x2dfddf6d902ffULL, 0x55b2f89408482ULL, 0x0adb809cdf10aULL, 0x203e44a11d989ULL}}, {{0x10190b77a360bULL, 0x41332bce05d1aULL, 0x0091eaa66e60cULL, 0x543dea7effc7dULL, 0x2772e344e0d36ULL}}, {{0x63eba37b9e39fULL, 0x52e476b447ad0ULL, 0x1701d88416f05ULL, 0x46a0827b22cd3ULL, 0x567951295b4d3ULL}}},
+        {{{0x42eb30d4b497fULL, 0x0d7379990e0e4ULL, 0x045bd147be58cULL, 0x5821bca849a6cULL, 0x05468d6201405ULL}}, {{0x7d60613037524ULL, 0x6d61f784d4a6bULL, 0x7a642bb8842b7ULL, 0x5fcd646854d91ULL, 0x47204d08d72fdULL}}, {{0x565a9f93267deULL, 0x1b81ab1d1401eULL, 0x4638a3b3b3f5eULL, 0x1a9510af16e79ULL, 0x4599ee919b633ULL}}},
+        {{{0x46d6b861ae579ULL, 0x21ed5d53b958eULL, 0x095b530c6ac19ULL, 0x2ef120eb308a0ULL, 0x2f485e853d21aULL}}, {{0x220ca70e0e76bULL, 0x31d53e6129a78ULL, 0x49c4a0ac4afa9ULL, 0x01414a6ef6461ULL, 0x0c3539e1a1d1dULL}}, {{0x744839c0833f3ULL, 0x7fa5578908652ULL, 0x4d6205dbf9895ULL, 0x4de2993e8c0a5ULL, 0x65712585893feULL}}},
+        {{{0x29f1bd708ee3fULL, 0x0b5cc80fa1038ULL, 0x28fae9f772d68ULL, 0x418cbd760ebe9ULL, 0x1590521a91d50ULL}}, {{0x02fb732a61161ULL, 0x3a69aa4151382ULL, 0x66a45db923843ULL, 0x0031b2e31aa37ULL, 0x32f6fe4c046f6ULL}}, {{0x3a11ec7910accULL, 0x71e2da4f5c814ULL, 0x6c65752404f7fULL, 0x2318d4b906c55ULL, 0x1bb9fe452ea98ULL}}},
+        {{{0x66c95cc36747cULL, 0x26d617861b9ebULL, 0x1e5ebc0a50805ULL, 0x1e4a29d633e77ULL, 0x5eae6ab32a8bbULL}}, {{0x1d950b3d54f9eULL, 0x7dc01a6783d3aULL, 0x13f1ab0b57e72ULL, 0x664a8e1632b50ULL, 0x65c091ee3c1cbULL}}, {{0x3661114f118eaULL, 0x772869395ae10ULL, 0x3a67d00acdee1ULL, 0x34c3939fa8e5aULL, 0x78a2a95823d75ULL}}},
+        {{{0x23c425ef83207ULL, 0x279352696b69eULL, 0x7f61fdeafe253ULL, 0x098683846099cULL, 0x1876789117166ULL}}, {{0x072e95c8c2aceULL, 0x2cca3d3897456ULL, 0x39ed0ada73ff2ULL, 0x759a219477c21ULL, 0x5dd996c122aadULL}}, {{0x35ef0670c507cULL, 0x057278677f24bULL, 0x37400fe066f21ULL, 0x63a083c974d38ULL, 0x59ad4b7a6e28dULL}}},
+    },
+    {
+        {{{0x304bfacad8ea2ULL, 0x502917d108b07ULL, 0x043176ca6dd0fULL, 0x5d5158f2c1d84ULL, 0x2b5449e58eb3bULL}}, {{0x27562eb3dbe47ULL, 0x291d7b4170be7ULL, 0x5d1ca67dfa8e1ULL, 0x2a88061f298a2ULL, 0x1304e9e71627dULL}}, {{0x014d26adc9cfeULL, 0x7f1691ba16f13ULL, 0x5e71828f06eacULL, 0x349ed07f0fffcULL, 0x4468de2d7c2ddULL}}},
+        {{{0x2d8c6f86307ceULL, 0x6286ba1850973ULL, 0x5e9dcb08444d4ULL, 0x1a96a543362b2ULL, 0x5da6427e63247ULL}}, {{0x3355e9419469eULL, 0x1847bb8ea8a37ULL, 0x1fe6588cf9b71ULL, 0x6b1c9d2db6b22ULL, 0x6cce7c6ffb44bULL}}, {{0x4c688deac22caULL, 0x6f775c3ff0352ULL, 0x565603ee419bbULL, 0x6544456c61c46ULL, 0x58f29abfe79f2ULL}}},
+        {{{0x264bf710ecdf6ULL, 0x708c58527896bULL, 0x42ceae6c53394ULL, 0x4381b21e82b6aULL, 0x6af93724185b4ULL}}, {{0x6cfab8de73e68ULL, 0x3e6efced4bd21ULL, 0x0056609500dbeULL, 0x71b7824ad85dfULL, 0x577629c4a7f41ULL}}, {{0x0024509c6a888ULL, 0x2696ab12e6644ULL, 0x0cca27f4b80d8ULL, 0x0c7c1f11b119eULL, 0x701f25bb0caecULL}}},
+        {{{0x0f6d97cbec113ULL, 0x4ce97fb7c93a3ULL, 0x139835a11281bULL, 0x728907ada9156ULL, 0x720a5bc050955ULL}}, {{0x0b0f8e4616cedULL, 0x1d3c4b50fb875ULL, 0x2f29673dc0198ULL, 0x5f4b0f1830ffaULL, 0x2e0c92bfbdc40ULL}}, {{0x709439b805a35ULL, 0x6ec48557f8187ULL, 0x08a4d1ba13a2cULL, 0x076348a0bf9aeULL, 0x0e9b9cbb144efULL}}},
+        {{{0x69bd55db1beeeULL, 0x6e14e47f731bdULL, 0x1a35e47270eacULL, 0x66f225478df8eULL, 0x366d44191cfd3ULL}}, {{0x2d48ffb5720adULL, 0x57b7f21a1df77ULL, 0x5550effba0645ULL, 0x5ec6a4098a931ULL, 0x221104eb3f337ULL}}, {{0x41743f2bc8c14ULL, 0x796b0ad8773c7ULL, 0x29fee5cbb689bULL, 0x122665c178734ULL, 0x4167a4e6bc593ULL}}},
+        {{{0x62665f8ce8feeULL, 0x29d101ac59857ULL, 0x4d93bbba59ffcULL, 0x17b7897373f17ULL, 0x34b33370cb7edULL}}, {{0x39d2876f62700ULL, 0x001cecd1d6c87ULL, 0x7f01a11747675ULL, 0x2350da5a18190ULL, 0x7938bb7e22552ULL}}, {{0x591ee8681d6ccULL, 0x39db0b4ea79b8ULL, 0x202220f380842ULL, 0x2f276ba42e0acULL, 0x1176fc6e2dfe6ULL}}},
+        {{{0x0e28949770eb8ULL, 0x5559e88147b72ULL, 0x35e1e6e63ef30ULL, 0x35b109aa7ff6fULL, 0x1f6a3e54f2690ULL}}, {{0x76cd05b9c619bULL, 0x69654b0901695ULL, 0x7a53710b77f27ULL, 0x79a1ea7d28175ULL, 0x08fc3a4c677d5ULL}}, {{0x4c199d30734eaULL, 0x6c622cb9acc14ULL, 0x5660a55030216ULL, 0x068f1199f11fbULL, 0x4f2fad0116b90ULL}}},
+        {{{0x4d91db73bb638ULL, 0x55f82538112c5ULL, 0x6d85a279815deULL, 0x740b7b0cd9cf9ULL, 0x3451995f2944eULL}}, {{0x6b24194ae4e54ULL, 0x2230afded8897ULL, 0x23412617d5071ULL, 0x3d5d30f35969bULL, 0x445484a4972efULL}}, {{0x2fcd09fea7d7cULL, 0x296126b9ed22aULL, 0x4a171012a05b2ULL, 0x1db92c74d5523ULL, 0x10b89ca604289ULL}}},
+    },
+    {
+        {{{0x4ded679d34aa0ULL, 0x01989b673facfULL, 0x574643f302e7bULL, 0x7f7d29ad22b71ULL, 0x2e05d9eaf61f6ULL}}, {{0x2426e3b646025ULL, 0x2070b9c99f365ULL, 0x5b7a914c849c6ULL, 0x73ad12e7fe16eULL, 0x06409010bea8dULL}}, {{0x7901ad61beb59ULL, 0x79cbb91015888ULL, 0x729a09d987c66ULL, 0x79312342a415bULL, 0x293c778cefe07ULL}}},
+        {{{0x795d6a11ff200ULL, 0x4562b02b922d8ULL, 0x54e56d72dc343ULL, 0x5a7c4f949904dULL, 0x50b8c2d031e47ULL}}, {{0x09e7007069096ULL, 0x2bc9ca03130d0ULL, 0x068051eab5d6cULL, 0x6af03f9ab8ad1ULL, 0x0487f3f112815ULL}}, {{0x50c08068a4962ULL, 0x26a2125934906ULL, 0x5bf2375bff741ULL, 0x2c58bd7a7a557ULL, 0x4b0553b53cdbaULL}}},
+        {{{0x5211b27c152d4ULL, 0x137a35ec737e0ULL, 0x1beae617b09a1ULL, 0x4202f05965547ULL, 0x054c8bdd50bd0ULL}}, {{0x5fcbe1b32ff79ULL, 0x3e076a1f3738cULL, 0x01f981badd7aaULL, 0x4847e76953636ULL, 0x35106cd551717ULL}}, {{0x0b12f1dcf073dULL, 0x476fed44ec714ULL, 0x5013e692d82a2ULL, 0x114ff6ad612e9ULL, 0x72e82d5e5505cULL}}},
+        {{{0x1cdfd69771d02ULL, 0x1ad9f7e2fc01bULL, 0x2c4bb1d0409dbULL, 0x430a62298360eULL, 0x2857bf1627500ULL}}, {{0x3697ff0d844c8ULL, 0x39b2f39692d61ULL, 0x7683c7eec4be1ULL, 0x108e952a0e360ULL, 0x7b7c242958ce7ULL}}, {{0x1903f0101689eULL, 0x277f0c200b3e4ULL, 0x7ac3c6f5de77fULL, 0x06a5091772f9eULL, 0x510df84b485a0ULL}}},
+        {{{0x3c887c70ac15eULL, 0x2ff7036e64496ULL, 0x5e3306ec3ce95ULL, 0x7c74d966f17f2ULL, 0x4cf7ed0703b54ULL}}, {{0x133bb9277a1faULL, 0x44c732246f4a8ULL, 0x74bc569d3b0edULL, 0x51d0d1e2a6e1aULL, 0x2d347144e482bULL}}, {{0x47c6598fbee0fULL, 0x4556ab7c5ad7aULL, 0x1d84316791ccfULL, 0x5520849fb1209ULL, 0x4e05e26ad0a1eULL}}},
+        {{{0x3c773e18fe6c0ULL, 0x35a790e4ca306ULL, 0x45aca0f8f11c4ULL, 0x6dc1dfe9e2780ULL, 0x1955875eb4cd4ULL}}, {{0x36b624b531f20ULL, 0x1ceea13577b53ULL, 0x08f2e010a69d8ULL, 0x7c16df4fa9174ULL, 0x618f1856880c8ULL}}, {{0x6de8f0e399799ULL, 0x4881fb42f0db4ULL, 0x0d58f75eb586aULL, 0x05759966c082fULL, 0x15f6beae2ae34ULL}}},
+        {{{0x20f7b9245e215ULL, 0x5bb3181b77753ULL, 0x082c083cda184ULL, 0x76d17427265f9ULL, 0x6ba92fe962d90ULL}}, {{0x3cb0c31ec3a62ULL, 0x0a2271e7850c5ULL, 0x76b0a920438adULL, 0x140bc47625c1cULL, 0x28f76867ae2a9ULL}}, {{0x5f9655884e2aaULL, 0x37b7a8cb4a7c9ULL, 0x7a79492f58befULL, 0x1ebebacb65506ULL, 0x6e8042ccb2b1bULL}}},
+        {{{0x0653616521f7eULL, 0x712c407b742a6ULL, 0x17c21e598341aULL, 0x3d8169cc4de2aULL, 0x4b5303af78ebdULL}}, {{0x53c29ce28ca6eULL, 0x01f96c127be21ULL, 0x3a8b4feeb4d15ULL, 0x45cf3a1376bd1ULL, 0x08af9d4e4ff29ULL}}, {{0x0a6c3bebcbde8ULL, 0x15b8751d12e5fULL, 0x6ff7de93c3f29ULL, 0x75bb7d4ea7463ULL, 0x0dcf2d679b624ULL}}},
+    },
+    {
+        {{{0x141be5a45f06eULL, 0x5adb38becaea7ULL, 0x3fd46db41f2bbULL, 0x6d488bbb5ce39ULL, 0x17d2d1d9ef0d4ULL}}, {{0x147499718289cULL, 0x0a48a67e4c7abULL, 0x30fbc544bafe3ULL, 0x0c701315fe58aULL, 0x20b878d577b75ULL}}, {{0x2af18073f3e6aULL, 0x33aea420d24feULL, 0x298008bf4ff94ULL, 0x3539171db961eULL, 0x72214f63cc65cULL}}},
+        {{{0x5b7b9f43b29c9ULL, 0x149ea31eea3b3ULL, 0x4be7713581609ULL, 0x2d87960395e98ULL, 0x1f24ac855a154ULL}}, {{0x37f405307a693ULL, 0x2e5e66cf2b69cULL, 0x5d84266ae9c53ULL, 0x5e4eb7de853b9ULL, 0x5fdf48c58171cULL}}, {{0x608328e9505aaULL, 0x22182841dc49aULL, 0x3ec96891d2307ULL, 0x2f363fff22e03ULL, 0x00ba739e2ae39ULL}}},
+        {{{0x426f5ea88bb26ULL, 0x33092e77f75c8ULL, 0x1a53940d819e7ULL, 0x1132e4f818613ULL, 0x72297de7d518dULL}}, {{0x698de5c8790d6ULL, 0x268b8545beb25ULL, 0x6d2648b96fedfULL, 0x47988ad1db07cULL, 0x03283a3e67ad7ULL}}, {{0x41dc7be0cb939ULL, 0x1b16c66100904ULL, 0x0a24c20cbc66dULL, 0x4a2e9efe48681ULL, 0x05e1296846271ULL}}},
+        {{{0x7bbc8242c4550ULL, 0x59a06103b35b7ULL, 0x7237e4af32033ULL, 0x726421ab3537aULL, 0x78cf25d38258cULL}}, {{0x2eeb32d9c495aULL, 0x79e25772f9750ULL, 0x6d747833bbf23ULL, 0x6cdd816d5d749ULL, 0x39c00c9c13698ULL}}, {{0x66b8e31489d68ULL, 0x573857e10e2b5ULL, 0x13be816aa1472ULL, 0x41964d3ad4bf8ULL, 0x006b52076b3ffULL}}},
+        {{{0x37e16b9ce082dULL, 0x1882f57853eb9ULL, 0x7d29eacd01fc5ULL, 0x2e76a59b5e715ULL, 0x7de2e9561a9f7ULL}}, {{0x0cfe19d95781cULL, 0x312cc621c453cULL, 0x145ace6da077cULL, 0x0912bef9ce9b8ULL, 0x4d57e3443bc76ULL}}, {{0x0d4f4b6a55ecbULL, 0x7ebb0bb733bceULL, 0x7ba6a05200549ULL, 0x4f6ede4e22069ULL, 0x6b2a90af1a602ULL}}},
+        {{{0x3f3245bb2d80aULL, 0x0e5f720f36efdULL, 0x3b9cccf60c06dULL, 0x084e323f37926ULL, 0x465812c8276c2ULL}}, {{0x3f4fc9ae61e97ULL, 0x3bc07ebfa2d24ULL, 0x3b744b55cd4a0ULL, 0x72553b25721f3ULL, 0x5fd8f4e9d12d3ULL}}, {{0x3beb22a1062d9ULL, 0x6a7063b82c9a8ULL, 0x0a5a35dc197edULL, 0x3c80c06a53defULL, 0x05b32c2b1cb16ULL}}},
+        {{{0x4a42c7ad58195ULL, 0x5c8667e799effULL, 0x02e5e74c850a1ULL, 0x3f0db614e869aULL, 0x31771a4856730ULL}}, {{0x05eccd24da8fdULL, 0x580bbfdf07918ULL, 0x7e73586873c6aULL, 0x74ceddf77f93eULL, 0x3b5556a37b471ULL}}, {{0x0c524e14dd482ULL, 0x283457496c656ULL, 0x0ad6bcfb6cd45ULL, 0x375d1e8b02414ULL, 0x4fc079d27a733ULL}}},
+        {{{0x48b440c86c50dULL, 0x139929cca3b86ULL, 0x0f8f2e44cdf2fULL, 0x68432117ba6b2ULL, 0x241170c2bae3cULL}}, {{0x138b089bf2f7fULL, 0x4a05bfd34ea39ULL, 0x203914c925ef5ULL, 0x7497fffe04e3cULL, 0x124567cecaf98ULL}}, {{0x1ab860ac473b4ULL, 0x5c0227c86a7ffULL, 0x71b12bfc24477ULL, 0x006a573a83075ULL, 0x3f8612966c870ULL}}},
+    },
+    {
+        {{{0x7dffe638c7bf3ULL, 0x407116932aa53ULL, 0x6b409277cae79ULL, 0x276f013d9a78dULL, 0x7bc92fc9b9fa7ULL}}, {{0x45303f7957be4ULL, 0x41c10b828a193ULL, 0x21401428f0c68ULL, 0x16d58390eb8e8ULL, 0x0aba390eab0bfULL}}, {{0x7ef2e801ad9f9ULL, 0x28f35fb4753f2ULL, 0x565ad420da5f5ULL, 0x470748359ffdeULL, 0x02672b37dd3fbULL}}},
+        {{{0x3a729398ca7f5ULL, 0x4af49093b7dd3ULL, 0x3151387ae7298ULL, 0x16414f594e73fULL, 0x232ca21ef736eULL}}, {{0x2ca8b260885e4ULL, 0x5905669838916ULL, 0x7d63dd290a1afULL, 0x152c9bf0d130bULL, 0x741d1fcbab2caULL}}, {{0x1423d253fcb17ULL, 0x55f473d6297ecULL, 0x1471ebc2200f3ULL, 0x0a5f8c3016fccULL, 0x0400f3a049e34ULL}}},
+        {{{0x3a412a06e7b06ULL, 0x0a591a4ac05dfULL, 0x1ea471c519e15ULL, 0x6f9efcb89f5ebULL, 0x32830ac7157eaULL}}, {{0x60476ba61c55bULL, 0x2f89a72e2d579ULL, 0x360b424da8f5bULL, 0x37db7592ceaf4ULL, 0x0c9176e984d75ULL}}, {{0x02a7ab73769e8ULL, 0x70eb631c581cfULL, 0x733ab84128175ULL, 0x41014a9291375ULL, 0x0d794f8383ebaULL}}},
+        {{{0x44ce7a7a2e1acULL, 0x7df5a3716ef7cULL, 0x57df26d047f64ULL, 0x58b0b9a50eb86ULL, 0x0d6592233127dULL}}, {{0x5f5cb9e1516f4ULL, 0x1ec9155c8bfe6ULL, 0x4ea7bcfba016fULL, 0x361786b9e15dcULL, 0x097b0bf22092aULL}}, {{0x3ab1521a9d733ULL, 0x55ac35764b891ULL, 0x32d0c169b0babULL, 0x533b12e360e63ULL, 0x7fc90fea93eb3ULL}}},
+        {{{0x7deb59c7cb23dULL, 0x52a650809d8a4ULL, 0x33cb1ea554e45ULL, 0x508eb21c940beULL, 0x6ce97dabf7d8fULL}}, {{0x0f1fe1f5c5926ULL, 0x3c764b17e8081ULL, 0x71c59a46a3cbdULL, 0x3bf2054a8d17eULL, 0x6598ee93c98b5ULL}}, {{0x5a8e50ef7c48fULL, 0x22de59ca644b6ULL, 0x4f794dfad80d0ULL, 0x581e2f3a8b9f2ULL, 0x73119fa08c12bULL}}},
+        {{{0x5b94d21f4774dULL, 0x58f12f6e4ef08ULL, 0x15948aefd8bc5ULL, 0x109338c2be01eULL, 0x3cd6a85295621ULL}}, {{0x0129453f1a4cbULL, 0x1391ea6f0fda6ULL, 0x2fb9ee6f39887ULL, 0x1467d6595899cULL, 0x3025798a9ea84ULL}}, {{0x4de923aeca999ULL, 0x00c5d1825e7fdULL, 0x2622b7af6a96cULL, 0x01b33dccefe4bULL, 0x3f52c02852661ULL}}},
+        {{{0x0bf99eec416c6ULL, 0x2f53a5ece324bULL, 0x37a92aeb22940ULL, 0x2b4b14aa4d58bULL, 0x05d0e85c99091ULL}}, {{0x2a48e2a1351c6ULL, 0x29f4fea7afffdULL, 0x60b77c4a1891dULL, 0x62c85add4f2baULL, 0x60c0104ba696aULL}}, {{0x5e020de9cbe97ULL, 0x2d6a179ee80a3ULL, 0x4477d97e81ff1ULL, 0x7269bc6764f87ULL, 0x36853c69ab96dULL}}},
+        {{{0x3c0b0fac5e7beULL, 0x0a9811b97c886ULL, 0x25e3e6dc92ebaULL, 0x7e478f9266223ULL, 0x4a0aff6d62825ULL}}, {{0x1b8de78f39b2dULL, 0x63508f73d86dbULL, 0x6f4ff79fd0bb5ULL, 0x735920e68eb3cULL, 0x6a704fec92fbcULL}}, {{0x7fb9e61095301ULL, 0x28054125f1d22ULL, 0x198642f040b7eULL, 0x71bdf84f17afdULL, 0x681109bee0dcfULL}}},
+    },
+    {
+        {{{0x0fcfa36048d13ULL, 0x66e7133bbb383ULL, 0x64b42a8a45676ULL, 0x4ea6e4f9a85cfULL, 0x26f57eee878a1ULL}}, {{0x20cc9782a0ddeULL, 0x65d4e3070aab3ULL, 0x7bc8e31547736ULL, 0x09ebfb1432d98ULL, 0x504aa77679736ULL}}, {{0x32cd55687efb1ULL, 0x4448f5e2f6195ULL, 0x568919d460345ULL, 0x034c2e0ad1a27ULL, 0x4041943d9dba3ULL}}},
+        {{{0x17743a26caaddULL, 0x48c9156f9c964ULL, 0x7ef278d1e9ad0ULL, 0x00ce58ea7bd01ULL, 0x12d931429800dULL}}, {{0x0eeba43ebcc96ULL, 0x384dd5395f878ULL, 0x1df331a35d272ULL, 0x207ecfd4af70eULL, 0x1420a1d976843ULL}}, {{0x67799d337594fULL, 0x01647548f6018ULL, 0x57fce5578f145ULL, 0x009220c142a71ULL, 0x1b4f92314359aULL}}},
+        {{{0x73030a49866b1ULL, 0x2442be90b2679ULL, 0x77bd3d8947dcfULL, 0x1fb55c1552028ULL, 0x5ff191d56f9a2ULL}}, {{0x4109d89150951ULL, 0x225bd2d2d47cbULL, 0x57cc080e73beaULL, 0x6d71075721fcbULL, 0x239b572a7f132ULL}}, {{0x6d433ac2d9068ULL, 0x72bf930a47033ULL, 0x64facf4a20eadULL, 0x365f7a2b9402aULL, 0x020c526a758f3ULL}}},
+        {{{0x1ef59f042cc89ULL, 0x3b1c24976dd26ULL, 0x31d665cb16272ULL, 0x28656e470c557ULL, 0x452cfe0a5602cULL}}, {{0x034f89ed8dbbcULL, 0x73b8f948d8ef3ULL, 0x786c1d323caabULL, 0x43bd4a9266e51ULL, 0x02aacc4615313ULL}}, {{0x0f7a0647877dfULL, 0x4e1cc0f93f0d4ULL, 0x7ec4726ef1190ULL, 0x3bdd58bf512f8ULL, 0x4cfb7d7b304b8ULL}}},
+        {{{0x699c29789ef12ULL, 0x63beae321bc50ULL, 0x325c340adbb35ULL, 0x562e1a1e42bf6ULL, 0x5b1d4cbc434d3ULL}}, {{0x43d6cb89b75feULL, 0x3338d5b900e56ULL, 0x38d327d531a53ULL, 0x1b25c61d51b9fULL, 0x14b4622b39075ULL}}, {{0x32615cc0a9f26ULL, 0x57711b99cb6dfULL, 0x5a69c14e93c38ULL, 0x6e88980a4c599ULL, 0x2f98f71258592ULL}}},
+        {{{0x2ae444f54a701ULL, 0x615397afbc5c2ULL, 0x60d7783f3f8fbULL, 0x2aa675fc486baULL, 0x1d8062e9e7614ULL}}, {{0x4a74cb50f9e56ULL, 0x531d1c2640192ULL, 0x0c03d9d6c7fd2ULL, 0x57ccd156610c1ULL, 0x3a6ae249d806aULL}}, {{0x2da85a9907c5aULL, 0x6b23721ec4cafULL, 0x4d2d3a4683aa2ULL, 0x7f9c6870efdefULL, 0x298b8ce8aef25ULL}}},
+        {{{0x272ea0a2165deULL, 0x68179ef3ed06fULL, 0x4e2b9c0feac1eULL, 0x3ee290b1b63bbULL, 0x6ba6271803a7dULL}}, {{0x27953eff70cb2ULL, 0x54f22ae0ec552ULL, 0x29f3da92e2724ULL, 0x242ca0c22bd18ULL, 0x34b8a8404d5ceULL}}, {{0x6ecb583693335ULL, 0x3ec76bfdfb84dULL, 0x2c895cf56a04fULL, 0x6355149d54d52ULL, 0x71d62bdd465e1ULL}}},
+        {{{0x5b5dab1f75ef5ULL, 0x1e2d60cbeb9a5ULL, 0x527c2175dfe57ULL, 0x59e8a2b8ff51fULL, 0x1c333621262b2ULL}}, {{0x3cc28d378df80ULL, 0x72141f4968ca6ULL, 0x407696bdb6d0dULL, 0x5d271b22ffcfbULL, 0x74d5f317f3172ULL}}, {{0x7e55467d9ca81ULL, 0x6a5653186f50dULL, 0x6b188ece62df1ULL, 0x4c66d36844971ULL, 0x4aebcc4547e9dULL}}},
+    },
+    {
+        {{{0x1b204a059a445ULL, 0x54962f5a1e1bdULL, 0x5e7155f8572d2ULL, 0x40df0ddf6290fULL, 0x2633f1b9d0710ULL}}, {{0x75a7205d21a77ULL, 0x45a77269a8a62ULL, 0x577ab72c30110ULL, 0x7c656ecf925eeULL, 0x074f46e69f10fULL}}, {{0x34177018b9910ULL, 0x38d81fc28183fULL, 0x5531bfe9ba883ULL, 0x03d6b30f9f3a1ULL, 0x5ecb72e6f1a34ULL}}},
+        {{{0x2e106e8e86997ULL, 0x7f31a12707fddULL, 0x01bafbe618ccdULL, 0x1684a38240755ULL, 0x038b6898d4c5cULL}}, {{0x5a31b2259fb4eULL, 0x2e57958a5f4a2ULL, 0x4d1532c2583ceULL, 0x00cf6da97f646ULL, 0x382e2720c476cULL}}, {{0x1c51d8ace50a6ULL, 0x735c5a5291e72ULL, 0x4932a00c50b42ULL, 0x7546da6ad0d3fULL, 0x21aeba8b59250ULL}}},
+        {{{0x53600f0087f23ULL, 0x73b4faaf08a70ULL, 0x07da181311861ULL, 0x476b57981ef5aULL, 0x0a3c16c5c27c1ULL}}, {{0x13b34cf405530ULL, 0x14861115ee49eULL, 0x01a9208f113a9ULL, 0x436aeeae28b80ULL, 0x118eb8f8890b0ULL}}, {{0x49c17cc947f3dULL, 0x4d5583a4f62fcULL, 0x3c2395b331bb6ULL, 0x1b5efb0496758ULL, 0x4909b3e22c67cULL}}},
+        {{{0x16676706ff64eULL, 0x3a1b0d4a7ab34ULL, 0x1702e5842e54fULL, 0x6342c2470f367ULL, 0x2d8b78e712780ULL}}, {{0x485ea63fe2e89ULL, 0x221d2825d9393ULL, 0x3eff9eef86ebeULL, 0x5b647bdd54543ULL, 0x0fb17f9fef968ULL}}, {{0x5c62eafc3902bULL, 0x2513d00e50f3aULL, 0x40482e5dce885ULL, 0x536e1c5732070ULL, 0x09ae23717b2b1ULL}}},
+        {{{0x38fa1ad32b1d0ULL, 0x37c4ef1648215ULL, 0x4f7a43fa6b3b4ULL, 0x4cb5442b5e01bULL, 0x66f35ddddda53ULL}}, {{0x2192a4e4d083cULL, 0x460053c32576dULL, 0x3eaebacd2b381ULL, 0x5564c122d2cd5ULL, 0x6d9c8a9ada97fULL}}, {{0x59afb24997323ULL, 0x7dede03a5da4fULL, 0x4bb31fc6edf81ULL, 0x6e415d3a396faULL, 0x03019b4f646f9ULL}}},
+        {{{0x1b214e6b3dc6bULL, 0x6b5afa5ecb5e1ULL, 0x0288ec0fdd5ceULL, 0x2fbe80cecc408ULL, 0x392b63a58b5c3ULL}}, {{0x186b5565345cdULL, 0x21798822d4094ULL, 0x3eca917bb9d98ULL, 0x289344e39da3cULL, 0x387dcbff65697ULL}}, {{0x3addc9c07c205ULL, 0x2bea6586fc812ULL, 0x60d00ab1596f8ULL, 0x19731edf67e8aULL, 0x61722b4aef2e0ULL}}},
+        {{{0x07a5581cb0e3cULL, 0x0db28892d3ad6ULL, 0x373687ca43fc0ULL, 0x72c843405b50bULL, 0x5568d2b75a06dULL}}, {{0x2aafeecbd47afULL, 0x7639a8c612002ULL, 0x59f1cb156899bULL, 0x214f901f5b404ULL, 0x39633944ca3c1ULL}}, {{0x4b88c1b37cfe1ULL, 0x460a7031e71a1ULL, 0x61f656416da96ULL, 0x7b27974de025bULL, 0x6beba1249add7ULL}}},
+        {{{0x4ecb943f5a53bULL, 0x3a0d811be4b87ULL, 0x625511e732698ULL, 0x7eae7dd31cd42ULL, 0x5a845ae80df09ULL}}, {{0x6005ca5b1b143ULL, 0x70ffa39b443a0ULL, 0x7f3ff9db531aeULL, 0x752b77acb3b29ULL, 0x097c29e8c1ce1ULL}}, {{0x17dbe5deb94caULL, 0x7118e1389099dULL, 0x5a7425ce34290ULL, 0x3e1e21f676a50ULL, 0x0a1249fff7e58ULL}}},
+    },
+    {
+        {{{0x08d9e7354b610ULL, 0x26b750b6dc168ULL, 0x162881e01acc9ULL, 0x7966df31d01a5ULL, 0x173bd9ddc9a1dULL}}, {{0x0071b276d01c9ULL, 0x0b0d8918e025eULL, 0x75beea79ee2ebULL, 0x3c92984094db8ULL, 0x5d88fbf95a3dbULL}}, {{0x00f1efe5872dfULL, 0x5da872318256aULL, 0x59ceb81635960ULL, 0x18cf37693c764ULL, 0x06e1cd13b19eaULL}}},
+        {{{0x3af629e5b0353ULL, 0x204f1a088e8e5ULL, 0x10efc9ceea82eULL, 0x589863c2fa34bULL, 0x7f3a6a1a8d837ULL}}, {{0x0ad516f166f23ULL, 0x263f56d57c81aULL, 0x13422384638caULL, 0x1331ff1af0a50ULL, 0x3080603526e16ULL}}, {{0x644395d3d800bULL, 0x2b9203dbedefcULL, 0x4b18ce656a355ULL, 0x03f3466bc182cULL, 0x30d0fded2e513ULL}}},
+        {{{0x4971e68b84750ULL, 0x52ccc9779f396ULL, 0x3e904ae8255c8ULL, 0x4ecae46f39339ULL, 0x4615084351c58ULL}}, {{0x14d1af21233b3ULL, 0x1de1989b39c0bULL, 0x52669dc6f6f9eULL, 0x43434b28c3fc7ULL, 0x0a9214202c099ULL}}, {{0x019c0aeb9a02eULL, 0x1a2c06995d792ULL, 0x664cbb1571c44ULL, 0x6ff0736fa80b2ULL, 0x3bca0d2895ca5ULL}}},
+        {{{0x08eb69ecc01bfULL, 0x5b4c8912df38dULL, 0x5ea7f8bc2f20eULL, 0x120e516caafafULL, 0x4ea8b4038df28ULL}}, {{0x031bc3c5d62a4ULL, 0x7d9fe0f4c081eULL, 0x43ed51467f22cULL, 0x1e6cc0c1ed109ULL, 0x5631deddae8f1ULL}}, {{0x5460af1cad202ULL, 0x0b4919dd0655dULL, 0x7c4697d18c14cULL, 0x231c890bba2a4ULL, 0x24ce0930542caULL}}},
+        {{{0x7a155fdf30b85ULL, 0x1c6c6e5d487f9ULL, 0x24be1134bdc5aULL, 0x1405970326f32ULL, 0x549928a7324f4ULL}}, {{0x090f5fd06c106ULL, 0x6abb1021e43fdULL, 0x232bcfad711a0ULL, 0x3a5c13c047f37ULL, 0x41d4e3c28a06dULL}}, {{0x632a763ee1a2eULL, 0x6fa4bffbd5e4dULL, 0x5fd35a6ba4792ULL, 0x7b55e1de99de8ULL, 0x491b66dec0dcfULL}}},
+        {{{0x04a8ed0da64a1ULL, 0x5ecfc45096ebeULL, 0x5edee93b488b2ULL, 0x5b3c11a51bc8fULL, 0x4cf6b8b0b7018ULL}}, {{0x5b13dc7ea32a7ULL, 0x18fc2db73131eULL, 0x7e3651f8f57e3ULL, 0x25656055fa965ULL, 0x08f338d0c85eeULL}}, {{0x3a821991a73bdULL, 0x03be6418f5870ULL, 0x1ddc18eac9ef0ULL, 0x54ce09e998dc2ULL, 0x530d4a82eb078ULL}}},
+        {{{0x173456c9abf9eULL, 0x7892015100dadULL, 0x33ee14095fecbULL, 0x6ad95d67a0964ULL, 0x0db3e7e00cbfbULL}}, {{0x43630e1f94825ULL, 0x4d1956a6b4009ULL, 0x213fe2df8b5e0ULL, 0x05ce3a41191e6ULL, 0x65ea753f10177ULL}}, {{0x6fc3ee2096363ULL, 0x7ec36b96d67acULL, 0x510ec6a0758b1ULL, 0x0ed87df022109ULL, 0x02a4ec1921e1aULL}}},
+        {{{0x06162f1cf795fULL, 0x324ddcafe5eb9ULL, 0x018d5e0463218ULL, 0x7e78b9092428eULL, 0x36d12b5dec067ULL}}, {{0x6259a3b24b8a2ULL, 0x188b5f4170b9cULL, 0x681c0dee15debULL, 0x4dfe665f37445ULL, 0x3d143c5112780ULL}}, {{0x5279179154557ULL, 0x39f8f0741424dULL, 0x45e6eb357923dULL, 0x42c9b5edb746fULL, 0x2ef517885ba82ULL}}},
+    },
+    {
+        {{{0x436837c6da1e9ULL, 0x5e3f737b7c3d4ULL, 0x1774557e70626ULL, 0x729181800fe67ULL, 0x28a7c99ebc57bULL}}, {{0x5438cd11e0d4aULL, 0x1a8799e611117ULL, 0x64def30c32d84ULL, 0x106704d071bc8ULL, 0x4559135b25b17ULL}}, {{0x59399e8d19e9dULL, 0x172c4847ff71fULL, 0x71d0a8e420647ULL, 0x262595ca46ba3ULL, 0x37f33226d7fb4ULL}}},
+        {{{0x12553c821b11dULL, 0x0483c603be672ULL, 0x1088bf59bb50bULL, 0x3478337e60888ULL, 0x307a3b41c1921ULL}}, {{0x68767b55f6e08ULL, 0x66b64074041b5ULL, 0x2be31e5290eceULL, 0x3d1f1b92d3740ULL, 0x0f7a7fd1705faULL}}, {{0x35d076eb55ce0ULL, 0x7f541b24b51ddULL, 0x2db1ba0bf14daULL, 0x7a95f40c187eeULL, 0x556c7045827baULL}}},
+        {{{0x390022bf44406ULL, 0x7dff216a69729ULL, 0x3e1b4eaaf508dULL, 0x771bb0054b07dULL, 0x2f45abdac2322ULL}}, {{0x3517302e9d8b7ULL, 0x52490e29d11c5ULL, 0x2a582d78f9489ULL, 0x6d4dea7debba6ULL, 0x6f4b4199c5ecaULL}}, {{0x74912c8ef8a6aULL, 0x7c87f6dcbcc35ULL, 0x7509f3f963e93ULL, 0x0f5dad7e62eb7ULL, 0x6a5393281e1e1ULL}}},
+        {{{0x704fe149443cfULL, 0x330cb9bbae1ffULL, 0x47b46dd4f2b1bULL, 0x1ce989c2d81a9ULL, 0x5846a27cacd10ULL}}, {{0x25139a5d1ee89ULL, 0x79ff26d311e7bULL, 0x3862312051515ULL, 0x51e9fb117f680ULL, 0x0f513815db8b5ULL}}, {{0x5cdac1eb08717ULL, 0x2b21e5d3789feULL, 0x5ebea659fa2caULL, 0x45922049daf11ULL, 0x0d414bed8708bULL}}},
+        {{{0x06a92294ac9e8ULL, 0x0baaaa8f7d031ULL, 0x5c5660c8c58adULL, 0x200ca67de2201ULL, 0x50eb8fdb134bcULL}}, {{0x68265fd0e75f6ULL, 0x517721ce0f9f6ULL, 0x7e4b1eb916cf8ULL, 0x16eb921546f4fULL, 0x685b320193320ULL}}, {{0x73ec6d6b330cdULL, 0x0e265f5fe3816ULL, 0x2977b86139120ULL, 0x1693995b9a962ULL, 0x5d7c7cf1aa7cdULL}}},
+        {{{0x1013e9b73a562ULL, 0x2e91d84dc267aULL, 0x51a01624973bdULL, 0x21c53fe730a6eULL, 0x78b0fad41e9aaULL}}, {{0x346bf7a4aafa2ULL, 0x589a81a8235e7ULL, 0x1f0578ede1c17ULL, 0x6a688a7863565ULL, 0x3f364faaa9489ULL}}, {{0x6a431ed05b488ULL, 0x593892b8fd7eaULL, 0x7cd946a94cf99ULL, 0x619f43295d7c3ULL, 0x0241800059d66ULL}}},
+        {{{0x50c7dcf38ea01ULL, 0x016522f56c506ULL, 0x5c20bddf1b36fULL, 0x0f05673e7df42ULL, 0x4d2845aba2d9aULL}}, {{0x077fea37a5be4ULL, 0x05cb4bdd6f9d6ULL, 0x449c2e36d90bcULL, 0x14e61736862a3ULL, 0x4771b65538e45ULL}}, {{0x37fe0447070deULL, 0x06dbaaafbf76aULL, 0x0036f2f2e9d11ULL, 0x3fc69dad1a39bULL, 0x4aeabbe6f9ffdULL}}},
+        {{{0x134bcc4a9c8f2ULL, 0x39159c5c6ed44ULL, 0x44682ebefe3f4ULL, 0x5cf000571824cULL, 0x046e3a616bc89ULL}}, {{0x0119e40d8f78cULL, 0x0a78e21c228c6ULL, 0x44375e6806a6fULL, 0x272a4369592c4ULL, 0x1e6c47b3db032ULL}}, {{0x65442f03906beULL, 0x29c6c57c5429cULL, 0x708c31d280675ULL, 0x30e34666ff646ULL, 0x7cfb7e3faf6b8ULL}}},
+    },
+    {
+        {{{0x6bffb305b2f51ULL, 0x5b112b2d712ddULL, 0x35774974fe4e2ULL, 0x04af87a96e3a3ULL, 0x57968290bb3a0ULL}}, {{0x7974e8c58aedcULL, 0x7757e083488c6ULL, 0x601c62ae7bc8bULL, 0x45370c2ecab74ULL, 0x2f1b78fab143aULL}}, {{0x2b8430a20e101ULL, 0x1a49e1d88fee3ULL, 0x38bbb47ce4d96ULL, 0x1f0e7ba84d437ULL, 0x7dc43e35dc2aaULL}}},
+        {{{0x02a5c273e9718ULL, 0x32bc9dfb28b4fULL, 0x48df4f8d5db1aULL, 0x54c87976c028fULL, 0x044fb81d82d50ULL}}, {{0x66665887dd9c3ULL, 0x629760a6ab0b2ULL, 0x481e6c7243e6cULL, 0x097e37046fc77ULL, 0x7ef72016758ccULL}}, {{0x718c5a907e3d9ULL, 0x3b9c98c6b383bULL, 0x006ed255eccdcULL, 0x6976538229a59ULL, 0x7f79823f9c30dULL}}},
+        {{{0x41ff068f587baULL, 0x1c00a191bcd53ULL, 0x7b56f9c209e25ULL, 0x3781e5fccaabeULL, 0x64a9b0431c06dULL}}, {{0x4d239a3b513e8ULL, 0x29723f51b1066ULL, 0x642f4cf04d9c3ULL, 0x4da095aa09b7aULL, 0x0a4e0373d784dULL}}, {{0x3d6a15b7d2919ULL, 0x41aa75046a5d6ULL, 0x691751ec2d3daULL, 0x23638ab6721c4ULL, 0x071a7d0ace183ULL}}},
+        {{{0x4355220e14431ULL, 0x0e1362a283981ULL, 0x2757cd8359654ULL, 0x2e9cd7ab10d90ULL, 0x7c69bcf761775ULL}}, {{0x72daac887ba0bULL, 0x0b7f4ac5dda60ULL, 0x3bdda2c0498a4ULL, 0x74e67aa180160ULL, 0x2c3bcc7146ea7ULL}}, {{0x0d7eb04e8295fULL, 0x4a5ea1e6fa0feULL, 0x45e635c436c60ULL, 0x28ef4a8d4d18bULL, 0x6f5a9a7322acaULL}}},
+        {{{0x1d4eba3d944beULL, 0x0100f15f3dce5ULL, 0x61a700e367825ULL, 0x5922292ab3d23ULL, 0x02ab9680ee8d3ULL}}, {{0x1000c2f41c6c5ULL, 0x0219fdf737174ULL, 0x314727f127de7ULL, 0x7e5277d23b81eULL, 0x494e21a2e147aULL}}, {{0x48a85dde50d9aULL, 0x1c1f734493df4ULL, 0x47bdb64866889ULL, 0x59a7d048f8eecULL, 0x6b5d76cbea46bULL}}},
+        {{{0x141171e782522ULL, 0x6806d26da7c1fULL, 0x3f31d1bc79ab9ULL, 0x09f20459f5168ULL, 0x16fb869c03dd3ULL}}, {{0x7556cec0cd994ULL, 0x5eb9a03b7510aULL, 0x50ad1dd91cb71ULL, 0x1aa5780b48a47ULL, 0x0ae333f685277ULL}}, {{0x6199733b60962ULL, 0x69b157c266511ULL, 0x64740f893f1caULL, 0x03aa408fbf684ULL, 0x3f81e38b8f70dULL}}},
+        {{{0x37f355f17c824ULL, 0x07ae85334815bULL, 0x7e3abddd2e48fULL, 0x61eeabe1f45e5ULL, 0x0ad3e2d34cdedULL}}, {{0x10fcc7ed9affeULL, 0x4248cb0e96ff2ULL, 0x4311c115172e2ULL, 0x4c9d41cbf6925ULL, 0x50510fc104f50ULL}}, {{0x40fc5336e249dULL, 0x3386639fb2de1ULL, 0x7bbf871d17b78ULL, 0x75f796b7e8004ULL, 0x127c158bf0fa1ULL}}},
+        {{{0x28fc4ae51b974ULL, 0x26e89bfd2dbd4ULL, 0x4e122a07665cfULL, 0x7cab1203405c3ULL, 0x4ed82479d167dULL}}, {{0x17c422e9879a2ULL, 0x28a5946c8fec3ULL, 0x53ab32e912b77ULL, 0x7b44da09fe0a5ULL, 0x354ef87d07ef4ULL}}, {{0x3b52260c5d975ULL, 0x79d6836171fdcULL, 0x7d994f140d4bbULL, 0x1b6c404561854ULL, 0x302d92d205392ULL}}},
+    },
+    {
+        {{{0x38b8b0df53c30ULL, 0x151cc1e1312afULL, 0x15e5b78a871dcULL, 0x5e4dde3d3381aULL, 0x22a48f9a90c99ULL}}, {{0x1023fcb3efb7cULL, 0x338c78552898bULL, 0x71f8211b0bf2eULL, 0x26cdd20c87161ULL, 0x0e545daea5187ULL}}, {{0x5c0dc8d3fac58ULL, 0x59cdc857fad6fULL, 0x0034c15525f35ULL, 0x09b2a17be8dfaULL, 0x4159f47f048d9ULL}}},
+        {{{0x515a8bbd24839ULL, 0x0f5f6056aae90ULL, 0x68a85fddc4a0dULL, 0x078a85d156324ULL, 0x060525513ad73ULL}}, {{0x5660839e31e32ULL, 0x2b080b7ca0415ULL, 0x36af1a7e0786fULL, 0x4bafc03202b7aULL, 0x14d23dd4ce71bULL}}, {{0x18e098aa27f82ULL, 0x7713436049e47ULL, 0x5374931b5e60aULL, 0x0e1fd34a04210ULL, 0x71ab966fa3230ULL}}},
+        {{{0x08a0702809955ULL, 0x5416878723621ULL, 0x01a1bb50ec9cfULL, 0x276e54db3d77fULL, 0x605eecbf8335fULL}}, {{0x3d8e34ded02fcULL, 0x58b2de45545b9ULL, 0x00ca3684547cfULL, 0x5915e512aa1a7ULL, 0x35768fbe92411ULL}}, {{0x00a656c340431ULL, 0x4f1dcb385f064ULL, 0x4c03e2a7f35c5ULL, 0x17cbaea309fb8ULL, 0x7a912faf60f54ULL}}},
+        {{{0x74f8dfa2d5597ULL, 0x00a8ee26184a7ULL, 0x5ac4408979271ULL, 0x62500602972ccULL, 0x33cb966e33bb6ULL}}, {{0x4585e5edc1a43ULL, 0x5cb12f8e79640ULL, 0x1c120f27c385bULL, 0x4df2dc1605727ULL, 0x624a170e2bddfULL}}, {{0x028047f116909ULL, 0x383cac88ceb2eULL, 0x085ce1e0a2b10ULL, 0x1c23820bedef3ULL, 0x721627aefbac4ULL}}},
+        {{{0x097bc410b2f22ULL, 0x4f6b9f5089fa6ULL, 0x55f29d3c68176ULL, 0x48130944d0ef7ULL, 0x245ea199bb821ULL}}, {{0x03bc38736add5ULL, 0x5f8a6562612faULL, 0x406ef10bc508aULL, 0x7d39d534502b8ULL, 0x4c946cf7e74f9ULL}}, {{0x4a66978d477f8ULL, 0x785222ffc35dbULL, 0x032f5606262e8ULL, 0x1a8e7b9fcc1b9ULL, 0x67da12e6b8b56ULL}}},
+        {{{0x6f3d38ec8308cULL, 0x58e3d7295656fULL, 0x418aaf60a3f5fULL, 0x0a0c03e1d9b62ULL, 0x0cb64cb831a94ULL}}, {{0x7e187b4bd6e07ULL, 0x078fa3fce8e0cULL, 0x32168c1ba3c08ULL, 0x3c549e355179cULL, 0x76297d1f3d75aULL}}, {{0x0fc33534c6378ULL, 0x39ca83d0c2606ULL, 0x6cb1ca2e58d71ULL, 0x6e58aecd4df6cULL, 0x49233ea3f3775ULL}}},
+        {{{0x185fe1c9f249bULL, 0x2b42466526f67ULL, 0x37d35893f5acbULL, 0x2866759a2ca0dULL, 0x6987ff6f542deULL}}, {{0x398fa8dbffc3aULL, 0x5baa9b68aac52ULL, 0x3c94a5784bf94ULL, 0x5a8f9df08efedULL, 0x628b140dce5e7ULL}}, {{0x241428f83753cULL, 0x790cd5f32e8fcULL, 0x46a60a58c5efaULL, 0x596ed5dada19eULL, 0x074d8d245287fULL}}},
+        {{{0x075c6c0e31488ULL, 0x65c4406968903ULL, 0x4a0ed948650a6ULL, 0x3fcb911e4c518ULL, 0x3420d60b34227ULL}}, {{0x7d9cd440bfc31ULL, 0x435e631faf066ULL, 0x4b081c1ca74b2ULL, 0x4df502052523bULL, 0x46002ef03a734ULL}}, {{0x23adeaffe65f7ULL, 0x28b7c0ec99f54ULL, 0x459100de0987bULL, 0x1caa20e050f17ULL, 0x5aea8e567a87dULL}}},
+    },
+    {
+        {{{0x46fb6e4e0f177ULL, 0x53497ad5265b7ULL, 0x1ebdba01386fcULL, 0x0302f0cb36a3cULL, 0x0edc5f5eb426dULL}}, {{0x3c1a2bca4283dULL, 0x23430c7bb2f02ULL, 0x1a3ea1bb58bc2ULL, 0x7265763de5c61ULL, 0x10e5d3b76f1caULL}}, {{0x3bfd653da8e67ULL, 0x584953ec82a8aULL, 0x55e288fa7707bULL, 0x5395fc3931d81ULL, 0x45b46c51361cbULL}}},
+        {{{0x54ddd8a7fe3e4ULL, 0x2cecc41c619d3ULL, 0x43a6562ac4d91ULL, 0x4efa5aca7bdd9ULL, 0x5c1c0aef32122ULL}}, {{0x02abf314f7fa1ULL, 0x391d19e8a1528ULL, 0x6a2fa13895fc7ULL, 0x09d8eddeaa591ULL, 0x2177bfa36dcb7ULL}}, {{0x01bbcfa79db8fULL, 0x3d84beb3666e1ULL, 0x20c921d812204ULL, 0x2dd843d3b32ceULL, 0x4ae619387d8abULL}}},
+        {{{0x17e44985bfb83ULL, 0x54e32c626cc22ULL, 0x096412ff38118ULL, 0x6b241d61a246aULL, 0x75685abe5ba43ULL}}, {{0x3f6aa5344a32eULL, 0x69683680f11bbULL, 0x04c3581f623aaULL, 0x701af5875cba5ULL, 0x1a00d91b17bf3ULL}}, {{0x60933eb61f2b2ULL, 0x5193fe92a4dd2ULL, 0x3d995a550f43eULL, 0x3556fb93a883dULL, 0x135529b623b0eULL}}},
+        {{{0x716bce22e83feULL, 0x33d0130b83eb8ULL, 0x0952abad0afacULL, 0x309f64ed31b8aULL, 0x5972ea051590aULL}}, {{0x0dbd7add1d518ULL, 0x119f823e2231eULL, 0x451d66e5e7de2ULL, 0x500c39970f838ULL, 0x79b5b81a65ca3ULL}}, {{0x4ac20dc8f7811ULL, 0x29589a9f501faULL, 0x4d810d26a6b4aULL, 0x5ede00d96b259ULL, 0x4f7e9c95905f3ULL}}},
+        {{{0x0443d355299feULL, 0x39b7d7d5aee39ULL, 0x692519a2f34ecULL, 0x6e4404924cf78ULL, 0x1942eec4a144aULL}}, {{0x74bbc5781302eULL, 0x73135bb81ec4cULL, 0x7ef671b61483cULL, 0x7264614ccd729ULL, 0x31993ad92e638ULL}}, {{0x45319ae234992ULL, 0x2219d47d24fb5ULL, 0x4f04488b06cf6ULL, 0x53aaa9e724a12ULL, 0x2a0a65314ef9cULL}}},
+        {{{0x61acd3c1c793aULL, 0x58b46b78779e6ULL, 0x3369aacbe7af2ULL, 0x509b0743074d4ULL, 0x055dc39b6dea1ULL}}, {{0x7937ff7f927c2ULL, 0x0c2fa14c6a5b6ULL, 0x556bddb6dd07cULL, 0x6f6acc179d108ULL, 0x4cf6e218647c2ULL}}, {{0x1227cc28d5bb6ULL, 0x78ee9bff57623ULL, 0x28cb2241f893aULL, 0x25b541e3c6772ULL, 0x121a307710aa2ULL}}},
+        {{{0x1713ec77483c9ULL, 0x6f70572d5facbULL, 0x25ef34e22ff81ULL, 0x54d944f141188ULL, 0x527bb94a6ced3ULL}}, {{0x35d5e9f034a97ULL, 0x126069785bc9bULL, 0x5474ec7854ff0ULL, 0x296a302a348caULL, 0x333fc76c7a40eULL}}, {{0x5992a995b482eULL, 0x78dc707002ac7ULL, 0x5936394d01741ULL, 0x4fba4281aef17ULL, 0x6b89069b20a7aULL}}},
+        {{{0x2fa8cb5c7db77ULL, 0x718e6982aa810ULL, 0x39e95f81a1a1bULL, 0x5e794f3646cfbULL, 0x0473d308a7639ULL}}, {{0x2a0416270220dULL, 0x75f248b69d025ULL, 0x1cbbc16656a27ULL, 0x5b9ffd6e26728ULL, 0x23bc2103aa73eULL}}, {{0x6792603589e05ULL, 0x248db9892595dULL, 0x006a53cad2d08ULL, 0x20d0150f7ba73ULL, 0x102f73bfde043ULL}}},
+    },
+    {
+        {{{0x6cba293a36247ULL, 0x4564d1faca6b1ULL, 0x2807226be3e61ULL, 0x2922097bf4cb4ULL, 0x5786f312cd754ULL}}, {{0x2d50c7ec20d3eULL, 0x5d4192e4c76b4ULL, 0x7fdcd37192f75ULL, 0x55d2b74482960ULL, 0x4929c6f72b2ffULL}}, {{0x788ffca14032cULL, 0x5088fe3dc666eULL, 0x46f32b7ce4840ULL, 0x3c1c58a038f91ULL, 0x4c817b4bf2344ULL}}},
+        {{{0x3a057a40b4484ULL, 0x349ebed486827ULL, 0x3875872e930b8ULL, 0x629b0a5d052d7ULL, 0x78a1531a8b05dULL}}, {{0x053852871b96eULL, 0x56c187e3761ffULL, 0x4d1100b84fa7eULL, 0x225f77eaca992ULL, 0x0a37c37075b77ULL}}, {{0x5f1703ad0562bULL, 0x61924a4346d97ULL, 0x610939e3b3d20ULL, 0x2b7ed75e981feULL, 0x72ad82a42e5ecULL}}},
+        {{{0x0939167024bc3ULL, 0x5a92a05fb586dULL, 0x17d2ca639a745ULL, 0x5e27e79761e72ULL, 0x065f669ea3b4cULL}}, {{0x68e35bafb65f6ULL, 0x11e4e527427f3ULL, 0x3da8f40e75a7bULL, 0x736b65c66cac6ULL, 0x1734778173adaULL}}, {{0x0aec75532db4dULL, 0x4887c63763140ULL, 0x69fd456e1a693ULL, 0x6042507c2a969ULL, 0x19adeb7c303d7ULL}}},
+        {{{0x5ba7d43c31794ULL, 0x7f26644a4d3a0ULL, 0x065d0e091c323ULL, 0x5a9c191ef640bULL, 0x2852709881569ULL}}, {{0x0cb6153ead9a3ULL, 0x7ea256c6dd8e4ULL, 0x00a42c556cb25ULL, 0x77158f1adafeaULL, 0x2fd9ccf13b530ULL}}, {{0x5475b47f796b8ULL, 0x26a8591ea80f7ULL, 0x493e1fb4b1ec0ULL, 0x0eb16de91fa1dULL, 0x6551afd77b090ULL}}},
+        {{{0x24ce3a1d5c9acULL, 0x7a21fec8c2d14ULL, 0x74c59baedde8cULL, 0x11d87c3672212ULL, 0x56507c0950b96ULL}}, {{0x6baaf54aac27fULL, 0x596548b4508a8ULL, 0x0af3fa3dbd9bfULL, 0x42fac168dadabULL, 0x44b123f3920f7ULL}}, {{0x6f0b7d1713e63ULL, 0x322b75f8e8240ULL, 0x3676534d4ff8fULL, 0x5698ca675cb85ULL, 0x62fadd7cf9d03ULL}}},
+        {{{0x7bc61e7ce4594ULL, 0x536fba4cfc79aULL, 0x59bbc9f35acd6ULL, 0x388d04055e421ULL, 0x6ec7c46f59c79ULL}}, {{0x5967b5598a074ULL, 0x1d1c927c4b8d6ULL, 0x4a022217bfa47ULL, 0x0616a5b9622a4ULL, 0x20ef1149a2674ULL}}, {{0x7ad636f09a8a2ULL, 0x1c4840bcfa5e0ULL, 0x0d684e61a5f9bULL, 0x44be0577e02f7ULL, 0x15e80958b5f9dULL}}},
+        {{{0x1ed355bb061c4ULL, 0x5f28380e009baULL, 0x618d0390b7033ULL, 0x221b0982ee0feULL, 0x56b2cc930e55aULL}}, {{0x5ef7d0c3e235bULL, 0x7f7c269dce4b4ULL, 0x7170c9db0e705ULL, 0x79ce3ba709a16ULL, 0x021354b892021ULL}}, {{0x79da6a6bfc5a2ULL, 0x693fbc86d23beULL, 0x68e429c0bce89ULL, 0x1b1d991ecf966ULL, 0x7be0847b8774dULL}}},
+        {{{0x6f5af5307fa11ULL, 0x7bdad815e428cULL, 0x6928fee05ff31ULL, 0x6858536f22761ULL, 0x74071475bc927ULL}}, {{0x1cc5a8b3f55c3ULL, 0x4a7fbda541193ULL, 0x2dc28d818475cULL, 0x30cf694caff9bULL, 0x1f699a54d78a2ULL}}, {{0x292f373e7ea8aULL, 0x259608b463ceeULL, 0x49d3f78a594dfULL, 0x4b30de8329f69ULL, 0x2f9a2c4476bd2ULL}}},
+    },
+    {
+        {{{0x4dae0b5511c9aULL, 0x5257fffe0d456ULL, 0x54108d1eb2180ULL, 0x096cc0f9baefaULL, 0x3f6bd725da4eaULL}}, {{0x0b9ab7f5745c6ULL, 0x5caf0f8d21d63ULL, 0x7debea408ea2bULL, 0x09edb93896d16ULL, 0x36597d25ea5c0ULL}}, {{0x58d7b106058acULL, 0x3cdf8d20bee69ULL, 0x00a4cb765015eULL, 0x36832337c7cc9ULL, 0x7b7ecc19da60dULL}}},
+        {{{0x64a51a77cfa9bULL, 0x29cf470ca0db5ULL, 0x4b60b6e0898d9ULL, 0x55d04ddffe6c7ULL, 0x03bedc661bf5cULL}}, {{0x2373c695c690dULL, 0x4c0c8520dcf18ULL, 0x384af4b7494b9ULL, 0x4ab4a8ea22225ULL, 0x4235ad7601743ULL}}, {{0x0cb0d078975f5ULL, 0x292313e530c4bULL, 0x38dbb9124a509ULL, 0x350d0655a11f1ULL, 0x0e7ce2b0cdf06ULL}}},
+        {{{0x6fedfd94b70f9ULL, 0x2383f9745bfd4ULL, 0x4beae27c4c301ULL, 0x75aa4416a3f3fULL, 0x615256138aeceULL}}, {{0x4643ac48c85a3ULL, 0x6878c2735b892ULL, 0x3a53523f4d877ULL, 0x3a504ed8bee9dULL, 0x666e0a5d8fb46ULL}}, {{0x3f64e4870cb0dULL, 0x61548b16d6557ULL, 0x7a261773596f3ULL, 0x7724d5f275d3aULL, 0x7f0bc810d514dULL}}},
+        {{{0x49dad737213a0ULL, 0x745dee5d31075ULL, 0x7b1a55e7fdbe2ULL, 0x5ba988f176ea1ULL, 0x1d3a907ddec5aULL}}, {{0x06ba426f4136fULL, 0x3cafc0606b720ULL, 0x518f0a2359cdaULL, 0x5fae5e46feca7ULL, 0x0d1f8dbcf8eedULL}}, {{0x693313ed081dcULL, 0x5b0a366901742ULL, 0x40c872ca4ca7eULL, 0x6f18094009e01ULL, 0x00011b44a31bfULL}}},
+        {{{0x61f696a0aa75cULL, 0x38b0a57ad42caULL, 0x1e59ab706fdc9ULL, 0x01308d46ebfcdULL, 0x63d988a2d2851ULL}}, {{0x7a06c3fc66c0cULL, 0x1c9bac1ba47fbULL, 0x23935c575038eULL, 0x3f0bd71c59c13ULL, 0x3ac48d916e835ULL}}, {{0x20753afbd232eULL, 0x71fbb1ed06002ULL, 0x39cae47a4af3aULL, 0x0337c0b34d9c2ULL, 0x33fad52b2368aULL}}},
+        {{{0x4c8d0c422cfe8ULL, 0x760b4275971a5ULL, 0x3da95bc1cad3dULL, 0x0f151ff5b7376ULL, 0x3cc355ccb90a7ULL}}, {{0x649c6c5e41e16ULL, 0x60667eee6aa80ULL, 0x4179d182be190ULL, 0x653d9567e6979ULL, 0x16c0f429a256dULL}}, {{0x69443903e9131ULL, 0x16f4ac6f9dd36ULL, 0x2ea4912e29253ULL, 0x2b4643e68d25dULL, 0x631eaf426bae7ULL}}},
+        {{{0x175b9a3700de8ULL, 0x77c5f00aa48fbULL, 0x3917785ca0317ULL, 0x05aa9b2c79399ULL, 0x431f2c7f665f8ULL}}, {{0x10410da66fe9fULL, 0x24d82dcb4d67dULL, 0x3e6fe0e17752dULL, 0x4dade1ecbb08fULL, 0x5599648b1ea91ULL}}, {{0x26344858f7b19ULL, 0x5f43d4a295ac0ULL, 0x242a75c52acd4ULL, 0x5934480220d10ULL, 0x7b04715f91253ULL}}},
+        {{{0x6c280c4e6bac6ULL, 0x3ada3b361766eULL, 0x42fe5125c3b4fULL, 0x111d84d4aac22ULL, 0x48d0acfa57cdeULL}}, {{0x5bd28acf6ae43ULL, 0x16fab8f56907dULL, 0x7acb11218d5f2ULL, 0x41fe02023b4dbULL, 0x59b37bf5c2f65ULL}}, {{0x726e47dabe671ULL, 0x2ec45e746f6c1ULL, 0x6580e53c74686ULL, 0x5eda104673f74ULL, 0x16234191336d3ULL}}},
+    },
+    {
+        {{{0x5d1fd3d578bbeULL, 0x658650c2110a5ULL, 0x33889ccad9739ULL, 0x5a032c603fa75ULL, 0x0933f804ec38aULL}}, {{0x2eac733a63aefULL, 0x3a88848a9de33ULL, 0x6579104b1fee9ULL, 0x07aaed43d5023ULL, 0x413051e1a4e0bULL}}, {{0x369798d496476ULL, 0x3df96b57914f5ULL, 0x54e51ca0486abULL, 0x28d52ee0977bdULL, 0x07fd47065e453ULL}}},
+        {{{0x211559ae8e7c3ULL, 0x532891054a608ULL, 0x6094393ca06c8ULL, 0x47a4509d6171bULL, 0x014afa0954ba4ULL}}, {{0x03c3d258d2bcdULL, 0x1b5ec16e7f90bULL, 0x5a8de045c0a69ULL, 0x591fd07e4eb20ULL, 0x1c1e5fba38b3fULL}}, {{0x197001bb3666cULL, 0x2497ffd973966ULL, 0x2208cf0cc0181ULL, 0x1b2149b88cc8dULL, 0x291884363d4edULL}}},
+        {{{0x537c3bc1ab6ebULL, 0x269aaf4481f73ULL, 0x29787d80af851ULL, 0x0c47a6b9a0afcULL, 0x5964f4300ccc8ULL}}, {{0x46805dc4babfaULL, 0x3cab2dd982067ULL, 0x66c74ecb056fdULL, 0x7628de383125aULL, 0x3ede9850a19f0ULL}}, {{0x223152d096800ULL, 0x32e10cd32dc89ULL, 0x2bfedb9702315ULL, 0x6c4ef96db0523ULL, 0x579155c1f856fULL}}},
+        {{{0x16b630817e7a6ULL, 0x46786a204d6beULL, 0x33bc8060231a4ULL, 0x1a299254c1daaULL, 0x53c092084a485ULL}}, {{0x24edd12e0c9efULL, 0x1be484052f2c6ULL, 0x3d5cef91a2e1eULL, 0x4950ccd1bbb52ULL, 0x1e7fbcf18e91eULL}}, {{0x41481f1cbafbfULL, 0x6ce2c2e9cba5aULL, 0x29572608c74b6ULL, 0x2fb05bebb2b71ULL, 0x3e955cd82aa49ULL}}},
+        {{{0x1f3ef61bb3a3fULL, 0x4a5d72327d567ULL, 0x3047dd23ad001ULL, 0x24fdaef37661cULL, 0x654d7e9626f3cULL}}, {{0x7535e3ed15433ULL, 0x541ae4e147c91ULL, 0x3798e1f41d5a4ULL, 0x2faa07de90ed5ULL, 0x14264887cf449ULL}}, {{0x4cfdd5c7d2cebULL, 0x3dae6f9973cacULL, 0x7e6c2ae0bbabfULL, 0x6ddb083edb168ULL, 0x0b6baac3b4358ULL}}},
+        {{{0x2bad63700a93bULL, 0x27b4ef26e6409ULL, 0x4eadc26f8008fULL, 0x2096c2f81a331ULL, 0x00496dc490820ULL}}, {{0x62bcb8622fe98ULL, 0x2d9d71235ef5cULL, 0x3901ad11dd889ULL, 0x2808d2d495e79ULL, 0x7d29401784e41ULL}}, {{0x4b88dc27e6360ULL, 0x4d1a290a1838eULL, 0x0372cc01d2150ULL, 0x591d0a2fdbd9fULL, 0x10843f1b43803ULL}}},
+        {{{0x7672de324689bULL, 0x5b67295303aadULL, 0x5a33fb7476a2bULL, 0x0f46ebdac7f48ULL, 0x7ce246cd4d56cULL}}, {{0x10455376276ddULL, 0x1baec8b9b38bfULL, 0x4d9ace7396456ULL, 0x362497b2ea88eULL, 0x11574b6e52699ULL}}, {{0x4308e7f80be53ULL, 0x166953a72f71eULL, 0x730acb17cf2e3ULL, 0x3388c54b0de99ULL, 0x710045fb3a9afULL}}},
+        {{{0x7c862059d699eULL, 0x4334c33cd3407ULL, 0x608f7ac8dc33eULL, 0x227627f1d8917ULL, 0x1d1b056fa7f08ULL}}, {{0x13d36101b95ebULL, 0x729ede890ce7fULL, 0x457958bebbccdULL, 0x6d0ab28b9afc7ULL, 0x7fa3f19058b40ULL}}, {{0x64631e56bf61fULL, 0x20dca70546378ULL, 0x5005a374de6acULL, 0x47226ac62bf02ULL, 0x566256628442dULL}}},
+    },
+    {
+        {{{0x19cd61ff38640ULL, 0x060c6c4b41ba9ULL, 0x75cf70ca7366fULL, 0x118a8f16c011eULL, 0x4a25707a203b9ULL}}, {{0x499def6267ff6ULL, 0x76e858108773cULL, 0x693cac5ddcb29ULL, 0x00311d00a9ff4ULL, 0x2cdfdfecd5d05ULL}}, {{0x7668a53f6ed6aULL, 0x303ba2e142556ULL, 0x3880584c10909ULL, 0x4fe20000a261dULL, 0x5721896d248e4ULL}}},
+        {{{0x55091a1d0da4eULL, 0x4f6bfc7c1050bULL, 0x64e4ecd2ea9beULL, 0x07eb1f28bbe70ULL, 0x03c935afc4b03ULL}}, {{0x65517fd181baeULL, 0x3e5772c76816dULL, 0x019189640898aULL, 0x1ed2a84de7499ULL, 0x578edd74f63c1ULL}}, {{0x276c6492b0c3dULL, 0x09bfc40bf932eULL, 0x588e8f11f330bULL, 0x3d16e694dc26eULL, 0x3ec2ab590288cULL}}},
+        {{{0x13a09ae32d1cbULL, 0x3e81eb85ab4e4ULL, 0x07aaca43cae1fULL, 0x62f05d7526374ULL, 0x0e1bf66c6adbaULL}}, {{0x0d27be4d87bb9ULL, 0x56c27235db434ULL, 0x72e6e0ea62d37ULL, 0x5674cd06ee839ULL, 0x2dd5c25a200fcULL}}, {{0x3d5e9792c887eULL, 0x319724dabbc55ULL, 0x2b97c78680800ULL, 0x7afdfdd34e6ddULL, 0x730548b35ae88ULL}}},
+        {{{0x3094ba1d6e334ULL, 0x6e126a7e3300bULL, 0x089c0aefcfbc5ULL, 0x2eea11f836583ULL, 0x585a2277d8784ULL}}, {{0x551a3cba8b8eeULL, 0x3b6422be2d886ULL, 0x630e1419689bcULL, 0x4653b07a7a955ULL, 0x3043443b411dbULL}}, {{0x25f8233d48962ULL, 0x6bd8f04aff431ULL, 0x4f907fd9a6312ULL, 0x40fd3c737d29bULL, 0x7656278950ef9ULL}}},
+        {{{0x073a3ea86cf9dULL, 0x6e0e2abfb9c2eULL, 0x60e2a38ea33eeULL, 0x30b2429f3fe18ULL, 0x28bbf484b613fULL}}, {{0x3cf59d51fc8c0ULL, 0x7a0a0d6de4718ULL, 0x55c3a3e6fb74bULL, 0x353135f884fd5ULL, 0x3f4160a8c1b84ULL}}, {{0x12f5c6f136c7cULL, 0x0fedba237de4cULL, 0x779bccebfab44ULL, 0x3aea93f4d6909ULL, 0x1e79cb358188fULL}}},
+        {{{0x153d8f5e08181ULL, 0x08533bbdb2efdULL, 0x1149796129431ULL, 0x17a6e36168643ULL, 0x478ab52d39d1fULL}}, {{0x436c3eef7e3f1ULL, 0x7ffd3c21f0026ULL, 0x3e77bf20a2da9ULL, 0x418bffc8472deULL, 0x65d7951b3a3b3ULL}}, {{0x6a4d39252d159ULL, 0x790e35900ecd4ULL, 0x30725bf977786ULL, 0x10a5c1635a053ULL, 0x16d87a411a212ULL}}},
+        {{{0x4d5e2d54e0583ULL, 0x2e5d7b33f5f74ULL, 0x3a5de3f887ebfULL, 0x6ef24bd6139b7ULL, 0x1f990b577a5a6ULL}}, {{0x57e5a42066215ULL, 0x1a18b44983677ULL, 0x3e652de1e6f8fULL, 0x6532be02ed8ebULL, 0x28f87c8165f38ULL}}, {{0x44ead1be8f7d6ULL, 0x5759d4f31f466ULL, 0x0378149f47943ULL, 0x69f3be32b4f29ULL, 0x45882fe1534d6ULL}}},
+        {{{0x49929943c6fe4ULL, 0x4347072545b15ULL, 0x3226bced7e7c5ULL, 0x03a134ced89dfULL, 0x7dcf843ce405fULL}}, {{0x1345d757983d6ULL, 0x222f54234cccdULL, 0x1784a3d8adbb4ULL, 0x36ebeee8c2bccULL, 0x688fe5b8f626fULL}}, {{0x0d6484a4732c0ULL, 0x7b94ac6532d92ULL, 0x5771b8754850fULL, 0x48dd9df1461c8ULL, 0x6739687e73271ULL}}},
+    },
+    {
+        {{{0x5aad0c9cb971fULL, 0x533faa945319cULL, 0x6be6de0455aaaULL, 0x4d520fb92380aULL, 0x1fe8cca8420f4ULL}}, {{0x5c5ea200814cfULL, 0x42d3462e813ecULL, 0x722d2b61014dbULL, 0x30ec587689c92ULL, 0x0080dbafe9363ULL}}, {{0x1848f3c0cc82aULL, 0x050ef93ca8e54ULL, 0x1550500e31583ULL, 0x6b8a802711467ULL, 0x042418a103429ULL}}},
+        {{{0x04c6f20816247ULL, 0x6dc6dfaf26b1dULL, 0x521361636cacaULL, 0x5ebcbb8c12b0eULL, 0x0822024f8632aULL}}, {{0x5ea51abf3ff5fULL, 0x4e5f85b175133ULL, 0x1baf5726e4ea1ULL, 0x5ae961c65cbdfULL, 0x114d578497263ULL}}, {{0x1bb7c6b1beca3ULL, 0x5b8dd626eb660ULL, 0x6db93ad54e4fdULL, 0x751c88694084bULL, 0x1ad4548d9d479ULL}}},
+        {{{0x7e66d0fe9fed3ULL, 0x0038b0f21340dULL, 0x7e6254ea1cce9ULL, 0x12c1868a6c006ULL, 0x41ce5876c7b30ULL}}, {{0x27da0389a48fdULL, 0x5534f06e3d9abULL, 0x36e39b2ce3e92ULL, 0x221e36cbb0d96ULL, 0x35cf51dbc97e1ULL}}, {{0x43bc5d670c022ULL, 0x213623280cb35ULL, 0x5e0bf6bab99f0ULL, 0x0494bcc5ef859ULL, 0x651e3201fd074ULL}}},
+        {{{0x3a4a01efcae9eULL, 0x5db86115294afULL, 0x00f2cb9da7d2fULL, 0x13c68f887759bULL, 0x4099ce5e7e441ULL}}, {{0x58483ef30c5cfULL, 0x2c46c39819ac7ULL, 0x2109ab13352d2ULL, 0x775f748728052ULL, 0x0af51d7d18c14ULL}}, {{0x18e4f8a5121e9ULL, 0x09b7f45fc0359ULL, 0x10c37e5f6ba55ULL, 0x7dac1905506ebULL, 0x667282652c4a2ULL}}},
+        {{{0x0b6e02946db23ULL, 0x34f64a756f5b5ULL, 0x375216c703394ULL, 0x56fc224642d33ULL, 0x7f1fc025d0675ULL}}, {{0x621f4d86bc9abULL, 0x7cadfcdfd50e8ULL, 0x6b708b2d531eeULL, 0x69c83bd1212bfULL, 0x1ab53be419b90ULL}}, {{0x61b18319ea6aaULL, 0x107443e1b5b1dULL, 0x0e93d2c013620ULL, 0x68a1deb550ec4ULL, 0x4db9a3a6dfd9fULL}}},
+        {{{0x300bbcbb77c68ULL, 0x5523e2f093b2bULL, 0x0a366cf76f211ULL, 0x79f3e7b80575fULL, 0x5ce1285c85d31ULL}}, {{0x7b23bb99c0755ULL, 0x5b89ea1ef519cULL, 0x66d430cd7175bULL, 0x6d0bf0f176976ULL, 0x36305f16e8934ULL}}, {{0x6972d98b0bde8ULL, 0x0d594dbcb6636ULL, 0x229967df6481cULL, 0x11af339887c48ULL, 0x50fac2a6efdf0ULL}}},
+        {{{0x31c86f6f449bcULL, 0x143e1569ba52bULL, 0x239547546cba1ULL, 0x3316000e59855ULL, 0x6a28d35944f43ULL}}, {{0x3a9f35b880f5aULL, 0x19b607cf85e7aULL, 0x7c2c68bb7b014ULL, 0x252544b4c0ffcULL, 0x49a4ae2bac5e3ULL}}, {{0x312ee04a740e0ULL, 0x7b379d02e8517ULL, 0x304310050c4eeULL, 0x6adb97adaf274ULL, 0x7cbfb19936adcULL}}},
+        {{{0x13a7acc36e6e0ULL, 0x46fab0dddb1cfULL, 0x387d393e7eadeULL, 0x23f1d27cb495dULL, 0x1c14b03eff5f4ULL}}, {{0x1ddc26b89792dULL, 0x0db4a24cc9462ULL, 0x45421646cc2d3ULL, 0x2040653bda667ULL, 0x1de443df1b009ULL}}, {{0x47bd114a85291ULL, 0x642069a75e32cULL, 0x675b7e95eddb2ULL, 0x249b194eda207ULL, 0x5ef43e586a571ULL}}},
+    },
+    {
+        {{{0x5cc9dc80c1ac0ULL, 0x683671486d4cdULL, 0x76f5f1a5e8173ULL, 0x6d5d3f5f9df4aULL, 0x7da0b8f68d7e7ULL}}, {{0x02014385675a6ULL, 0x6155fb53d1defULL, 0x37ea32e89927cULL, 0x059a668f5a82eULL, 0x46115aba1d4dcULL}}, {{0x71953c3b5da76ULL, 0x6642233d37a81ULL, 0x2c9658076b1bdULL, 0x5a581e63010ffULL, 0x5a5f887e83674ULL}}},
+        {{{0x628d3a0a643b9ULL, 0x01cd8640c93d2ULL, 0x0b7b0cad70f2cULL, 0x3864da98144beULL, 0x43e37ae2d5d1cULL}}, {{0x301cf70a13d11ULL, 0x2a6a1ba1891ecULL, 0x2f291fb3f3ae0ULL, 0x21a7b814bea52ULL, 0x3669b656e44d1ULL}}, {{0x63f06eda6e133ULL, 0x233342758070fULL, 0x098e0459cc075ULL, 0x4df5ead6c7c1bULL, 0x6a21e6cd4fd5eULL}}},
+        {{{0x129126699b2e3ULL, 0x0ee11a2603de8ULL, 0x60ac2f5c74c21ULL, 0x59b192a196808ULL, 0x45371b07001e8ULL}}, {{0x6170a3046e65fULL, 0x5401a46a49e38ULL, 0x20add5561c4a8ULL, 0x7abb4edde9e46ULL, 0x586bf9f1a195fULL}}, {{0x3088d5ef8790bULL, 0x38c2126fcb4dbULL, 0x685bae149e3c3ULL, 0x0bcd601a4e930ULL, 0x0eafb03790e52ULL}}},
+        {{{0x0805e0f75ae1dULL, 0x464cc59860a28ULL, 0x248e5b7b00befULL, 0x5d99675ef8f75ULL, 0x44ae3344c5435ULL}}, {{0x555c13748042fULL, 0x4d041754232c0ULL, 0x521b430866907ULL, 0x3308e40fb9c39ULL, 0x309acc675a02cULL}}, {{0x289b9bba543eeULL, 0x3ab592e28539eULL, 0x64d82abcdd83aULL, 0x3c78ec172e327ULL, 0x62d5221b7f946ULL}}},
+        {{{0x5d4263af77a3cULL, 0x23fdd2289aeb0ULL, 0x7dc64f77eb9ecULL, 0x01bd28338402cULL, 0x14f29a5383922ULL}}, {{0x4299c18d0936dULL, 0x5914183418a49ULL, 0x52a18c721aed5ULL, 0x2b151ba82976dULL, 0x5c0efde4bc754ULL}}, {{0x17edc25b2d7f5ULL, 0x37336a6081beeULL, 0x7b5318887e5c3ULL, 0x49f6d491a5be1ULL, 0x5e72365c7bee0ULL}}},
+        {{{0x339062f08b33eULL, 0x4bbf3e657cfb2ULL, 0x67af7f56e5967ULL, 0x4dbd67f9ed68fULL, 0x70b20555cb734ULL}}, {{0x3fc074571217fULL, 0x3a0d29b2b6aebULL, 0x06478ccdde59dULL, 0x55e4d051bddfaULL, 0x77f1104c47b4eULL}}, {{0x113c555112c4cULL, 0x7535103f9b7caULL, 0x140ed1d9a2108ULL, 0x02522333bc2afULL, 0x0e34398f4a064ULL}}},
+        {{{0x30b093e4b1928ULL, 0x1ce7e7ec80312ULL, 0x4e575bdf78f84ULL, 0x61f7a190bed39ULL, 0x6f8aded6ca379ULL}}, {{0x522d93ecebde8ULL, 0x024f045e0f6cfULL, 0x16db63426cfa1ULL, 0x1b93a1fd30fd8ULL, 0x5e5405368a362ULL}}, {{0x0123dfdb7b29aULL, 0x4344356523c68ULL, 0x79a527921ee5fULL, 0x74bfccb3e817eULL, 0x780de72ec8d3dULL}}},
+        {{{0x7eaf300f42772ULL, 0x5455188354ce3ULL, 0x4dcca4a3dcbacULL, 0x3d314d0bfebcbULL, 0x1defc6ad32b58ULL}}, {{0x28545089ae7bcULL, 0x1e38fe9a0c15cULL, 0x12046e0e2377bULL, 0x6721c560aa885ULL, 0x0eb28bf671928ULL}}, {{0x3be1aef5195a7ULL, 0x6f22f62bdb5ebULL, 0x39768b8523049ULL, 0x43394c8fbfdbdULL, 0x467d201bf8dd2ULL}}},
+    },
+    {
+        {{{0x79d56296bc318ULL, 0x29b02a5ccae8bULL, 0x0e7a73a64d603ULL, 0x0e05872d89facULL, 0x51fc2b28d4392ULL}}, {{0x6ee72f7bd2e6bULL, 0x2c21357e9cf20ULL, 0x506a2901749c3ULL, 0x143c6ae7f22dcULL, 0x44c218671c974ULL}}, {{0x7d11795e2a98cULL, 0x4256d6c522371ULL, 0x092d5c871397bULL, 0x5632d9873883aULL, 0x6e6b9de84c4f4ULL}}},
+        {{{0x45f10f80cb088ULL, 0x38adc842a2d6fULL, 0x3be6711cdad53ULL, 0x7a1615b1052e3ULL, 0x5f4c802cc3a06ULL}}, {{0x25fce4b1de151ULL, 0x0fc238804bbfeULL, 0x1d2721f610703ULL, 0x6fc92aa59e42aULL, 0x2d292459908e0ULL}}, {{0x5c8f17d0752daULL, 0x718efdd00136cULL, 0x58be78e20738cULL, 0x6a461da8a782dULL, 0x66ed5dd5bec10ULL}}},
+        {{{0x5f3c9cbca047dULL, 0x17e8aa5ed7e15ULL, 0x1cd7e4e070ecbULL, 0x24667ed0896a2ULL, 0x1f23a0c77e200ULL}}, {{0x0a1c20bb2089dULL, 0x432d99a824fa7ULL, 0x25f4c4e020cd3ULL, 0x790625385c636ULL, 0x2eacf8bc03007ULL}}, {{0x5467be5bc1570ULL, 0x041b756719e46ULL, 0x3e782780f4b64ULL, 0x62813a94d517eULL, 0x0840bef29d34bULL}}},
+        {{{0x4e06b7f37e4ebULL, 0x0febd2d9959aaULL, 0x565f73a33057eULL, 0x0065c1245d869ULL, 0x246affa060744ULL}}, {{0x5fb35dc10b287ULL, 0x1ab8ffe53af2dULL, 0x6c924149c5dafULL, 0x13b3f9ea1f463ULL, 0x0304f5a191c54ULL}}, {{0x08e68fbe45321ULL, 0x1181aea0646fbULL, 0x52834d61825d5ULL, 0x192a74d89f7c4ULL, 0x25a83cac5753dULL}}},
+        {{{0x766293952b6e2ULL, 0x1c12684cf73e1ULL, 0x027fb70cf6d78ULL, 0x064ffa29295ebULL, 0x06be10f5c506eULL}}, {{0x22f48eed8165eULL, 0x4697179e74204ULL, 0x087a3c188ff04ULL, 0x3180f0a2e04e1ULL, 0x7ccfa59fca782ULL}}, {{0x615a9b62a345fULL, 0x2c94a5fd98352ULL, 0x2f037f8881431ULL, 0x38ed3d13c4294ULL, 0x5e82770a1a1eeULL}}},
+        {{{0x2e80a42339c74ULL, 0x4d4ffff5cbd00ULL, 0x10232b8d05d45ULL, 0x2f71a432e8f8eULL, 0x2cca982c605bcULL}}, {{0x25183ad896a5cULL, 0x77cf1aa5ec6a8ULL, 0x28d7d93a19cebULL, 0x0811633792fc9ULL, 0x09d04f3b3b86bULL}}, {{0x55d35197dbe6eULL, 0x5517c9ff47fa5ULL, 0x16ba46081f0bbULL, 0x69f1309ec6d99ULL, 0x7a325d1727741ULL}}},
+        {{{0x27d017e2a076aULL, 0x3e2c6c92bdd9aULL, 0x648cf975e21a2ULL, 0x73229530d7848ULL, 0x2a479df17bb1aULL}}, {{0x6b9bbd16dfde2ULL, 0x2f892f5053a06ULL, 0x7c4999e88155dULL, 0x0c0473664b353ULL, 0x4d3b1a791239cULL}}, {{0x6ee8e33db2710ULL, 0x3dad88794b3cbULL, 0x1c604e0626153ULL, 0x74dd20e1162c9ULL, 0x27ad5538a43a5ULL}}},
+        {{{0x27d638e47077cULL, 0x42414380b396bULL, 0x7b7f73236dd4dULL, 0x3ceaa4f0f26c5ULL, 0x080153b7503b1ULL}}, {{0x6dd4b15350d61ULL, 0x11dd2a436e4e8ULL, 0x619cb2b40ff2fULL, 0x4f174371b2d09ULL, 0x510e987f7e7d8ULL}}, {{0x69d930a3ed3e3ULL, 0x639ac14e45bb4ULL, 0x6a93b98f4e1bbULL, 0x395640bd6ac5eULL, 0x23be8d554fe73ULL}}},
+    },
+    {
+        {{{0x6f4bd567ae7a9ULL, 0x65ac89317b783ULL, 0x07d3b20fd8932ULL, 0x000f208326916ULL, 0x2ef9c5a5ba384ULL}}, {{0x6919a74ef4fadULL, 0x59ed4611452bfULL, 0x691ec04ea09efULL, 0x3cbcb2700e984ULL, 0x71c43c4f5ba3cULL}}, {{0x56df6fa9e74cdULL, 0x79c95e4cf56dfULL, 0x7be643bc609e2ULL, 0x149c12ad9e878ULL, 0x5a758ca390c5fULL}}},
+        {{{0x0918b1d61dc94ULL, 0x0d350260cd19cULL, 0x7a2ab4e37b4d9ULL, 0x21fea735414d7ULL, 0x0a738027f639dULL}}, {{0x72710d9462495ULL, 0x25aafaa007456ULL, 0x2d21f28eaa31bULL, 0x17671ea005fd0ULL, 0x2dbae244b3eb7ULL}}, {{0x74a2f57ffe1ccULL, 0x1bc3073087301ULL, 0x7ec57f4019c34ULL, 0x34e082e1fa524ULL, 0x2698ca635126aULL}}},
+        {{{0x5702f5e3dd90eULL, 0x31c9a4a70c5c7ULL, 0x136a5aa78fc24ULL, 0x1992f3b9f7b01ULL, 0x3c004b0c4afa3ULL}}, {{0x5318832b0ba78ULL, 0x6f24b9ff17cecULL, 0x0a47f30e060c7ULL, 0x58384540dc8d0ULL, 0x1fb43dcc49caeULL}}, {{0x146ac06f4b82bULL, 0x4b500d89e7355ULL, 0x3351e1c728a12ULL, 0x10b9f69932fe3ULL, 0x6b43fd01cd1fdULL}}},
+        {{{0x742583e760ef3ULL, 0x73dc1573216b8ULL, 0x4ae48fdd7714aULL, 0x4f85f8a13e103ULL, 0x73420b2d6ff0dULL}}, {{0x75d4b4697c544ULL, 0x11be1fff7f8f4ULL, 0x119e16857f7e1ULL, 0x38a14345cf5d5ULL, 0x5a68d7105b52fULL}}, {{0x4f6cb9e851e06ULL, 0x278c4471895e5ULL, 0x7efcdce3d64e4ULL, 0x64f6d455c4b4cULL, 0x3db5632fea34bULL}}},
+        {{{0x190b1829825d5ULL, 0x0e7d3513225c9ULL, 0x1c12be3b7abaeULL, 0x58777781e9ca6ULL, 0x59197ea495df2ULL}}, {{0x6ee2bf75dd9d8ULL, 0x6c72ceb34be8dULL, 0x679c9cc345ec7ULL, 0x7898df96898a4ULL, 0x04321adf49d75ULL}}, {{0x16019e4e55aaeULL, 0x74fc5f25d209cULL, 0x4566a939ded0dULL, 0x66063e716e0b7ULL, 0x45eafdc1f4d70ULL}}},
+        {{{0x64624cfccb1edULL, 0x257ab8072b6c1ULL, 0x0120725676f0aULL, 0x4a018d04e8eeeULL, 0x3f73ceea5d56dULL}}, {{0x401858045d72bULL, 0x459e5e0ca2d30ULL, 0x488b719308beaULL, 0x56f4a0d1b32b5ULL, 0x5a5eebc80362dULL}}, {{0x7bfd10a4e8dc6ULL, 0x7c899366736f4ULL, 0x55ebbeaf95c01ULL, 0x46db060903f8aULL, 0x2605889126621ULL}}},
+        {{{0x18e3cc676e542ULL, 0x26079d995a990ULL, 0x04a7c217908b2ULL, 0x1dc7603e6655aULL, 0x0dedfa10b2444ULL}}, {{0x704a68360ff04ULL, 0x3cecc3cde8b3eULL, 0x21cd5470f64ffULL, 0x6abc18d953989ULL, 0x54ad0c2e4e615ULL}}, {{0x367d5b82b522aULL, 0x0d3f4b83d7dc7ULL, 0x3067f4cdbc58dULL, 0x20452da697937ULL, 0x62ecb2baa77a9ULL}}},
+        {{{0x72836afb62874ULL, 0x0af3c2094b240ULL, 0x0c285297f357aULL, 0x7cc2d5680d6e3ULL, 0x61913d5075663ULL}}, {{0x5795261152b3dULL, 0x7a1dbbafa3cbdULL, 0x5ad31c52588d5ULL, 0x45f3a4164685cULL, 0x2e59f919a966dULL}}, {{0x62d361a3231daULL, 0x65284004e01b8ULL, 0x656533be91d60ULL, 0x6ae016c00a89fULL, 0x3ddbc2a131c05ULL}}},
+    },
+    {
+        {{{0x35ac2004a35d1ULL, 0x0674cc0f87f6eULL, 0x4a35664c7783dULL, 0x2863dc2c8dfe2ULL, 0x55be9a25f5bb0ULL}}, {{0x0a50a4ffb81efULL, 0x1277e8417e7eaULL, 0x2a8b342c780d4ULL, 0x5204dd5470e63ULL, 0x32239861fa237ULL}}, {{0x05acd33db3dbfULL, 0x7901586bc41a0ULL, 0x623afac0446cdULL, 0x5e6a4496b3637ULL, 0x770eadb16508fULL}}},
+        {{{0x3b681a05071b9ULL, 0x346b25fe75e3aULL, 0x2079038881d96ULL, 0x3a72f80b494bcULL, 0x16bedd0e86ba3ULL}}, {{0x1f9e05e4e89ddULL, 0x7f78f2726f08aULL, 0x2992573018c0bULL, 0x1fdae913a4aabULL, 0x09a6755ca0560ULL}}, {{0x4cc4f2c2737b5ULL, 0x185b996e06bd9ULL, 0x310f7cd0ede78ULL, 0x36019f0045e27ULL, 0x06c1b840f0756ULL}}},
+        {{{0x69e7f9b02805cULL, 0x14a8fa2c80d3dULL, 0x10c25a32ffe0aULL, 0x4b91ec9d434d9ULL, 0x46b7b8cd3fe26ULL}}, {{0x0a5c6a388f877ULL, 0x29bd656d58ed1ULL, 0x630abe00aa5b0ULL, 0x76b3264f9a18dULL, 0x3628435554a1eULL}}, {{0x12086fe7eebe0ULL, 0x4e5ea2a86fd30ULL, 0x5bbeba532e9afULL, 0x65c8e820b45a8ULL, 0x5ea1391043982ULL}}},
+        {{{0x33be4d5d3b002ULL, 0x32d4139100de5ULL, 0x2f31332bfb0cfULL, 0x4c581afb9d254ULL, 0x22c5b92846621ULL}}, {{0x25c9cf4702ee1ULL, 0x3f164b665a922ULL, 0x07fbdf91482dcULL, 0x595998c981328ULL, 0x656d8997c8d2eULL}}, {{0x0c8fe433d8939ULL, 0x5cd51afca196bULL, 0x7eef96a26832cULL, 0x0833ce54aa984ULL, 0x0c626616cd7fcULL}}},
+        {{{0x7c379fbf454b1ULL, 0x61e3496ee31fbULL, 0x34d64551696a5ULL, 0x0c956490f7bddULL, 0x42d088dca81c2ULL}}, {{0x6b80a4879b61fULL, 0x5c95b443da3ffULL, 0x20096e98e59c9ULL, 0x3c419e3d8499bULL, 0x471aa0c6f3c31ULL}}, {{0x20f37a0165199ULL, 0x6f9141c6871fbULL, 0x1d7a0802b6b6dULL, 0x373907dfefe64ULL, 0x1cf2bea80c220ULL}}},
+        {{{0x56e1a02c0412fULL, 0x07b6b1d1fd305ULL, 0x2c62f0243e932ULL, 0x63300e17ade6eULL, 0x686e0c90216abULL}}, {{0x5f1deb36202acULL, 0x13a5c4f54b85bULL, 0x027c74e4a97f8ULL, 0x4acbe8b247b7eULL, 0x74c2cc0513bc4ULL}}, {{0x5badba54395a7ULL, 0x415c1b4cd43f5ULL, 0x68df01ed0680aULL, 0x186df8cfacc5dULL, 0x6a12b8acde484ULL}}},
+        {{{0x3dd801aaeeb5fULL, 0x5582a310e2f27ULL, 0x484dad0028a82ULL, 0x78cf451b9d18fULL, 0x48aab888fc91eULL}}, {{0x2ea1f39d495d9ULL, 0x1ca4be3bf9f1bULL, 0x664746d64b064ULL, 0x65bedc65e8264ULL, 0x11f7fda3d88f0ULL}}, {{0x77e925830f40eULL, 0x52f2cc380c083ULL, 0x411a8b800b5b2ULL, 0x1e8c36e4ffc95ULL, 0x760360928b049ULL}}},
+        {{{0x108e5695a0b05ULL, 0x515a6f4717686ULL, 0x54dce05b2c03bULL, 0x1122f6d6b7751ULL, 0x3f2602d4b6dc3ULL}}, {{0x341c6120cf9c6ULL, 0x25bd9b4b36437ULL, 0x2922cd3aacaa8ULL, 0x5b460d3968105ULL, 0x215d4d27e87d3ULL}}, {{0x247b65bcaf19cULL, 0x0763658ca5916ULL, 0x7b38b8925de77ULL, 0x01cc4d0c05deaULL, 0x13f098a3cec8eULL}}},
+    },
+    {
+        {{{0x257a22796bb14ULL, 0x6f360fb443e75ULL, 0x680e47220eaeaULL, 0x2fcf2a5f10c18ULL, 0x5ee7fb38d8320ULL}}, {{0x40ff9ce5ec54bULL, 0x57185e261b35bULL, 0x3e254540e70a9ULL, 0x1b5814003e3f8ULL, 0x78968314ac04bULL}}, {{0x5fdcb41446a8eULL, 0x5286926ff2a71ULL, 0x0f231e296b3f6ULL, 0x684a357c84693ULL, 0x61d0633c9bca0ULL}}},
+        {{{0x328bcf8fc73dfULL, 0x3b4de06ff95b4ULL, 0x30aa427ba11a5ULL, 0x5ee31bfda6d9cULL, 0x5b23ac2df8067ULL}}, {{0x44935ffdb2566ULL, 0x12f016d176c6eULL, 0x4fbb00f16f5aeULL, 0x3fab78d99402aULL, 0x6e965fd847aedULL}}, {{0x2b953ee80527bULL, 0x55f5bcdb1b35aULL, 0x43a0b3fa23c66ULL, 0x76e07388b820aULL, 0x79b9bbb9dd95dULL}}},
+        {{{0x17dae8e9f7374ULL, 0x719f76102da33ULL, 0x5117c2a80ca8bULL, 0x41a66b65d0936ULL, 0x1ba811460accbULL}}, {{0x355406a3126c2ULL, 0x50d1918727d76ULL, 0x6e5ea0b498e0eULL, 0x0a3b6063214f2ULL, 0x5065f158c9fd2ULL}}, {{0x169fb0c429954ULL, 0x59aedd9ecee10ULL, 0x39916eb851802ULL, 0x57917555cc538ULL, 0x3981f39e58a4fULL}}},
+        {{{0x5dfa56de66fdeULL, 0x0058809075908ULL, 0x6d3d8cb854a94ULL, 0x5b2f4e970b1e3ULL, 0x30f4452edcbc1ULL}}, {{0x38a7559230a93ULL, 0x52c1cde8ba31fULL, 0x2a4f2d4745a3dULL, 0x07e9d42d4a28aULL, 0x38dc083705acdULL}}, {{0x52782c5759740ULL, 0x53f3397d990adULL, 0x3a939c7e84d15ULL, 0x234c4227e39e0ULL, 0x632d9a1a593f2ULL}}},
+        {{{0x1fd11ed0c84a7ULL, 0x021b3ed2757e1ULL, 0x73e1de58fc1c6ULL, 0x5d110c84616abULL, 0x3a5a7df28af64ULL}}, {{0x36b15b807cba6ULL, 0x3f78a9e1afed7ULL, 0x0a59c2c608f1fULL, 0x52bdd8ecb81b7ULL, 0x0b24f48847ed4ULL}}, {{0x2d4be511beac7ULL, 0x6bda4d99e5b9bULL, 0x17e6996914e01ULL, 0x7b1f0ce7fcf80ULL, 0x34fcf74475481ULL}}},
+        {{{0x31dab78cfaa98ULL, 0x4e3216e5e54b7ULL, 0x249823973b689ULL, 0x2584984e48885ULL, 0x0119a3042fb37ULL}}, {{0x7e04c789767caULL, 0x1671b28cfb832ULL, 0x7e57ea2e1c537ULL, 0x1fbaaef444141ULL, 0x3d3bdc164dfa6ULL}}, {{0x2d89ce8c2177dULL, 0x6cd12ba182cf4ULL, 0x20a8ac19a7697ULL, 0x539fab2cc72d9ULL, 0x56c088f1ede20ULL}}},
+        {{{0x35fac24f38f02ULL, 0x7d75c6197ab03ULL, 0x33e4bc2a42fa7ULL, 0x1c7cd10b48145ULL, 0x038b7ea483590ULL}}, {{0x53d1110a86e17ULL, 0x6416eb65f466dULL, 0x41ca6235fce20ULL, 0x5c3fc8a99bb12ULL, 0x09674c6b99108ULL}}, {{0x6f82199316ff8ULL, 0x05d54f1a9f3e9ULL, 0x3bcc5d0bd274aULL, 0x5b284b8d2d5adULL, 0x6e5e31025969eULL}}},
+        {{{0x4fb0e63066222ULL, 0x130f59747e660ULL, 0x041868fecd41aULL, 0x3105e8c923bc6ULL, 0x3058ad43d1838ULL}}, {{0x462f587e593fbULL, 0x3d94ba7ce362dULL, 0x330f9b52667b7ULL, 0x5d45a48e0f00aULL, 0x08f5114789a8dULL}}, {{0x40ffde57663d0ULL, 0x71445d4c20647ULL, 0x2653e68170f7cULL, 0x64cdee3c55ed6ULL, 0x26549fa4efe3dULL}}},
+    },
+    {
+        {{{0x3bc17f75396b9ULL, 0x2fa5f0ce8c09bULL, 0x4faaf19a79a8bULL, 0x2e963204eccfaULL, 0x606175f6332e2ULL}}, {{0x338d787ce8f89ULL, 0x4482f3511ae71ULL, 0x544c5b6d89963ULL, 0x2e49839c64e78ULL, 0x49128c7f72727ULL}}, {{0x1370ef540e7ddULL, 0x6b43e3a14a804ULL, 0x41ae01c24435bULL, 0x11aa31a5566adULL, 0x6a39e6356944fULL}}},
+        {{{0x1965774049e9dULL, 0x4331fc6a563b4ULL, 0x148da9bef35baULL, 0x37158e5e6a866ULL, 0x1f5ec83d3f984ULL}}, {{0x55640df90f3e7ULL, 0x1db7f44bd52d9ULL, 0x78cf311b0e9d8ULL, 0x72c1279f784acULL, 0x42889e7e530d2ULL}}, {{0x323c3328ccb75ULL, 0x0fbb0eddd31dfULL, 0x7eb9e5abd0a88ULL, 0x7a8907ded6e2eULL, 0x241e246b06bf9ULL}}},
+        {{{0x2fc9a6280bbb8ULL, 0x25e807b012fd5ULL, 0x7f234808a9c3cULL, 0x1f718e7205d8dULL, 0x2bc65635e8bd5ULL}}, {{0x68e57ad6e98f6ULL, 0x10168c40ca53cULL, 0x47aed2d324983ULL, 0x04b9f80431752ULL, 0x5bc2c77fb38d9ULL}}, {{0x5dc9fa96bad93ULL, 0x7bbc328fb9d1aULL, 0x4617e8f963ec5ULL, 0x418340a997532ULL, 0x1fdd6c3b034a7ULL}}},
+        {{{0x3a6a52dd8f7a9ULL, 0x187dfb957f382ULL, 0x023ded4b6ec7eULL, 0x4f2cb0f19202fULL, 0x48c8a121bbe6cULL}}, {{0x4e28c55dc18feULL, 0x326733d7ba14cULL, 0x38b994b8f7e7aULL, 0x6073cd62191b8ULL, 0x35ff7fc33ae4cULL}}, {{0x15a7c59646445ULL, 0x2f82516c2bf88ULL, 0x7eee44b4892cbULL, 0x7d5b01ae4e482ULL, 0x42d7a91274429ULL}}},
+        {{{0x48947933da5bcULL, 0x1d85d2f3d9534ULL, 0x796b131296248ULL, 0x0a3cb6c400009ULL, 0x453692d74b48bULL}}, {{0x213e3eaf72ed3ULL, 0x348759a9ce9ccULL, 0x2d4232d9e5260ULL, 0x2997faa3e6f37ULL, 0x6fed19dd10fcbULL}}, {{0x75d99a8559c6fULL, 0x01be007c49baeULL, 0x24a299bd0a885ULL, 0x1162911f114edULL, 0x063f46ba6d38fULL}}},
+        {{{0x43cb737346921ULL, 0x0e7191288e730ULL, 0x114c1fa9d1fecULL, 0x03465c6c018d1ULL, 0x67810f8e6d82fULL}}, {{0x242895f536694ULL, 0x0a85273659a5aULL, 0x776e57328ce8bULL, 0x6aecc37d6d363ULL, 0x5a152c042f712ULL}}, {{0x38fbcd2287db4ULL, 0x4603407d267ddULL, 0x6609969cb1f4eULL, 0x201aa39f4465eULL, 0x7324aa515921bULL}}},
+        {{{0x3f6dae82354cbULL, 0x556cae34db5a4ULL, 0x638df45a58940ULL, 0x097cdb28b1b71ULL, 0x5cac5005d1a33ULL}}, {{0x142f46c3cbe8eULL, 0x628e61808d0afULL, 0x0f106fe874d92ULL, 0x2e90e476c8a69ULL, 0x0838e161eef6dULL}}, {{0x154cce9e39904ULL, 0x1709bcd08d198ULL, 0x6f975b96ce810ULL, 0x781626c530e58ULL, 0x40fb897bd8861ULL}}},
+        {{{0x6d8475ab10761ULL, 0x40dfa26e8dcafULL, 0x40958c9c50d78ULL, 0x73d9a17c12766ULL, 0x4b16281ea8791ULL}}, {{0x5aa9062de37a1ULL, 0x001a3b2dc3098ULL, 0x2490b65087694ULL, 0x06d3c41431835ULL, 0x3c5e464a690d1ULL}}, {{0x101d50b813381ULL, 0x22eddcd051a38ULL, 0x0fd90277b983cULL, 0x425065b44499cULL, 0x6183c565f6ff4ULL}}},
+    },
+    {
+        {{{0x68549af3f666eULL, 0x09e2941d4bb68ULL, 0x2e8311f5dff3cULL, 0x6429ef91ffbd2ULL, 0x3a10dfe132ce3ULL}}, {{0x55a461e6bf9d6ULL, 0x78eeef4b02e83ULL, 0x1d34f648c16cfULL, 0x07fea2aba5132ULL, 0x1926e1dc6401eULL}}, {{0x74e8aea17cea0ULL, 0x0c743f83fbc0fULL, 0x7cb03c4bf5455ULL, 0x68a8ba9917e98ULL, 0x1fa1d01d861e5ULL}}},
+        {{{0x4ac00d1df94abULL, 0x3ba2101bd271bULL, 0x7578988b9c4afULL, 0x0f2bf89f49f7eULL, 0x73fced18ee9a0ULL}}, {{0x055947d599832ULL, 0x346fe2aa41990ULL, 0x0164c8079195bULL, 0x799ccfb7bba27ULL, 0x773563bc6a75cULL}}, {{0x1e90863139cb3ULL, 0x4f8b407d9a0d6ULL, 0x58e24ca924f69ULL, 0x7a246bbe76456ULL, 0x1f426b701b864ULL}}},
+        {{{0x635c891a12552ULL, 0x26aebd38ede2fULL, 0x66dc8faddae05ULL, 0x21c7d41a03786ULL, 0x0b76bb1b3fa7eULL}}, {{0x1264c41911c01ULL, 0x702f44584bdf9ULL, 0x43c511fc68edeULL, 0x0482c3aed35f9ULL, 0x4e1af5271d31bULL}}, {{0x0c1f97f92939bULL, 0x17a88956dc117ULL, 0x6ee005ef99dc7ULL, 0x4aa9172b231ccULL, 0x7b6dd61eb772aULL}}},
+        {{{0x0abf9ab01d2c7ULL, 0x3880287630ae6ULL, 0x32eca045beddbULL, 0x57f43365f32d0ULL, 0x53fa9b659bff6ULL}}, {{0x5c1e850f33d92ULL, 0x1ec119ab9f6f5ULL, 0x7f16f6de663e9ULL, 0x7a7d6cb16dec6ULL, 0x703e9bceaf1d2ULL}}, {{0x4c8e994885455ULL, 0x4ccb5da9cad82ULL, 0x3596bc610e975ULL, 0x7a80c0ddb9f5eULL, 0x398d93e5c4c61ULL}}},
+        {{{0x77c60d2e7e3f2ULL, 0x4061051763870ULL, 0x67bc4e0ecd2aaULL, 0x2bb941f1373b9ULL, 0x699c9c9002c30ULL}}, {{0x3d16733e248f3ULL, 0x0e2b7e14be389ULL, 0x42c0ddaf6784aULL, 0x589ea1fc67850ULL, 0x53b09b5ddf191ULL}}, {{0x6a7235946f1ccULL, 0x6b99cbb2fbe60ULL, 0x6d3a5d6485c62ULL, 0x4839466e923c0ULL, 0x51caf30c6fcddULL}}},
+        {{{0x2f99a18ac54c7ULL, 0x398a39661ee6fULL, 0x384331e40cde3ULL, 0x4cd15c4de19a6ULL, 0x12ae29c189f8eULL}}, {{0x3a7427674e00aULL, 0x6142f4f7e74c1ULL, 0x4cc93318c3a15ULL, 0x6d51bac2b1ee7ULL, 0x5504aa292383fULL}}, {{0x6c0cb1f0d01cfULL, 0x187469ef5d533ULL, 0x27138883747bfULL, 0x2f52ae53a90e8ULL, 0x5fd14fe958ebaULL}}},
+        {{{0x2fe5ebf93cb8eULL, 0x226da8acbe788ULL, 0x10883a2fb7ea1ULL, 0x094707842cf44ULL, 0x7dd73f960725dULL}}, {{0x42ddf2845ab2cULL, 0x6214ffd3276bbULL, 0x00b8d181a5246ULL, 0x268a6d579eb20ULL, 0x093ff26e58647ULL}}, {{0x524fe68059829ULL, 0x65b75e47cb621ULL, 0x15eb0a5d5cc19ULL, 0x05209b3929d5aULL, 0x2f59bcbc86b47ULL}}},
+        {{{0x1d560b691c301ULL, 0x7f5bafce3ce08ULL, 0x4cd561614806cULL, 0x4588b6170b188ULL, 0x2aa55e3d01082ULL}}, {{0x47d429917135fULL, 0x3eacfa07af070ULL, 0x1deab46b46e44ULL, 0x7a53f3ba46cdfULL, 0x5458b42e2e51aULL}}, {{0x192e60c07444fULL, 0x5ae8843a21daaULL, 0x6d721910b1538ULL, 0x3321a95a6417eULL, 0x13e9004a8a768ULL}}},
+    },
+    {
+        {{{0x284c5806b467cULL, 0x77cebac0f63ccULL, 0x5e3498b17da65ULL, 0x5b845b3ecac59ULL, 0x3d88d66a81cd8ULL}}, {{0x5b5556c032bffULL, 0x6e5252f475976ULL, 0x7b606ef7dc646ULL, 0x1fae0ffb99356ULL, 0x71ade8bb68be0ULL}}, {{0x67a93204ed789ULL, 0x173f415c5516eULL, 0x739221dd8bf2bULL, 0x7d9bb8ff5e636ULL, 0x343062158ff05ULL}}},
+        {{{0x219072a7b31b4ULL, 0x6b54af002df9cULL, 0x51e4c9135eb71ULL, 0x5f587613b5343ULL, 0x6d6d9d5d1fda4ULL}}, {{0x5a1a7e1f5bf49ULL, 0x5ba8e6c125c0bULL, 0x730cbd89915f5ULL, 0x7e6bbee583bb9ULL, 0x0a5d94969cdd5ULL}}, {{0x1a58ae9b08183ULL, 0x6382b87116456ULL, 0x428145ff65741ULL, 0x1af54c091bb42ULL, 0x33384cbabb7f3ULL}}},
+        {{{0x4627a26218b8dULL, 0x3f8f5018c2677ULL, 0x4fa7b9baa02c8ULL, 0x02cca2c58958bULL, 0x076247be0e2f3ULL}}, {{0x7a2680ca2c7b5ULL, 0x08df6c9fb478dULL, 0x0c75b786d4208ULL, 0x644f5a99a4e2aULL, 0x5278b38f6b879ULL}}, {{0x105f61416375aULL, 0x6d0b57d748a5cULL, 0x699f0dbb25ebcULL, 0x58093735a8311ULL, 0x5cf0e856f3d4fULL}}},
+        {{{0x6ce313db342a8ULL, 0x37085b6fdd7d5ULL, 0x5fc4fbf2e8d8dULL, 0x2e37446331040ULL, 0x1b9438aa4e76dULL}}, {{0x168731ae8cab4ULL, 0x3d969f258bed9ULL, 0x336f0f97881d0ULL, 0x6fb96d29df2c6ULL, 0x2dddfea269970ULL}}, {{0x0777e166f031aULL, 0x621f6f465114aULL, 0x43ef5d819ece7ULL, 0x4828c92e4d300ULL, 0x6df9b575cc740ULL}}},
+        {{{0x7c35b48cade41ULL, 0x3f646504e1d9bULL, 0x2806da9aa211cULL, 0x794ba05251220ULL, 0x471e5796003b5ULL}}, {{0x1192927f6bdcfULL, 0x74807ac394858ULL, 0x6787d863e4645ULL, 0x7c6ee0e2d3345ULL, 0x1596047804ec0ULL}}, {{0x6bbb3aced37acULL, 0x6bd24119d5b52ULL, 0x2baeb89e8908eULL, 0x71792662e181cULL, 0x50c356afdc5daULL}}},
+        {{{0x59cdf1b31b964ULL, 0x0b194a35e79fdULL, 0x2307e13d21aa6ULL, 0x6000a44b932f5ULL, 0x784a53dd932acULL}}, {{0x4bf4341c30318ULL, 0x2306303b9c13bULL, 0x078a687bae818ULL, 0x2d860bce0676eULL, 0x1dbf7b89073f3ULL}}, {{0x1f9df14fc4920ULL, 0x1988933fca5b3ULL, 0x73c000ddb32d8ULL, 0x0755209965df2ULL, 0x3f93d82354f00ULL}}},
+        {{{0x412d179e14978ULL, 0x6777d7febdd55ULL, 0x18f389ffe48ffULL, 0x2ffa57b31f203ULL, 0x0fd381a811a5fULL}}, {{0x3e7689e04ce85ULL, 0x3c088ca683030ULL, 0x223b6b19e3edcULL, 0x4cd56c902c7b3ULL, 0x5da350d3532b0ULL}}, {{0x6aceca436df54ULL, 0x515cd3add1e4aULL, 0x5740db0422d85ULL, 0x7a8106cc365b5ULL, 0x655957b9fee2aULL}}},
+        {{{0x1409bd002d0acULL, 0x0b6b99b34d7b8ULL, 0x37a17b1999809ULL, 0x786c118bee27dULL, 0x02fe934b6ad7dULL}}, {{0x0b07fa902030fULL, 0x55e8c7a2875d5ULL, 0x1e1e983e231d9ULL, 0x2540ad841b31eULL, 0x08eab1148267aULL}}, {{0x4f100cfb7ea74ULL, 0x6743968559debULL, 0x3ca17888a25d8ULL, 0x52aea67062a67ULL, 0x30408c048a146ULL}}},
+    },
+    {
+        {{{0x600c9193b877fULL, 0x21c1b8a0d7765ULL, 0x379927fb38ea2ULL, 0x70d7679dbe01bULL, 0x5f46040898de9ULL}}, {{0x58845832fcedbULL, 0x135cd7f0c6e73ULL, 0x53ffbdfe8e35bULL, 0x22f195e06e55bULL, 0x73937e8814bceULL}}, {{0x37116297bf48dULL, 0x45a9e0d069720ULL, 0x25af71aa744ecULL, 0x41af0cb8aaba3ULL, 0x2cf8a4e891d5eULL}}},
+        {{{0x5487e17d06ba2ULL, 0x3872a032d6596ULL, 0x65e28c09348e0ULL, 0x27b6bb2ce40c2ULL, 0x7a6f7f2891d6aULL}}, {{0x3fd8707110f67ULL, 0x26f8716a92db2ULL, 0x1cdaa1b753027ULL, 0x504be58b52661ULL, 0x2049bd6e58252ULL}}, {{0x1fd8d6a9aef49ULL, 0x7cb67b7216fa1ULL, 0x67aff53c3b982ULL, 0x20ea610da9628ULL, 0x6011aadfc5459ULL}}},
+        {{{0x6d0c802cbf890ULL, 0x141bfed554c7bULL, 0x6dbb667ef4263ULL, 0x58f3126857edcULL, 0x69ce18b779340ULL}}, {{0x7926dcf95f83cULL, 0x42e25120e2becULL, 0x63de96df1fa15ULL, 0x4f06b50f3f9ccULL, 0x6fc5cc1b0b62fULL}}, {{0x75528b29879cbULL, 0x79a8fd2125a3dULL, 0x27c8d4b746ab8ULL, 0x0f8893f02210cULL, 0x15596b3ae5710ULL}}},
+        {{{0x731167e5124caULL, 0x17b38e8bbe13fULL, 0x3d55b942f9056ULL, 0x09c1495be913fULL, 0x3aa4e241afb6dULL}}, {{0x739d23f9179a2ULL, 0x632fadbb9e8c4ULL, 0x7c8522bfe0c48ULL, 0x6ed0983ef5aa9ULL, 0x0d2237687b5f4ULL}}, {{0x138bf2a3305f5ULL, 0x1f45d24d86598ULL, 0x5274bad2160feULL, 0x1b6041d58d12aULL, 0x32fcaa6e4687aULL}}},
+        {{{0x7a4732787ccdfULL, 0x11e427c7f0640ULL, 0x03659385f8c64ULL, 0x5f4ead9766bfbULL, 0x746f6336c2600ULL}}, {{0x56e8dc57d9af5ULL, 0x5b3be17be4f78ULL, 0x3bf928cf82f4bULL, 0x52e55600a6f11ULL, 0x4627e9cefebd6ULL}}, {{0x2f345ab6c971cULL, 0x653286e63e7e9ULL, 0x51061b78a23adULL, 0x14999acb54501ULL, 0x7b4917007ed66ULL}}},
+        {{{0x41b28dd53a2ddULL, 0x37be85f87ea86ULL, 0x74be3d2a85e41ULL, 0x1be87fac96ca6ULL, 0x1d03620fe08cdULL}}, {{0x5fb5cab84b064ULL, 0x2513e778285b0ULL, 0x457383125e043ULL, 0x6bda3b56e223dULL, 0x122ba376f844fULL}}, {{0x232cda2b4e554ULL, 0x0422ba30ff840ULL, 0x751e7667b43f5ULL, 0x6261755da5f3eULL, 0x02c70bf52b68eULL}}},
+        {{{0x532bf458d72e1ULL, 0x40f96e796b59cULL, 0x22ef79d6f9da3ULL, 0x501ab67beca77ULL, 0x6b0697e3feb43ULL}}, {{0x7ec4b5d0b2fbbULL, 0x200e910595450ULL, 0x742057105715eULL, 0x2f07022530f60ULL, 0x26334f0a409efULL}}, {{0x0f04adf62a3c0ULL, 0x5e0edb48bb6d9ULL, 0x7c34aa4fbc003ULL, 0x7d74e4e5cac24ULL, 0x1cc37f43441b2ULL}}},
+        {{{0x656f1c9ceaeb9ULL, 0x7031cacad5aecULL, 0x1308cd0716c57ULL, 0x41c1373941942ULL, 0x3a346f772f196ULL}}, {{0x7565a5cc7324fULL, 0x01ca0d5244a11ULL, 0x116b067418713ULL, 0x0a57d8c55edaeULL, 0x6c6809c103803ULL}}, {{0x55112e2da6ac8ULL, 0x6363d0a3dba5aULL, 0x319c98ba6f40cULL, 0x2e84b03a36ec7ULL, 0x05911b9f6ef7cULL}}},
+    },
+    {
+        {{{0x18980c5fe9f94ULL, 0x52e2dfab90038ULL, 0x656821b35959dULL, 0x4c140b022e1e8ULL, 0x6e2b7f3266cc7ULL}}, {{0x4d756b637ff2dULL, 0x1f930fe189d3bULL, 0x7ef1edfb130d2ULL, 0x543e76ac942f9ULL, 0x3305354793e1eULL}}, {{0x02468f7c3568fULL, 0x04332e9967990ULL, 0x6e04d8277a6eaULL, 0x53155db914e5aULL, 0x44e2017a6fbebULL}}},
+        {{{0x02cf3b6ca6ecdULL, 0x7c31e941850ffULL, 0x013955d603e24ULL, 0x60e82c4980393ULL, 0x6cab6ac256d19ULL}}, {{0x2a74354dab774ULL, 0x789d5e0635898ULL, 0x20e3c5e397530ULL, 0x2755bb611e921ULL, 0x749a098f68dceULL}}, {{0x7e0a02cc1de60ULL, 0x7ea38aaeb7b9bULL, 0x4eafbac0c9997ULL, 0x3031606197883ULL, 0x6a882014cd7b8ULL}}},
+        {{{0x1d17caf4feb6eULL, 0x0566754947a22ULL, 0x2d1b0c0142ee9ULL, 0x6ba8ba8a61e77ULL, 0x54bedb8b1bc27ULL}}, {{0x292fea4747fb5ULL, 0x123f4b57134a5ULL, 0x11e933b704a91ULL, 0x6276c16d4a5dcULL, 0x4d77edce9512cULL}}, {{0x0e14577e2189cULL, 0x55ff33888aef9ULL, 0x4cd4d0e8f91bdULL, 0x35498a26fe436ULL, 0x3a96559e7c421ULL}}},
+        {{{0x3896880baaa52ULL, 0x09e50b281c892ULL, 0x15122d93262bfULL, 0x73ff7a553cdd2ULL, 0x5278c510a57aaULL}}, {{0x50d37f42ad2eeULL, 0x093143f7ea24aULL, 0x62532ca2de380ULL, 0x6862ea983c119ULL, 0x02c84e4e3e498ULL}}, {{0x5d074294c0b94ULL, 0x71be31ff6d4a9ULL, 0x6ba0d9bd5751aULL, 0x0b2f837f662c6ULL, 0x588657668190dULL}}},
+        {{{0x034f03de25cc3ULL, 0x5dad02a92d7ebULL, 0x207a24ae21f22ULL, 0x7c9a882910d4aULL, 0x6760ed19f7723ULL}}, {{0x712311aef7117ULL, 0x02453d258fa8eULL, 0x4566e5d40d0c4ULL, 0x4e4bd4af0c24eULL, 0x2449959b8b5d2ULL}}, {{0x3a3b7ac35e160ULL, 0x7f750840accd3ULL, 0x2013c1cbb33dcULL, 0x2738d760f8be0ULL, 0x0d96bc031856fULL}}},
+        {{{0x534b0cc7505e1ULL, 0x682d86a51163aULL, 0x58b0a74cb3400ULL, 0x5fc659b52c003ULL, 0x5bfe69b9237a0ULL}}, {{0x0be7775c52d82ULL, 0x6aa9a15572663ULL, 0x1dcf64532dd92ULL, 0x44555e79e93e6ULL, 0x3bf4d18481232ULL}}, {{0x6ab7e78a151abULL, 0x1332126ec6307ULL, 0x31f8cd6efa643ULL, 0x7c47fb8beb725ULL, 0x4c5cddb325f39ULL}}},
+        {{{0x50967e7a9f902ULL, 0x789eb68cfcaeeULL, 0x5dee918b0dff7ULL, 0x195d930b31d18ULL, 0x3a375e78dc2d5ULL}}, {{0x6b74d6190a6ebULL, 0x485b71e9c981eULL, 0x4c55d8083aa06ULL, 0x610d45eb7becbULL, 0x33b1d60262ac7ULL}}, {{0x1e72f2d4dddeaULL, 0x30c58c0f91028ULL, 0x4f2bf439babfaULL, 0x1a311e1422c2bULL, 0x46b9476f4ff97ULL}}},
+        {{{0x5505c0d58359fULL, 0x0ff85188d6242ULL, 0x7a99938a8804fULL, 0x70f925050d7c4ULL, 0x4400b638a1130ULL}}, {{0x7fea44f901e5cULL, 0x6e43096f04183ULL, 0x4536e20ac2dbeULL, 0x0a172c3ffc880ULL, 0x37130f364785aULL}}, {{0x1b76496ed19c3ULL, 0x61da64e460740ULL, 0x72856c4c7802aULL, 0x763a905442bc1ULL, 0x06aab9875accbULL}}},
+    },
+    {
+        {{{0x1acf3512eeaefULL, 0x2639839692a69ULL, 0x669a234830507ULL, 0x68b920c0603d4ULL, 0x555ef9d1c64b2ULL}}, {{0x39983f5df0ebbULL, 0x1ea2589959826ULL, 0x6ce638703cdd6ULL, 0x6311678898505ULL, 0x6b3cecf9aa270ULL}}, {{0x770ba3b73bd08ULL, 0x11475f7e186d4ULL, 0x0251bc9892bbcULL, 0x24eab9bffcc5aULL, 0x675f4de133817ULL}}},
+        {{{0x7f6d93bdab31dULL, 0x1f3aca5bfd425ULL, 0x2fa521c1c9760ULL, 0x62180ce27f9cdULL, 0x60f450b882cd3ULL}}, {{0x452036b1782fcULL, 0x02d95b07681c5ULL, 0x5901cf99205b2ULL, 0x290686e5eecb4ULL, 0x13d99df70164cULL}}, {{0x35ec321e5c0caULL, 0x13ae337f44029ULL, 0x4008e813f2da7ULL, 0x640272f8e0c3aULL, 0x1c06de9e55edaULL}}},
+        {{{0x52b40ff6d69aaULL, 0x31b8809377ffaULL, 0x536625cd14c2cULL, 0x516af252e17d1ULL, 0x78096f8e7d32bULL}}, {{0x77ad6a33ec4e2ULL, 0x717c5dc11d321ULL, 0x4a114559823e4ULL, 0x306ce50a1e2b1ULL, 0x4cf38a1fec2dbULL}}, {{0x2aa650dfa5ce7ULL, 0x54916a8f19415ULL, 0x00dc96fe71278ULL, 0x55f2784e63eb8ULL, 0x373cad3a26091ULL}}},
+        {{{0x6a8fb89ddbbadULL, 0x78c35d5d97e37ULL, 0x66e3674ef2cb2ULL, 0x34347ac53dd8fULL, 0x21547eda5112aULL}}, {{0x4634d82c9f57cULL, 0x4249268a6d652ULL, 0x6336d687f2ff7ULL, 0x4fe4f4e26d9a0ULL, 0x0040f3d945441ULL}}, {{0x5e939fd5986d3ULL, 0x12a2147019bdfULL, 0x4c466e7d09cb2ULL, 0x6fa5b95d203ddULL, 0x63550a334a254ULL}}},
+        {{{0x2584572547b49ULL, 0x75c58811c1377ULL, 0x4d3c637cc171bULL, 0x33d30747d34e3ULL, 0x39a92bafaa7d7ULL}}, {{0x7d6edb569cf37ULL, 0x60194a5dc2ca0ULL, 0x5af59745e10a6ULL, 0x7a8f53e004875ULL, 0x3eea62c7daf78ULL}}, {{0x4c713e693274eULL, 0x6ed1b7a6eb3a4ULL, 0x62ace697d8e15ULL, 0x266b8292ab075ULL, 0x68436a0665c9cULL}}},
+        {{{0x6d317e820107cULL, 0x090815d2ca3caULL, 0x03ff1eb1499a1ULL, 0x23960f050e319ULL, 0x5373669c91611ULL}}, {{0x235e8202f3f27ULL, 0x44c9f2eb61780ULL, 0x630905b1d7003ULL, 0x4fcc8d274ead1ULL, 0x17b6e7f68ab78ULL}}, {{0x014ab9a0e5257ULL, 0x09939567f8ba5ULL, 0x4b47b2a423c82ULL, 0x688d7e57ac42dULL, 0x1cb4b5a678f87ULL}}},
+        {{{0x4aa62a2a007e7ULL, 0x61e0e38f62d6eULL, 0x02f888fcc4782ULL, 0x7562b83f21c00ULL, 0x2dc0fd2d82ef6ULL}}, {{0x4c06b394afc6cULL, 0x4931b4bf636ccULL, 0x72b60d0322378ULL, 0x25127c6818b25ULL, 0x330bca78de743ULL}}, {{0x6ff841119744eULL, 0x2c560e8e49305ULL, 0x7254fefe5a57aULL, 0x67ae2c560a7dfULL, 0x3c31be1b369f1ULL}}},
+        {{{0x0bc93f9cb4272ULL, 0x3f8f9db73182dULL, 0x2b235eabae1c4ULL, 0x2ddbf8729551aULL, 0x41cec1097e7d5ULL}}, {{0x4864d08948aeeULL, 0x5d237438df61eULL, 0x2b285601f7067ULL, 0x25dbcbae6d753ULL, 0x330b61134262dULL}}, {{0x619d7a26d808aULL, 0x3c3b3c2adbef2ULL, 0x6877c9eec7f52ULL, 0x3beb9ebe1b66dULL, 0x26b44cd91f287ULL}}},
+    },
+    {
+        {{{0x4842db0285f37ULL, 0x208fdf91bf5e8ULL, 0x0825e6a1d4c62ULL, 0x2bccaba7048fcULL, 0x0e378d6069615ULL}}, {{0x29035393aa6d8ULL, 0x634257639a601ULL, 0x24f0888ad4044ULL, 0x5d6bd8ffb3bf8ULL, 0x4309c1f8cab82ULL}}, {{0x2917183075a55ULL, 0x24d6013fb9b3fULL, 0x0f7bc392f6d6bULL, 0x43bbc14d6966bULL, 0x078fc54975fd3ULL}}},
+        {{{0x04b5bb833a98aULL, 0x585a986661c40ULL, 0x2b3a44d11dd77ULL, 0x0549d5122033fULL, 0x272630e3d58e0ULL}}, {{0x7bd1428878f2dULL, 0x3a3d2843430fbULL, 0x5cd068c4d18dbULL, 0x65c278be4a892ULL, 0x5df98d4bad296ULL}}, {{0x78fd0ecc90b54ULL, 0x3624086b33e6cULL, 0x562e26fc00516ULL, 0x4d713392fde1bULL, 0x4325e4aa73a71ULL}}},
+        {{{0x4629acf69f59dULL, 0x1dbab577e9da4ULL, 0x2cb59eca92873ULL, 0x2169a9ae50fabULL, 0x5d8c68d043b1bULL}}, {{0x5c6ef433c3493ULL, 0x3f01b7f186cafULL, 0x4dcb6b994dd7aULL, 0x4a3a3fe96a32dULL, 0x4966ab79796e7ULL}}, {{0x32d4de3b42b0aULL, 0x562d48c039dc6ULL, 0x62e8f93613968ULL, 0x21bbc121c3b83ULL, 0x77ed1eb4184eeULL}}},
+        {{{0x543f89e92ed1aULL, 0x55fc8e338c30bULL, 0x3c0fd3ec1287bULL, 0x5eea4cfdf4453ULL, 0x5d8b0d2f3c859ULL}}, {{0x4e13f201839a0ULL, 0x447c7be2c37faULL, 0x5747f8ebbbfffULL, 0x5e05b2d827835ULL, 0x52e085fb2b62fULL}}, {{0x079eaa54cf2baULL, 0x5600364dce248ULL, 0x5ebdff75c9197ULL, 0x6813421de7ee4ULL, 0x0524b42b55eacULL}}},
+        {{{0x0dcad9b829eacULL, 0x516beaf3a1783ULL, 0x4e108cc8eb9f4ULL, 0x644e1a3091534ULL, 0x1a6110b2e7d4aULL}}, {{0x55dbee45447b0ULL, 0x3412400bddfa1ULL, 0x1d5e72db3b0d4ULL, 0x522ccd23c222bULL, 0x59d242a216e7fULL}}, {{0x33f6ae66997acULL, 0x546c3073489f0ULL, 0x42ad495a125d8ULL, 0x2a334c2ef60cbULL, 0x53045e89dcb1fULL}}},
+        {{{0x23cde8d45fe12ULL, 0x31c889c5a509bULL, 0x5f8d662f50b08ULL, 0x1595428cb3c0fULL, 0x7642c93f5616eULL}}, {{0x3b346d75353dbULL, 0x175ca23c45971ULL, 0x42b9bbff3f2c9ULL, 0x5aee5d246a06aULL, 0x26e3bae5f4f7cULL}}, {{0x3daa74595f8e4ULL, 0x170af57d68464ULL, 0x164c9bb79a232ULL, 0x45d1fe2474b0eULL, 0x0b2e73ca15c9bULL}}},
+        {{{0x7bfaf79c03a55ULL, 0x0a9976b59e1c7ULL, 0x4f78e7cc1debcULL, 0x57beae2a922edULL, 0x015e68c1476a4ULL}}, {{0x34428c17f5026ULL, 0x47f6b5394fad7ULL, 0x46719127ac9c8ULL, 0x30171bdd2818cULL, 0x21ce380db59a6ULL}}, {{0x5285220066a38ULL, 0x246ae15de783aULL, 0x1ae29365580f9ULL, 0x6e4c1932cd391ULL, 0x5dd689091f8eeULL}}},
+        {{{0x22591a5313084ULL, 0x5dac4e10e43a0ULL, 0x42ff48328b52aULL, 0x3a4435095c297ULL, 0x56e6c439ad7daULL}}, {{0x484debfd3c856ULL, 0x1166bfe489975ULL, 0x672b41c58930dULL, 0x5f45bfc46e52eULL, 0x3b0e574da2c2eULL}}, {{0x4ff4942bdbae6ULL, 0x4565bc3ef38e0ULL, 0x14beb617886b7ULL, 0x5e0f4aed9f9abULL, 0x0822b5378f08eULL}}},
+    },
+    {
+        {{{0x7f29362730383ULL, 0x7fd7951459c36ULL, 0x7504c512d49e7ULL, 0x087ed7e3bc55fULL, 0x7deb10149c726ULL}}, {{0x048478f387475ULL, 0x69397d9678a3eULL, 0x67c8156c976f3ULL, 0x2eb4d5589226cULL, 0x2c709e6c1c10aULL}}, {{0x2af6a8766ee7aULL, 0x08aaa79a1d96cULL, 0x42f92d59b2fb0ULL, 0x1752c40009c07ULL, 0x08e68e9ff62ceULL}}},
+        {{{0x509d50ab8f2f9ULL, 0x1b8ab247be5e5ULL, 0x5d9b2e6b2e486ULL, 0x4faa5479a1339ULL, 0x4cb13bd738f71ULL}}, {{0x5500a4bc130adULL, 0x127a17a938695ULL, 0x02a26fa34e36dULL, 0x584d12e1ecc28ULL, 0x2f1f3f87eeba3ULL}}, {{0x48c75e515b64aULL, 0x75b6952071ef0ULL, 0x5d46d42965406ULL, 0x7746106989f9fULL, 0x19a1e353c0ae2ULL}}},
+        {{{0x172cdd596bdbdULL, 0x0731ddf881684ULL, 0x10426d64f8115ULL, 0x71a4fd8a9a3daULL, 0x736bd3990266aULL}}, {{0x47560bafa05c3ULL, 0x418dcabcc2fa3ULL, 0x35991cecf8682ULL, 0x24371a94b8c60ULL, 0x41546b11c20c3ULL}}, {{0x32d509334b3b4ULL, 0x16c102cae70aaULL, 0x1720dd51bf445ULL, 0x5ae662faf9821ULL, 0x412295a2b87faULL}}},
+        {{{0x55261e293eac6ULL, 0x06426759b65ccULL, 0x40265ae116a48ULL, 0x6c02304bae5bcULL, 0x0760bb8d195adULL}}, {{0x19b88f57ed6e9ULL, 0x4cdbf1904a339ULL, 0x42b49cd4e4f2cULL, 0x71a2e771909d9ULL, 0x14e153ebb52d2ULL}}, {{0x61a17cde6818aULL, 0x53dad34108827ULL, 0x32b32c55c55b6ULL, 0x2f9165f9347a3ULL, 0x6b34be9bc33acULL}}},
+        {{{0x469656571f2d3ULL, 0x0aa61ce6f423fULL, 0x3f940d71b27a1ULL, 0x185f19d73d16aULL, 0x01b9c7b62e6ddULL}}, {{0x72f643a78c0b2ULL, 0x3de45c04f9e7bULL, 0x706d68d30fa5cULL, 0x696f63e8e2f24ULL, 0x2012c18f0922dULL}}, {{0x355e55ac89d29ULL, 0x3e8b414ec7101ULL, 0x39db07c520c90ULL, 0x6f41e9b77efe1ULL, 0x08af5b784e4baULL}}},
+        {{{0x314d289cc2c4bULL, 0x23450e2f1bc4eULL, 0x0cd93392f92f4ULL, 0x1370c6a946b7dULL, 0x6423c1d5afd98ULL}}, {{0x499dc881f2533ULL, 0x34ef26476c506ULL, 0x4d107d2741497ULL, 0x346c4bd6efdb3ULL, 0x32b79d71163a1ULL}}, {{0x5f8d9edfcb36aULL, 0x1e6e8dcbf3990ULL, 0x7974f348af30aULL, 0x6e6724ef19c7cULL, 0x480a5efbc13e2ULL}}},
+        {{{0x14ce442ce221fULL, 0x18980a72516ccULL, 0x072f80db86677ULL, 0x703331fda526eULL, 0x24b31d47691c8ULL}}, {{0x1e70b01622071ULL, 0x1f163b5f8a16aULL, 0x56aaf341ad417ULL, 0x7989635d830f7ULL, 0x47aa27600cb7bULL}}, {{0x41eedc015f8c3ULL, 0x7cf8d27ef854aULL, 0x289e3584693f9ULL, 0x04a7857b309a7ULL, 0x545b585d14ddaULL}}},
+        {{{0x4e4d0e3b321e1ULL, 0x7451fe3d2ac40ULL, 0x666f678eea98dULL, 0x038858667feadULL, 0x4d22dc3e64c8dULL}}, {{0x7275ea0d43a0fULL, 0x681137dd7ccf7ULL, 0x1e79cbab79a38ULL, 0x22a214489a66aULL, 0x0f62f9c332ba5ULL}}, {{0x46589d63b5f39ULL, 0x7eaf979ec3f96ULL, 0x4ebe81572b9a8ULL, 0x21b7f5d61694aULL, 0x1c0fa01a36371ULL}}},
+    },
+    {
+        {{{0x6e5e854c53faeULL, 0x02569e7fe9823ULL, 0x2d9e9c9a82c1bULL, 0x1f799aa07c070ULL, 0x15f18fc3cd07eULL}}, {{0x47449bc7cd692ULL, 0x55cdee7bbfceaULL, 0x20df8a43e6afaULL, 0x0c1a5780e5380ULL, 0x63ab1b5d3f1bcULL}}, {{0x50763b028f48cULL, 0x00aad40cbe64eULL, 0x5256d6018081dULL, 0x046ea9dec0961ULL, 0x08706c9b865f5ULL}}},
+        {{{0x11b4138b41246ULL, 0x24df3584d7993ULL, 0x72eaef490ee71ULL, 0x6805cf7a4a6dbULL, 0x5fba433dd082eULL}}, {{0x4a2ab3d343dffULL, 0x5b01578c2fe6fULL, 0x333ff286a31a8ULL, 0x0dcc724f01aeaULL, 0x48b46beebaa1dULL}}, {{0x1e355c9941ad0ULL, 0x3ce8931f09389ULL, 0x198f972e5cd2bULL, 0x059a0e1ff6833ULL, 0x0ecfedf8e8e71ULL}}},
+        {{{0x77463e9403762ULL, 0x5d1bf99392e89ULL, 0x793378fde6a37ULL, 0x21a8b1d324b2aULL, 0x3b61788db284fULL}}, {{0x30f9f9cd470d9ULL, 0x37485ec010ec8ULL, 0x6b6b57ad8ab32ULL, 0x0400c4c14be2cULL, 0x7789dd2db78c5ULL}}, {{0x228190d6ef6b2ULL, 0x648d9c97f5644ULL, 0x42db31ea5299aULL, 0x467a360d3bd27ULL, 0x4236ccffeb733ULL}}},
+        {{{0x02dbfda777df6ULL, 0x1817306d3c77bULL, 0x430da65c6c5dfULL, 0x0f88e874231c2ULL, 0x5a71945b48e2dULL}}, {{0x7404d0d55e274ULL, 0x33895a56a7092ULL, 0x6a55cd1b1998fULL, 0x39e7617d86cd6ULL, 0x2617e120cdb8fULL}}, {{0x03dd5405b4b42ULL, 0x0821648a12de4ULL, 0x0aa2118c9fb18ULL, 0x5b54e1a391856ULL, 0x77de29fc11ffeULL}}},
+        {{{0x6138fecced2caULL, 0x27d52c773506bULL, 0x0583a9a327abcULL, 0x44964afdfe059ULL, 0x575e66f3ad877ULL}}, {{0x457c983b778a8ULL, 0x53affd2259615ULL, 0x47d67714f3732ULL, 0x6d630e15c2a7fULL, 0x3a1a2cf0f0de7ULL}}, {{0x03a27c88fcb3aULL, 0x124ebd8161330ULL, 0x5b0af94d1699eULL, 0x45922cbc4e87fULL, 0x62f882651e70aULL}}},
+        {{{0x22986698a19e0ULL, 0x42e9af14e2db0ULL, 0x32c7d1f726087ULL, 0x628a0d42f98fbULL, 0x352721c2bcda9ULL}}, {{0x2e2c759ff1be4ULL, 0x12761c816e10bULL, 0x7c9cde4524517ULL, 0x54ae233f3fd3fULL, 0x4eeecf0ad5c73ULL}}, {{0x29952213fc985ULL, 0x1a6d142e8c906ULL, 0x3056a94421f3cULL, 0x610c72930d8b3ULL, 0x2d5b2d842ed24ULL}}},
+        {{{0x7d13d196ac533ULL, 0x59b7017c56bd6ULL, 0x3d6b890ddc8d3ULL, 0x67670a267fe3eULL, 0x5226bcf9c441aULL}}, {{0x7ebd9ebd3ded1ULL, 0x6e720432e8059ULL, 0x0c286df516c85ULL, 0x3613abb7c09ffULL, 0x5691b6f9a34efULL}}, {{0x66c7223e5b547ULL, 0x6d0661acf2f3dULL, 0x62b73a5bd7d41ULL, 0x601f6b9f0f4b6ULL, 0x27c3da1e1d8ccULL}}},
+        {{{0x02e71630ef9f6ULL, 0x0656c99dc0506ULL, 0x58a4afb0b5288ULL, 0x78c0484101825ULL, 0x5fca747aa82adULL}}, {{0x1efb23fe24c74ULL, 0x3e2ca37c02fd7ULL, 0x61637a8f943d2ULL, 0x07c9f53996e10ULL, 0x17377bd75bb81ULL}}, {{0x203c35c258ea5ULL, 0x58d79619e2465ULL, 0x110859a1bc8e8ULL, 0x3159ed6c68697ULL, 0x04a8933cab768ULL}}},
+    },
+    {
+        {{{0x02b0e8c936a50ULL, 0x6b83b58b6cd21ULL, 0x37ed8d3e72680ULL, 0x0a037db9f2a62ULL, 0x4005419b1d2bcULL}}, {{0x604b622943dffULL, 0x1c899f6741a58ULL, 0x60219e2f232fbULL, 0x35fae92a7f9cbULL, 0x0fa3614f3b1caULL}}, {{0x3febdb9be82f0ULL, 0x5e74895921400ULL, 0x553ea38822706ULL, 0x5a17c24cfc88cULL, 0x1fba218aef40aULL}}},
+        {{{0x657043e7b0194ULL, 0x5c11b55efe9e7ULL, 0x7737bc6a074fbULL, 0x0eae41ce355ccULL, 0x6c535d13ff776ULL}}, {{0x49448fac8f53eULL, 0x34f74c6e8356aULL, 0x0ad780607dba2ULL, 0x7213a7eb63eb6ULL, 0x392e3acaa8c86ULL}}, {{0x534e93e8a35afULL, 0x08b10fd02c997ULL, 0x26ac2acb81e05ULL, 0x09d8c98ce3b79ULL, 0x25e17fe4d50acULL}}},
+        {{{0x77ff576f121a7ULL, 0x4e5f9b0fc722bULL, 0x46f949b0d28c8ULL, 0x4cde65d17ef26ULL, 0x6bba828f89698ULL}}, {{0x09bd71e04f676ULL, 0x25ac841f2a145ULL, 0x1a47eac823871ULL, 0x1a8a8c36c581aULL, 0x255751442a9fbULL}}, {{0x1bc6690fe3901ULL, 0x314132f5abc5aULL, 0x611835132d528ULL, 0x5f24b8eb48a57ULL, 0x559d504f7f6b7ULL}}},
+        {{{0x091e7f6d266fdULL, 0x36060ef037389ULL, 0x18788ec1d1286ULL, 0x287441c478eb0ULL, 0x123ea6a3354bdULL}}, {{0x38378b3eb54d5ULL, 0x4d4aaa78f94eeULL, 0x4a002e875a74dULL, 0x10b851367b17cULL, 0x01ab12d5807e3ULL}}, {{0x5189041e32d96ULL, 0x05b062b090231ULL, 0x0c91766e7b78fULL, 0x0aa0f55a138ecULL, 0x4a3961e2c918aULL}}},
+        {{{0x7d644f3233f1eULL, 0x1c69f9e02c064ULL, 0x36ae5e5266898ULL, 0x08fc1dad38b79ULL, 0x68aceead9bd41ULL}}, {{0x43be0f8e6bba0ULL, 0x68fdffc614e3bULL, 0x4e91dab5b3be0ULL, 0x3b1d4c9212ff0ULL, 0x2cd6bce3fb1dbULL}}, {{0x4c90ef3d7c210ULL, 0x496f5a0818716ULL, 0x79cf88cc239b8ULL, 0x2cb9c306cf8dbULL, 0x595760d5b508fULL}}},
+        {{{0x2cbebfd022790ULL, 0x0b8822aec1105ULL, 0x4d1cfd226bcccULL, 0x515b2fa4971beULL, 0x2cb2c5df54515ULL}}, {{0x1bfe104aa6397ULL, 0x11494ff996c25ULL, 0x64251623e5800ULL, 0x0d49fc5e044beULL, 0x709fa43edcb29ULL}}, {{0x25d8c63fd2acaULL, 0x4c5cd29dffd61ULL, 0x32ec0eb48af05ULL, 0x18f9391f9b77cULL, 0x70f029ecf0c81ULL}}},
+        {{{0x2afaa5e10b0b9ULL, 0x61de08355254dULL, 0x0eb587de3c28dULL, 0x4f0bb9f7dbbd5ULL, 0x44eca5a2a74bdULL}}, {{0x307b32eed3e33ULL, 0x6748ab03ce8c2ULL, 0x57c0d9ab810bcULL, 0x42c64a224e98cULL, 0x0b7d5d8a6c314ULL}}, {{0x448327b95d543ULL, 0x0146681e3a4baULL, 0x38714adc34e0cULL, 0x4f26f0e298e30ULL, 0x272224512c7deULL}}},
+        {{{0x3bb8a42a975fcULL, 0x6f2d5b46b17efULL, 0x7b6a9223170e5ULL, 0x053713fe3b7e6ULL, 0x19735fd7f6bc2ULL}}, {{0x492af49c5342eULL, 0x2365cdf5a0357ULL, 0x32138a7ffbb60ULL, 0x2a1f7d14646feULL, 0x11b5df18a44ccULL}}, {{0x390d042c84266ULL, 0x1efe32a8fdc75ULL, 0x6925ee7ae1238ULL, 0x4af9281d0e832ULL, 0x0fef911191df8ULL}}},
+    },
+    {
+        {{{0x5dcb85b1c16b7ULL, 0x5078f64f4ad56ULL, 0x5545efa5303f3ULL, 0x7d552588e0d39ULL, 0x499238d0ba0eaULL}}, {{0x07ca1ab1c6eb9ULL, 0x7c2d6d0f6762aULL, 0x1ea46aef5123cULL, 0x7609a2afdbf96ULL, 0x7579229e2f2adULL}}, {{0x46e527aba8b57ULL, 0x0f17a2c8f7d9eULL, 0x5c1bfbc568231ULL, 0x06abd78e3532fULL, 0x6345fa78f03a3ULL}}},
+        {{{0x3cbe9bdd8f0a4ULL, 0x37fa2ee60527aULL, 0x45ea1d76c54b0ULL, 0x77f3edeee36bfULL, 0x3e1a71cc8f426ULL}}, {{0x2f95f1015e7a1ULL, 0x3b536804c7be0ULL, 0x7a8441de43b10ULL, 0x464a69d075099ULL, 0x54f70be7e33afULL}}, {{0x4a3e390babd62ULL, 0x4e05239067907ULL, 0x5e4031203b78dULL, 0x7d0e4401c6669ULL, 0x2c5fc0231ec31ULL}}},
+        {{{0x2e4d102456e65ULL, 0x0395a8f723884ULL, 0x2dbff761d052bULL, 0x0078ac9715dd1ULL, 0x75d9d2bff5c21ULL}}, {{0x2911717038b4fULL, 0x4393bddf03fd7ULL, 0x43620d39448dcULL, 0x5e30e4bf273aeULL, 0x68afae7a23dc3ULL}}, {{0x1b4763626e81cULL, 0x6d79405dbab7bULL, 0x7c1dece2659a4ULL, 0x23885208c9eb0ULL, 0x3097a24200ce5ULL}}},
+        {{{0x2e7246695c486ULL, 0x686b512c0f42cULL, 0x344a8dc4c758cULL, 0x1b198290ab0d0ULL, 0x56704bada6afbULL}}, {{0x27734c7f8b84cULL, 0x7c0364e1d2ae8ULL, 0x395929bc50684ULL, 0x6a40168d6ff5aULL, 0x4bb23d92ce83bULL}}, {{0x44aa752f912b9ULL, 0x59b0cee1915edULL, 0x723356179997dULL, 0x53f261ad641d1ULL, 0x2b7a29c010a58ULL}}},
+        {{{0x10a23bf00086eULL, 0x3dce6dfef8670ULL, 0x1248b52bf3a49ULL, 0x30d9eb0733871ULL, 0x11ce9e714f960ULL}}, {{0x07f77d0c1cec3ULL, 0x6d758925f1880ULL, 0x1a76abe344082ULL, 0x670197614eabfULL, 0x599408759d95fULL}}, {{0x6f713d815bac1ULL, 0x3a90b7c4b8433ULL, 0x144f147c50519ULL, 0x1c9b6aa23e627ULL, 0x174926be5ef44ULL}}},
+        {{{0x5d41593ea022eULL, 0x441da1ddac7deULL, 0x4e0b23172f306ULL, 0x0d6c7e9276783ULL, 0x6fa42ead06d8eULL}}, {{0x6b2f9fc5bd5bbULL, 0x55c3b021c36bbULL, 0x4a871664b6a9cULL, 0x51257e267ee5bULL, 0x497d78813fc22ULL}}, {{0x6824a1f73371fULL, 0x389eb6ce6dc4eULL, 0x3e91b9dfdf3c0ULL, 0x64b3f100ff182ULL, 0x785a36a357808ULL}}},
+        {{{0x442985d517bc3ULL, 0x0f5cca6cf00e0ULL, 0x169dd8dab355bULL, 0x31580513cc1ccULL, 0x5167effae5126ULL}}, {{0x7bdfd63014d2bULL, 0x38d94eaf1704bULL, 0x02d77c32148daULL, 0x647ad97e6942eULL, 0x12ab214c58048ULL}}, {{0x6a9e10f53c4b6ULL, 0x3f159234297a9ULL, 0x3306ae859cf71ULL, 0x512d47c0d2715ULL, 0x33a92a7924332ULL}}},
+        {{{0x15ba0218f2adaULL, 0x0e661f7394f75ULL, 0x31b641f3fd08aULL, 0x72a6d6d24b6abULL, 0x5380c296f4beeULL}}, {{0x1f49927996c02ULL, 0x31c09a2ea53baULL, 0x740b0f832cec1ULL, 0x7588fbf444b3fULL, 0x2f964268cb8b3ULL}}, {{0x7270466898d0aULL, 0x3215fe7ef53a9ULL, 0x76ae914f4261eULL, 0x34e684f79b133ULL, 0x7761455e7b1c6ULL}}},
+    },
+};
+
+#endif /* PICOCRYPTO_ED25519_BASE_TABLE_H */
@@ -0,0 +1,480 @@
+/*
+ * Ed25519 field and group arithmetic on 5x51-bit limbs (ref10 / donna layout).
+ *
+ * A field element is n[0] + n[1]*2^51 + ... + n[4]*2^204 mod p = 2^255 - 19.
+ * Every function returns "weak" elements (limbs < 2^52) and accepts weak
+ * inputs; products use unsigned __int128 and fold 2^255 = 19 (mod p). Only
+ * ed25519_fe_tobytes reduces to the canonical value in [0, p).
+ *
+ * Points use extended twisted-Edwards coordinates (X:Y:Z:T), x = X/Z,
+ * y = Y/Z, xy = T/Z, on -x^2 + y^2 = 1 + d x^2 y^2. Additions take the second
+ * operand either "cached" (Y+X, Y-X, Z, 2dT) or "precomp" affine
+ * (y+x, y-x, 2dxy). Table lookups (ed25519_select) are constant time; the
+ * rest only avoids branching on secret data where noted.
+ */
+#ifndef PICOCRYPTO_ED25519_FIELD_H
+#define PICOCRYPTO_ED25519_FIELD_H
+
+#include <stdint.h>
+#include <string.h>
+
+typedef unsigned __int128 ed25519_u128;
+
+typedef struct {
+    uint64_t n[5];
+} ed25519_fe;
+
+typedef struct {
+    ed25519_fe X, Y, Z, T;
+} ed25519_ge;
+
+typedef struct {
+    ed25519_fe YplusX, YminusX, Z, T2d;
+} ed25519_ge_cached;
+
+typedef struct {
+    ed25519_fe yplusx, yminusx, xy2d;
+} ed25519_ge_precomp;
+
+#define ED25519_M51 0x7FFFFFFFFFFFFULL
+
+/* d = -121665/121666, 2d and sqrt(-1) mod p. */
+static const ed25519_fe ed25519_d = {{
+    0x34dca135978a3ULL, 0x1a8283b156ebdULL, 0x5e7a26001c029ULL, 0x739c663a03cbbULL, 0x52036cee2b6ffULL,
+}};
+static const ed25519_fe ed25519_d2 = {{
+    0x69b9426b2f159ULL, 0x35050762add7aULL, 0x3cf44c0038052ULL, 0x6738cc7407977ULL, 0x2406d9dc56dffULL,
+}};
+static const ed25519_fe ed25519_sqrtm1 = {{
+    0x61b274a0ea0b0ULL, 0x0d5a5fc8f189dULL, 0x7ef5e9cbd0c60ULL, 0x78595a6804c9eULL, 0x2b8324804fc1dULL,
+}};
+
+/* 4p limb-wise; added before subtracting so limbs stay >= 0. */
+#define ED25519_4P0 0x1FFFFFFFFFFFB4ULL
+#define ED25519_4P1 0x1FFFFFFFFFFFFCULL
+
+static inline void ed25519_fe_0(ed25519_fe *r) {
+    memset(r, 0, sizeof(*r));
+}
+
+static inline void ed25519_fe_1(ed25519_fe *r) {
+    memset(r, 0, sizeof(*r));
+    r->n[0] = 1;
+}
+
+static inline void ed25519_fe_carry(ed25519_fe *r) {
+    uint64_t c;
+    c = r->n[0] >> 51; r->n[0] &= ED25519_M51; r->n[1] += c;
+    c = r->n[1] >> 51; r->n[1] &= ED25519_M51; r->n[2] += c;
+    c = r->n[2] >> 51; r->n[2] &= ED25519_M51; r->n[3] += c;
+    c = r->n[3] >> 51; r->n[3] &= ED25519_M51; r->n[4] += c;
+    c = r->n[4] >> 51; r->n[4] &= ED25519_M51; r->n[0] += 19 * c;
+}
+
+static inline void ed25519_fe_add(ed25519_fe *r, const ed25519_fe *a, const ed25519_fe *b) {
+    int i;
+    for (i = 0; i < 5; i++) r->n[i] = a->n[i] + b->n[i];
+    ed25519_fe_carry(r);
+}
+
+static inline void ed25519_fe_sub(ed25519_fe *r, const ed25519_fe *a, const ed25519_fe *b) {
+    r->n[0] = a->n[0] + ED25519_4P0 - b->n[0];
+    r->n[1] = a->n[1] + ED25519_4P1 - b->n[1];
+    r->n[2] = a->n[2] + ED25519_4P1 - b->n[2];
+    r->n[3] = a->n[3] + ED25519_4P1 - b->n[3];
+    r->n[4] = a->n[4] + ED25519_4P1 - b->n[4];
+    ed25519_fe_carry(r);
+}
+
+static inline void ed25519_fe_neg(ed25519_fe *r, const ed25519_fe *a) {
+    ed25519_fe zero;
+    ed25519_fe_0(&zero);
+    ed25519_fe_sub(r, &zero, a);
+}
+
+static void ed25519_fe_mul(ed25519_fe *r, const ed25519_fe *a, const ed25519_fe *b) {
+    const uint64_t a0 = a->n[0], a1 = a->n[1], a2 = a->n[2], a3 = a->n[3], a4 = a->n[4];
+    const uint64_t b0 = b->n[0], b1 = b->n[1], b2 = b->n[2], b3 = b->n[3], b4 = b->n[4];
+    const uint64_t b1_19 = 19 * b1, b2_19 = 19 * b2, b3_19 = 19 * b3, b4_19 = 19 * b4;
+    ed25519_u128 t0, t1, t2, t3, t4;
+    uint64_t c;
+    t0 = (ed25519_u128)a0 * b0 + (ed25519_u128)a1 * b4_19 + (ed25519_u128)a2 * b3_19
+       + (ed25519_u128)a3 * b2_19 + (ed25519_u128)a4 * b1_19;
+    t1 = (ed25519_u128)a0 * b1 + (ed25519_u128)a1 * b0 + (ed25519_u128)a2 * b4_19
+       + (ed25519_u128)a3 * b3_19 + (ed25519_u128)a4 * b2_19;
+    t2 = (ed25519_u128)a0 * b2 + (ed25519_u128)a1 * b1 + (ed25519_u128)a2 * b0
+       + (ed25519_u128)a3 * b4_19 + (ed25519_u128)a4 * b3_19;
+    t3 = (ed25519_u128)a0 * b3 + (ed25519_u128)a1 * b2 + (ed25519_u128)a2 * b1
+       + (ed25519_u128)a3 * b0 + (ed25519_u128)a4 * b4_19;
+    t4 = (ed25519_u128)a0 * b4 + (ed25519_u128)a1 * b3 + (ed25519_u128)a2 * b2
+       + (ed25519_u128)a3 * b1 + (ed25519_u128)a4 * b0;
+    t1 += (uint64_t)(t0 >> 51);
+    t2 += (uint64_t)(t1 >> 51);
+    t3 += (uint64_t)(t2 >> 51);
+    t4 += (uint64_t)(t3 >> 51);
+    c = (uint64_t)(t4 >> 51);
+    r->n[0] = ((uint64_t)t0 & ED25519_M51) + 19 * c;
+    r->n[1] = (uint64_t)t1 & ED25519_M51;
+    r->n[2] = (uint64_t)t2 & ED25519_M51;
+    r->n[3] = (uint64_t)t3 & ED25519_M51;
+    r->n[4] = (uint64_t)t4 & ED25519_M51;
+    r->n[1] += r->n[0] >> 51;
+    r->n[0] &= ED25519_M51;
+}
+
+static inline void ed25519_fe_sq(ed25519_fe *r, const ed25519_fe *a) {
+    ed25519_fe_mul(r, a, a);
+}
+
+/* r = a^(2^n): n squarings; r may alias a. */
+static void ed25519_fe_sqn(ed25519_fe *r, const ed25519_fe *a, int n) {
+    int i;
+    ed25519_fe_sq(r, a);
+    for (i = 1; i < n; i++) ed25519_fe_sq(r, r);
+}
+
+/*
+ * r = z^(2^250 - 1) and z11 = z^11: the shared prefix of the ref10 addition
+ * chains for p - 2 and (p - 5) / 8 (250 squarings, 11 multiplications).
+ */
+static void ed25519_fe_pow_2_250_1(ed25519_fe *r, ed25519_fe *z11, const ed25519_fe *z) {
+    ed25519_fe t0, t1, t2;
+    ed25519_fe_sq(&t0, z);             /* z^2 */
+    ed25519_fe_sqn(&t1, &t0, 2);       /* z^8 */
+    ed25519_fe_mul(&t1, &t1, z);       /* z^9 */
+    ed25519_fe_mul(z11, &t0, &t1);     /* z^11 */
+    ed25519_fe_sq(&t0, z11);           /* z^22 */
+    ed25519_fe_mul(&t0, &t0, &t1);     /* z^(2^5 - 1) */
+    ed25519_fe_sqn(&t1, &t0, 5);
+    ed25519_fe_mul(&t0, &t1, &t0);     /* z^(2^10 - 1) */
+    ed25519_fe_sqn(&t1, &t0, 10);
+    ed25519_fe_mul(&t1, &t1, &t0);     /* z^(2^20 - 1) */
+    ed25519_fe_sqn(&t2, &t1, 20);
+    ed25519_fe_mul(&t1, &t2, &t1);     /* z^(2^40 - 1) */
+    ed25519_fe_sqn(&t1, &t1, 10);
+    ed25519_fe_mul(&t0, &t1, &t0);     /* z^(2^50 - 1) */
+    ed25519_fe_sqn(&t1, &t0, 50);
+    ed25519_fe_mul(&t1, &t1, &t0);     /* z^(2^100 - 1) */
+    ed25519_fe_sqn(&t2, &t1, 100);
+    ed25519_fe_mul(&t1, &t2, &t1);     /* z^(2^200 - 1) */
+    ed25519_fe_sqn(&t1, &t1, 50);
+    ed25519_fe_mul(r, &t1, &t0);       /* z^(2^250 - 1) */
+}
+
+/* r = a^(p - 2) = a^(2^255 - 21) = 1/a (0 for a = 0). */
+static void ed25519_fe_invert(ed25519_fe *r, const ed25519_fe *a) {
+    ed25519_fe t, z11;
+    ed25519_fe_pow_2_250_1(&t, &z11, a);
+    ed25519_fe_sqn(&t, &t, 5);
+    ed25519_fe_mul(r, &t, &z11);
+}
+
+/* r = a^((p - 5) / 8) = a^(2^252 - 3), the square-root exponent. */
+static void ed25519_fe_pow22523(ed25519_fe *r, const ed25519_fe *a) {
+    ed25519_fe t, z11;
+    ed25519_fe_pow_2_250_1(&t, &z11, a);
+    ed25519_fe_sqn(&t, &t, 2);
+    ed25519_fe_mul(r, &t, a);
+}
+
+/* Little-endian 32 bytes; bit 255 is ignored. */
+static void ed25519_fe_frombytes(ed25519_fe *r, const uint8_t s[32]) {
+    uint64_t w[4];
+    int i, j;
+    for (i = 0; i < 4; i++) {
+        w[i] = 0;
+        for (j = 7; j >= 0; j--) w[i] = (w[i] << 8) | s[8 * i + j];
+    }
+    r->n[0] = w[0] & ED25519_M51;
+    r->n[1] = ((w[0] >> 51) | (w[1] << 13)) & ED25519_M51;
+    r->n[2] = ((w[1] >> 38) | (w[2] << 26)) & ED25519_M51;
+    r->n[3] = ((w[2] >> 25) | (w[3] << 39)) & ED25519_M51;
+    r->n[4] = (w[3] >> 12) & ED25519_M51;
+}
+
+/* Canonical little-endian encoding. */
+static void ed25519_fe_tobytes(uint8_t s[32], const ed25519_fe *a) {
+    ed25519_fe t = *a;
+    uint64_t q, w[4];
+    int i, j;
+    ed25519_fe_carry(&t);
+    ed25519_fe_carry(&t);
+    /* t < 2^255 + small; q = 1 iff t >= p. */
+    q = (t.n[0] + 19) >> 51;
+    q = (t.n[1] + q) >> 51;
+    q = (t.n[2] + q) >> 51;
+    q = (t.n[3] + q) >> 51;
+    q = (t.n[4] + q) >> 51;
+    t.n[0] += 19 * q;
+    t.n[1] += t.n[0] >> 51; t.n[0] &= ED25519_M51;
+    t.n[2] += t.n[1] >> 51; t.n[1] &= ED25519_M51;
+    t.n[3] += t.n[2] >> 51; t.n[2] &= ED25519_M51;
+    t.n[4] += t.n[3] >> 51; t.n[3] &= ED25519_M51;
+    t.n[4] &= ED25519_M51;
+    w[0] = t.n[0] | (t.n[1] << 51);
+    w[1] = (t.n[1] >> 13) | (t.n[2] << 38);
+    w[2] = (t.n[2] >> 26) | (t.n[3] << 25);
+    w[3] = (t.n[3] >> 39) | (t.n[4] << 12);
+    for (i = 0; i < 4; i++)
+        for (j = 0; j < 8; j++) s[8 * i + j] = (uint8_t)(w[i] >> (8 * j));
+}
+
+static inline int ed25519_fe_isnegative(const ed25519_fe *a) {
+    uint8_t s[32];
+    ed25519_fe_tobytes(s, a);
+    return s[0] & 1;
+}
+
+static inline int ed25519_fe_iszero(const ed25519_fe *a) {
+    static const uint8_t zero[32] = {0};
+    uint8_t s[32];
+    ed25519_fe_tobytes(s, a);
+    return memcmp(s, zero, 32) == 0;
+}
+
+static inline int ed25519_fe_equal(const ed25519_fe *a, const ed25519_fe *b) {
+    uint8_t sa[32], sb[32];
+    ed25519_fe_tobytes(sa, a);
+    ed25519_fe_tobytes(sb, b);
+    return memcmp(sa, sb, 32) == 0;
+}
+
+/* r = a when flag is 1, unchanged when 0; no branch on flag. */
+static inline void ed25519_fe_cmov(ed25519_fe *r, const ed25519_fe *a, uint64_t flag) {
+    const uint64_t mask = (uint64_t)0 - flag;
+    int i;
+    for (i = 0; i < 5; i++) r->n[i] ^= mask & (r->n[i] ^ a->n[i]);
+}
+
+/* --- Points --- */
+
+static inline void ed25519_ge_identity(ed25519_ge *r) {
+    ed25519_fe_0(&r->X);
+    ed25519_fe_1(&r->Y);
+    ed25519_fe_1(&r->Z);
+    ed25519_fe_0(&r->T);
+}
+
+static inline void ed25519_precomp_identity(ed25519_ge_precomp *r) {
+    ed25519_fe_1(&r->yplusx);
+    ed25519_fe_1(&r->yminusx);
+    ed25519_fe_0(&r->xy2d);
+}
+
+static inline void ed25519_ge_to_cached(ed25519_ge_cached *r, const ed25519_ge *p) {
+    ed25519_fe_add(&r->YplusX, &p->Y, &p->X);
+    ed25519_fe_sub(&r->YminusX, &p->Y, &p->X);
+    r->Z = p->Z;
+    ed25519_fe_mul(&r->T2d, &p->T, &ed25519_d2);
+}
+
+/* Affine precomp form of p (one inversion). */
+static void ed25519_ge_to_precomp(ed25519_ge_precomp *r, const ed25519_ge *p) {
+    ed25519_fe zi, x, y;
+    ed25519_fe_invert(&zi, &p->Z);
+    ed25519_fe_mul(&x, &p->X, &zi);
+    ed25519_fe_mul(&y, &p->Y, &zi);
+    ed25519_fe_add(&r->yplusx, &y, &x);
+    ed25519_fe_sub(&r->yminusx, &y, &x);
+    ed25519_fe_mul(&r->xy2d, &x, &y);
+    ed25519_fe_mul(&r->xy2d, &r->xy2d, &ed25519_d2);
+}
+
+/* r = p + q (add-2008-hwcd-3, a = -1); r may alias p. */
+static void ed25519_ge_add(ed25519_ge *r, const ed25519_ge *p, const ed25519_ge_cached *q) {
+    ed25519_fe A, B, C, D, E, F, G, H;
+    ed25519_fe_sub(&A, &p->Y, &p->X);
+    ed25519_fe_mul(&A, &A, &q->YminusX);
+    ed25519_fe_add(&B, &p->Y, &p->X);
+    ed25519_fe_mul(&B, &B, &q->YplusX);
+    ed25519_fe_mul(&C, &p->T, &q->T2d);
+    ed25519_fe_mul(&D, &p->Z, &q->Z);
+    ed25519_fe_add(&D, &D, &D);
+    ed25519_fe_sub(&E, &B, &A);
+    ed25519_fe_sub(&F, &D, &C);
+    ed25519_fe_add(&G, &D, &C);
+    ed25519_fe_add(&H, &B, &A);
+    ed25519_fe_mul(&r->X, &E, &F);
+    ed25519_fe_mul(&r->Y, &G, &H);
+    ed25519_fe_mul(&r->Z, &F, &G);
+    ed25519_fe_mul(&r->T, &E, &H);
+}
+
+/* r = p + q with q affine precomp (Z2 = 1); r may alias p. */
+static void ed25519_ge_madd(ed25519_ge *r, const ed25519_ge *p, const ed25519_ge_precomp *q) {
+    ed25519_fe A, B, C, D, E, F, G, H;
+    ed25519_fe_sub(&A, &p->Y, &p->X);
+    ed25519_fe_mul(&A, &A, &q->yminusx);
+    ed25519_fe_add(&B, &p->Y, &p->X);
+    ed25519_fe_mul(&B, &B, &q->yplusx);
+    ed25519_fe_mul(&C, &p->T, &q->xy2d);
+    ed25519_fe_add(&D, &p->Z, &p->Z);
+    ed25519_fe_sub(&E, &B, &A);
+    ed25519_fe_sub(&F, &D, &C);
+    ed25519_fe_add(&G, &D, &C);
+    ed25519_fe_add(&H, &B, &A);
+    ed25519_fe_mul(&r->X, &E, &F);
+    ed25519_fe_mul(&r->Y, &G, &H);
+    ed25519_fe_mul(&r->Z, &F, &G);
+    ed25519_fe_mul(&r->T, &E, &H);
+}
+
+/* r = -p; r may alias p. */
+static inline void ed25519_ge_neg(ed25519_ge *r, const ed25519_ge *p) {
+    ed25519_fe_neg(&r->X, &p->X);
+    r->Y = p->Y;
+    r->Z = p->Z;
+    ed25519_fe_neg(&r->T, &p->T);
+}
+
+/* r = p - q: q's negation swaps Y+X / Y-X and negates 2dT; r may alias p. */
+static void ed25519_ge_sub(ed25519_ge *r, const ed25519_ge *p, const ed25519_ge_cached *q) {
+    ed25519_fe A, B, C, D, E, F, G, H;
+    ed25519_fe_sub(&A, &p->Y, &p->X);
+    ed25519_fe_mul(&A, &A, &q->YplusX);
+    ed25519_fe_add(&B, &p->Y, &p->X);
+    ed25519_fe_mul(&B, &B, &q->YminusX);
+    ed25519_fe_mul(&C, &p->T, &q->T2d);
+    ed25519_fe_mul(&D, &p->Z, &q->Z);
+    ed25519_fe_add(&D, &D, &D);
+    ed25519_fe_sub(&E, &B, &A);
+    ed25519_fe_add(&F, &D, &C);
+    ed25519_fe_sub(&G, &D, &C);
+    ed25519_fe_add(&H, &B, &A);
+    ed25519_fe_mul(&r->X, &E, &F);
+    ed25519_fe_mul(&r->Y, &G, &H);
+    ed25519_fe_mul(&r->Z, &F, &G);
+    ed25519_fe_mul(&r->T, &E, &H);
+}
+
+/* r = p - q with q affine precomp; r may alias p. */
+static void ed25519_ge_msub(ed25519_ge *r, const ed25519_ge *p, const ed25519_ge_precomp *q) {
+    ed25519_fe A, B, C, D, E, F, G, H;
+    ed25519_fe_sub(&A, &p->Y, &p->X);
+    ed25519_fe_mul(&A, &A, &q->yplusx);
+    ed25519_fe_add(&B, &p->Y, &p->X);
+    ed25519_fe_mul(&B, &B, &q->yminusx);
+    ed25519_fe_mul(&C, &p->T, &q->xy2d);
+    ed25519_fe_add(&D, &p->Z, &p->Z);
+    ed25519_fe_sub(&E, &B, &A);
+    ed25519_fe_add(&F, &D, &C);
+    ed25519_fe_sub(&G, &D, &C);
+    ed25519_fe_add(&H, &B, &A);
+    ed25519_fe_mul(&r->X, &E, &F);
+    ed25519_fe_mul(&r->Y, &G, &H);
+    ed25519_fe_mul(&r->Z, &F, &G);
+    ed25519_fe_mul(&r->T, &E, &H);
+}
+
+/* r = 2p (dbl-2008-hwcd, a = -1, with E, F, G, H negated); r may alias p. */
+static void ed25519_ge_dbl(ed25519_ge *r, const ed25519_ge *p) {
+    ed25519_fe A, B, C, E, F, G, H;
+    ed25519_fe_sq(&A, &p->X);
+    ed25519_fe_sq(&B, &p->Y);
+    ed25519_fe_sq(&C, &p->Z);
+    ed25519_fe_add(&C, &C, &C);
+    ed25519_fe_add(&H, &A, &B);
+    ed25519_fe_add(&E, &p->X, &p->Y);
+    ed25519_fe_sq(&E, &E);
+    ed25519_fe_sub(&E, &H, &E);
+    ed25519_fe_sub(&G, &A, &B);
+    ed25519_fe_add(&F, &C, &G);
+    ed25519_fe_mul(&r->X, &E, &F);
+    ed25519_fe_mul(&r->Y, &G, &H);
+    ed25519_fe_mul(&r->Z, &F, &G);
+    ed25519_fe_mul(&r->T, &E, &H);
+}
+
+/* Constant-time t = sign(b) * row[|b| - 1] (identity for b = 0), |b| <= 8. */
+static void ed25519_select(ed25519_ge_precomp *t, const ed25519_ge_precomp row[8], int b) {
+    const uint64_t neg = (uint64_t)(b < 0);
+    const int babs = b - 2 * (-(int)neg & b);
+    ed25519_fe tmp;
+    int i;
+    ed25519_precomp_identity(t);
+    for (i = 0; i < 8; i++) {
+        const uint64_t hit = (uint64_t)(((unsigned)(babs ^ (i + 1)) - 1U) >> 31);
+        ed25519_fe_cmov(&t->yplusx, &row[i].yplusx, hit);
+        ed25519_fe_cmov(&t->yminusx, &row[i].yminusx, hit);
+        ed25519_fe_cmov(&t->xy2d, &row[i].xy2d, hit);
+    }
+    /* Negation swaps y+x / y-x and negates 2dxy. */
+    tmp = t->yplusx;
+    ed25519_fe_cmov(&t->yplusx, &t->yminusx, neg);
+    ed25519_fe_cmov(&t->yminusx, &tmp, neg);
+    ed25519_fe_neg(&tmp, &t->xy2d);
+    ed25519_fe_cmov(&t->xy2d, &tmp, neg);
+}
+
+/* Compressed encoding: y with the sign of x in bit 255. */
+/* Compressed encoding of p given zi = 1/Z. */
+static void ed25519_ge_tobytes_zinv(uint8_t s[32], const ed25519_ge *p, const ed25519_fe *zi) {
+    ed25519_fe x, y;
+    ed25519_fe_mul(&x, &p->X, zi);
+    ed25519_fe_mul(&y, &p->Y, zi);
+    ed25519_fe_tobytes(s, &y);
+    s[31] ^= (uint8_t)(ed25519_fe_isnegative(&x) << 7);
+}
+
+static void ed25519_ge_tobytes(uint8_t s[32], const ed25519_ge *p) {
+    ed25519_fe zi;
+    ed25519_fe_invert(&zi, &p->Z);
+    ed25519_ge_tobytes_zinv(s, p, &zi);
+}
+
+/*
+ * Compress n >= 1 points into s[32 * i] with one field inversion (Montgomery's
+ * trick); acc is caller scratch of n elements.
+ */
+static void ed25519_ge_tobytes_batch(uint8_t *s, const ed25519_ge *p, ed25519_fe *acc, size_t n) {
+    ed25519_fe inv, zi;
+    size_t i;
+    acc[0] = p[0].Z;
+    for (i = 1; i < n; i++) ed25519_fe_mul(&acc[i], &acc[i - 1], &p[i].Z);
+    ed25519_fe_invert(&inv, &acc[n - 1]);
+    for (i = n - 1; i > 0; i--) {
+        ed25519_fe_mul(&zi, &inv, &acc[i - 1]);
+        ed25519_fe_mul(&inv, &inv, &p[i].Z);
+        ed25519_ge_tobytes_zinv(s + 32 * i, &p[i], &zi);
+    }
+    ed25519_ge_tobytes_zinv(s, &p[0], &inv);
+}
+
+/* Decode a compressed point (RFC 8032 5.1.3). Returns 0 if s is not a valid encoding. */
+static int ed25519_ge_frombytes(ed25519_ge *r, const uint8_t s[32]) {
+    ed25519_fe u, v, v3, vxx, check;
+    uint8_t y_bytes[32];
+    const int sign = s[31] >> 7;
+    ed25519_fe_frombytes(&r->Y, s);
+    /* Reject y >= p: the canonical re-encoding must match the input. */
+    ed25519_fe_tobytes(y_bytes, &r->Y);
+    y_bytes[31] |= (uint8_t)(sign << 7);
+    if (memcmp(y_bytes, s, 32) != 0) return 0;
+    ed25519_fe_1(&r->Z);
+    /* x = u v^3 (u v^7)^((p - 5) / 8), u = y^2 - 1, v = d y^2 + 1 */
+    ed25519_fe_sq(&u, &r->Y);
+    ed25519_fe_mul(&v, &u, &ed25519_d);
+    ed25519_fe_sub(&u, &u, &r->Z);
+    ed25519_fe_add(&v, &v, &r->Z);
+    ed25519_fe_sq(&v3, &v);
+    ed25519_fe_mul(&v3, &v3, &v);
+    ed25519_fe_sq(&r->X, &v3);
+    ed25519_fe_mul(&r->X, &r->X, &v);
+    ed25519_fe_mul(&r->X, &r->X, &u);
+    ed25519_fe_pow22523(&r->X, &r->X);
+    ed25519_fe_mul(&r->X, &r->X, &v3);
+    ed25519_fe_mul(&r->X, &r->X, &u);
+    ed25519_fe_sq(&vxx, &r->X);
+    ed25519_fe_mul(&vxx, &vxx, &v);
+    if (!ed25519_fe_equal(&vxx, &u)) {
+        ed25519_fe_neg(&check, &u);
+        if (!ed25519_fe_equal(&vxx, &check)) return 0;
+        ed25519_fe_mul(&r->X, &r->X, &ed25519_sqrtm1);
+    }
+    if (ed25519_fe_iszero(&r->X) && sign) return 0;
+    if (ed25519_fe_isnegative(&r->X) != sign) ed25519_fe_neg(&r->X, &r->X);
+    ed25519_fe_mul(&r->T, &r->X, &r->Y);
+    return 1;
+}
+
+#endif /* PICOCRYPTO_ED25519_FIELD_H */
@@ -0,0 +1,132 @@
+/*
+ * Ed25519 scalars mod L = 2^252 + 27742317777372353535851937790883648493,
+ * as little-endian 4x64-bit limbs.
+ *
+ * ed25519_sc_reduce64 is Barrett reduction (HAC 14.42, b = 2^64, k = 4) of a
+ * 512-bit SHA-512 digest. The final correction is branch-free: the nonce
+ * r = H(prefix || M) mod L is secret.
+ */
+#ifndef PICOCRYPTO_ED25519_SCALAR_H
+#define PICOCRYPTO_ED25519_SCALAR_H
+
+#include <stdint.h>
+
+typedef unsigned __int128 ed25519_u128;
+
+static const uint64_t ed25519_L[4] = {
+    0x5812631a5cf5d3edULL, 0x14def9dea2f79cd6ULL, 0, 0x1000000000000000ULL,
+};
+
+/* floor(2^512 / L), 260 bits. */
+static const uint64_t ed25519_mu[5] = {
+    0xed9ce5a30a2c131bULL, 0x2106215d086329a7ULL, 0xffffffffffffffebULL,
+    0xffffffffffffffffULL, 0xfULL,
+};
+
+static inline uint64_t ed25519_load64_le(const unsigned char *p) {
+    return (uint64_t)p[0] | ((uint64_t)p[1] << 8) | ((uint64_t)p[2] << 16) |
+           ((uint64_t)p[3] << 24) | ((uint64_t)p[4] << 32) | ((uint64_t)p[5] << 40) |
+           ((uint64_t)p[6] << 48) | ((uint64_t)p[7] << 56);
+}
+
+static inline void ed25519_store64_le(unsigned char *p, uint64_t v) {
+    int i;
+    for (i = 0; i < 8; i++) p[i] = (unsigned char)(v >> (8 * i));
+}
+
+/* r = r - L if r >= L (r < 2^320, five limbs), in constant time. */
+static inline void ed25519_sc_csub_L(uint64_t r[5]) {
+    uint64_t t[5], borrow = 0, mask;
+    int i;
+    for (i = 0; i < 5; i++) {
+        const uint64_t li = i < 4 ? ed25519_L[i] : 0;
+        const ed25519_u128 d = (ed25519_u128)r[i] - li - borrow;
+        t[i] = (uint64_t)d;
+        borrow = (uint64_t)(d >> 64) & 1;
+    }
+    mask = borrow - 1; /* all ones when no borrow, i.e. r >= L */
+    for (i = 0; i < 5; i++) r[i] = (t[i] & mask) | (r[i] & ~mask);
+}
+
+/* out = in mod L, in a 64-byte little-endian integer (a SHA-512 digest). */
+static void ed25519_sc_reduce64(unsigned char out[32], const unsigned char in[64]) {
+    uint64_t x[8], q3[5], r[5], q2[10] = {0}, r2[5] = {0}, borrow = 0;
+    int i, j;
+    for (i = 0; i < 8; i++) x[i] = ed25519_load64_le(in + 8 * i);
+
+    /* q3 = floor(floor(x / b^3) * mu / b^5) */
+    for (i = 0; i < 5; i++) {
+        uint64_t carry = 0;
+        for (j = 0; j < 5; j++) {
+            const ed25519_u128 t =
+                (ed25519_u128)x[3 + i] * ed25519_mu[j] + q2[i + j] + carry;
+            q2[i + j] = (uint64_t)t;
+            carry = (uint64_t)(t >> 64);
+        }
+        q2[i + 5] = carry;
+    }
+    for (i = 0; i < 5; i++) q3[i] = q2[5 + i];
+
+    /* r2 = q3 * L mod b^5 */
+    for (i = 0; i < 5; i++) {
+        uint64_t carry = 0;
+        for (j = 0; i + j < 5 && j < 4; j++) {
+            const ed25519_u128 t = (ed25519_u128)q3[i] * ed25519_L[j] + r2[i + j] + carry;
+            r2[i + j] = (uint64_t)t;
+            carry = (uint64_t)(t >> 64);
+        }
+        if (i + j < 5) r2[i + j] += carry;
+    }
+
+    /* r = (x mod b^5) - r2 mod b^5; then 0 <= r < 3L */
+    for (i = 0; i < 5; i++) {
+        const ed25519_u128 d = (ed25519_u128)x[i] - r2[i] - borrow;
+        r[i] = (uint64_t)d;
+        borrow = (uint64_t)(d >> 64) & 1;
+    }
+    ed25519_sc_csub_L(r);
+    ed25519_sc_csub_L(r);
+    for (i = 0; i < 4; i++) ed25519_store64_le(out + 8 * i, r[i]);
+}
+
+/* out = (a * b + c) mod L for little-endian 32-byte a, b, c (a * b + c < 2^512). */
+static void ed25519_sc_muladd(unsigned char out[32], const unsigned char a[32],
+                              const unsigned char b[32], const unsigned char c[32]) {
+    uint64_t x[4], y[4], z[8] = {0};
+    unsigned char wide[64];
+    ed25519_u128 t;
+    uint64_t carry;
+    int i, j;
+    for (i = 0; i < 4; i++) {
+        x[i] = ed25519_load64_le(a + 8 * i);
+        y[i] = ed25519_load64_le(b + 8 * i);
+        z[i] = ed25519_load64_le(c + 8 * i);
+    }
+    for (i = 0; i < 4; i++) {
+        carry = 0;
+        for (j = 0; j < 4; j++) {
+            t = (ed25519_u128)x[i] * y[j] + z[i + j] + carry;
+            z[i + j] = (uint64_t)t;
+            carry = (uint64_t)(t >> 64);
+        }
+        for (j = i + 4; carry && j < 8; j++) {
+            t = (ed25519_u128)z[j] + carry;
+            z[j] = (uint64_t)t;
+            carry = (uint64_t)(t >> 64);
+        }
+    }
+    for (i = 0; i < 8; i++) ed25519_store64_le(wide + 8 * i, z[i]);
+    ed25519_sc_reduce64(out, wide);
+}
+
+/* 1 if the little-endian 32-byte s is < L (a canonical signature scalar). */
+static int ed25519_sc_is_canonical(const unsigned char s[32]) {
+    int i;
+    for (i = 3; i >= 0; i--) {
+        const uint64_t w = ed25519_load64_le(s + 8 * i);
+        if (w != ed25519_L[i]) return w < ed25519_L[i];
+    }
+    return 0;
+}
+
+#endif /* PICOCRYPTO_ED25519_SCALAR_H */
@@ -1,6 +1,8 @@
 # cython: language_level=3
 # Declarations for cycrypto.curves.secp256k1
 cpdef bytes privkey_to_pubkey(bytes privkey)
+cpdef bytes batch_privkey_to_pubkey(bytes privkeys)
 cpdef bytes recover_pubkey(bytes msg_hash, object r, object s, int recid)
 cpdef tuple sign_recoverable(bytes privkey, bytes msg_hash)
+cpdef tuple sign_recoverable_mv(const unsigned char[::1] privkey, const unsigned char[::1] msg_hash)
 cpdef str privkey_to_address(bytes privkey)
@@ -1,5 +1,9 @@
 # Stubs for cycrypto.curves.secp256k1 (Cython extension)
+from collections.abc import Buffer
+
 def privkey_to_pubkey(privkey: bytes) -> bytes: ...
+def batch_privkey_to_pubkey(privkeys: bytes) -> bytes: ...
 def recover_pubkey(msg_hash: bytes, r: int, s: int, recid: int) -> bytes: ...
 def sign_recoverable(privkey: bytes, msg_hash: bytes) -> tuple[int, int, int]: ...
+def sign_recoverable_mv(privkey: Buffer, msg_hash: Buffer) -> tuple[int, int, int]: ...
 def privkey_to_address(privkey: bytes) -> str: ...
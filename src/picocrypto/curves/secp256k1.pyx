@@ -1,62 +1,468 @@
 """secp256k1 (Bitcoin/Ethereum curve): key derivation, ECDSA sign, public key recovery."""
 
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
+from cpython.mem cimport PyMem_Free, PyMem_Malloc
+from libc.stdint cimport int64_t, uint64_t
+from libc.string cimport memcmp
+
 from ..hashes cimport keccak256
+from ..hashes.hmac_sha256 cimport _hmac_sha256_parts
 
 
-cdef object _P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
-cdef object _N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
-cdef object _Gx = 0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798
-cdef object _Gy = 0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8
+# Field and Jacobian group arithmetic on 5x52-bit limbs live in secp256k1_field.h.
+cdef extern from "secp256k1_field.h" nogil:
+    ctypedef struct secp256k1_fe:
+        uint64_t n[5]
+    ctypedef struct secp256k1_ge:
+        secp256k1_fe x
+        secp256k1_fe y
+        int infinity
+    ctypedef struct secp256k1_gej:
+        secp256k1_fe x
+        secp256k1_fe y
+        secp256k1_fe z
+        int infinity
+    void secp256k1_fe_set_int(secp256k1_fe* r, uint64_t v)
+    void secp256k1_fe_set_b32(secp256k1_fe* r, const unsigned char* b)
+    void secp256k1_fe_get_b32(unsigned char* b, const secp256k1_fe* a)
+    void secp256k1_fe_add(secp256k1_fe* r, const secp256k1_fe* a)
+    void secp256k1_fe_mul(secp256k1_fe* r, const secp256k1_fe* a, const secp256k1_fe* b)
+    void secp256k1_fe_sqr(secp256k1_fe* r, const secp256k1_fe* a)
+    int secp256k1_fe_sqrt(secp256k1_fe* r, const secp256k1_fe* a)
+    int secp256k1_fe_is_odd(const secp256k1_fe* a)
+    void secp256k1_fe_normalize(secp256k1_fe* r)
+    void secp256k1_gej_set_infinity(secp256k1_gej* r)
+    void secp256k1_ge_set_gej(secp256k1_ge* r, const secp256k1_gej* a)
+    void secp256k1_ge_set_gej_batch(secp256k1_ge* r, const secp256k1_gej* a, secp256k1_fe* zs, size_t n)
+    void secp256k1_gej_set_ge(secp256k1_gej* r, const secp256k1_ge* a)
+    void secp256k1_ge_neg(secp256k1_ge* r, const secp256k1_ge* a)
+    void secp256k1_gej_double(secp256k1_gej* r, const secp256k1_gej* a)
+    void secp256k1_gej_add_ge(secp256k1_gej* r, const secp256k1_gej* a, const secp256k1_ge* b)
+    void secp256k1_gej_add(secp256k1_gej* r, const secp256k1_gej* a, const secp256k1_gej* b)
+    void secp256k1_ge_cmov(secp256k1_ge* r, const secp256k1_ge* a, int flag)
+    void secp256k1_gej_cmov(secp256k1_gej* r, const secp256k1_gej* a, int flag)
+    void secp256k1_ge_table_select(secp256k1_ge* r, const secp256k1_ge* table, int n, int idx)
 
-cdef inline object _mod_inv(object a, object n):
-    if a < 0:
-        a = (a % n + n) % n
-    t, r = 0, n
-    new_t, new_r = 1, a
-    while new_r:
-        q = r // new_r
-        t, new_t = new_t, t - q * new_t
-        r, new_r = new_r, r - q * new_r
-    if r != 1:
+cdef extern from "Python.h":
+    # int <-> fixed-width big-endian bytes (3.13+) without an intermediate bytes object.
+    Py_ssize_t PyLong_AsNativeBytes(object v, void* buf, Py_ssize_t n, int flags) except -1
+    object PyLong_FromUnsignedNativeBytes(const void* buf, size_t n, int flags)
+    enum:
+        Py_ASNATIVEBYTES_BIG_ENDIAN
+        Py_ASNATIVEBYTES_UNSIGNED_BUFFER
+        Py_ASNATIVEBYTES_REJECT_NEGATIVE
+        Py_ASNATIVEBYTES_ALLOW_INDEX
+
+# Optional: with gmpy2 installed, field/scalar arithmetic runs on GMP integers.
+try:
+    from gmpy2 import invert as _gmp_invert
+    from gmpy2 import mpz as _mpz
+except ImportError:
+    _gmp_invert = None
+    _mpz = int
+
+
+cdef object _P = _mpz(0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F)
+cdef object _N = _mpz(0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141)
+cdef object _Gx = _mpz(0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798)
+cdef object _Gy = _mpz(0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8)
+# Derived constants, so hot paths do no per-call arithmetic on the curve parameters.
+cdef object _N_HALF = _N // 2
+
+# GLV endomorphism (libsecp256k1 scalar_split_lambda): lambda * (x, y) = (beta * x, y),
+# and k = k1 + k2 * lambda (mod n) with |k1|, |k2| < 2**128 from the lattice basis below.
+cdef object _LAMBDA = _mpz(0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72)
+cdef object _BETA = _mpz(0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE)
+cdef object _MINUS_B1 = _mpz(0xE4437ED6010E88286F547FA90ABFE4C3)
+cdef object _MINUS_B2 = _mpz(0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFE8A280AC50774346DD765CDA83DB1562C)
+cdef object _G1 = _mpz(0x3086D221A7D46BCDE86C90E49284EB153DAA8A1471E8CA7FE893209A45DBB031)
+cdef object _G2 = _mpz(0xE4437ED6010E88286F547FA90ABFE4C4221208AC9DF506C61571B4AE8AC47F71)
+cdef object _HALF_2_384 = _mpz(1) << 383
+
+cdef object _M64 = 0xFFFFFFFFFFFFFFFF
+# 2**-62 mod n: rescales d, e after each batch of 62 divsteps.
+cdef object _INV2_62_N = pow(2, -62, int(_N))
+
+
+cdef int64_t _divsteps_62(int64_t delta, uint64_t f, uint64_t g, int64_t* t) noexcept nogil:
+    """62 branch-free Bernstein-Yang divsteps on the low 64 bits of f (odd) and g.
+
+    Writes the transition matrix (u, v, q, r), scaled by 2**62, to t and returns
+    the new delta.
+    """
+    cdef int64_t u = 1, v = 0, q = 0, r = 1
+    cdef int64_t c1, c2, x
+    cdef uint64_t y
+    cdef int i
+    for i in range(62):
+        # c1: g is odd; c2: also delta > 0, so swap (f, g) -> (g, -f) first.
+        c1 = -<int64_t>(g & 1)
+        c2 = c1 & -<int64_t>(delta > 0)
+        y = (f ^ g) & <uint64_t>c2
+        f ^= y
+        g ^= y
+        g = (g ^ <uint64_t>c2) - <uint64_t>c2
+        x = (u ^ q) & c2
+        u ^= x
+        q ^= x
+        q = (q ^ c2) - c2
+        x = (v ^ r) & c2
+        v ^= x
+        r ^= x
+        r = (r ^ c2) - c2
+        delta = (delta ^ c2) - c2
+        g += f & <uint64_t>c1
+        q += u & c1
+        r += v & c1
+        delta += 1
+        g >>= 1
+        u *= 2
+        v *= 2
+    t[0] = u
+    t[1] = v
+    t[2] = q
+    t[3] = r
+    return delta
+
+
+cdef object _safegcd_inv(object a, object m, object inv2_62):
+    """Inverse of a modulo odd m (< 2**256) in a fixed 12 x 62 = 744 divsteps."""
+    cdef int64_t delta = 1
+    cdef int64_t t[4]
+    cdef int i
+    f, g, d, e = m, a % m, 0, 1
+    for i in range(12):
+        delta = _divsteps_62(delta, <uint64_t>(f & _M64), <uint64_t>(g & _M64), t)
+        f, g = (t[0] * f + t[1] * g) >> 62, (t[2] * f + t[3] * g) >> 62
+        d, e = (t[0] * d + t[1] * e) * inv2_62 % m, (t[2] * d + t[3] * e) * inv2_62 % m
+    if g != 0 or (f != 1 and f != -1):
         raise ValueError("no inverse")
-    return t % n
-
-cdef inline tuple _point_add(object px, object py, object qx, object qy):
-    if (px, py) == (0, 0):
-        return (qx, qy)
-    if (qx, qy) == (0, 0):
-        return (px, py)
-    if px == qx:
-        if py == qy:
-            lam = (3 * px * px) * _mod_inv(2 * py, _P) % _P
-        else:
-            return (0, 0)
+    return d * f % m
+
+
+cdef inline object _mod_inv(object a, object n):
+    """Inverse mod n for public values; gmpy2's invert is fast but not constant-time."""
+    if _gmp_invert is not None:
+        try:
+            return _gmp_invert(a, n)
+        except ZeroDivisionError:
+            raise ValueError("no inverse")
+    if n is _N:
+        return _safegcd_inv(a, n, _INV2_62_N)
+    return _safegcd_inv(a, n, pow(2, -62, n))
+
+
+cdef int _scalar_to_b32(unsigned char* out, object k) except -1:
+    """Big-endian 32 bytes of 0 <= k < 2**256 (int or mpz), written straight to out."""
+    cdef int flags = (
+        Py_ASNATIVEBYTES_BIG_ENDIAN | Py_ASNATIVEBYTES_UNSIGNED_BUFFER
+        | Py_ASNATIVEBYTES_REJECT_NEGATIVE | Py_ASNATIVEBYTES_ALLOW_INDEX
+    )
+    if PyLong_AsNativeBytes(k, out, 32, flags) > 32:
+        raise OverflowError("int too big to convert")
+    return 0
+
+
+cdef inline object _b32_to_int(const unsigned char* b):
+    return PyLong_FromUnsignedNativeBytes(b, 32, Py_ASNATIVEBYTES_BIG_ENDIAN)
+
+
+cdef object _fe_to_int(const secp256k1_fe* a):
+    cdef unsigned char b[32]
+    secp256k1_fe_get_b32(b, a)
+    return _b32_to_int(b)
+
+
+cdef bytes _ge_serialize(const secp256k1_ge* a):
+    """Uncompressed SEC1 encoding: 0x04 || x || y."""
+    cdef unsigned char b[65]
+    b[0] = 0x04
+    secp256k1_fe_get_b32(&b[1], &a.x)
+    secp256k1_fe_get_b32(&b[33], &a.y)
+    return PyBytes_FromStringAndSize(<char*>b, 65)
+
+
+# Fixed-base table for G: _G_TABLE[i][j - 1] = j * 2**(5 * i) * G (affine), j = 1..16.
+# A scalar is recoded into signed base-32 digits in [-15, 16]; each nonzero digit
+# costs one table lookup and one mixed addition, and no doublings.
+cdef enum:
+    _G_ROWS = 53
+cdef unsigned char _GX_B32[32]
+cdef unsigned char _GY_B32[32]
+cdef secp256k1_ge _G_TABLE[_G_ROWS][16]
+
+_scalar_to_b32(_GX_B32, _Gx)
+_scalar_to_b32(_GY_B32, _Gy)
+cdef unsigned char _N_B32[32]
+cdef unsigned char _ZERO_B32[32]
+_scalar_to_b32(_N_B32, _N)
+_scalar_to_b32(_ZERO_B32, 0)
+
+
+cdef int _build_g_table() except -1:
+    """Fill _G_TABLE in Jacobian form, then convert all rows with one shared inversion."""
+    cdef Py_ssize_t n = _G_ROWS * 16
+    cdef secp256k1_gej* pj = <secp256k1_gej*>PyMem_Malloc(n * sizeof(secp256k1_gej))
+    cdef secp256k1_fe* zs = <secp256k1_fe*>PyMem_Malloc(n * sizeof(secp256k1_fe))
+    cdef secp256k1_gej* row
+    cdef secp256k1_gej base
+    cdef int i, j
+    if pj == NULL or zs == NULL:
+        PyMem_Free(pj)
+        PyMem_Free(zs)
+        raise MemoryError()
+    base.infinity = 0
+    secp256k1_fe_set_b32(&base.x, _GX_B32)
+    secp256k1_fe_set_b32(&base.y, _GY_B32)
+    secp256k1_fe_set_int(&base.z, 1)
+    with nogil:
+        for i in range(_G_ROWS):
+            row = &pj[16 * i]
+            row[0] = base
+            for j in range(1, 16):
+                secp256k1_gej_add(&row[j], &row[j - 1], &row[0])
+            secp256k1_gej_double(&base, &row[15])
+        secp256k1_ge_set_gej_batch(&_G_TABLE[0][0], pj, zs, n)
+    PyMem_Free(pj)
+    PyMem_Free(zs)
+    return 0
+
+
+_build_g_table()
+
+cdef secp256k1_fe _BETA_FE
+
+# Odd multiples for the wNAF loop in _ecmult_glv: entry i is (2i + 1) * P.
+cdef enum:
+    _WINDOW_A = 5
+    _WINDOW_G = 8
+    _TABLE_A = 8  # 2 ** (_WINDOW_A - 2)
+    _TABLE_G = 64  # 2 ** (_WINDOW_G - 2)
+cdef secp256k1_ge _G_ODD[_TABLE_G]
+cdef secp256k1_ge _G_ODD_LAMBDA[_TABLE_G]
+
+
+cdef void _ge_mul_lambda(secp256k1_ge* r, const secp256k1_ge* a) noexcept nogil:
+    """r = lambda * a = (beta * x, y)."""
+    secp256k1_fe_mul(&r.x, &a.x, &_BETA_FE)
+    secp256k1_fe_normalize(&r.x)
+    r.y = a.y
+    r.infinity = a.infinity
+
+
+cdef void _odd_multiples(
+    secp256k1_ge* out, secp256k1_ge* out_lambda, const secp256k1_ge* p, int n,
+    secp256k1_gej* pj, secp256k1_fe* zs,
+) noexcept nogil:
+    """out[i] = (2i + 1) * p and out_lambda[i] = lambda * out[i], for i < n, with one
+    inversion. pj and zs are scratch for n points and n field elements."""
+    cdef secp256k1_gej d
+    cdef int i
+    secp256k1_gej_set_ge(&pj[0], p)
+    secp256k1_gej_double(&d, &pj[0])
+    for i in range(1, n):
+        secp256k1_gej_add(&pj[i], &pj[i - 1], &d)
+    secp256k1_ge_set_gej_batch(out, pj, zs, n)
+    for i in range(n):
+        _ge_mul_lambda(&out_lambda[i], &out[i])
+
+
+cdef unsigned char _beta_b32[32]
+_scalar_to_b32(_beta_b32, _BETA)
+secp256k1_fe_set_b32(&_BETA_FE, _beta_b32)
+
+cdef secp256k1_gej _odd_pj[_TABLE_G]
+cdef secp256k1_fe _odd_zs[_TABLE_G]
+_odd_multiples(_G_ODD, _G_ODD_LAMBDA, &_G_TABLE[0][0], _TABLE_G, _odd_pj, _odd_zs)
+# -lambda * G: removes the starting offset of _ecmult_gen.
+cdef secp256k1_ge _NEG_G_LAMBDA
+secp256k1_ge_neg(&_NEG_G_LAMBDA, &_G_ODD_LAMBDA[0])
+
+
+cdef inline int _scalar_bits(const unsigned char* k32, int pos, int count) noexcept nogil:
+    """count (<= 8) bits of the big-endian 256-bit k32 starting at bit pos (LSB = 0)."""
+    cdef int v = 0
+    cdef int i, bit
+    for i in range(count):
+        bit = pos + i
+        if bit < 256:
+            v |= ((k32[31 - (bit >> 3)] >> (bit & 7)) & 1) << i
+    return v
+
+
+cdef void _ecmult_gen(secp256k1_gej* r, const unsigned char* k32) noexcept nogil:
+    """r = k * G via the signed-window table, for a secret k.
+
+    Each row is read in full with a masked select, the digit's sign is applied
+    with a conditional move, and the addition always runs (its result is kept
+    only for a nonzero digit), so neither memory accesses nor branches follow
+    the digits. The sum starts at lambda * G, removed at the end, so the
+    accumulator does not pass through infinity.
+    """
+    cdef int i, w, carry = 0, neg, absw
+    cdef secp256k1_ge t, tn
+    cdef secp256k1_gej s
+    secp256k1_gej_set_ge(r, &_G_ODD_LAMBDA[0])
+    for i in range(_G_ROWS):
+        w = _scalar_bits(k32, 5 * i, 5) + carry
+        carry = ((16 - w) >> 31) & 1
+        w -= carry << 5
+        neg = (w >> 31) & 1
+        absw = (w ^ -neg) + neg
+        secp256k1_ge_table_select(&t, _G_TABLE[i], 16, (absw - 1) & 15)
+        secp256k1_ge_neg(&tn, &t)
+        secp256k1_ge_cmov(&t, &tn, neg)
+        secp256k1_gej_add_ge(&s, r, &t)
+        secp256k1_gej_cmov(r, &s, absw != 0)
+    secp256k1_gej_add_ge(r, r, &_NEG_G_LAMBDA)
+
+
+cdef tuple _split_lambda(object k):
+    """(k1, k2) with k = k1 + k2 * lambda (mod n) and |k1|, |k2| < 2**128."""
+    c1 = (k * _G1 + _HALF_2_384) >> 384
+    c2 = (k * _G2 + _HALF_2_384) >> 384
+    k2 = (c1 * _MINUS_B1 + c2 * _MINUS_B2) % _N
+    k1 = (k - k2 * _LAMBDA) % _N
+    if k1 > _N_HALF:
+        k1 -= _N
+    if k2 > _N_HALF:
+        k2 -= _N
+    return k1, k2
+
+
+cdef int _wnaf(int* wnaf, const unsigned char* k32, int w) noexcept nogil:
+    """Width-w NAF of the big-endian k32 (< 2**128) into wnaf[0..129): every nonzero
+    digit is odd, |digit| < 2**(w - 1), and at least w - 1 zeros follow it.
+    Returns the number of digits used."""
+    cdef int bit = 0, carry = 0, last = -1, now, word
+    cdef int i
+    for i in range(130):
+        wnaf[i] = 0
+    while bit < 130:
+        if _scalar_bits(k32, bit, 1) == carry:
+            bit += 1
+            continue
+        now = w if w < 130 - bit else 130 - bit
+        word = _scalar_bits(k32, bit, now) + carry
+        carry = (word >> (w - 1)) & 1
+        word -= carry << w
+        wnaf[bit] = word
+        last = bit
+        bit += now
+    return last + 1
+
+
+cdef inline void _wnaf_add(
+    secp256k1_gej* r, const secp256k1_ge* table, int digit, bint neg
+) noexcept nogil:
+    """r += digit * P, with table[i] = (2i + 1) * P, negated when neg is set."""
+    cdef secp256k1_ge t
+    if digit > 0:
+        t = table[digit >> 1]
     else:
-        lam = (qy - py) * _mod_inv(qx - px, _P) % _P
-    rx = (lam * lam - px - qx) % _P
-    ry = (lam * (px - rx) - py) % _P
-    return (rx, ry)
-
-cdef inline tuple _point_mul(object d, object x, object y):
-    d = d % _N
-    rx, ry = 0, 0
-    while d:
-        if d & 1:
-            rx, ry = _point_add(rx, ry, x, y)
-        x, y = _point_add(x, y, x, y)
-        d >>= 1
-    return (rx, ry)
+        t = table[(-digit) >> 1]
+        neg = not neg
+    if neg:
+        secp256k1_ge_neg(&t, &t)
+    secp256k1_gej_add_ge(r, r, &t)
+
+
+cdef void _ecmult_glv(
+    secp256k1_gej* r, const secp256k1_ge* a, const unsigned char* ks, int negs
+) noexcept nogil:
+    """r = na * a + ng * G with both scalars split by the GLV endomorphism:
+    na = |ks[0:32]| + lambda * |ks[32:64]|, ng = |ks[64:96]| + lambda * |ks[96:128]|,
+    the halves (< 2**128, big-endian) negated where bits 0..3 of negs are set.
+
+    Each half is recoded to wNAF (width 5 for a, whose odd multiples are built here
+    with one inversion, width 8 for G, from the tables built at import), and the
+    four are walked together: 129 doublings and about 70 mixed additions.
+    Variable time: only for public scalars and points (recovery).
+    """
+    cdef secp256k1_ge at[_TABLE_A]
+    cdef secp256k1_ge alt[_TABLE_A]
+    cdef secp256k1_gej pj[_TABLE_A]
+    cdef secp256k1_fe zs[_TABLE_A]
+    cdef int wnaf[4][130]
+    cdef int lens[4]
+    cdef int i, j, n = 0
+    _odd_multiples(at, alt, a, _TABLE_A, pj, zs)
+    for j in range(4):
+        lens[j] = _wnaf(wnaf[j], ks + 32 * j, _WINDOW_A if j < 2 else _WINDOW_G)
+        if lens[j] > n:
+            n = lens[j]
+    secp256k1_gej_set_infinity(r)
+    for i in range(n - 1, -1, -1):
+        secp256k1_gej_double(r, r)
+        if wnaf[0][i]:
+            _wnaf_add(r, at, wnaf[0][i], negs & 1)
+        if wnaf[1][i]:
+            _wnaf_add(r, alt, wnaf[1][i], negs & 2)
+        if wnaf[2][i]:
+            _wnaf_add(r, _G_ODD, wnaf[2][i], negs & 4)
+        if wnaf[3][i]:
+            _wnaf_add(r, _G_ODD_LAMBDA, wnaf[3][i], negs & 8)
+
+
+cdef inline bint _privkey_valid(const unsigned char* k32) noexcept nogil:
+    """0 < k < n, compared as big-endian bytes."""
+    return memcmp(k32, _ZERO_B32, 32) != 0 and memcmp(k32, _N_B32, 32) < 0
+
+
+cdef bytes _pubkey_from_b32(const unsigned char* k32):
+    cdef secp256k1_gej pj
+    cdef secp256k1_ge p
+    _ecmult_gen(&pj, k32)
+    secp256k1_ge_set_gej(&p, &pj)
+    return _ge_serialize(&p)
+
 
 cpdef bytes privkey_to_pubkey(bytes privkey):
     if len(privkey) != 32:
         raise ValueError("privkey must be 32 bytes")
-    d = int.from_bytes(privkey, "big")
-    if d == 0 or d >= _N:
+    cdef const unsigned char* k32 = <const unsigned char*>PyBytes_AS_STRING(privkey)
+    if not _privkey_valid(k32):
         raise ValueError("invalid privkey")
-    x, y = _point_mul(d, _Gx, _Gy)
-    return bytes([0x04]) + x.to_bytes(32, "big") + y.to_bytes(32, "big")
+    return _pubkey_from_b32(k32)
+
+cpdef bytes batch_privkey_to_pubkey(bytes privkeys):
+    """Uncompressed pubkeys for concatenated 32-byte privkeys, concatenated in order.
 
-cdef tuple _recover_pubkey_from_sig(bytes msg_hash, object r, object s, int recid):
+    All k*G products share one field inversion and run without the GIL.
+    """
+    cdef Py_ssize_t n_bytes = len(privkeys)
+    if n_bytes % 32:
+        raise ValueError("privkeys must be a concatenation of 32-byte keys")
+    cdef size_t n = n_bytes // 32
+    cdef const unsigned char* keys = <const unsigned char*>PyBytes_AS_STRING(privkeys)
+    cdef size_t i
+    for i in range(n):
+        if not _privkey_valid(&keys[32 * i]):
+            raise ValueError(f"invalid privkey at index {i}")
+    cdef bytes out = PyBytes_FromStringAndSize(NULL, 65 * n)
+    cdef unsigned char* o = <unsigned char*>PyBytes_AS_STRING(out)
+    cdef secp256k1_gej* pj = <secp256k1_gej*>PyMem_Malloc(n * sizeof(secp256k1_gej))
+    cdef secp256k1_ge* pa = <secp256k1_ge*>PyMem_Malloc(n * sizeof(secp256k1_ge))
+    cdef secp256k1_fe* zs = <secp256k1_fe*>PyMem_Malloc(n * sizeof(secp256k1_fe))
+    if n and (pj == NULL or pa == NULL or zs == NULL):
+        PyMem_Free(pj)
+        PyMem_Free(pa)
+        PyMem_Free(zs)
+        raise MemoryError()
+    with nogil:
+        for i in range(n):
+            _ecmult_gen(&pj[i], &keys[32 * i])
+        secp256k1_ge_set_gej_batch(pa, pj, zs, n)
+        for i in range(n):
+            o[65 * i] = 0x04
+            secp256k1_fe_get_b32(&o[65 * i + 1], &pa[i].x)
+            secp256k1_fe_get_b32(&o[65 * i + 33], &pa[i].y)
+    PyMem_Free(pj)
+    PyMem_Free(pa)
+    PyMem_Free(zs)
+    return out
+
+cdef bytes _recover_pubkey_from_sig(const unsigned char* msg_hash, object r, object s, int recid):
     r_scalar = r % _N
     if recid & 2:
         if r + _N >= _P:
@@ -64,63 +470,170 @@ cdef tuple _recover_pubkey_from_sig(bytes msg_hash, object r, object s, int reci
         x = (r + _N) % _P
     else:
         x = r % _P
-    rhs = (x * x * x + 7) % _P
-    y_cand = pow(rhs, (_P + 1) // 4, _P)
-    if (y_cand * y_cand) % _P != rhs:
+    cdef unsigned char buf[32]
+    cdef unsigned char ks[128]
+    cdef int negs = 0, i
+    cdef secp256k1_fe rhs, seven
+    cdef secp256k1_ge rp, qp
+    cdef secp256k1_gej qj
+    _scalar_to_b32(buf, x)
+    secp256k1_fe_set_b32(&rp.x, buf)
+    secp256k1_fe_sqr(&rhs, &rp.x)
+    secp256k1_fe_mul(&rhs, &rhs, &rp.x)
+    secp256k1_fe_set_int(&seven, 7)
+    secp256k1_fe_add(&rhs, &seven)
+    if not secp256k1_fe_sqrt(&rp.y, &rhs):
         raise ValueError("no square root")
-    if (recid & 1) != (y_cand & 1):
-        y_cand = (_P - y_cand) % _P
+    rp.infinity = 0
+    if (recid & 1) != secp256k1_fe_is_odd(&rp.y):
+        secp256k1_ge_neg(&rp, &rp)
     r_inv = _mod_inv(r_scalar, _N)
-    z = int.from_bytes(msg_hash, "big") % _N
+    z = _mpz(_b32_to_int(msg_hash)) % _N
     u1 = (-z * r_inv) % _N
     u2 = (s * r_inv) % _N
-    g_mul = _point_mul(u1, _Gx, _Gy)
-    r_mul = _point_mul(u2, x, y_cand)
-    qx, qy = _point_add(g_mul[0], g_mul[1], r_mul[0], r_mul[1])
-    if (qx, qy) == (0, 0):
+    halves = _split_lambda(u2) + _split_lambda(u1)
+    for i in range(4):
+        h = halves[i]
+        if h < 0:
+            negs |= 1 << i
+            h = -h
+        _scalar_to_b32(ks + 32 * i, h)
+    _ecmult_glv(&qj, &rp, ks, negs)
+    if qj.infinity:
         raise ValueError("recovered point at infinity")
-    return (qx, qy)
+    secp256k1_ge_set_gej(&qp, &qj)
+    return _ge_serialize(&qp)
 
 cpdef bytes recover_pubkey(bytes msg_hash, object r, object s, int recid):
     if len(msg_hash) != 32:
         raise ValueError("msg_hash must be 32 bytes")
-    qx, qy = _recover_pubkey_from_sig(msg_hash, r, s, recid)
-    return bytes([0x04]) + qx.to_bytes(32, "big") + qy.to_bytes(32, "big")
+    return _recover_pubkey_from_sig(
+        <const unsigned char*>PyBytes_AS_STRING(msg_hash), r, s, recid
+    )
 
-cpdef tuple sign_recoverable(bytes privkey, bytes msg_hash):
-    if len(privkey) != 32 or len(msg_hash) != 32:
-        raise ValueError("privkey and msg_hash must be 32 bytes")
-    z = int.from_bytes(msg_hash, "big")
-    d = int.from_bytes(privkey, "big") % _N
-    k_cand = 1 + (z + d) % (_N - 2)
+cdef inline bint _nonce_valid(const unsigned char* k32) noexcept nogil:
+    """0 < k < n for a secret big-endian k32, without branching on its bytes."""
+    cdef int i, borrow = 0, nz = 0
+    for i in range(31, -1, -1):
+        borrow = ((<int>k32[i] - <int>_N_B32[i] - borrow) >> 31) & 1
+        nz |= k32[i]
+    return borrow & (((nz - 1) >> 31) ^ 1) & 1
+
+
+cdef struct _Rfc6979:
+    unsigned char k[32]
+    unsigned char v[32]
+    bint started
+
+
+cdef int _rfc6979_hmac(
+    _Rfc6979* st, unsigned char* out, const unsigned char* a, size_t na, int sep,
+    const unsigned char* x32, const unsigned char* h32,
+) except -1:
+    """out = HMAC_K(a[:na]) or, for sep >= 0, HMAC_K(a || sep || x32 || h32)."""
+    cdef unsigned char sep_byte = <unsigned char>sep
+    cdef const unsigned char* parts[4]
+    cdef size_t n[4]
+    parts[0] = a
+    n[0] = na
+    parts[1] = &sep_byte
+    n[1] = 1
+    parts[2] = x32
+    n[2] = 32 if x32 != NULL else 0
+    parts[3] = h32
+    n[3] = 32 if h32 != NULL else 0
+    if not _hmac_sha256_parts(st.k, 32, parts, n, 4 if sep >= 0 else 1, out):
+        raise RuntimeError("OpenSSL EVP digest (SHA-256) failed")
+    return 0
+
+
+cdef int _rfc6979_init(_Rfc6979* st, const unsigned char* x32, const unsigned char* h32) except -1:
+    """RFC 6979 3.2 steps b-g with HMAC-SHA256, key x32 and h32 = bits2octets(hash)."""
+    cdef int i
+    for i in range(32):
+        st.v[i] = 0x01
+        st.k[i] = 0x00
+    st.started = False
+    _rfc6979_hmac(st, st.k, st.v, 32, 0x00, x32, h32)
+    _rfc6979_hmac(st, st.v, st.v, 32, -1, NULL, NULL)
+    _rfc6979_hmac(st, st.k, st.v, 32, 0x01, x32, h32)
+    _rfc6979_hmac(st, st.v, st.v, 32, -1, NULL, NULL)
+    return 0
+
+
+cdef int _rfc6979_next(_Rfc6979* st, unsigned char* k32) except -1:
+    """Next nonce candidate into k32 (step h); the caller rejects k outside [1, n)."""
+    cdef int i
+    if st.started:
+        _rfc6979_hmac(st, st.k, st.v, 32, 0x00, NULL, NULL)
+        _rfc6979_hmac(st, st.v, st.v, 32, -1, NULL, NULL)
+    st.started = True
+    _rfc6979_hmac(st, st.v, st.v, 32, -1, NULL, NULL)
+    for i in range(32):
+        k32[i] = st.v[i]
+    return 0
+
+
+cdef tuple _sign_recoverable(const unsigned char* privkey, const unsigned char* msg_hash):
+    """ECDSA sign of the 32-byte msg_hash under the 32-byte privkey; returns (r, s, v).
+
+    The nonce is RFC 6979 (HMAC-SHA256), so signatures match other deterministic
+    secp256k1 signers (libsecp256k1, eth_keys, coincurve) bit for bit.
+    """
+    if not _privkey_valid(privkey):
+        raise ValueError("invalid privkey")
+    z = _mpz(_b32_to_int(msg_hash))
+    d = _mpz(_b32_to_int(privkey))
     cdef int attempt, recid
+    cdef unsigned char h1[32]
+    cdef unsigned char k32[32]
+    cdef _Rfc6979 drbg
+    cdef secp256k1_gej kj
+    cdef secp256k1_ge kp
+    _scalar_to_b32(h1, z % _N)
+    _rfc6979_init(&drbg, privkey, h1)
     for attempt in range(256):
-        k = (k_cand + attempt) % _N
-        if k == 0 or k >= _N:
+        _rfc6979_next(&drbg, k32)
+        if not _nonce_valid(k32):
             continue
-        kx, _ = _point_mul(k, _Gx, _Gy)
-        r = kx % _N
+        _ecmult_gen(&kj, k32)
+        secp256k1_ge_set_gej(&kp, &kj)
+        x = _mpz(_fe_to_int(&kp.x))
+        r = x % _N
         if r == 0:
             continue
-        k_inv = _mod_inv(k, _N)
+        # k is secret: always the fixed-divstep inverse, never gmpy2's variable-time invert.
+        k_inv = _safegcd_inv(_b32_to_int(k32), _N, _INV2_62_N)
         s = (k_inv * (z + r * d)) % _N
         if s == 0:
             continue
-        if s > _N // 2:
+        # recid names k*G: bit 0 is the parity of its y, bit 1 says x >= n.
+        # Taking the low s negates the recovered point, so y's parity flips.
+        recid = secp256k1_fe_is_odd(&kp.y) | (2 if x >= _N else 0)
+        if s > _N_HALF:
             s = _N - s
-        our_pub = privkey_to_pubkey(privkey)
-        our_addr = "0x" + keccak256(our_pub)[12:].hex()
-        for recid in range(4):
-            try:
-                rec = _recover_pubkey_from_sig(msg_hash, r, s, recid)
-                rec_pub = bytes([0x04]) + rec[0].to_bytes(32, "big") + rec[1].to_bytes(32, "big")
-                addr_rec = "0x" + keccak256(rec_pub)[12:].hex()
-                if addr_rec.lower() == our_addr.lower():
-                    return (r, s, 27 + recid)
-            except Exception:
-                pass
+            recid ^= 1
+        return (int(r), int(s), 27 + recid)
     raise ValueError("sign_recoverable: could not produce valid signature")
 
+cpdef tuple sign_recoverable(bytes privkey, bytes msg_hash):
+    if len(privkey) != 32 or len(msg_hash) != 32:
+        raise ValueError("privkey and msg_hash must be 32 bytes")
+    return _sign_recoverable(
+        <const unsigned char*>PyBytes_AS_STRING(privkey),
+        <const unsigned char*>PyBytes_AS_STRING(msg_hash),
+    )
+
+cpdef tuple sign_recoverable_mv(const unsigned char[::1] privkey, const unsigned char[::1] msg_hash):
+    """sign_recoverable over any C-contiguous byte buffers (bytes, bytearray,
+    memoryview), read in place. Both must be exactly 32 bytes long."""
+    # cpdef arguments cannot be declared "not None"; a None memoryview has shape 0.
+    if privkey is None or msg_hash is None:
+        raise TypeError("sign_recoverable_mv: privkey and msg_hash must be buffers, not None")
+    if privkey.shape[0] != 32 or msg_hash.shape[0] != 32:
+        raise ValueError("privkey and msg_hash must be 32 bytes")
+    return _sign_recoverable(&privkey[0], &msg_hash[0])
+
 cpdef str privkey_to_address(bytes privkey):
     pub = privkey_to_pubkey(privkey)
     return "0x" + keccak256(pub)[12:].hex()
@@ -0,0 +1,535 @@
+/*
+ * secp256k1 field and group arithmetic on 5x52-bit limbs.
+ *
+ * A field element is n[0] + n[1]*2^52 + ... + n[4]*2^208 with unsigned 64-bit
+ * limbs, so sums can be formed limb-wise and carried later. Products use
+ * unsigned __int128 accumulators and reduce with 2^256 = 0x1000003D1 (mod p).
+ *
+ * Limb bounds: "weak" elements (outputs of mul/sqr/normalize_weak) have
+ * n[0..3] < 2^52 and n[4] < 2^48 + 2^16, value < 2^256 + 2^226; fe_mul/fe_sqr
+ * accept limbs up to 2^56. fe_sub needs a weak subtrahend. Only
+ * secp256k1_fe_normalize gives the canonical value in [0, p).
+ *
+ * Points: affine secp256k1_ge and Jacobian secp256k1_gej (x = X/Z^2,
+ * y = Y/Z^3) with an explicit infinity flag. The cmov and table_select
+ * helpers are branch-free; the addition formulas still branch on infinity and
+ * on equal inputs.
+ */
+#ifndef PICOCRYPTO_SECP256K1_FIELD_H
+#define PICOCRYPTO_SECP256K1_FIELD_H
+
+#include <stdint.h>
+#include <string.h>
+
+typedef unsigned __int128 secp256k1_u128;
+
+typedef struct {
+    uint64_t n[5];
+} secp256k1_fe;
+
+typedef struct {
+    secp256k1_fe x, y;
+    int infinity;
+} secp256k1_ge;
+
+typedef struct {
+    secp256k1_fe x, y, z;
+    int infinity;
+} secp256k1_gej;
+
+#define SECP256K1_M52 0xFFFFFFFFFFFFFULL
+#define SECP256K1_M48 0xFFFFFFFFFFFFULL
+/* 2^256 mod p, and 2^260 mod p (the weight of limb 5 of a product). */
+#define SECP256K1_R256 0x1000003D1ULL
+#define SECP256K1_R260 0x1000003D10ULL
+
+/* 2p limb-wise; added before subtracting a weak element so limbs stay >= 0. */
+static const uint64_t secp256k1_fe_2p[5] = {
+    0x1FFFFDFFFFF85EULL, 0x1FFFFFFFFFFFFEULL, 0x1FFFFFFFFFFFFEULL,
+    0x1FFFFFFFFFFFFEULL, 0x1FFFFFFFFFFFEULL,
+};
+
+static inline void secp256k1_fe_set_int(secp256k1_fe *r, uint64_t v) {
+    r->n[0] = v & SECP256K1_M52;
+    r->n[1] = v >> 52;
+    r->n[2] = r->n[3] = r->n[4] = 0;
+}
+
+/* Carry limbs into 52 bits, folding bits >= 2^256 back in. Result is weak. */
+static inline void secp256k1_fe_normalize_weak(secp256k1_fe *r) {
+    uint64_t t0 = r->n[0], t1 = r->n[1], t2 = r->n[2], t3 = r->n[3], t4 = r->n[4];
+    uint64_t x = t4 >> 48;
+    t4 &= SECP256K1_M48;
+    t0 += x * SECP256K1_R256;
+    t1 += t0 >> 52; t0 &= SECP256K1_M52;
+    t2 += t1 >> 52; t1 &= SECP256K1_M52;
+    t3 += t2 >> 52; t2 &= SECP256K1_M52;
+    t4 += t3 >> 52; t3 &= SECP256K1_M52;
+    r->n[0] = t0; r->n[1] = t1; r->n[2] = t2; r->n[3] = t3; r->n[4] = t4;
+}
+
+/* Canonical representative in [0, p). */
+static inline void secp256k1_fe_normalize(secp256k1_fe *r) {
+    uint64_t t0, t1, t2, t3, t4, x;
+    secp256k1_fe_normalize_weak(r);
+    secp256k1_fe_normalize_weak(r);
+    /* Now value < 2^256; it is >= p iff value + (2^256 - p) carries past bit 255. */
+    t0 = r->n[0] + SECP256K1_R256;
+    t1 = r->n[1] + (t0 >> 52); t0 &= SECP256K1_M52;
+    t2 = r->n[2] + (t1 >> 52); t1 &= SECP256K1_M52;
+    t3 = r->n[3] + (t2 >> 52); t2 &= SECP256K1_M52;
+    t4 = r->n[4] + (t3 >> 52); t3 &= SECP256K1_M52;
+    x = t4 >> 48;
+    if (x) {
+        r->n[0] = t0; r->n[1] = t1; r->n[2] = t2; r->n[3] = t3; r->n[4] = t4 & SECP256K1_M48;
+    }
+}
+
+static inline int secp256k1_fe_is_zero(const secp256k1_fe *a) {
+    secp256k1_fe t = *a;
+    secp256k1_fe_normalize(&t);
+    return (t.n[0] | t.n[1] | t.n[2] | t.n[3] | t.n[4]) == 0;
+}
+
+static inline int secp256k1_fe_is_odd(const secp256k1_fe *a) {
+    secp256k1_fe t = *a;
+    secp256k1_fe_normalize(&t);
+    return (int)(t.n[0] & 1);
+}
+
+static inline int secp256k1_fe_equal(const secp256k1_fe *a, const secp256k1_fe *b) {
+    secp256k1_fe t = *a, u = *b;
+    secp256k1_fe_normalize(&t);
+    secp256k1_fe_normalize(&u);
+    return memcmp(t.n, u.n, sizeof(t.n)) == 0;
+}
+
+static inline void secp256k1_fe_add(secp256k1_fe *r, const secp256k1_fe *a) {
+    r->n[0] += a->n[0]; r->n[1] += a->n[1]; r->n[2] += a->n[2];
+    r->n[3] += a->n[3]; r->n[4] += a->n[4];
+}
+
+/* r = a - b for weak b. */
+static inline void secp256k1_fe_sub(secp256k1_fe *r, const secp256k1_fe *a, const secp256k1_fe *b) {
+    int i;
+    for (i = 0; i < 5; i++) r->n[i] = a->n[i] + secp256k1_fe_2p[i] - b->n[i];
+}
+
+static inline void secp256k1_fe_mul_int(secp256k1_fe *r, uint64_t k) {
+    r->n[0] *= k; r->n[1] *= k; r->n[2] *= k; r->n[3] *= k; r->n[4] *= k;
+}
+
+static void secp256k1_fe_mul(secp256k1_fe *r, const secp256k1_fe *a, const secp256k1_fe *b) {
+    const uint64_t *x = a->n, *y = b->n;
+    secp256k1_u128 c[9], acc;
+    uint64_t p[10], t[5];
+    int k;
+    c[0] = (secp256k1_u128)x[0] * y[0];
+    c[1] = (secp256k1_u128)x[0] * y[1] + (secp256k1_u128)x[1] * y[0];
+    c[2] = (secp256k1_u128)x[0] * y[2] + (secp256k1_u128)x[1] * y[1] + (secp256k1_u128)x[2] * y[0];
+    c[3] = (secp256k1_u128)x[0] * y[3] + (secp256k1_u128)x[1] * y[2] + (secp256k1_u128)x[2] * y[1] +
+           (secp256k1_u128)x[3] * y[0];
+    c[4] = (secp256k1_u128)x[0] * y[4] + (secp256k1_u128)x[1] * y[3] + (secp256k1_u128)x[2] * y[2] +
+           (secp256k1_u128)x[3] * y[1] + (secp256k1_u128)x[4] * y[0];
+    c[5] = (secp256k1_u128)x[1] * y[4] + (secp256k1_u128)x[2] * y[3] + (secp256k1_u128)x[3] * y[2] +
+           (secp256k1_u128)x[4] * y[1];
+    c[6] = (secp256k1_u128)x[2] * y[4] + (secp256k1_u128)x[3] * y[3] + (secp256k1_u128)x[4] * y[2];
+    c[7] = (secp256k1_u128)x[3] * y[4] + (secp256k1_u128)x[4] * y[3];
+    c[8] = (secp256k1_u128)x[4] * y[4];
+    /* Carry the 512-bit product into ten 52-bit limbs (p[9] holds the rest). */
+    acc = 0;
+    for (k = 0; k < 9; k++) {
+        acc += c[k];
+        p[k] = (uint64_t)acc & SECP256K1_M52;
+        acc >>= 52;
+    }
+    p[9] = (uint64_t)acc;
+    /* Fold limbs 5..9 (weight 2^260 * 2^52i) onto limbs 0..4. */
+    acc = 0;
+    for (k = 0; k < 5; k++) {
+        acc += (secp256k1_u128)p[k + 5] * SECP256K1_R260 + p[k];
+        t[k] = (uint64_t)acc & SECP256K1_M52;
+        acc >>= 52;
+    }
+    /* acc now has weight 2^260: fold it, together with t[4]'s bits above 2^256. */
+    acc = (acc << 4) | (t[4] >> 48);
+    t[4] &= SECP256K1_M48;
+    acc = acc * SECP256K1_R256 + t[0];
+    r->n[0] = (uint64_t)acc & SECP256K1_M52;
+    acc = (acc >> 52) + t[1];
+    r->n[1] = (uint64_t)acc & SECP256K1_M52;
+    acc = (acc >> 52) + t[2];
+    r->n[2] = (uint64_t)acc & SECP256K1_M52;
+    acc = (acc >> 52) + t[3];
+    r->n[3] = (uint64_t)acc & SECP256K1_M52;
+    r->n[4] = (uint64_t)(acc >> 52) + t[4];
+}
+
+static inline void secp256k1_fe_sqr(secp256k1_fe *r, const secp256k1_fe *a) {
+    secp256k1_fe_mul(r, a, a);
+}
+
+/* r = a^(2^n), n >= 1. */
+static void secp256k1_fe_sqn(secp256k1_fe *r, const secp256k1_fe *a, int n) {
+    int i;
+    secp256k1_fe_sqr(r, a);
+    for (i = 1; i < n; i++) secp256k1_fe_sqr(r, r);
+}
+
+/*
+ * r = a^(2^223 - 1), x22 = a^(2^22 - 1), x2 = a^3: the shared prefix of the
+ * libsecp256k1 addition chains for p - 2 and (p + 1) / 4, whose 1-runs have
+ * lengths 1, 2, 22 and 223 (block lengths 2, 3, 6, 9, 11, 22, 44, 88, 176,
+ * 220, 223; 222 squarings, 11 multiplications).
+ */
+static void secp256k1_fe_pow_2_223_1(secp256k1_fe *r, secp256k1_fe *x22, secp256k1_fe *x2,
+                                     const secp256k1_fe *a) {
+    secp256k1_fe x3, x6, x9, x11, x44, x88, x176, x220;
+    secp256k1_fe_sqr(x2, a);
+    secp256k1_fe_mul(x2, x2, a);
+    secp256k1_fe_sqr(&x3, x2);
+    secp256k1_fe_mul(&x3, &x3, a);
+    secp256k1_fe_sqn(&x6, &x3, 3);
+    secp256k1_fe_mul(&x6, &x6, &x3);
+    secp256k1_fe_sqn(&x9, &x6, 3);
+    secp256k1_fe_mul(&x9, &x9, &x3);
+    secp256k1_fe_sqn(&x11, &x9, 2);
+    secp256k1_fe_mul(&x11, &x11, x2);
+    secp256k1_fe_sqn(x22, &x11, 11);
+    secp256k1_fe_mul(x22, x22, &x11);
+    secp256k1_fe_sqn(&x44, x22, 22);
+    secp256k1_fe_mul(&x44, &x44, x22);
+    secp256k1_fe_sqn(&x88, &x44, 44);
+    secp256k1_fe_mul(&x88, &x88, &x44);
+    secp256k1_fe_sqn(&x176, &x88, 88);
+    secp256k1_fe_mul(&x176, &x176, &x88);
+    secp256k1_fe_sqn(&x220, &x176, 44);
+    secp256k1_fe_mul(&x220, &x220, &x44);
+    secp256k1_fe_sqn(r, &x220, 3);
+    secp256k1_fe_mul(r, r, &x3);
+}
+
+/* r = a^(p - 2) = 1/a (0 for a = 0): 255 squarings, 15 multiplications. */
+static void secp256k1_fe_inv(secp256k1_fe *r, const secp256k1_fe *a) {
+    secp256k1_fe x22, x2, t;
+    secp256k1_fe_pow_2_223_1(&t, &x22, &x2, a);
+    secp256k1_fe_sqn(&t, &t, 23);
+    secp256k1_fe_mul(&t, &t, &x22);
+    secp256k1_fe_sqn(&t, &t, 5);
+    secp256k1_fe_mul(&t, &t, a);
+    secp256k1_fe_sqn(&t, &t, 3);
+    secp256k1_fe_mul(&t, &t, &x2);
+    secp256k1_fe_sqn(&t, &t, 2);
+    secp256k1_fe_mul(r, &t, a);
+}
+
+/*
+ * Square root of a if it exists (returns 1), else 0. r = a^((p + 1) / 4):
+ * 253 squarings, 13 multiplications.
+ */
+static int secp256k1_fe_sqrt(secp256k1_fe *r, const secp256k1_fe *a) {
+    secp256k1_fe x22, x2, t, s;
+    secp256k1_fe_pow_2_223_1(&t, &x22, &x2, a);
+    secp256k1_fe_sqn(&t, &t, 23);
+    secp256k1_fe_mul(&t, &t, &x22);
+    secp256k1_fe_sqn(&t, &t, 6);
+    secp256k1_fe_mul(&t, &t, &x2);
+    secp256k1_fe_sqn(r, &t, 2);
+    secp256k1_fe_sqr(&s, r);
+    return secp256k1_fe_equal(&s, a);
+}
+
+static void secp256k1_fe_set_b32(secp256k1_fe *r, const uint8_t b[32]) {
+    uint64_t w[4];
+    int i, j;
+    for (i = 0; i < 4; i++) {
+        w[i] = 0;
+        for (j = 0; j < 8; j++) w[i] = (w[i] << 8) | b[8 * (3 - i) + j];
+    }
+    r->n[0] = w[0] & SECP256K1_M52;
+    r->n[1] = ((w[0] >> 52) | (w[1] << 12)) & SECP256K1_M52;
+    r->n[2] = ((w[1] >> 40) | (w[2] << 24)) & SECP256K1_M52;
+    r->n[3] = ((w[2] >> 28) | (w[3] << 36)) & SECP256K1_M52;
+    r->n[4] = w[3] >> 16;
+}
+
+/* Big-endian encoding of the canonical value. */
+static void secp256k1_fe_get_b32(uint8_t b[32], const secp256k1_fe *a) {
+    secp256k1_fe t = *a;
+    uint64_t w[4];
+    int i, j;
+    secp256k1_fe_normalize(&t);
+    w[0] = t.n[0] | (t.n[1] << 52);
+    w[1] = (t.n[1] >> 12) | (t.n[2] << 40);
+    w[2] = (t.n[2] >> 24) | (t.n[3] << 28);
+    w[3] = (t.n[3] >> 36) | (t.n[4] << 16);
+    for (i = 0; i < 4; i++)
+        for (j = 0; j < 8; j++) b[8 * (3 - i) + j] = (uint8_t)(w[i] >> (56 - 8 * j));
+}
+
+static inline void secp256k1_gej_set_infinity(secp256k1_gej *r) {
+    memset(r, 0, sizeof(*r));
+    r->infinity = 1;
+}
+
+static inline void secp256k1_gej_set_ge(secp256k1_gej *r, const secp256k1_ge *a) {
+    r->x = a->x;
+    r->y = a->y;
+    secp256k1_fe_set_int(&r->z, 1);
+    r->infinity = a->infinity;
+}
+
+/* Affine (x, y) from Jacobian given zi = 1/Z. */
+static void secp256k1_ge_set_gej_zinv(secp256k1_ge *r, const secp256k1_gej *a, const secp256k1_fe *zi) {
+    secp256k1_fe zi2, zi3;
+    r->infinity = a->infinity;
+    if (a->infinity) return;
+    secp256k1_fe_sqr(&zi2, zi);
+    secp256k1_fe_mul(&zi3, &zi2, zi);
+    secp256k1_fe_mul(&r->x, &a->x, &zi2);
+    secp256k1_fe_mul(&r->y, &a->y, &zi3);
+    secp256k1_fe_normalize(&r->x);
+    secp256k1_fe_normalize(&r->y);
+}
+
+/* Affine (x, y) from Jacobian with one inversion. */
+static void secp256k1_ge_set_gej(secp256k1_ge *r, const secp256k1_gej *a) {
+    secp256k1_fe zi;
+    r->infinity = a->infinity;
+    if (a->infinity) return;
+    secp256k1_fe_inv(&zi, &a->z);
+    secp256k1_ge_set_gej_zinv(r, a, &zi);
+}
+
+/*
+ * r[i] = affine a[i] for n points with a single inversion (Montgomery's trick):
+ * prefix products of the Z's, one inverse of the total, then peel back.
+ * zs is scratch for n field elements. Points at infinity count as Z = 1.
+ */
+static void secp256k1_ge_set_gej_batch(secp256k1_ge *r, const secp256k1_gej *a,
+                                       secp256k1_fe *zs, size_t n) {
+    secp256k1_fe one, inv, zi;
+    size_t i;
+    if (n == 0) return;
+    secp256k1_fe_set_int(&one, 1);
+    zs[0] = a[0].infinity ? one : a[0].z;
+    for (i = 1; i < n; i++) {
+        secp256k1_fe_mul(&zs[i], &zs[i - 1], a[i].infinity ? &one : &a[i].z);
+    }
+    secp256k1_fe_inv(&inv, &zs[n - 1]);
+    for (i = n - 1; i > 0; i--) {
+        secp256k1_fe_mul(&zi, &inv, &zs[i - 1]);
+        if (!a[i].infinity) secp256k1_fe_mul(&inv, &inv, &a[i].z);
+        secp256k1_ge_set_gej_zinv(&r[i], &a[i], &zi);
+    }
+    secp256k1_ge_set_gej_zinv(&r[0], &a[0], &inv);
+}
+
+static inline void secp256k1_ge_neg(secp256k1_ge *r, const secp256k1_ge *a) {
+    secp256k1_fe zero;
+    secp256k1_fe_set_int(&zero, 0);
+    r->x = a->x;
+    secp256k1_fe_sub(&r->y, &zero, &a->y);
+    secp256k1_fe_normalize(&r->y);
+    r->infinity = a->infinity;
+}
+
+/* dbl-2009-l (a = 0). */
+static void secp256k1_gej_double(secp256k1_gej *r, const secp256k1_gej *a) {
+    secp256k1_fe A, B, C, D, E, F, t;
+    if (a->infinity) {
+        *r = *a;
+        return;
+    }
+    secp256k1_fe_sqr(&A, &a->x);
+    secp256k1_fe_sqr(&B, &a->y);
+    secp256k1_fe_sqr(&C, &B);
+    /* D = 2 * ((X + B)^2 - A - C) */
+    t = a->x;
+    secp256k1_fe_add(&t, &B);
+    secp256k1_fe_sqr(&D, &t);
+    secp256k1_fe_sub(&D, &D, &A);
+    secp256k1_fe_sub(&D, &D, &C);
+    secp256k1_fe_mul_int(&D, 2);
+    secp256k1_fe_normalize_weak(&D);
+    /* E = 3A, F = E^2 */
+    E = A;
+    secp256k1_fe_mul_int(&E, 3);
+    secp256k1_fe_sqr(&F, &E);
+    /* Z3 = 2 * Y * Z (before X/Y are overwritten, r may alias a) */
+    secp256k1_fe_mul(&r->z, &a->y, &a->z);
+    secp256k1_fe_mul_int(&r->z, 2);
+    secp256k1_fe_normalize_weak(&r->z);
+    /* X3 = F - 2D */
+    t = D;
+    secp256k1_fe_mul_int(&t, 2);
+    secp256k1_fe_normalize_weak(&t);
+    secp256k1_fe_sub(&r->x, &F, &t);
+    secp256k1_fe_normalize_weak(&r->x);
+    /* Y3 = E * (D - X3) - 8C */
+    secp256k1_fe_sub(&t, &D, &r->x);
+    secp256k1_fe_mul(&r->y, &E, &t);
+    secp256k1_fe_mul_int(&C, 8);
+    secp256k1_fe_normalize_weak(&C);
+    secp256k1_fe_sub(&r->y, &r->y, &C);
+    secp256k1_fe_normalize_weak(&r->y);
+    r->infinity = 0;
+}
+
+/* madd-2007-bl: r = a + b with b affine. */
+static void secp256k1_gej_add_ge(secp256k1_gej *r, const secp256k1_gej *a, const secp256k1_ge *b) {
+    secp256k1_fe Z1Z1, U2, S2, H, HH, I, J, rr, V, t;
+    if (b->infinity) {
+        *r = *a;
+        return;
+    }
+    if (a->infinity) {
+        secp256k1_gej_set_ge(r, b);
+        return;
+    }
+    secp256k1_fe_sqr(&Z1Z1, &a->z);
+    secp256k1_fe_mul(&U2, &b->x, &Z1Z1);
+    secp256k1_fe_mul(&S2, &b->y, &a->z);
+    secp256k1_fe_mul(&S2, &S2, &Z1Z1);
+    secp256k1_fe_sub(&H, &U2, &a->x);
+    secp256k1_fe_normalize_weak(&H);
+    secp256k1_fe_sub(&rr, &S2, &a->y);
+    secp256k1_fe_normalize_weak(&rr);
+    if (secp256k1_fe_is_zero(&H)) {
+        if (secp256k1_fe_is_zero(&rr)) {
+            secp256k1_gej_double(r, a);
+        } else {
+            secp256k1_gej_set_infinity(r);
+        }
+        return;
+    }
+    secp256k1_fe_mul_int(&rr, 2);
+    secp256k1_fe_sqr(&HH, &H);
+    I = HH;
+    secp256k1_fe_mul_int(&I, 4);
+    secp256k1_fe_mul(&J, &H, &I);
+    secp256k1_fe_mul(&V, &a->x, &I);
+    /* Z3 = (Z1 + H)^2 - Z1Z1 - HH */
+    t = a->z;
+    secp256k1_fe_add(&t, &H);
+    secp256k1_fe_sqr(&r->z, &t);
+    secp256k1_fe_sub(&r->z, &r->z, &Z1Z1);
+    secp256k1_fe_sub(&r->z, &r->z, &HH);
+    secp256k1_fe_normalize_weak(&r->z);
+    /* Y1 * J before r->y is written (r may alias a) */
+    secp256k1_fe_mul(&t, &a->y, &J);
+    secp256k1_fe_mul_int(&t, 2);
+    secp256k1_fe_normalize_weak(&t);
+    /* X3 = rr^2 - J - 2V */
+    secp256k1_fe_sqr(&r->x, &rr);
+    secp256k1_fe_sub(&r->x, &r->x, &J);
+    secp256k1_fe_sub(&r->x, &r->x, &V);
+    secp256k1_fe_sub(&r->x, &r->x, &V);
+    secp256k1_fe_normalize_weak(&r->x);
+    /* Y3 = rr * (V - X3) - 2 * Y1 * J */
+    secp256k1_fe_sub(&V, &V, &r->x);
+    secp256k1_fe_mul(&r->y, &rr, &V);
+    secp256k1_fe_sub(&r->y, &r->y, &t);
+    secp256k1_fe_normalize_weak(&r->y);
+    r->infinity = 0;
+}
+
+/* add-2007-bl: r = a + b, both Jacobian. */
+static void secp256k1_gej_add(secp256k1_gej *r, const secp256k1_gej *a, const secp256k1_gej *b) {
+    secp256k1_fe Z1Z1, Z2Z2, U1, U2, S1, S2, H, I, J, rr, V, t;
+    if (b->infinity) {
+        *r = *a;
+        return;
+    }
+    if (a->infinity) {
+        *r = *b;
+        return;
+    }
+    secp256k1_fe_sqr(&Z1Z1, &a->z);
+    secp256k1_fe_sqr(&Z2Z2, &b->z);
+    secp256k1_fe_mul(&U1, &a->x, &Z2Z2);
+    secp256k1_fe_mul(&U2, &b->x, &Z1Z1);
+    secp256k1_fe_mul(&S1, &a->y, &b->z);
+    secp256k1_fe_mul(&S1, &S1, &Z2Z2);
+    secp256k1_fe_mul(&S2, &b->y, &a->z);
+    secp256k1_fe_mul(&S2, &S2, &Z1Z1);
+    secp256k1_fe_sub(&H, &U2, &U1);
+    secp256k1_fe_normalize_weak(&H);
+    secp256k1_fe_sub(&rr, &S2, &S1);
+    secp256k1_fe_normalize_weak(&rr);
+    if (secp256k1_fe_is_zero(&H)) {
+        if (secp256k1_fe_is_zero(&rr)) {
+            secp256k1_gej_double(r, a);
+        } else {
+            secp256k1_gej_set_infinity(r);
+        }
+        return;
+    }
+    secp256k1_fe_mul_int(&rr, 2);
+    /* I = (2H)^2, J = H * I, V = U1 * I */
+    t = H;
+    secp256k1_fe_mul_int(&t, 2);
+    secp256k1_fe_sqr(&I, &t);
+    secp256k1_fe_mul(&J, &H, &I);
+    secp256k1_fe_mul(&V, &U1, &I);
+    /* Z3 = ((Z1 + Z2)^2 - Z1Z1 - Z2Z2) * H (before r->z is written, r may alias) */
+    t = a->z;
+    secp256k1_fe_add(&t, &b->z);
+    secp256k1_fe_sqr(&t, &t);
+    secp256k1_fe_sub(&t, &t, &Z1Z1);
+    secp256k1_fe_sub(&t, &t, &Z2Z2);
+    secp256k1_fe_normalize_weak(&t);
+    secp256k1_fe_mul(&r->z, &t, &H);
+    /* X3 = rr^2 - J - 2V */
+    secp256k1_fe_sqr(&r->x, &rr);
+    secp256k1_fe_sub(&r->x, &r->x, &J);
+    secp256k1_fe_sub(&r->x, &r->x, &V);
+    secp256k1_fe_sub(&r->x, &r->x, &V);
+    secp256k1_fe_normalize_weak(&r->x);
+    /* Y3 = rr * (V - X3) - 2 * S1 * J */
+    secp256k1_fe_mul(&t, &S1, &J);
+    secp256k1_fe_mul_int(&t, 2);
+    secp256k1_fe_normalize_weak(&t);
+    secp256k1_fe_sub(&V, &V, &r->x);
+    secp256k1_fe_mul(&r->y, &rr, &V);
+    secp256k1_fe_sub(&r->y, &r->y, &t);
+    secp256k1_fe_normalize_weak(&r->y);
+    r->infinity = 0;
+}
+
+/* r = a when flag is 1, leave r when 0, without branching on flag. */
+static inline void secp256k1_ge_cmov(secp256k1_ge *r, const secp256k1_ge *a, int flag) {
+    const uint64_t mask = -(uint64_t)(flag & 1);
+    int i;
+    for (i = 0; i < 5; i++) {
+        r->x.n[i] ^= mask & (r->x.n[i] ^ a->x.n[i]);
+        r->y.n[i] ^= mask & (r->y.n[i] ^ a->y.n[i]);
+    }
+    r->infinity ^= (int)mask & (r->infinity ^ a->infinity);
+}
+
+static inline void secp256k1_gej_cmov(secp256k1_gej *r, const secp256k1_gej *a, int flag) {
+    const uint64_t mask = -(uint64_t)(flag & 1);
+    int i;
+    for (i = 0; i < 5; i++) {
+        r->x.n[i] ^= mask & (r->x.n[i] ^ a->x.n[i]);
+        r->y.n[i] ^= mask & (r->y.n[i] ^ a->y.n[i]);
+        r->z.n[i] ^= mask & (r->z.n[i] ^ a->z.n[i]);
+    }
+    r->infinity ^= (int)mask & (r->infinity ^ a->infinity);
+}
+
+/*
+ * r = table[idx] for 0 <= idx < n, reading every entry so the memory access
+ * pattern does not depend on idx.
+ */
+static inline void secp256k1_ge_table_select(secp256k1_ge *r, const secp256k1_ge *table,
+                                             int n, int idx) {
+    int i;
+    *r = table[0];
+    for (i = 1; i < n; i++) {
+        secp256k1_ge_cmov(r, &table[i], (int)(((uint32_t)(i ^ idx) - 1) >> 31));
+    }
+}
+
+#endif /* PICOCRYPTO_SECP256K1_FIELD_H */
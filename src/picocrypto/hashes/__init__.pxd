@@ -1,3 +1,30 @@
-from .keccak cimport _keccak_f, _rol64, keccak256
+from .hmac_sha256 cimport _hmac_sha256_parts, hmac_sha256
+from .keccak cimport (
+    _keccak256,
+    _keccak256_final,
+    _keccak256_init,
+    _keccak256_update,
+    _keccak256_x4,
+    _Keccak256Ctx,
+    _keccak_f,
+    keccak256,
+    keccak256_batch,
+)
+from .sha512 cimport _sha512, _sha512_parts, sha512
 
-__all__: tuple[str, ...] = ("keccak256", "_keccak_f", "_rol64")
+__all__: tuple[str, ...] = (
+    "keccak256",
+    "keccak256_batch",
+    "_keccak_f",
+    "_keccak256",
+    "_keccak256_x4",
+    "_Keccak256Ctx",
+    "_keccak256_init",
+    "_keccak256_update",
+    "_keccak256_final",
+    "hmac_sha256",
+    "_hmac_sha256_parts",
+    "sha512",
+    "_sha512",
+    "_sha512_parts",
+)
@@ -1,5 +1,24 @@
-"""Hash functions: Keccak-256."""
+"""
+Hash functions: Keccak-256.
 
-from .keccak import keccak256
+Implementation order: the compiled extension, then pycryptodome's C Keccak,
+then pure Python. Set PICOCRYPTO_PUREPY_KECCAK=1 to force the pure-Python one.
+"""
 
-__all__: tuple[str, ...] = ("keccak256",)
+import os as _os
+import sys as _sys
+
+try:
+    if _os.environ.get("PICOCRYPTO_PUREPY_KECCAK") == "1":
+        raise ImportError("PICOCRYPTO_PUREPY_KECCAK=1")
+    try:
+        from .keccak import keccak256, keccak256_batch
+    except ImportError:
+        from ._keccak_pycryptodome import keccak256, keccak256_batch
+except ImportError:
+    if _sys.implementation.name == "cpython":
+        from ._keccak import keccak256, keccak256_batch
+    else:
+        from ._keccak_interleaved import keccak256, keccak256_batch
+
+__all__: tuple[str, ...] = ("keccak256", "keccak256_batch")
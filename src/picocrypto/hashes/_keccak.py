@@ -4,10 +4,10 @@ Keccak-256 (multirate padding, 256-bit output). Pure Python.
 
 from __future__ import annotations
 
-from functools import reduce
-from operator import xor
+import struct
+from collections.abc import Iterable
 
-_ROUND_CONSTANTS = [
+_ROUND_CONSTANTS = (
     0x0000000000000001,
     0x0000000000008082,
     0x800000000000808A,
@@ -32,7 +32,7 @@ _ROUND_CONSTANTS = [
     0x8000000000008080,
     0x0000000080000001,
     0x8000000080008008,
-]
+)
 
 _ROTATION = [
     [0, 1, 62, 28, 27],
@@ -42,54 +42,149 @@ _ROTATION = [
     [18, 2, 61, 56, 14],
 ]
 
+_LANE_MASK = 0xFFFFFFFFFFFFFFFF
 
-def _rol64(v: int, n: int) -> int:
-    n = n % 64
-    return ((v << n) | (v >> (64 - n))) & 0xFFFFFFFFFFFFFFFF
 
+def _keccak_f(state: list[int]) -> None:
+    """
+    Keccak-f[1600] in place on 25 lanes indexed x + 5 * y.
 
-def _keccak_f(state: list[list[int]]) -> None:
+    One round is written out over local variables sXY, with the rho offsets
+    as literals: no list indexing or calls inside the 24-round loop.
+    """
+    mask = _LANE_MASK
+    # fmt: off
+    (
+        s00, s10, s20, s30, s40,
+        s01, s11, s21, s31, s41,
+        s02, s12, s22, s32, s42,
+        s03, s13, s23, s33, s43,
+        s04, s14, s24, s34, s44,
+    ) = state
+    # fmt: on
     for rc in _ROUND_CONSTANTS:
-        c = [reduce(xor, state[x]) for x in range(5)]
-        d = [_rol64(c[(x + 1) % 5], 1) ^ c[(x - 1) % 5] for x in range(5)]
-        for x in range(5):
-            for y in range(5):
-                state[x][y] ^= d[x]
-        b = [[0] * 5 for _ in range(5)]
-        for x in range(5):
-            for y in range(5):
-                b[y][(2 * x + 3 * y) % 5] = _rol64(state[x][y], _ROTATION[y][x])
-        for x in range(5):
-            for y in range(5):
-                state[x][y] = b[x][y] ^ ((~b[(x + 1) % 5][y]) & b[(x + 2) % 5][y])
-        state[0][0] ^= rc
+        c0 = s00 ^ s01 ^ s02 ^ s03 ^ s04
+        c1 = s10 ^ s11 ^ s12 ^ s13 ^ s14
+        c2 = s20 ^ s21 ^ s22 ^ s23 ^ s24
+        c3 = s30 ^ s31 ^ s32 ^ s33 ^ s34
+        c4 = s40 ^ s41 ^ s42 ^ s43 ^ s44
+        d0 = c4 ^ ((c1 << 1 | c1 >> 63) & mask)
+        d1 = c0 ^ ((c2 << 1 | c2 >> 63) & mask)
+        d2 = c1 ^ ((c3 << 1 | c3 >> 63) & mask)
+        d3 = c2 ^ ((c4 << 1 | c4 >> 63) & mask)
+        d4 = c3 ^ ((c0 << 1 | c0 >> 63) & mask)
+        b00 = s00 ^ d0
+        v = s10 ^ d1
+        b02 = (v << 1 | v >> 63) & mask
+        v = s20 ^ d2
+        b04 = (v << 62 | v >> 2) & mask
+        v = s30 ^ d3
+        b01 = (v << 28 | v >> 36) & mask
+        v = s40 ^ d4
+        b03 = (v << 27 | v >> 37) & mask
+        v = s01 ^ d0
+        b13 = (v << 36 | v >> 28) & mask
+        v = s11 ^ d1
+        b10 = (v << 44 | v >> 20) & mask
+        v = s21 ^ d2
+        b12 = (v << 6 | v >> 58) & mask
+        v = s31 ^ d3
+        b14 = (v << 55 | v >> 9) & mask
+        v = s41 ^ d4
+        b11 = (v << 20 | v >> 44) & mask
+        v = s02 ^ d0
+        b21 = (v << 3 | v >> 61) & mask
+        v = s12 ^ d1
+        b23 = (v << 10 | v >> 54) & mask
+        v = s22 ^ d2
+        b20 = (v << 43 | v >> 21) & mask
+        v = s32 ^ d3
+        b22 = (v << 25 | v >> 39) & mask
+        v = s42 ^ d4
+        b24 = (v << 39 | v >> 25) & mask
+        v = s03 ^ d0
+        b34 = (v << 41 | v >> 23) & mask
+        v = s13 ^ d1
+        b31 = (v << 45 | v >> 19) & mask
+        v = s23 ^ d2
+        b33 = (v << 15 | v >> 49) & mask
+        v = s33 ^ d3
+        b30 = (v << 21 | v >> 43) & mask
+        v = s43 ^ d4
+        b32 = (v << 8 | v >> 56) & mask
+        v = s04 ^ d0
+        b42 = (v << 18 | v >> 46) & mask
+        v = s14 ^ d1
+        b44 = (v << 2 | v >> 62) & mask
+        v = s24 ^ d2
+        b41 = (v << 61 | v >> 3) & mask
+        v = s34 ^ d3
+        b43 = (v << 56 | v >> 8) & mask
+        v = s44 ^ d4
+        b40 = (v << 14 | v >> 50) & mask
+        s00 = b00 ^ (~b10 & b20)
+        s10 = b10 ^ (~b20 & b30)
+        s20 = b20 ^ (~b30 & b40)
+        s30 = b30 ^ (~b40 & b00)
+        s40 = b40 ^ (~b00 & b10)
+        s01 = b01 ^ (~b11 & b21)
+        s11 = b11 ^ (~b21 & b31)
+        s21 = b21 ^ (~b31 & b41)
+        s31 = b31 ^ (~b41 & b01)
+        s41 = b41 ^ (~b01 & b11)
+        s02 = b02 ^ (~b12 & b22)
+        s12 = b12 ^ (~b22 & b32)
+        s22 = b22 ^ (~b32 & b42)
+        s32 = b32 ^ (~b42 & b02)
+        s42 = b42 ^ (~b02 & b12)
+        s03 = b03 ^ (~b13 & b23)
+        s13 = b13 ^ (~b23 & b33)
+        s23 = b23 ^ (~b33 & b43)
+        s33 = b33 ^ (~b43 & b03)
+        s43 = b43 ^ (~b03 & b13)
+        s04 = b04 ^ (~b14 & b24)
+        s14 = b14 ^ (~b24 & b34)
+        s24 = b24 ^ (~b34 & b44)
+        s34 = b34 ^ (~b44 & b04)
+        s44 = b44 ^ (~b04 & b14)
+        s00 ^= rc
+    # fmt: off
+    state[:] = (
+        s00, s10, s20, s30, s40,
+        s01, s11, s21, s31, s41,
+        s02, s12, s22, s32, s42,
+        s03, s13, s23, s33, s43,
+        s04, s14, s24, s34, s44,
+    )
+    # fmt: on
+
+
+_RATE_BYTES = 1088 // 8
+_RATE_LANES = _RATE_BYTES // 8
+_UNPACK_BLOCK = struct.Struct(f"<{_RATE_LANES}Q").unpack_from
+_PACK_DIGEST = struct.Struct("<4Q").pack
 
 
 def keccak256(data: bytes) -> bytes:
-    rate_bytes = 1088 // 8
-    lanes_per_block = rate_bytes // 8
-    state = [[0] * 5 for _ in range(5)]
-    lane_bytes = 8
-    if len(data) % rate_bytes != 0 or len(data) == 0:
-        padlen = rate_bytes - (len(data) % rate_bytes)
-        if padlen == 0:
-            padlen = rate_bytes
-        data = data + bytes([0x01] + [0x00] * (padlen - 2) + [0x80])
-    for block_start in range(0, len(data), rate_bytes):
-        for i in range(lanes_per_block):
-            off = block_start + i * lane_bytes
-            x, y = i % 5, i // 5
-            state[x][y] ^= int.from_bytes(data[off : off + lane_bytes], "little")
+    state = [0] * 25
+    mv = memoryview(data)
+    n = len(mv)
+    full = n - n % _RATE_BYTES
+    for block_start in range(0, full, _RATE_BYTES):
+        for i, w in enumerate(_UNPACK_BLOCK(mv, block_start)):
+            state[i] ^= w
         _keccak_f(state)
-    out = bytearray()
-    while len(out) < 32:
-        for y in range(5):
-            for x in range(5):
-                out.extend(state[x][y].to_bytes(lane_bytes, "little"))
-                if len(out) >= 32:
-                    return bytes(out[:32])
-        _keccak_f(state)
-    return bytes(out[:32])
+    # Last (possibly empty) block: tail bytes, 0x01, then 0x80 in the last rate byte.
+    tail = int.from_bytes(mv[full:], "little")
+    tail ^= (0x01 << (8 * (n - full))) ^ (0x80 << (8 * _RATE_BYTES - 8))
+    for i in range(_RATE_LANES):
+        state[i] ^= (tail >> (64 * i)) & _LANE_MASK
+    _keccak_f(state)
+    return _PACK_DIGEST(*state[:4])
+
+
+def keccak256_batch(messages: Iterable[bytes]) -> list[bytes]:
+    return [keccak256(m) for m in messages]
 
 
-__all__: tuple[str, ...] = ("keccak256",)
+__all__: tuple[str, ...] = ("keccak256", "keccak256_batch")
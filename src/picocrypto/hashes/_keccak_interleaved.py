@@ -0,0 +1,134 @@
+"""
+Keccak-256 on bit-interleaved 32-bit halves. Pure Python.
+
+Each 64-bit lane is held as two 32-bit words: the even-numbered bits and the
+odd-numbered bits. A 64-bit rotate by r becomes two 32-bit rotates by about
+r / 2 (swapping the halves when r is odd), so no intermediate value grows
+past 33 bits. That keeps every int a machine word on interpreters with a
+small-int fast path (PyPy, GraalPy, WASM builds); CPython uses _keccak.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from ._keccak import _ROTATION, _ROUND_CONSTANTS
+
+_M32 = 0xFFFFFFFF
+
+
+def _split_byte(b: int) -> tuple[int, int]:
+    even = odd = 0
+    for k in range(4):
+        even |= ((b >> (2 * k)) & 1) << k
+        odd |= ((b >> (2 * k + 1)) & 1) << k
+    return even, odd
+
+
+# Byte -> its 4 even bits and 4 odd bits; (even | odd << 4) -> byte.
+_INTERLEAVE_EVEN = [_split_byte(b)[0] for b in range(256)]
+_INTERLEAVE_ODD = [_split_byte(b)[1] for b in range(256)]
+_DEINTERLEAVE = [0] * 256
+for _b in range(256):
+    _e, _o = _split_byte(_b)
+    _DEINTERLEAVE[_e | (_o << 4)] = _b
+del _b, _e, _o
+
+
+def _interleave(lane: int) -> tuple[int, int]:
+    even = odd = 0
+    for k in range(8):
+        b = (lane >> (8 * k)) & 0xFF
+        even |= _INTERLEAVE_EVEN[b] << (4 * k)
+        odd |= _INTERLEAVE_ODD[b] << (4 * k)
+    return even, odd
+
+
+_ROUND_CONSTANTS_IL = [_interleave(rc) for rc in _ROUND_CONSTANTS]
+
+# Rho + pi as (src, dst, x, swap, rot_even, rot_odd): result even/odd words are
+# rol32(even, rot_even) / rol32(odd, rot_odd), taking the halves crosswise on swap.
+_RHO_PI = []
+for _x in range(5):
+    for _y in range(5):
+        _r = _ROTATION[_y][_x]
+        _dst = _y + 5 * ((2 * _x + 3 * _y) % 5)
+        _swap = _r % 2 == 1
+        _RHO_PI.append((_x + 5 * _y, _dst, _x, _swap, (_r + 1) // 2, _r // 2))
+del _x, _y, _r, _dst, _swap
+
+
+def _keccak_f(even: list[int], odd: list[int]) -> None:
+    """Keccak-f[1600] in place on interleaved lanes indexed x + 5 * y."""
+    be = [0] * 25
+    bo = [0] * 25
+    for rc_even, rc_odd in _ROUND_CONSTANTS_IL:
+        ce = [
+            even[x] ^ even[x + 5] ^ even[x + 10] ^ even[x + 15] ^ even[x + 20]
+            for x in range(5)
+        ]
+        co = [
+            odd[x] ^ odd[x + 5] ^ odd[x + 10] ^ odd[x + 15] ^ odd[x + 20]
+            for x in range(5)
+        ]
+        # D[x] = C[x - 1] ^ rol64(C[x + 1], 1); rol by 1 moves odd bits to even.
+        de = [0] * 5
+        do = [0] * 5
+        for x in range(5):
+            c = co[(x + 1) % 5]
+            de[x] = ce[(x - 1) % 5] ^ (((c << 1) | (c >> 31)) & _M32)
+            do[x] = co[(x - 1) % 5] ^ ce[(x + 1) % 5]
+        for src, dst, x, swap, re, ro in _RHO_PI:
+            e = even[src] ^ de[x]
+            o = odd[src] ^ do[x]
+            if swap:
+                e, o = o, e
+            be[dst] = ((e << re) | (e >> (32 - re))) & _M32
+            bo[dst] = ((o << ro) | (o >> (32 - ro))) & _M32
+        for y in range(0, 25, 5):
+            for x in range(5):
+                x1 = (x + 1) % 5 + y
+                x2 = (x + 2) % 5 + y
+                even[x + y] = be[x + y] ^ (~be[x1] & be[x2] & _M32)
+                odd[x + y] = bo[x + y] ^ (~bo[x1] & bo[x2] & _M32)
+        even[0] ^= rc_even
+        odd[0] ^= rc_odd
+
+
+_RATE_BYTES = 1088 // 8
+
+
+def keccak256(data: bytes) -> bytes:
+    even = [0] * 25
+    odd = [0] * 25
+    n = len(data)
+    padded = bytearray(data)
+    padded.extend(bytes(_RATE_BYTES - n % _RATE_BYTES))
+    padded[n] ^= 0x01
+    padded[-1] ^= 0x80
+    for block_start in range(0, len(padded), _RATE_BYTES):
+        for i in range(_RATE_BYTES // 8):
+            off = block_start + 8 * i
+            e = o = 0
+            for k in range(8):
+                b = padded[off + k]
+                e |= _INTERLEAVE_EVEN[b] << (4 * k)
+                o |= _INTERLEAVE_ODD[b] << (4 * k)
+            even[i] ^= e
+            odd[i] ^= o
+        _keccak_f(even, odd)
+    out = bytearray(32)
+    for i in range(4):
+        e = even[i]
+        o = odd[i]
+        for k in range(8):
+            nibbles = ((e >> (4 * k)) & 0xF) | (((o >> (4 * k)) & 0xF) << 4)
+            out[8 * i + k] = _DEINTERLEAVE[nibbles]
+    return bytes(out)
+
+
+def keccak256_batch(messages: Iterable[bytes]) -> list[bytes]:
+    return [keccak256(m) for m in messages]
+
+
+__all__: tuple[str, ...] = ("keccak256", "keccak256_batch")
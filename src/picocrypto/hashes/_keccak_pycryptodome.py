@@ -0,0 +1,23 @@
+"""
+Keccak-256 through pycryptodome's C Keccak (Crypto.Hash.keccak).
+
+Used by picocrypto.hashes when the compiled extension is not built; importing
+this module raises ImportError when pycryptodome is not installed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from Crypto.Hash import keccak as _keccak  # type: ignore[import-not-found]
+
+
+def keccak256(data: bytes) -> bytes:
+    return _keccak.new(data=data, digest_bits=256).digest()
+
+
+def keccak256_batch(messages: Iterable[bytes]) -> list[bytes]:
+    return [keccak256(m) for m in messages]
+
+
+__all__: tuple[str, ...] = ("keccak256", "keccak256_batch")
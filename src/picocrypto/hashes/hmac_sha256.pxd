@@ -0,0 +1,11 @@
+# cython: language_level=3
+"""Declarations for picocrypto.hashes.hmac_sha256."""
+
+# HMAC-SHA256 under key[:key_len] of parts[0][:n[0]] || ... || parts[count - 1] into
+# out[32]; returns 1 on success, 0 on OpenSSL failure.
+cdef int _hmac_sha256_parts(
+    const unsigned char* key, size_t key_len,
+    const unsigned char** parts, const size_t* n, int count, unsigned char* out,
+) noexcept nogil
+
+cpdef bytes hmac_sha256(bytes key, bytes data)
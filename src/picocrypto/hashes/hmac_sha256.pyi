@@ -0,0 +1,3 @@
+"""Stub for picocrypto.hashes.hmac_sha256."""
+
+def hmac_sha256(key: bytes, data: bytes) -> bytes: ...
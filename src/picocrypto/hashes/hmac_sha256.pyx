@@ -0,0 +1,91 @@
+"""HMAC-SHA256 through OpenSSL libcrypto (EVP digests). Cython only; backs RFC 6979 nonces."""
+
+from cpython.bytes cimport (
+    PyBytes_AS_STRING,
+    PyBytes_FromStringAndSize,
+    PyBytes_GET_SIZE,
+)
+
+
+# Declarations in hmac_sha256.pxd.
+cdef extern from "openssl/evp.h" nogil:
+    ctypedef struct EVP_MD:
+        pass
+    ctypedef struct ENGINE:
+        pass
+    ctypedef struct EVP_MD_CTX:
+        pass
+    const EVP_MD* EVP_sha256()
+    EVP_MD_CTX* EVP_MD_CTX_new()
+    void EVP_MD_CTX_free(EVP_MD_CTX* ctx)
+    int EVP_DigestInit_ex(EVP_MD_CTX* ctx, const EVP_MD* type, ENGINE* impl)
+    int EVP_DigestUpdate(EVP_MD_CTX* ctx, const void* d, size_t cnt)
+    int EVP_DigestFinal_ex(EVP_MD_CTX* ctx, unsigned char* md, unsigned int* s)
+
+
+cdef enum:
+    _BLOCK = 64
+
+# Looked up once; EVP_sha256() returns a static method table.
+cdef const EVP_MD* _MD = EVP_sha256()
+
+
+cdef int _hmac_sha256_parts(
+    const unsigned char* key, size_t key_len,
+    const unsigned char** parts, const size_t* n, int count, unsigned char* out,
+) noexcept nogil:
+    # H((K ^ opad) || H((K ^ ipad) || parts)), K zero-padded to one block (hashed first if longer).
+    cdef unsigned char pad[_BLOCK]
+    cdef unsigned char k0[_BLOCK]
+    cdef unsigned char inner[32]
+    cdef EVP_MD_CTX* ctx = EVP_MD_CTX_new()
+    cdef int ok, i
+    cdef size_t j
+    if ctx == NULL:
+        return 0
+    for j in range(<size_t>_BLOCK):
+        k0[j] = 0
+    ok = 1
+    if key_len > <size_t>_BLOCK:
+        ok = (
+            EVP_DigestInit_ex(ctx, _MD, NULL)
+            and EVP_DigestUpdate(ctx, key, key_len)
+            and EVP_DigestFinal_ex(ctx, k0, NULL)
+        )
+    else:
+        for j in range(key_len):
+            k0[j] = key[j]
+    for j in range(<size_t>_BLOCK):
+        pad[j] = k0[j] ^ 0x36
+    ok = ok and EVP_DigestInit_ex(ctx, _MD, NULL) and EVP_DigestUpdate(ctx, pad, _BLOCK)
+    i = 0
+    while ok and i < count:
+        ok = EVP_DigestUpdate(ctx, parts[i], n[i])
+        i += 1
+    ok = ok and EVP_DigestFinal_ex(ctx, inner, NULL)
+    for j in range(<size_t>_BLOCK):
+        pad[j] = k0[j] ^ 0x5C
+    ok = (
+        ok
+        and EVP_DigestInit_ex(ctx, _MD, NULL)
+        and EVP_DigestUpdate(ctx, pad, _BLOCK)
+        and EVP_DigestUpdate(ctx, inner, 32)
+        and EVP_DigestFinal_ex(ctx, out, NULL)
+    )
+    EVP_MD_CTX_free(ctx)
+    return ok
+
+
+cpdef bytes hmac_sha256(bytes key, bytes data):
+    """HMAC-SHA256 (32 bytes) of data under key."""
+    # cpdef arguments cannot be declared "not None"; key and data are read raw.
+    if key is None or data is None:
+        raise TypeError("hmac_sha256: key and data must be bytes, not None")
+    cdef unsigned char out[32]
+    cdef const unsigned char* part = <const unsigned char*>PyBytes_AS_STRING(data)
+    cdef size_t n = PyBytes_GET_SIZE(data)
+    if not _hmac_sha256_parts(
+        <const unsigned char*>PyBytes_AS_STRING(key), PyBytes_GET_SIZE(key), &part, &n, 1, out
+    ):
+        raise RuntimeError("OpenSSL EVP digest (SHA-256) failed")
+    return PyBytes_FromStringAndSize(<char*>out, 32)
@@ -4,8 +4,23 @@
 cdef extern from "stdint.h":
     ctypedef unsigned long long uint64_t
 
-cdef uint64_t _rol64(uint64_t v, int n) noexcept nogil
+cdef void _keccak_f(uint64_t state[25]) noexcept nogil
 
-cdef void _keccak_f(uint64_t state[5][5]) noexcept nogil
+cdef void _keccak256(const unsigned char* data, size_t n, unsigned char* out) noexcept nogil
+
+# Digests of count (1..4) independent inputs; 4-way AVX2 permutation when available.
+cdef void _keccak256_x4(
+    const unsigned char** data, const size_t* n, unsigned char** out, int count
+) noexcept nogil
+
+# Incremental Keccak-256; zero the context with _keccak256_init before use.
+ctypedef struct _Keccak256Ctx:
+    uint64_t state[25]
+    size_t pos
+
+cdef void _keccak256_init(_Keccak256Ctx* ctx) noexcept nogil
+cdef void _keccak256_update(_Keccak256Ctx* ctx, const unsigned char* data, size_t n) noexcept nogil
+cdef void _keccak256_final(_Keccak256Ctx* ctx, unsigned char* out) noexcept nogil
 
 cpdef bytes keccak256(bytes data)
+cpdef list keccak256_batch(object messages)
@@ -1,3 +1,6 @@
 """Stub for picocrypto.hashes.keccak_cy."""
 
+from collections.abc import Iterable
+
 def keccak256(data: bytes) -> bytes: ...
+def keccak256_batch(messages: Iterable[bytes]) -> list[bytes]: ...
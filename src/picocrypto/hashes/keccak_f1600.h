@@ -0,0 +1,744 @@
+/*
+ * Keccak-f[1600] permutation and Keccak-256 sponge.
+ *
+ * The 24 rounds are fully unrolled over 25 lanes held in locals (lane index
+ * x + 5*y). The same body is compiled twice: a portable kernel and, on x86-64,
+ * a BMI2 kernel where rotates lower to RORX and ~a & b to ANDN. The kernel is
+ * picked once by keccak_f1600_init() via __builtin_cpu_supports. A
+ * row-per-register AVX-512 kernel (keccak_f1600_avx512) measured no faster than
+ * BMI2, so it is only built and preferred with -DPICOCRYPTO_KECCAK_AVX512, for
+ * hosts where a benchmark shows it winning.
+ *
+ * keccak_f1600_x4 runs four independent states side by side in AVX2 registers
+ * (one 4x64-bit vector per lane), or as two 2-way NEON passes on aarch64; it
+ * is NULL elsewhere and keccak256_digest_x4 then hashes its inputs one at a
+ * time. On aarch64 with FEAT_SHA3 keccak_f1600_x4 uses the SHA3 instructions;
+ * those kernels are 2-way only, so single-stream calls stay on the generic one.
+ */
+#ifndef PICOCRYPTO_KECCAK_F1600_H
+#define PICOCRYPTO_KECCAK_F1600_H
+
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+
+#define KECCAK256_RATE 136
+
+static const uint64_t keccak_rc[24] = {
+    0x0000000000000001ULL, 0x0000000000008082ULL, 0x800000000000808AULL,
+    0x8000000080008000ULL, 0x000000000000808BULL, 0x0000000080000001ULL,
+    0x8000000080008081ULL, 0x8000000000008009ULL, 0x000000000000008AULL,
+    0x0000000000000088ULL, 0x0000000080008009ULL, 0x000000008000000AULL,
+    0x000000008000808BULL, 0x800000000000008BULL, 0x8000000000008089ULL,
+    0x8000000000008003ULL, 0x8000000000008002ULL, 0x8000000000000080ULL,
+    0x000000000000800AULL, 0x800000008000000AULL, 0x8000000080008081ULL,
+    0x8000000000008080ULL, 0x0000000080000001ULL, 0x8000000080008008ULL,
+};
+
+#define KECCAK_ROL(v, n) (((v) << (n)) | ((v) >> (64 - (n))))
+#define KECCAK_ANDN(a, b) (~(a) & (b))
+
+/* theta, rho, pi, chi, iota for one round. */
+#define KECCAK_ROUND(rc) \
+    c0 = s0 ^ s5 ^ s10 ^ s15 ^ s20; \
+    c1 = s1 ^ s6 ^ s11 ^ s16 ^ s21; \
+    c2 = s2 ^ s7 ^ s12 ^ s17 ^ s22; \
+    c3 = s3 ^ s8 ^ s13 ^ s18 ^ s23; \
+    c4 = s4 ^ s9 ^ s14 ^ s19 ^ s24; \
+    d0 = c4 ^ KECCAK_ROL(c1, 1); \
+    d1 = c0 ^ KECCAK_ROL(c2, 1); \
+    d2 = c1 ^ KECCAK_ROL(c3, 1); \
+    d3 = c2 ^ KECCAK_ROL(c4, 1); \
+    d4 = c3 ^ KECCAK_ROL(c0, 1); \
+    b0 = s0 ^ d0; \
+    b10 = KECCAK_ROL(s1 ^ d1, 1); \
+    b20 = KECCAK_ROL(s2 ^ d2, 62); \
+    b5 = KECCAK_ROL(s3 ^ d3, 28); \
+    b15 = KECCAK_ROL(s4 ^ d4, 27); \
+    b16 = KECCAK_ROL(s5 ^ d0, 36); \
+    b1 = KECCAK_ROL(s6 ^ d1, 44); \
+    b11 = KECCAK_ROL(s7 ^ d2, 6); \
+    b21 = KECCAK_ROL(s8 ^ d3, 55); \
+    b6 = KECCAK_ROL(s9 ^ d4, 20); \
+    b7 = KECCAK_ROL(s10 ^ d0, 3); \
+    b17 = KECCAK_ROL(s11 ^ d1, 10); \
+    b2 = KECCAK_ROL(s12 ^ d2, 43); \
+    b12 = KECCAK_ROL(s13 ^ d3, 25); \
+    b22 = KECCAK_ROL(s14 ^ d4, 39); \
+    b23 = KECCAK_ROL(s15 ^ d0, 41); \
+    b8 = KECCAK_ROL(s16 ^ d1, 45); \
+    b18 = KECCAK_ROL(s17 ^ d2, 15); \
+    b3 = KECCAK_ROL(s18 ^ d3, 21); \
+    b13 = KECCAK_ROL(s19 ^ d4, 8); \
+    b14 = KECCAK_ROL(s20 ^ d0, 18); \
+    b24 = KECCAK_ROL(s21 ^ d1, 2); \
+    b9 = KECCAK_ROL(s22 ^ d2, 61); \
+    b19 = KECCAK_ROL(s23 ^ d3, 56); \
+    b4 = KECCAK_ROL(s24 ^ d4, 14); \
+    s0 = b0 ^ KECCAK_ANDN(b1, b2); \
+    s1 = b1 ^ KECCAK_ANDN(b2, b3); \
+    s2 = b2 ^ KECCAK_ANDN(b3, b4); \
+    s3 = b3 ^ KECCAK_ANDN(b4, b0); \
+    s4 = b4 ^ KECCAK_ANDN(b0, b1); \
+    s5 = b5 ^ KECCAK_ANDN(b6, b7); \
+    s6 = b6 ^ KECCAK_ANDN(b7, b8); \
+    s7 = b7 ^ KECCAK_ANDN(b8, b9); \
+    s8 = b8 ^ KECCAK_ANDN(b9, b5); \
+    s9 = b9 ^ KECCAK_ANDN(b5, b6); \
+    s10 = b10 ^ KECCAK_ANDN(b11, b12); \
+    s11 = b11 ^ KECCAK_ANDN(b12, b13); \
+    s12 = b12 ^ KECCAK_ANDN(b13, b14); \
+    s13 = b13 ^ KECCAK_ANDN(b14, b10); \
+    s14 = b14 ^ KECCAK_ANDN(b10, b11); \
+    s15 = b15 ^ KECCAK_ANDN(b16, b17); \
+    s16 = b16 ^ KECCAK_ANDN(b17, b18); \
+    s17 = b17 ^ KECCAK_ANDN(b18, b19); \
+    s18 = b18 ^ KECCAK_ANDN(b19, b15); \
+    s19 = b19 ^ KECCAK_ANDN(b15, b16); \
+    s20 = b20 ^ KECCAK_ANDN(b21, b22); \
+    s21 = b21 ^ KECCAK_ANDN(b22, b23); \
+    s22 = b22 ^ KECCAK_ANDN(b23, b24); \
+    s23 = b23 ^ KECCAK_ANDN(b24, b20); \
+    s24 = b24 ^ KECCAK_ANDN(b20, b21); \
+    s0 ^= (rc);
+
+#define KECCAK_F1600_BODY(state) \
+    uint64_t s0 = state[0], s1 = state[1], s2 = state[2], s3 = state[3], s4 = state[4]; \
+    uint64_t s5 = state[5], s6 = state[6], s7 = state[7], s8 = state[8], s9 = state[9]; \
+    uint64_t s10 = state[10], s11 = state[11], s12 = state[12], s13 = state[13], s14 = state[14]; \
+    uint64_t s15 = state[15], s16 = state[16], s17 = state[17], s18 = state[18], s19 = state[19]; \
+    uint64_t s20 = state[20], s21 = state[21], s22 = state[22], s23 = state[23], s24 = state[24]; \
+    uint64_t b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11, b12; \
+    uint64_t b13, b14, b15, b16, b17, b18, b19, b20, b21, b22, b23, b24; \
+    uint64_t c0, c1, c2, c3, c4, d0, d1, d2, d3, d4; \
+    KECCAK_ROUND(keccak_rc[0]) KECCAK_ROUND(keccak_rc[1]) KECCAK_ROUND(keccak_rc[2]) \
+    KECCAK_ROUND(keccak_rc[3]) KECCAK_ROUND(keccak_rc[4]) KECCAK_ROUND(keccak_rc[5]) \
+    KECCAK_ROUND(keccak_rc[6]) KECCAK_ROUND(keccak_rc[7]) KECCAK_ROUND(keccak_rc[8]) \
+    KECCAK_ROUND(keccak_rc[9]) KECCAK_ROUND(keccak_rc[10]) KECCAK_ROUND(keccak_rc[11]) \
+    KECCAK_ROUND(keccak_rc[12]) KECCAK_ROUND(keccak_rc[13]) KECCAK_ROUND(keccak_rc[14]) \
+    KECCAK_ROUND(keccak_rc[15]) KECCAK_ROUND(keccak_rc[16]) KECCAK_ROUND(keccak_rc[17]) \
+    KECCAK_ROUND(keccak_rc[18]) KECCAK_ROUND(keccak_rc[19]) KECCAK_ROUND(keccak_rc[20]) \
+    KECCAK_ROUND(keccak_rc[21]) KECCAK_ROUND(keccak_rc[22]) KECCAK_ROUND(keccak_rc[23]) \
+    state[0] = s0; state[1] = s1; state[2] = s2; state[3] = s3; state[4] = s4; \
+    state[5] = s5; state[6] = s6; state[7] = s7; state[8] = s8; state[9] = s9; \
+    state[10] = s10; state[11] = s11; state[12] = s12; state[13] = s13; state[14] = s14; \
+    state[15] = s15; state[16] = s16; state[17] = s17; state[18] = s18; state[19] = s19; \
+    state[20] = s20; state[21] = s21; state[22] = s22; state[23] = s23; state[24] = s24;
+
+typedef void (*keccak_f1600_fn)(uint64_t *state);
+
+static void keccak_f1600_generic(uint64_t *state) {
+    KECCAK_F1600_BODY(state)
+}
+
+#if defined(__x86_64__) && (defined(__GNUC__) || defined(__clang__))
+#define KECCAK_HAVE_X86_DISPATCH 1
+
+__attribute__((target("bmi,bmi2")))
+static void keccak_f1600_bmi2(uint64_t *state) {
+    KECCAK_F1600_BODY(state)
+}
+
+#include <immintrin.h>
+
+#define KECCAK_X4_XOR(a, b) _mm256_xor_si256((a), (b))
+#define KECCAK_X4_ANDN(a, b) _mm256_andnot_si256((a), (b))
+#define KECCAK_X4_ROL(v, n) _mm256_or_si256(_mm256_slli_epi64((v), (n)), _mm256_srli_epi64((v), 64 - (n)))
+#define KECCAK_X4_SET1(rc) _mm256_set1_epi64x((long long)(rc))
+
+#define KECCAK_X4_ROUND(rc) \
+    c0 = KECCAK_X4_XOR(KECCAK_X4_XOR(KECCAK_X4_XOR(KECCAK_X4_XOR(s0, s5), s10), s15), s20); \
+    c1 = KECCAK_X4_XOR(KECCAK_X4_XOR(KECCAK_X4_XOR(KECCAK_X4_XOR(s1, s6), s11), s16), s21); \
+    c2 = KECCAK_X4_XOR(KECCAK_X4_XOR(KECCAK_X4_XOR(KECCAK_X4_XOR(s2, s7), s12), s17), s22); \
+    c3 = KECCAK_X4_XOR(KECCAK_X4_XOR(KECCAK_X4_XOR(KECCAK_X4_XOR(s3, s8), s13), s18), s23); \
+    c4 = KECCAK_X4_XOR(KECCAK_X4_XOR(KECCAK_X4_XOR(KECCAK_X4_XOR(s4, s9), s14), s19), s24); \
+    d0 = KECCAK_X4_XOR(c4, KECCAK_X4_ROL(c1, 1)); \
+    d1 = KECCAK_X4_XOR(c0, KECCAK_X4_ROL(c2, 1)); \
+    d2 = KECCAK_X4_XOR(c1, KECCAK_X4_ROL(c3, 1)); \
+    d3 = KECCAK_X4_XOR(c2, KECCAK_X4_ROL(c4, 1)); \
+    d4 = KECCAK_X4_XOR(c3, KECCAK_X4_ROL(c0, 1)); \
+    b0 = KECCAK_X4_XOR(s0, d0); \
+    b10 = KECCAK_X4_ROL(KECCAK_X4_XOR(s1, d1), 1); \
+    b20 = KECCAK_X4_ROL(KECCAK_X4_XOR(s2, d2), 62); \
+    b5 = KECCAK_X4_ROL(KECCAK_X4_XOR(s3, d3), 28); \
+    b15 = KECCAK_X4_ROL(KECCAK_X4_XOR(s4, d4), 27); \
+    b16 = KECCAK_X4_ROL(KECCAK_X4_XOR(s5, d0), 36); \
+    b1 = KECCAK_X4_ROL(KECCAK_X4_XOR(s6, d1), 44); \
+    b11 = KECCAK_X4_ROL(KECCAK_X4_XOR(s7, d2), 6); \
+    b21 = KECCAK_X4_ROL(KECCAK_X4_XOR(s8, d3), 55); \
+    b6 = KECCAK_X4_ROL(KECCAK_X4_XOR(s9, d4), 20); \
+    b7 = KECCAK_X4_ROL(KECCAK_X4_XOR(s10, d0), 3); \
+    b17 = KECCAK_X4_ROL(KECCAK_X4_XOR(s11, d1), 10); \
+    b2 = KECCAK_X4_ROL(KECCAK_X4_XOR(s12, d2), 43); \
+    b12 = KECCAK_X4_ROL(KECCAK_X4_XOR(s13, d3), 25); \
+    b22 = KECCAK_X4_ROL(KECCAK_X4_XOR(s14, d4), 39); \
+    b23 = KECCAK_X4_ROL(KECCAK_X4_XOR(s15, d0), 41); \
+    b8 = KECCAK_X4_ROL(KECCAK_X4_XOR(s16, d1), 45); \
+    b18 = KECCAK_X4_ROL(KECCAK_X4_XOR(s17, d2), 15); \
+    b3 = KECCAK_X4_ROL(KECCAK_X4_XOR(s18, d3), 21); \
+    b13 = KECCAK_X4_ROL(KECCAK_X4_XOR(s19, d4), 8); \
+    b14 = KECCAK_X4_ROL(KECCAK_X4_XOR(s20, d0), 18); \
+    b24 = KECCAK_X4_ROL(KECCAK_X4_XOR(s21, d1), 2); \
+    b9 = KECCAK_X4_ROL(KECCAK_X4_XOR(s22, d2), 61); \
+    b19 = KECCAK_X4_ROL(KECCAK_X4_XOR(s23, d3), 56); \
+    b4 = KECCAK_X4_ROL(KECCAK_X4_XOR(s24, d4), 14); \
+    s0 = KECCAK_X4_XOR(b0, KECCAK_X4_ANDN(b1, b2)); \
+    s1 = KECCAK_X4_XOR(b1, KECCAK_X4_ANDN(b2, b3)); \
+    s2 = KECCAK_X4_XOR(b2, KECCAK_X4_ANDN(b3, b4)); \
+    s3 = KECCAK_X4_XOR(b3, KECCAK_X4_ANDN(b4, b0)); \
+    s4 = KECCAK_X4_XOR(b4, KECCAK_X4_ANDN(b0, b1)); \
+    s5 = KECCAK_X4_XOR(b5, KECCAK_X4_ANDN(b6, b7)); \
+    s6 = KECCAK_X4_XOR(b6, KECCAK_X4_ANDN(b7, b8)); \
+    s7 = KECCAK_X4_XOR(b7, KECCAK_X4_ANDN(b8, b9)); \
+    s8 = KECCAK_X4_XOR(b8, KECCAK_X4_ANDN(b9, b5)); \
+    s9 = KECCAK_X4_XOR(b9, KECCAK_X4_ANDN(b5, b6)); \
+    s10 = KECCAK_X4_XOR(b10, KECCAK_X4_ANDN(b11, b12)); \
+    s11 = KECCAK_X4_XOR(b11, KECCAK_X4_ANDN(b12, b13)); \
+    s12 = KECCAK_X4_XOR(b12, KECCAK_X4_ANDN(b13, b14)); \
+    s13 = KECCAK_X4_XOR(b13, KECCAK_X4_ANDN(b14, b10)); \
+    s14 = KECCAK_X4_XOR(b14, KECCAK_X4_ANDN(b10, b11)); \
+    s15 = KECCAK_X4_XOR(b15, KECCAK_X4_ANDN(b16, b17)); \
+    s16 = KECCAK_X4_XOR(b16, KECCAK_X4_ANDN(b17, b18)); \
+    s17 = KECCAK_X4_XOR(b17, KECCAK_X4_ANDN(b18, b19)); \
+    s18 = KECCAK_X4_XOR(b18, KECCAK_X4_ANDN(b19, b15)); \
+    s19 = KECCAK_X4_XOR(b19, KECCAK_X4_ANDN(b15, b16)); \
+    s20 = KECCAK_X4_XOR(b20, KECCAK_X4_ANDN(b21, b22)); \
+    s21 = KECCAK_X4_XOR(b21, KECCAK_X4_ANDN(b22, b23)); \
+    s22 = KECCAK_X4_XOR(b22, KECCAK_X4_ANDN(b23, b24)); \
+    s23 = KECCAK_X4_XOR(b23, KECCAK_X4_ANDN(b24, b20)); \
+    s24 = KECCAK_X4_XOR(b24, KECCAK_X4_ANDN(b20, b21)); \
+    s0 = KECCAK_X4_XOR(s0, KECCAK_X4_SET1(rc));
+
+/* In-place 4x4 transpose of 64-bit elements via unpack + 128-bit permutes (no gathers). */
+#define KECCAK_X4_TRANSPOSE(r0, r1, r2, r3) do { \
+    __m256i t0 = _mm256_unpacklo_epi64(r0, r1), t1 = _mm256_unpackhi_epi64(r0, r1); \
+    __m256i t2 = _mm256_unpacklo_epi64(r2, r3), t3 = _mm256_unpackhi_epi64(r2, r3); \
+    r0 = _mm256_permute2x128_si256(t0, t2, 0x20); \
+    r1 = _mm256_permute2x128_si256(t1, t3, 0x20); \
+    r2 = _mm256_permute2x128_si256(t0, t2, 0x31); \
+    r3 = _mm256_permute2x128_si256(t1, t3, 0x31); \
+} while (0)
+
+__attribute__((target("avx2")))
+static void keccak_f1600_x4_avx2(uint64_t state[4][25]) {
+    __m256i v[25];
+    uint64_t last[4];
+    int i;
+    for (i = 0; i < 24; i += 4) {
+        __m256i r0 = _mm256_loadu_si256((const __m256i *)&state[0][i]);
+        __m256i r1 = _mm256_loadu_si256((const __m256i *)&state[1][i]);
+        __m256i r2 = _mm256_loadu_si256((const __m256i *)&state[2][i]);
+        __m256i r3 = _mm256_loadu_si256((const __m256i *)&state[3][i]);
+        KECCAK_X4_TRANSPOSE(r0, r1, r2, r3);
+        v[i] = r0;
+        v[i + 1] = r1;
+        v[i + 2] = r2;
+        v[i + 3] = r3;
+    }
+    v[24] = _mm256_set_epi64x((long long)state[3][24], (long long)state[2][24],
+                              (long long)state[1][24], (long long)state[0][24]);
+    {
+        __m256i s0 = v[0], s1 = v[1], s2 = v[2], s3 = v[3], s4 = v[4], s5 = v[5], s6 = v[6], s7 = v[7], s8 = v[8], s9 = v[9], s10 = v[10], s11 = v[11], s12 = v[12], s13 = v[13], s14 = v[14], s15 = v[15], s16 = v[16], s17 = v[17], s18 = v[18], s19 = v[19], s20 = v[20], s21 = v[21], s22 = v[22], s23 = v[23], s24 = v[24];
+        __m256i b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11, b12, b13, b14, b15, b16, b17, b18, b19, b20, b21, b22, b23, b24;
+        __m256i c0, c1, c2, c3, c4, d0, d1, d2, d3, d4;
+        KECCAK_X4_ROUND(keccak_rc[0]) KECCAK_X4_ROUND(keccak_rc[1]) KECCAK_X4_ROUND(keccak_rc[2]) \
+    KECCAK_X4_ROUND(keccak_rc[3]) KECCAK_X4_ROUND(keccak_rc[4]) KECCAK_X4_ROUND(keccak_rc[5]) \
+    KECCAK_X4_ROUND(keccak_rc[6]) KECCAK_X4_ROUND(keccak_rc[7]) KECCAK_X4_ROUND(keccak_rc[8]) \
+    KECCAK_X4_ROUND(keccak_rc[9]) KECCAK_X4_ROUND(keccak_rc[10]) KECCAK_X4_ROUND(keccak_rc[11]) \
+    KECCAK_X4_ROUND(keccak_rc[12]) KECCAK_X4_ROUND(keccak_rc[13]) KECCAK_X4_ROUND(keccak_rc[14]) \
+    KECCAK_X4_ROUND(keccak_rc[15]) KECCAK_X4_ROUND(keccak_rc[16]) KECCAK_X4_ROUND(keccak_rc[17]) \
+    KECCAK_X4_ROUND(keccak_rc[18]) KECCAK_X4_ROUND(keccak_rc[19]) KECCAK_X4_ROUND(keccak_rc[20]) \
+    KECCAK_X4_ROUND(keccak_rc[21]) KECCAK_X4_ROUND(keccak_rc[22]) KECCAK_X4_ROUND(keccak_rc[23])
+        v[0] = s0; v[1] = s1; v[2] = s2; v[3] = s3; v[4] = s4; v[5] = s5; v[6] = s6; v[7] = s7; v[8] = s8; v[9] = s9; v[10] = s10; v[11] = s11; v[12] = s12; v[13] = s13; v[14] = s14; v[15] = s15; v[16] = s16; v[17] = s17; v[18] = s18; v[19] = s19; v[20] = s20; v[21] = s21; v[22] = s22; v[23] = s23; v[24] = s24;
+    }
+    for (i = 0; i < 24; i += 4) {
+        __m256i r0 = v[i], r1 = v[i + 1], r2 = v[i + 2], r3 = v[i + 3];
+        KECCAK_X4_TRANSPOSE(r0, r1, r2, r3);
+        _mm256_storeu_si256((__m256i *)&state[0][i], r0);
+        _mm256_storeu_si256((__m256i *)&state[1][i], r1);
+        _mm256_storeu_si256((__m256i *)&state[2][i], r2);
+        _mm256_storeu_si256((__m256i *)&state[3][i], r3);
+    }
+    _mm256_storeu_si256((__m256i *)last, v[24]);
+    for (i = 0; i < 4; i++) state[i][24] = last[i];
+}
+
+#ifdef PICOCRYPTO_KECCAK_AVX512
+#define KECCAK_HAVE_AVX512 1
+/*
+ * AVX-512 kernel: row y (lanes x = 0..4) lives in the low five qwords of one
+ * zmm register for all 24 rounds. Theta's column parity and chi are single
+ * vpternlogq ops (0x96 = a^b^c, 0xD2 = a^(~b&c)), rho is one vprolvq per row
+ * and pi is a fixed two-source permute + blend per output row.
+ */
+__attribute__((target("avx512f")))
+static void keccak_f1600_avx512(uint64_t *state) {
+    const __mmask8 rowmask = 0x1F;
+    const __m512i xm1 = _mm512_setr_epi64(4, 0, 1, 2, 3, 5, 6, 7);
+    const __m512i xp1 = _mm512_setr_epi64(1, 2, 3, 4, 0, 5, 6, 7);
+    const __m512i xp2 = _mm512_setr_epi64(2, 3, 4, 0, 1, 5, 6, 7);
+    const __m512i rho0 = _mm512_setr_epi64(0, 1, 62, 28, 27, 0, 0, 0);
+    const __m512i rho1 = _mm512_setr_epi64(36, 44, 6, 55, 20, 0, 0, 0);
+    const __m512i rho2 = _mm512_setr_epi64(3, 10, 43, 25, 39, 0, 0, 0);
+    const __m512i rho3 = _mm512_setr_epi64(41, 45, 15, 21, 8, 0, 0, 0);
+    const __m512i rho4 = _mm512_setr_epi64(18, 2, 61, 56, 14, 0, 0, 0);
+    const __m512i pi0a = _mm512_setr_epi64(0, 9, 0, 0, 0, 0, 0, 0), pi0b = _mm512_setr_epi64(0, 0, 2, 11, 0, 0, 0, 0), pi0c = _mm512_setr_epi64(0, 1, 2, 3, 12, 0, 0, 0);
+    const __m512i pi1a = _mm512_setr_epi64(3, 12, 0, 0, 0, 0, 0, 0), pi1b = _mm512_setr_epi64(0, 0, 0, 9, 0, 0, 0, 0), pi1c = _mm512_setr_epi64(0, 1, 2, 3, 10, 0, 0, 0);
+    const __m512i pi2a = _mm512_setr_epi64(1, 10, 0, 0, 0, 0, 0, 0), pi2b = _mm512_setr_epi64(0, 0, 3, 12, 0, 0, 0, 0), pi2c = _mm512_setr_epi64(0, 1, 2, 3, 8, 0, 0, 0);
+    const __m512i pi3a = _mm512_setr_epi64(4, 8, 0, 0, 0, 0, 0, 0), pi3b = _mm512_setr_epi64(0, 0, 1, 10, 0, 0, 0, 0), pi3c = _mm512_setr_epi64(0, 1, 2, 3, 11, 0, 0, 0);
+    const __m512i pi4a = _mm512_setr_epi64(2, 11, 0, 0, 0, 0, 0, 0), pi4b = _mm512_setr_epi64(0, 0, 4, 8, 0, 0, 0, 0), pi4c = _mm512_setr_epi64(0, 1, 2, 3, 9, 0, 0, 0);
+    __m512i a0 = _mm512_maskz_loadu_epi64(rowmask, state);
+    __m512i a1 = _mm512_maskz_loadu_epi64(rowmask, state + 5);
+    __m512i a2 = _mm512_maskz_loadu_epi64(rowmask, state + 10);
+    __m512i a3 = _mm512_maskz_loadu_epi64(rowmask, state + 15);
+    __m512i a4 = _mm512_maskz_loadu_epi64(rowmask, state + 20);
+    __m512i b0, b1, b2, b3, b4, c, d;
+    int r;
+    for (r = 0; r < 24; r++) {
+        c = _mm512_ternarylogic_epi64(_mm512_ternarylogic_epi64(a0, a1, a2, 0x96), a3, a4, 0x96);
+        d = _mm512_xor_si512(_mm512_permutexvar_epi64(xm1, c),
+                             _mm512_rol_epi64(_mm512_permutexvar_epi64(xp1, c), 1));
+        a0 = _mm512_rolv_epi64(_mm512_xor_si512(a0, d), rho0);
+        a1 = _mm512_rolv_epi64(_mm512_xor_si512(a1, d), rho1);
+        a2 = _mm512_rolv_epi64(_mm512_xor_si512(a2, d), rho2);
+        a3 = _mm512_rolv_epi64(_mm512_xor_si512(a3, d), rho3);
+        a4 = _mm512_rolv_epi64(_mm512_xor_si512(a4, d), rho4);
+        b0 = _mm512_permutex2var_epi64(
+            _mm512_mask_blend_epi64(0x0C, _mm512_permutex2var_epi64(a0, pi0a, a1),
+                                    _mm512_permutex2var_epi64(a2, pi0b, a3)),
+            pi0c, a4);
+        b1 = _mm512_permutex2var_epi64(
+            _mm512_mask_blend_epi64(0x0C, _mm512_permutex2var_epi64(a0, pi1a, a1),
+                                    _mm512_permutex2var_epi64(a2, pi1b, a3)),
+            pi1c, a4);
+        b2 = _mm512_permutex2var_epi64(
+            _mm512_mask_blend_epi64(0x0C, _mm512_permutex2var_epi64(a0, pi2a, a1),
+                                    _mm512_permutex2var_epi64(a2, pi2b, a3)),
+            pi2c, a4);
+        b3 = _mm512_permutex2var_epi64(
+            _mm512_mask_blend_epi64(0x0C, _mm512_permutex2var_epi64(a0, pi3a, a1),
+                                    _mm512_permutex2var_epi64(a2, pi3b, a3)),
+            pi3c, a4);
+        b4 = _mm512_permutex2var_epi64(
+            _mm512_mask_blend_epi64(0x0C, _mm512_permutex2var_epi64(a0, pi4a, a1),
+                                    _mm512_permutex2var_epi64(a2, pi4b, a3)),
+            pi4c, a4);
+        a0 = _mm512_ternarylogic_epi64(b0, _mm512_permutexvar_epi64(xp1, b0), _mm512_permutexvar_epi64(xp2, b0), 0xD2);
+        a1 = _mm512_ternarylogic_epi64(b1, _mm512_permutexvar_epi64(xp1, b1), _mm512_permutexvar_epi64(xp2, b1), 0xD2);
+        a2 = _mm512_ternarylogic_epi64(b2, _mm512_permutexvar_epi64(xp1, b2), _mm512_permutexvar_epi64(xp2, b2), 0xD2);
+        a3 = _mm512_ternarylogic_epi64(b3, _mm512_permutexvar_epi64(xp1, b3), _mm512_permutexvar_epi64(xp2, b3), 0xD2);
+        a4 = _mm512_ternarylogic_epi64(b4, _mm512_permutexvar_epi64(xp1, b4), _mm512_permutexvar_epi64(xp2, b4), 0xD2);
+        a0 = _mm512_mask_xor_epi64(a0, 0x01, a0, _mm512_set1_epi64((long long)keccak_rc[r]));
+    }
+    _mm512_mask_storeu_epi64(state, rowmask, a0);
+    _mm512_mask_storeu_epi64(state + 5, rowmask, a1);
+    _mm512_mask_storeu_epi64(state + 10, rowmask, a2);
+    _mm512_mask_storeu_epi64(state + 15, rowmask, a3);
+    _mm512_mask_storeu_epi64(state + 20, rowmask, a4);
+}
+#endif /* PICOCRYPTO_KECCAK_AVX512 */
+#endif
+
+typedef void (*keccak_f1600_x4_fn)(uint64_t state[4][25]);
+
+#if defined(__aarch64__) && defined(__ARM_NEON) && (defined(__GNUC__) || defined(__clang__))
+#define KECCAK_HAVE_NEON 1
+#include <arm_neon.h>
+
+/*
+ * NEON kernels hold lane i of two independent states in one uint64x2_t.
+ * Rotates are VSHR + VSLI (shift-left-and-insert) rather than shift, shift, or.
+ * keccak_f1600_x4 runs them as two 2-way passes.
+ */
+#define KECCAK_N2_XOR(a, b) veorq_u64((a), (b))
+#define KECCAK_N2_ANDN(a, b) vbicq_u64((b), (a))
+#define KECCAK_N2_ROL(v, n) vsliq_n_u64(vshrq_n_u64((v), 64 - (n)), (v), (n))
+#define KECCAK_N2_SET1(rc) vdupq_n_u64(rc)
+
+#define KECCAK_N2_ROUND(rc) \
+    c0 = KECCAK_N2_XOR(KECCAK_N2_XOR(KECCAK_N2_XOR(KECCAK_N2_XOR(s0, s5), s10), s15), s20); \
+    c1 = KECCAK_N2_XOR(KECCAK_N2_XOR(KECCAK_N2_XOR(KECCAK_N2_XOR(s1, s6), s11), s16), s21); \
+    c2 = KECCAK_N2_XOR(KECCAK_N2_XOR(KECCAK_N2_XOR(KECCAK_N2_XOR(s2, s7), s12), s17), s22); \
+    c3 = KECCAK_N2_XOR(KECCAK_N2_XOR(KECCAK_N2_XOR(KECCAK_N2_XOR(s3, s8), s13), s18), s23); \
+    c4 = KECCAK_N2_XOR(KECCAK_N2_XOR(KECCAK_N2_XOR(KECCAK_N2_XOR(s4, s9), s14), s19), s24); \
+    d0 = KECCAK_N2_XOR(c4, KECCAK_N2_ROL(c1, 1)); \
+    d1 = KECCAK_N2_XOR(c0, KECCAK_N2_ROL(c2, 1)); \
+    d2 = KECCAK_N2_XOR(c1, KECCAK_N2_ROL(c3, 1)); \
+    d3 = KECCAK_N2_XOR(c2, KECCAK_N2_ROL(c4, 1)); \
+    d4 = KECCAK_N2_XOR(c3, KECCAK_N2_ROL(c0, 1)); \
+    b0 = KECCAK_N2_XOR(s0, d0); \
+    b10 = KECCAK_N2_ROL(KECCAK_N2_XOR(s1, d1), 1); \
+    b20 = KECCAK_N2_ROL(KECCAK_N2_XOR(s2, d2), 62); \
+    b5 = KECCAK_N2_ROL(KECCAK_N2_XOR(s3, d3), 28); \
+    b15 = KECCAK_N2_ROL(KECCAK_N2_XOR(s4, d4), 27); \
+    b16 = KECCAK_N2_ROL(KECCAK_N2_XOR(s5, d0), 36); \
+    b1 = KECCAK_N2_ROL(KECCAK_N2_XOR(s6, d1), 44); \
+    b11 = KECCAK_N2_ROL(KECCAK_N2_XOR(s7, d2), 6); \
+    b21 = KECCAK_N2_ROL(KECCAK_N2_XOR(s8, d3), 55); \
+    b6 = KECCAK_N2_ROL(KECCAK_N2_XOR(s9, d4), 20); \
+    b7 = KECCAK_N2_ROL(KECCAK_N2_XOR(s10, d0), 3); \
+    b17 = KECCAK_N2_ROL(KECCAK_N2_XOR(s11, d1), 10); \
+    b2 = KECCAK_N2_ROL(KECCAK_N2_XOR(s12, d2), 43); \
+    b12 = KECCAK_N2_ROL(KECCAK_N2_XOR(s13, d3), 25); \
+    b22 = KECCAK_N2_ROL(KECCAK_N2_XOR(s14, d4), 39); \
+    b23 = KECCAK_N2_ROL(KECCAK_N2_XOR(s15, d0), 41); \
+    b8 = KECCAK_N2_ROL(KECCAK_N2_XOR(s16, d1), 45); \
+    b18 = KECCAK_N2_ROL(KECCAK_N2_XOR(s17, d2), 15); \
+    b3 = KECCAK_N2_ROL(KECCAK_N2_XOR(s18, d3), 21); \
+    b13 = KECCAK_N2_ROL(KECCAK_N2_XOR(s19, d4), 8); \
+    b14 = KECCAK_N2_ROL(KECCAK_N2_XOR(s20, d0), 18); \
+    b24 = KECCAK_N2_ROL(KECCAK_N2_XOR(s21, d1), 2); \
+    b9 = KECCAK_N2_ROL(KECCAK_N2_XOR(s22, d2), 61); \
+    b19 = KECCAK_N2_ROL(KECCAK_N2_XOR(s23, d3), 56); \
+    b4 = KECCAK_N2_ROL(KECCAK_N2_XOR(s24, d4), 14); \
+    s0 = KECCAK_N2_XOR(b0, KECCAK_N2_ANDN(b1, b2)); \
+    s1 = KECCAK_N2_XOR(b1, KECCAK_N2_ANDN(b2, b3)); \
+    s2 = KECCAK_N2_XOR(b2, KECCAK_N2_ANDN(b3, b4)); \
+    s3 = KECCAK_N2_XOR(b3, KECCAK_N2_ANDN(b4, b0)); \
+    s4 = KECCAK_N2_XOR(b4, KECCAK_N2_ANDN(b0, b1)); \
+    s5 = KECCAK_N2_XOR(b5, KECCAK_N2_ANDN(b6, b7)); \
+    s6 = KECCAK_N2_XOR(b6, KECCAK_N2_ANDN(b7, b8)); \
+    s7 = KECCAK_N2_XOR(b7, KECCAK_N2_ANDN(b8, b9)); \
+    s8 = KECCAK_N2_XOR(b8, KECCAK_N2_ANDN(b9, b5)); \
+    s9 = KECCAK_N2_XOR(b9, KECCAK_N2_ANDN(b5, b6)); \
+    s10 = KECCAK_N2_XOR(b10, KECCAK_N2_ANDN(b11, b12)); \
+    s11 = KECCAK_N2_XOR(b11, KECCAK_N2_ANDN(b12, b13)); \
+    s12 = KECCAK_N2_XOR(b12, KECCAK_N2_ANDN(b13, b14)); \
+    s13 = KECCAK_N2_XOR(b13, KECCAK_N2_ANDN(b14, b10)); \
+    s14 = KECCAK_N2_XOR(b14, KECCAK_N2_ANDN(b10, b11)); \
+    s15 = KECCAK_N2_XOR(b15, KECCAK_N2_ANDN(b16, b17)); \
+    s16 = KECCAK_N2_XOR(b16, KECCAK_N2_ANDN(b17, b18)); \
+    s17 = KECCAK_N2_XOR(b17, KECCAK_N2_ANDN(b18, b19)); \
+    s18 = KECCAK_N2_XOR(b18, KECCAK_N2_ANDN(b19, b15)); \
+    s19 = KECCAK_N2_XOR(b19, KECCAK_N2_ANDN(b15, b16)); \
+    s20 = KECCAK_N2_XOR(b20, KECCAK_N2_ANDN(b21, b22)); \
+    s21 = KECCAK_N2_XOR(b21, KECCAK_N2_ANDN(b22, b23)); \
+    s22 = KECCAK_N2_XOR(b22, KECCAK_N2_ANDN(b23, b24)); \
+    s23 = KECCAK_N2_XOR(b23, KECCAK_N2_ANDN(b24, b20)); \
+    s24 = KECCAK_N2_XOR(b24, KECCAK_N2_ANDN(b20, b21)); \
+    s0 = KECCAK_N2_XOR(s0, KECCAK_N2_SET1(rc));
+
+static void keccak_f1600_x2_neon(uint64_t *x, uint64_t *y) {
+    uint64x2_t v[25];
+    int i;
+    for (i = 0; i < 24; i += 2) {
+        uint64x2_t r0 = vld1q_u64(x + i), r1 = vld1q_u64(y + i);
+        v[i] = vzip1q_u64(r0, r1);
+        v[i + 1] = vzip2q_u64(r0, r1);
+    }
+    v[24] = vcombine_u64(vcreate_u64(x[24]), vcreate_u64(y[24]));
+    {
+        uint64x2_t s0 = v[0], s1 = v[1], s2 = v[2], s3 = v[3], s4 = v[4], s5 = v[5], s6 = v[6], s7 = v[7], s8 = v[8], s9 = v[9], s10 = v[10], s11 = v[11], s12 = v[12], s13 = v[13], s14 = v[14], s15 = v[15], s16 = v[16], s17 = v[17], s18 = v[18], s19 = v[19], s20 = v[20], s21 = v[21], s22 = v[22], s23 = v[23], s24 = v[24];
+        uint64x2_t b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11, b12, b13, b14, b15, b16, b17, b18, b19, b20, b21, b22, b23, b24;
+        uint64x2_t c0, c1, c2, c3, c4, d0, d1, d2, d3, d4;
+        KECCAK_N2_ROUND(keccak_rc[0]) KECCAK_N2_ROUND(keccak_rc[1]) KECCAK_N2_ROUND(keccak_rc[2]) \
+    KECCAK_N2_ROUND(keccak_rc[3]) KECCAK_N2_ROUND(keccak_rc[4]) KECCAK_N2_ROUND(keccak_rc[5]) \
+    KECCAK_N2_ROUND(keccak_rc[6]) KECCAK_N2_ROUND(keccak_rc[7]) KECCAK_N2_ROUND(keccak_rc[8]) \
+    KECCAK_N2_ROUND(keccak_rc[9]) KECCAK_N2_ROUND(keccak_rc[10]) KECCAK_N2_ROUND(keccak_rc[11]) \
+    KECCAK_N2_ROUND(keccak_rc[12]) KECCAK_N2_ROUND(keccak_rc[13]) KECCAK_N2_ROUND(keccak_rc[14]) \
+    KECCAK_N2_ROUND(keccak_rc[15]) KECCAK_N2_ROUND(keccak_rc[16]) KECCAK_N2_ROUND(keccak_rc[17]) \
+    KECCAK_N2_ROUND(keccak_rc[18]) KECCAK_N2_ROUND(keccak_rc[19]) KECCAK_N2_ROUND(keccak_rc[20]) \
+    KECCAK_N2_ROUND(keccak_rc[21]) KECCAK_N2_ROUND(keccak_rc[22]) KECCAK_N2_ROUND(keccak_rc[23])
+        v[0] = s0; v[1] = s1; v[2] = s2; v[3] = s3; v[4] = s4; v[5] = s5; v[6] = s6; v[7] = s7; v[8] = s8; v[9] = s9; v[10] = s10; v[11] = s11; v[12] = s12; v[13] = s13; v[14] = s14; v[15] = s15; v[16] = s16; v[17] = s17; v[18] = s18; v[19] = s19; v[20] = s20; v[21] = s21; v[22] = s22; v[23] = s23; v[24] = s24;
+    }
+    for (i = 0; i < 24; i += 2) {
+        vst1q_u64(x + i, vzip1q_u64(v[i], v[i + 1]));
+        vst1q_u64(y + i, vzip2q_u64(v[i], v[i + 1]));
+    }
+    x[24] = vgetq_lane_u64(v[24], 0);
+    y[24] = vgetq_lane_u64(v[24], 1);
+}
+
+static void keccak_f1600_x4_neon(uint64_t state[4][25]) {
+    keccak_f1600_x2_neon(state[0], state[1]);
+    keccak_f1600_x2_neon(state[2], state[3]);
+}
+
+#if defined(__ARM_FEATURE_SHA3)
+#define KECCAK_HAVE_SHA3 1
+#if defined(__linux__)
+#include <sys/auxv.h>
+#ifndef HWCAP_SHA3
+#define HWCAP_SHA3 (1UL << 17)
+#endif
+#elif defined(__APPLE__)
+#include <sys/sysctl.h>
+#endif
+
+/*
+ * FEAT_SHA3 (ARMv8.2+, mandatory from v8.4): theta's five-way parity is two
+ * EOR3, D is one RAX1, theta-xor + rho is one XAR per lane and chi is one BCAX.
+ * Only built when the compiler targets SHA3 (-march=native on such a host);
+ * the CPU is still checked at init so a copied binary falls back cleanly.
+ * There is no 1-lane form: running one state through both lanes would do the
+ * permutation twice, so it backs keccak_f1600_x4 only.
+ */
+#define KECCAK_SHA3_ROUND(rc) \
+    c0 = veor3q_u64(veor3q_u64(s0, s5, s10), s15, s20); \
+    c1 = veor3q_u64(veor3q_u64(s1, s6, s11), s16, s21); \
+    c2 = veor3q_u64(veor3q_u64(s2, s7, s12), s17, s22); \
+    c3 = veor3q_u64(veor3q_u64(s3, s8, s13), s18, s23); \
+    c4 = veor3q_u64(veor3q_u64(s4, s9, s14), s19, s24); \
+    d0 = vrax1q_u64(c4, c1); \
+    d1 = vrax1q_u64(c0, c2); \
+    d2 = vrax1q_u64(c1, c3); \
+    d3 = vrax1q_u64(c2, c4); \
+    d4 = vrax1q_u64(c3, c0); \
+    b0 = veorq_u64(s0, d0); \
+    b10 = vxarq_u64(s1, d1, 63); \
+    b20 = vxarq_u64(s2, d2, 2); \
+    b5 = vxarq_u64(s3, d3, 36); \
+    b15 = vxarq_u64(s4, d4, 37); \
+    b16 = vxarq_u64(s5, d0, 28); \
+    b1 = vxarq_u64(s6, d1, 20); \
+    b11 = vxarq_u64(s7, d2, 58); \
+    b21 = vxarq_u64(s8, d3, 9); \
+    b6 = vxarq_u64(s9, d4, 44); \
+    b7 = vxarq_u64(s10, d0, 61); \
+    b17 = vxarq_u64(s11, d1, 54); \
+    b2 = vxarq_u64(s12, d2, 21); \
+    b12 = vxarq_u64(s13, d3, 39); \
+    b22 = vxarq_u64(s14, d4, 25); \
+    b23 = vxarq_u64(s15, d0, 23); \
+    b8 = vxarq_u64(s16, d1, 19); \
+    b18 = vxarq_u64(s17, d2, 49); \
+    b3 = vxarq_u64(s18, d3, 43); \
+    b13 = vxarq_u64(s19, d4, 56); \
+    b14 = vxarq_u64(s20, d0, 46); \
+    b24 = vxarq_u64(s21, d1, 62); \
+    b9 = vxarq_u64(s22, d2, 3); \
+    b19 = vxarq_u64(s23, d3, 8); \
+    b4 = vxarq_u64(s24, d4, 50); \
+    s0 = vbcaxq_u64(b0, b2, b1); \
+    s1 = vbcaxq_u64(b1, b3, b2); \
+    s2 = vbcaxq_u64(b2, b4, b3); \
+    s3 = vbcaxq_u64(b3, b0, b4); \
+    s4 = vbcaxq_u64(b4, b1, b0); \
+    s5 = vbcaxq_u64(b5, b7, b6); \
+    s6 = vbcaxq_u64(b6, b8, b7); \
+    s7 = vbcaxq_u64(b7, b9, b8); \
+    s8 = vbcaxq_u64(b8, b5, b9); \
+    s9 = vbcaxq_u64(b9, b6, b5); \
+    s10 = vbcaxq_u64(b10, b12, b11); \
+    s11 = vbcaxq_u64(b11, b13, b12); \
+    s12 = vbcaxq_u64(b12, b14, b13); \
+    s13 = vbcaxq_u64(b13, b10, b14); \
+    s14 = vbcaxq_u64(b14, b11, b10); \
+    s15 = vbcaxq_u64(b15, b17, b16); \
+    s16 = vbcaxq_u64(b16, b18, b17); \
+    s17 = vbcaxq_u64(b17, b19, b18); \
+    s18 = vbcaxq_u64(b18, b15, b19); \
+    s19 = vbcaxq_u64(b19, b16, b15); \
+    s20 = vbcaxq_u64(b20, b22, b21); \
+    s21 = vbcaxq_u64(b21, b23, b22); \
+    s22 = vbcaxq_u64(b22, b24, b23); \
+    s23 = vbcaxq_u64(b23, b20, b24); \
+    s24 = vbcaxq_u64(b24, b21, b20); \
+    s0 = veorq_u64(s0, vdupq_n_u64(rc));
+
+static void keccak_f1600_x2_sha3(uint64_t *x, uint64_t *y) {
+    uint64x2_t v[25];
+    int i;
+    for (i = 0; i < 24; i += 2) {
+        uint64x2_t r0 = vld1q_u64(x + i), r1 = vld1q_u64(y + i);
+        v[i] = vzip1q_u64(r0, r1);
+        v[i + 1] = vzip2q_u64(r0, r1);
+    }
+    v[24] = vcombine_u64(vcreate_u64(x[24]), vcreate_u64(y[24]));
+    {
+        uint64x2_t s0 = v[0], s1 = v[1], s2 = v[2], s3 = v[3], s4 = v[4], s5 = v[5], s6 = v[6], s7 = v[7], s8 = v[8], s9 = v[9], s10 = v[10], s11 = v[11], s12 = v[12], s13 = v[13], s14 = v[14], s15 = v[15], s16 = v[16], s17 = v[17], s18 = v[18], s19 = v[19], s20 = v[20], s21 = v[21], s22 = v[22], s23 = v[23], s24 = v[24];
+        uint64x2_t b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11, b12, b13, b14, b15, b16, b17, b18, b19, b20, b21, b22, b23, b24;
+        uint64x2_t c0, c1, c2, c3, c4, d0, d1, d2, d3, d4;
+        KECCAK_SHA3_ROUND(keccak_rc[0]) KECCAK_SHA3_ROUND(keccak_rc[1]) KECCAK_SHA3_ROUND(keccak_rc[2]) \
+    KECCAK_SHA3_ROUND(keccak_rc[3]) KECCAK_SHA3_ROUND(keccak_rc[4]) KECCAK_SHA3_ROUND(keccak_rc[5]) \
+    KECCAK_SHA3_ROUND(keccak_rc[6]) KECCAK_SHA3_ROUND(keccak_rc[7]) KECCAK_SHA3_ROUND(keccak_rc[8]) \
+    KECCAK_SHA3_ROUND(keccak_rc[9]) KECCAK_SHA3_ROUND(keccak_rc[10]) KECCAK_SHA3_ROUND(keccak_rc[11]) \
+    KECCAK_SHA3_ROUND(keccak_rc[12]) KECCAK_SHA3_ROUND(keccak_rc[13]) KECCAK_SHA3_ROUND(keccak_rc[14]) \
+    KECCAK_SHA3_ROUND(keccak_rc[15]) KECCAK_SHA3_ROUND(keccak_rc[16]) KECCAK_SHA3_ROUND(keccak_rc[17]) \
+    KECCAK_SHA3_ROUND(keccak_rc[18]) KECCAK_SHA3_ROUND(keccak_rc[19]) KECCAK_SHA3_ROUND(keccak_rc[20]) \
+    KECCAK_SHA3_ROUND(keccak_rc[21]) KECCAK_SHA3_ROUND(keccak_rc[22]) KECCAK_SHA3_ROUND(keccak_rc[23])
+        v[0] = s0; v[1] = s1; v[2] = s2; v[3] = s3; v[4] = s4; v[5] = s5; v[6] = s6; v[7] = s7; v[8] = s8; v[9] = s9; v[10] = s10; v[11] = s11; v[12] = s12; v[13] = s13; v[14] = s14; v[15] = s15; v[16] = s16; v[17] = s17; v[18] = s18; v[19] = s19; v[20] = s20; v[21] = s21; v[22] = s22; v[23] = s23; v[24] = s24;
+    }
+    for (i = 0; i < 24; i += 2) {
+        vst1q_u64(x + i, vzip1q_u64(v[i], v[i + 1]));
+        vst1q_u64(y + i, vzip2q_u64(v[i], v[i + 1]));
+    }
+    x[24] = vgetq_lane_u64(v[24], 0);
+    y[24] = vgetq_lane_u64(v[24], 1);
+}
+
+static void keccak_f1600_x4_sha3(uint64_t state[4][25]) {
+    keccak_f1600_x2_sha3(state[0], state[1]);
+    keccak_f1600_x2_sha3(state[2], state[3]);
+}
+
+static int keccak_cpu_has_sha3(void) {
+#if defined(__linux__)
+    return (getauxval(AT_HWCAP) & HWCAP_SHA3) != 0;
+#elif defined(__APPLE__)
+    int v = 0;
+    size_t len = sizeof(v);
+    if (sysctlbyname("hw.optional.armv8_2_sha3", &v, &len, NULL, 0) != 0) return 0;
+    return v != 0;
+#else
+    return 1;
+#endif
+}
+#endif /* __ARM_FEATURE_SHA3 */
+#endif /* __aarch64__ */
+
+/* Selected kernels; call keccak_f1600_init() once before use. */
+static keccak_f1600_fn keccak_f1600 = keccak_f1600_generic;
+static keccak_f1600_x4_fn keccak_f1600_x4 = NULL;
+static const char *keccak_f1600_backend = "generic";
+
+static void keccak_f1600_init(void) {
+#ifdef KECCAK_HAVE_X86_DISPATCH
+    __builtin_cpu_init();
+    if (__builtin_cpu_supports("bmi2")) {
+        keccak_f1600 = keccak_f1600_bmi2;
+        keccak_f1600_backend = "bmi2";
+    }
+#ifdef KECCAK_HAVE_AVX512
+    if (__builtin_cpu_supports("avx512f")) {
+        keccak_f1600 = keccak_f1600_avx512;
+        keccak_f1600_backend = "avx512";
+    }
+#endif
+    if (__builtin_cpu_supports("avx2")) {
+        keccak_f1600_x4 = keccak_f1600_x4_avx2;
+    }
+#endif
+#ifdef KECCAK_HAVE_NEON
+    keccak_f1600_x4 = keccak_f1600_x4_neon;
+#ifdef KECCAK_HAVE_SHA3
+    if (keccak_cpu_has_sha3()) {
+        keccak_f1600_x4 = keccak_f1600_x4_sha3;
+    }
+#endif
+#endif
+}
+
+static inline uint64_t keccak_load64_le(const uint8_t *p) {
+#if defined(__BYTE_ORDER__) && __BYTE_ORDER__ == __ORDER_LITTLE_ENDIAN__
+    uint64_t v;
+    memcpy(&v, p, 8);
+    return v;
+#else
+    return (uint64_t)p[0] | ((uint64_t)p[1] << 8) | ((uint64_t)p[2] << 16) |
+           ((uint64_t)p[3] << 24) | ((uint64_t)p[4] << 32) | ((uint64_t)p[5] << 40) |
+           ((uint64_t)p[6] << 48) | ((uint64_t)p[7] << 56);
+#endif
+}
+
+static inline void keccak_store64_le(uint8_t *p, uint64_t v) {
+#if defined(__BYTE_ORDER__) && __BYTE_ORDER__ == __ORDER_LITTLE_ENDIAN__
+    memcpy(p, &v, 8);
+#else
+    int i;
+    for (i = 0; i < 8; i++) p[i] = (uint8_t)(v >> (8 * i));
+#endif
+}
+
+static inline void keccak_absorb_block(uint64_t *state, const uint8_t *in) {
+    size_t i;
+    for (i = 0; i < KECCAK256_RATE / 8; i++) state[i] ^= keccak_load64_le(in + 8 * i);
+}
+
+/* XOR the final len < KECCAK256_RATE bytes plus multirate padding into the state. */
+static inline void keccak_absorb_last(uint64_t *state, const uint8_t *in, size_t len) {
+    size_t i;
+    for (i = 0; i < len / 8; i++) state[i] ^= keccak_load64_le(in + 8 * i);
+    for (i = len & ~(size_t)7; i < len; i++) state[i / 8] ^= (uint64_t)in[i] << (8 * (i % 8));
+    state[len / 8] ^= (uint64_t)0x01 << (8 * (len % 8));
+    state[KECCAK256_RATE / 8 - 1] ^= (uint64_t)0x80 << 56;
+}
+
+static inline void keccak_squeeze256(const uint64_t *state, uint8_t out[32]) {
+    size_t i;
+    for (i = 0; i < 4; i++) keccak_store64_le(out + 8 * i, state[i]);
+}
+
+/* Keccak-256: input is XORed straight into the state lanes, no block buffer. */
+static void keccak256_digest(const uint8_t *in, size_t len, uint8_t out[32]) {
+    uint64_t state[25] = {0};
+    while (len >= KECCAK256_RATE) {
+        keccak_absorb_block(state, in);
+        keccak_f1600(state);
+        in += KECCAK256_RATE;
+        len -= KECCAK256_RATE;
+    }
+    keccak_absorb_last(state, in, len);
+    keccak_f1600(state);
+    keccak_squeeze256(state, out);
+}
+
+/*
+ * Incremental Keccak-256: pos is the number of bytes already XORed into the
+ * current rate block (0 <= pos < KECCAK256_RATE). Start from a zeroed state
+ * and pos = 0; keccak256_final may be called once.
+ */
+static void keccak256_update(uint64_t *state, size_t *pos, const uint8_t *in, size_t len) {
+    size_t p = *pos, take, i;
+    while (len > 0) {
+        if (p == 0 && len >= KECCAK256_RATE) {
+            keccak_absorb_block(state, in);
+            keccak_f1600(state);
+            in += KECCAK256_RATE;
+            len -= KECCAK256_RATE;
+            continue;
+        }
+        take = KECCAK256_RATE - p;
+        if (take > len) take = len;
+        for (i = 0; i < take; i++) state[(p + i) / 8] ^= (uint64_t)in[i] << (8 * ((p + i) % 8));
+        p += take;
+        in += take;
+        len -= take;
+        if (p == KECCAK256_RATE) {
+            keccak_f1600(state);
+            p = 0;
+        }
+    }
+    *pos = p;
+}
+
+static void keccak256_final(uint64_t *state, size_t pos, uint8_t out[32]) {
+    state[pos / 8] ^= (uint64_t)0x01 << (8 * (pos % 8));
+    state[KECCAK256_RATE / 8 - 1] ^= (uint64_t)0x80 << 56;
+    keccak_f1600(state);
+    keccak_squeeze256(state, out);
+}
+
+/*
+ * Keccak-256 of count (1..4) independent inputs. Each input's digest is
+ * squeezed right after its last block; lanes that finish early keep riding
+ * along in the 4-way permutation until the longest input is done.
+ */
+static void keccak256_digest_x4(const uint8_t *const in[4], const size_t len[4],
+                                uint8_t *const out[4], int count) {
+    uint64_t state[4][25];
+    size_t nblocks[4] = {0, 0, 0, 0}, maxblocks = 0, b;
+    int k;
+    if (keccak_f1600_x4 == NULL || count < 2) {
+        for (k = 0; k < count; k++) keccak256_digest(in[k], len[k], out[k]);
+        return;
+    }
+    memset(state, 0, sizeof(state));
+    for (k = 0; k < count; k++) {
+        nblocks[k] = len[k] / KECCAK256_RATE + 1;
+        if (nblocks[k] > maxblocks) maxblocks = nblocks[k];
+    }
+    for (b = 0; b < maxblocks; b++) {
+        for (k = 0; k < count; k++) {
+            if (b + 1 < nblocks[k])
+                keccak_absorb_block(state[k], in[k] + b * KECCAK256_RATE);
+            else if (b + 1 == nblocks[k])
+                keccak_absorb_last(state[k], in[k] + b * KECCAK256_RATE, len[k] - b * KECCAK256_RATE);
+        }
+        keccak_f1600_x4(state);
+        for (k = 0; k < count; k++)
+            if (b + 1 == nblocks[k]) keccak_squeeze256(state[k], out[k]);
+    }
+}
+
+#endif /* PICOCRYPTO_KECCAK_F1600_H */
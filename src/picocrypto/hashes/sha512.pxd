@@ -0,0 +1,12 @@
+# cython: language_level=3
+"""Declarations for picocrypto.hashes.sha512."""
+
+# One-shot SHA-512 of data[:n] into out[64]; returns 1 on success, 0 on OpenSSL failure.
+cdef int _sha512(const unsigned char* data, size_t n, unsigned char* out) noexcept nogil
+
+# SHA-512 of parts[0][:n[0]] || ... || parts[count - 1] without joining them first.
+cdef int _sha512_parts(
+    const unsigned char** parts, const size_t* n, int count, unsigned char* out
+) noexcept nogil
+
+cpdef bytes sha512(bytes data)
@@ -0,0 +1,3 @@
+"""Stub for picocrypto.hashes.sha512."""
+
+def sha512(data: bytes) -> bytes: ...
@@ -0,0 +1,68 @@
+"""SHA-512 through OpenSSL libcrypto (EVP_Digest). Cython only; backs Ed25519."""
+
+from cpython.bytes cimport (
+    PyBytes_AS_STRING,
+    PyBytes_FromStringAndSize,
+    PyBytes_GET_SIZE,
+)
+
+
+# Declarations in sha512.pxd.
+cdef extern from "openssl/evp.h" nogil:
+    ctypedef struct EVP_MD:
+        pass
+    ctypedef struct ENGINE:
+        pass
+    ctypedef struct EVP_MD_CTX:
+        pass
+    const EVP_MD* EVP_sha512()
+    EVP_MD_CTX* EVP_MD_CTX_new()
+    void EVP_MD_CTX_free(EVP_MD_CTX* ctx)
+    int EVP_DigestInit_ex(EVP_MD_CTX* ctx, const EVP_MD* type, ENGINE* impl)
+    int EVP_DigestUpdate(EVP_MD_CTX* ctx, const void* d, size_t cnt)
+    int EVP_DigestFinal_ex(EVP_MD_CTX* ctx, unsigned char* md, unsigned int* s)
+    int EVP_Digest(
+        const void* data,
+        size_t count,
+        unsigned char* md,
+        unsigned int* size,
+        const EVP_MD* type,
+        ENGINE* impl,
+    )
+
+
+# Looked up once; EVP_sha512() returns a static method table.
+cdef const EVP_MD* _MD = EVP_sha512()
+
+
+cdef int _sha512(const unsigned char* data, size_t n, unsigned char* out) noexcept nogil:
+    return EVP_Digest(data, n, out, NULL, _MD, NULL)
+
+
+cdef int _sha512_parts(
+    const unsigned char** parts, const size_t* n, int count, unsigned char* out
+) noexcept nogil:
+    cdef EVP_MD_CTX* ctx = EVP_MD_CTX_new()
+    cdef int ok, i
+    if ctx == NULL:
+        return 0
+    ok = EVP_DigestInit_ex(ctx, _MD, NULL)
+    i = 0
+    while ok and i < count:
+        ok = EVP_DigestUpdate(ctx, parts[i], n[i])
+        i += 1
+    if ok:
+        ok = EVP_DigestFinal_ex(ctx, out, NULL)
+    EVP_MD_CTX_free(ctx)
+    return ok
+
+
+cpdef bytes sha512(bytes data):
+    """SHA-512 digest (64 bytes) of data."""
+    cdef unsigned char out[64]
+    # cpdef arguments cannot be declared "not None"; data is read raw.
+    if data is None:
+        raise TypeError("sha512: data must be bytes, not None")
+    if not _sha512(<const unsigned char*>PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data), out):
+        raise RuntimeError("OpenSSL EVP_Digest(SHA-512) failed")
+    return PyBytes_FromStringAndSize(<char*>out, 64)
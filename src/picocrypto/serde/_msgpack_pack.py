@@ -2,94 +2,126 @@
 
 from __future__ import annotations
 
+import struct
 
-def _msgpack_pack_obj(obj, buf: bytearray) -> None:
-    if obj is None:
-        buf.append(0xC0)
-    elif isinstance(obj, bool):
-        buf.append(0xC3 if obj else 0xC2)
-    elif isinstance(obj, int):
-        if 0 <= obj <= 0x7F:
+# Tag byte + big-endian payload in one call, no separate to_bytes temporary.
+_PACK_U32 = struct.Struct(">BI").pack
+_PACK_U64 = struct.Struct(">BQ").pack
+_PACK_I32 = struct.Struct(">Bi").pack
+_PACK_I64 = struct.Struct(">Bq").pack
+
+
+def _write_nil(obj, buf: bytearray) -> None:
+    buf.append(0xC0)
+
+
+def _write_bool(obj, buf: bytearray) -> None:
+    buf.append(0xC3 if obj else 0xC2)
+
+
+def _write_int(obj, buf: bytearray) -> None:
+    # Dispatch on the payload width; (-obj - 1) has the bit length of a negative obj.
+    if obj >= 0:
+        bl = obj.bit_length()
+        if bl <= 7:
             buf.append(obj)
-        elif -32 <= obj < 0:
-            buf.append(0x100 + obj & 0xFF)
-        elif 0x80 <= obj <= 0xFF:
-            buf.extend((0xCC, obj & 0xFF))
-        elif 0x100 <= obj <= 0xFFFF:
-            buf.extend((0xCD, (obj >> 8) & 0xFF, obj & 0xFF))
-        elif 0x10000 <= obj <= 0xFFFFFFFF:
-            buf.append(0xCE)
-            buf.extend(obj.to_bytes(4, "big"))
-        elif 0x100000000 <= obj <= 0xFFFFFFFFFFFFFFFF:
-            buf.append(0xCF)
-            buf.extend(obj.to_bytes(8, "big"))
-        elif obj < 0:
-            if obj >= -0x80:
-                buf.extend((0xD0, (0x100 + obj) & 0xFF))
-            elif obj >= -0x8000:
-                buf.extend(
-                    (0xD1, ((0x10000 + obj) >> 8) & 0xFF, (0x10000 + obj) & 0xFF)
-                )
-            elif obj >= -0x80000000:
-                buf.append(0xD2)
-                buf.extend((0x100000000 + obj).to_bytes(4, "big"))
-            else:
-                buf.append(0xD3)
-                buf.extend((0x10000000000000000 + obj).to_bytes(8, "big"))
-        else:
-            if obj <= 0xFF:
-                buf.extend((0xCC, obj & 0xFF))
-            elif obj <= 0xFFFF:
-                buf.extend((0xCD, (obj >> 8) & 0xFF, obj & 0xFF))
-            elif obj <= 0xFFFFFFFF:
-                buf.append(0xCE)
-                buf.extend(obj.to_bytes(4, "big"))
-            else:
-                buf.append(0xCF)
-                buf.extend(obj.to_bytes(8, "big"))
-    elif isinstance(obj, (bytes, bytearray)):
-        s = bytes(obj)
-        n = len(s)
-        if n <= 31:
-            buf.append(0xA0 | n)
-        elif n <= 0xFFFF:
-            buf.extend((0xDA, (n >> 8) & 0xFF, n & 0xFF))
+        elif bl <= 8:
+            buf += b"\xcc" + obj.to_bytes(1, "big")
+        elif bl <= 16:
+            buf += b"\xcd" + obj.to_bytes(2, "big")
+        elif bl <= 32:
+            buf += _PACK_U32(0xCE, obj)
+        elif bl <= 64:
+            buf += _PACK_U64(0xCF, obj)
         else:
-            buf.extend((0xDB, *((n >> (8 * i)) & 0xFF for i in range(3, -1, -1))))
-        buf.extend(s)
-    elif isinstance(obj, str):
-        s = obj.encode("utf-8")
-        n = len(s)
-        if n <= 31:
-            buf.append(0xA0 | n)
-        elif n <= 0xFFFF:
-            buf.extend((0xDA, (n >> 8) & 0xFF, n & 0xFF))
-        else:
-            buf.extend((0xDB, *((n >> (8 * i)) & 0xFF for i in range(3, -1, -1))))
-        buf.extend(s)
-    elif isinstance(obj, (list, tuple)):
-        n = len(obj)
-        if n <= 15:
-            buf.append(0x90 | n)
-        elif n <= 0xFFFF:
-            buf.extend((0xDC, (n >> 8) & 0xFF, n & 0xFF))
-        else:
-            buf.extend((0xDD, *((n >> (8 * i)) & 0xFF for i in range(3, -1, -1))))
-        for x in obj:
-            _msgpack_pack_obj(x, buf)
-    elif isinstance(obj, dict):
-        n = len(obj)
-        if n <= 15:
-            buf.append(0x80 | n)
-        elif n <= 0xFFFF:
-            buf.extend((0xDE, (n >> 8) & 0xFF, n & 0xFF))
+            raise OverflowError("msgpack pack: int too big for uint64")
+    else:
+        bl = (-obj - 1).bit_length()
+        if bl <= 5:
+            buf.append((0x100 + obj) & 0xFF)
+        elif bl <= 7:
+            buf += b"\xd0" + obj.to_bytes(1, "big", signed=True)
+        elif bl <= 15:
+            buf += b"\xd1" + obj.to_bytes(2, "big", signed=True)
+        elif bl <= 31:
+            buf += _PACK_I32(0xD2, obj)
+        elif bl <= 63:
+            buf += _PACK_I64(0xD3, obj)
         else:
-            buf.extend((0xDF, *((n >> (8 * i)) & 0xFF for i in range(3, -1, -1))))
-        for k, v in obj.items():
-            _msgpack_pack_obj(k, buf)
-            _msgpack_pack_obj(v, buf)
+            raise OverflowError("msgpack pack: int too small for int64")
+
+
+def _write_raw(s: bytes, buf: bytearray) -> None:
+    n = len(s)
+    if n <= 31:
+        buf.append(0xA0 | n)
+    elif n <= 0xFFFF:
+        buf.extend((0xDA, (n >> 8) & 0xFF, n & 0xFF))
+    else:
+        buf.extend((0xDB, *((n >> (8 * i)) & 0xFF for i in range(3, -1, -1))))
+    buf.extend(s)
+
+
+def _write_bytes(obj, buf: bytearray) -> None:
+    _write_raw(bytes(obj), buf)
+
+
+def _write_str(obj, buf: bytearray) -> None:
+    _write_raw(obj.encode("utf-8"), buf)
+
+
+def _write_list(obj, buf: bytearray) -> None:
+    n = len(obj)
+    if n <= 15:
+        buf.append(0x90 | n)
+    elif n <= 0xFFFF:
+        buf.extend((0xDC, (n >> 8) & 0xFF, n & 0xFF))
+    else:
+        buf.extend((0xDD, *((n >> (8 * i)) & 0xFF for i in range(3, -1, -1))))
+    writers = _WRITERS
+    for x in obj:
+        (writers.get(type(x)) or _writer_for(x))(x, buf)
+
+
+def _write_dict(obj, buf: bytearray) -> None:
+    n = len(obj)
+    if n <= 15:
+        buf.append(0x80 | n)
+    elif n <= 0xFFFF:
+        buf.extend((0xDE, (n >> 8) & 0xFF, n & 0xFF))
     else:
-        raise TypeError(f"msgpack pack: unsupported type {type(obj)}")
+        buf.extend((0xDF, *((n >> (8 * i)) & 0xFF for i in range(3, -1, -1))))
+    writers = _WRITERS
+    for k, v in obj.items():
+        (writers.get(type(k)) or _writer_for(k))(k, buf)
+        (writers.get(type(v)) or _writer_for(v))(v, buf)
+
+
+# Exact type -> writer. type(True) is bool, so bool never reaches _write_int.
+_WRITERS = {
+    type(None): _write_nil,
+    bool: _write_bool,
+    int: _write_int,
+    str: _write_str,
+    bytes: _write_bytes,
+    bytearray: _write_bytes,
+    list: _write_list,
+    tuple: _write_list,
+    dict: _write_dict,
+}
+
+
+def _writer_for(obj):
+    """Writer for a subclass of a supported type (IntEnum, OrderedDict, ...)."""
+    for cls in type(obj).__mro__:
+        writer = _WRITERS.get(cls)
+        if writer is not None:
+            return writer
+    raise TypeError(f"msgpack pack: unsupported type {type(obj)}")
+
+
+def _msgpack_pack_obj(obj, buf: bytearray) -> None:
+    (_WRITERS.get(type(obj)) or _writer_for(obj))(obj, buf)
 
 
 def msgpack_pack(obj) -> bytes:
@@ -1,20 +1,22 @@
 # cython: language_level=3
 """Declarations for picocrypto.serde.msgpack_pack."""
 
-from libc.stdint cimport uint8_t, uint16_t, uint32_t, uint64_t
+from cpython.ref cimport PyObject
+from libc.stdint cimport uint8_t
 
 
-cdef void _append_byte(bytearray buf, uint8_t b) except *
-cdef void _append_bytes_fast(bytearray buf, const uint8_t* data, Py_ssize_t size) except *
-cdef void _write_header_uint16(bytearray buf, uint8_t tag, uint16_t val) except *
-cdef void _write_header_uint32(bytearray buf, uint8_t tag, uint32_t val) except *
-cdef void _pack_int_optimized(object obj, bytearray buf) except *
-cdef void _pack_str_or_bytes_combined(bytearray buf, const uint8_t* s_ptr, Py_ssize_t n) except *
-cdef void _write_list_header(bytearray buf, Py_ssize_t n) except *
-cdef void _write_dict_header(bytearray buf, Py_ssize_t n) except *
+# Output buffer shared by both packers. buf is the result bytes filled in place
+# (msgpack_pack), or NULL when p is a PyMem buffer the caller frees (msgpack_pack_2).
+cdef struct _Out:
+    PyObject* buf
+    uint8_t* p
+    Py_ssize_t len
+    Py_ssize_t cap
 
-cdef void _msgpack_pack_dict(dict obj, bytearray buf) except *
-cdef void _msgpack_pack_list(object obj, bytearray buf) except *
-cdef void _msgpack_pack_obj(object obj, bytearray buf) except *
+
+cdef int _pack_int(_Out* out, object obj) except -1
+cdef int _pack_raw(_Out* out, const char* s, Py_ssize_t n) except -1
+cdef int _write_container_header(_Out* out, Py_ssize_t n, uint8_t fix, uint8_t tag16) except -1
+cdef int _msgpack_pack_obj(_Out* out, object obj) except -1
 
 cpdef bytes msgpack_pack(object obj)
@@ -1,333 +1,201 @@
-"""msgpack pack: optimized (direct writes, PyDict_Next, PyList_GET_ITEM). Preserves dict order."""
+"""msgpack pack: exact-type dispatch straight into the result bytes. Preserves dict order."""
 
-from cpython.bytearray cimport PyByteArray_AS_STRING, PyByteArray_Resize
+from cpython.bool cimport PyBool_Check
+from cpython.bytearray cimport PyByteArray_AS_STRING, PyByteArray_GET_SIZE
 from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_GET_SIZE
 from cpython.dict cimport PyDict_Next
 from cpython.list cimport PyList_GET_ITEM, PyList_GET_SIZE
-from cpython.ref cimport PyObject
-from libc.stdint cimport int64_t, uint8_t, uint16_t, uint32_t, uint64_t
+from cpython.long cimport PyLong_AsLongLongAndOverflow, PyLong_AsUnsignedLongLong
+from cpython.mem cimport PyMem_Realloc
+from cpython.ref cimport Py_XDECREF, PyObject
+from cpython.tuple cimport PyTuple_GET_ITEM, PyTuple_GET_SIZE
+from libc.stdint cimport uint8_t, uint64_t
 from libc.string cimport memcpy
 
 
-# Type cache
-cdef object DICT_TYPE = dict
-cdef object LIST_TYPE = list
-cdef object TUPLE_TYPE = tuple
-cdef object STR_TYPE = str
-cdef object BYTES_TYPE = bytes
-cdef object BYTEARRAY_TYPE = bytearray
-cdef object INT_TYPE = int
-cdef object BOOL_TYPE = bool
-
-
-cdef inline bint _is_type(object obj, object typ):
-    """Exact type check."""
-    return type(obj) is typ
-
-
-# Keep your original fast append - it's already optimized!
-cdef inline void _append_byte(bytearray buf, uint8_t b) except *:
-    buf.append(b)
-
-
-# Optimized: single resize + memcpy for multi-byte sequences
-cdef inline void _append_bytes_fast(bytearray buf, const uint8_t* data, Py_ssize_t size) except *:
-    """Single resize + memcpy (faster than repeated appends)."""
-    cdef Py_ssize_t old_size = len(buf)
-    PyByteArray_Resize(buf, old_size + size)
-    memcpy(PyByteArray_AS_STRING(buf) + old_size, data, size)
-
-
-# Direct write variants for headers (avoid stack temp array)
-cdef inline void _write_header_uint16(bytearray buf, uint8_t tag, uint16_t val) except *:
-    """Write tag + uint16 big-endian directly."""
-    cdef Py_ssize_t old_size = len(buf)
-    PyByteArray_Resize(buf, old_size + 3)
-    cdef uint8_t* ptr = <uint8_t*>PyByteArray_AS_STRING(buf) + old_size
-    ptr[0] = tag
-    ptr[1] = (val >> 8) & 0xFF
-    ptr[2] = val & 0xFF
-
-
-cdef inline void _write_header_uint32(bytearray buf, uint8_t tag, uint32_t val) except *:
-    """Write tag + uint32 big-endian directly."""
-    cdef Py_ssize_t old_size = len(buf)
-    PyByteArray_Resize(buf, old_size + 5)
-    cdef uint8_t* ptr = <uint8_t*>PyByteArray_AS_STRING(buf) + old_size
-    ptr[0] = tag
-    ptr[1] = (val >> 24) & 0xFF
-    ptr[2] = (val >> 16) & 0xFF
-    ptr[3] = (val >> 8) & 0xFF
-    ptr[4] = val & 0xFF
-
-
-# Keep your excellent fused int implementation - it's already great!
-ctypedef fused int_type:
-    int
-    long
-    long long
-
-
-cdef void _pack_fused_int(int_type val, bytearray buf) except *:
-    """Your original optimized version - already excellent!"""
-    cdef int64_t ival = val
-    cdef uint8_t* ptr
-    cdef Py_ssize_t old_size
-    cdef int bytes_needed
-    cdef uint64_t uval
-
-    if 0 <= ival <= 0x7F or (-32 <= ival < 0):
-        bytes_needed = 1
-    elif (ival >= -0x80 and ival < -32) or (0x80 <= ival <= 0xFF):
-        bytes_needed = 2
-    elif (ival >= -0x8000 and ival < -0x80) or (0x100 <= ival <= 0xFFFF):
-        bytes_needed = 3
-    elif (ival >= -0x80000000 and ival < -0x8000) or (0x10000 <= ival <= 0xFFFFFFFF):
-        bytes_needed = 5
+cdef extern from "Python.h":
+    bint PyLong_CheckExact(object o)
+    bint PyUnicode_CheckExact(object o)
+    bint PyBytes_CheckExact(object o)
+    bint PyByteArray_CheckExact(object o)
+    bint PyList_CheckExact(object o)
+    bint PyTuple_CheckExact(object o)
+    bint PyDict_CheckExact(object o)
+    const char* PyUnicode_AsUTF8AndSize(object o, Py_ssize_t* size) except NULL
+    # New reference; the result is written in place before anyone else sees it.
+    PyObject* _new_bytes "PyBytes_FromStringAndSize"(const char* s, Py_ssize_t n) except NULL
+    # Resizes a bytes object we still own exclusively; on failure frees it and sets NULL.
+    int _PyBytes_Resize(PyObject** b, Py_ssize_t n) except -1
+
+
+cdef enum:
+    _INITIAL_SIZE = 256
+
+
+cdef int _grow(_Out* out, Py_ssize_t need) except -1:
+    """Double out.cap until need fits, resizing the result bytes or the PyMem buffer."""
+    cdef Py_ssize_t cap = out.cap if out.cap else _INITIAL_SIZE
+    cdef void* p
+    while cap < need:
+        cap *= 2
+    if out.buf != NULL:
+        _PyBytes_Resize(&out.buf, cap)
+        out.p = <uint8_t*>PyBytes_AS_STRING(<object>out.buf)
     else:
-        bytes_needed = 9
-
-    old_size = len(buf)
-    PyByteArray_Resize(buf, old_size + bytes_needed)
-    ptr = <uint8_t*>PyByteArray_AS_STRING(buf) + old_size
-
-    if 0 <= ival <= 0x7F:
-        ptr[0] = <uint8_t>ival
-    elif -32 <= ival < 0:
-        ptr[0] = <uint8_t>((256 + ival) & 0xFF)
-    elif ival > 0:
-        uval = <uint64_t>ival
-        if uval <= 0xFF:
-            ptr[0] = 0xCC
-            ptr[1] = <uint8_t>uval
-        elif uval <= 0xFFFF:
-            ptr[0] = 0xCD
-            ptr[1] = (uval >> 8) & 0xFF
-            ptr[2] = uval & 0xFF
-        elif uval <= 0xFFFFFFFF:
-            ptr[0] = 0xCE
-            ptr[1] = (uval >> 24) & 0xFF
-            ptr[2] = (uval >> 16) & 0xFF
-            ptr[3] = (uval >> 8) & 0xFF
-            ptr[4] = uval & 0xFF
+        p = PyMem_Realloc(out.p, cap)
+        if p == NULL:
+            raise MemoryError()
+        out.p = <uint8_t*>p
+    out.cap = cap
+    return 0
+
+
+cdef inline uint8_t* _reserve(_Out* out, Py_ssize_t n) except NULL:
+    """Pointer to n writable bytes at out.len; advances it, growing out as needed."""
+    cdef Py_ssize_t need = out.len + n
+    cdef uint8_t* p
+    if need > out.cap:
+        _grow(out, need)
+    p = out.p + out.len
+    out.len = need
+    return p
+
+
+cdef inline void _store_be(uint8_t* p, uint64_t v, int n) noexcept nogil:
+    """Low n bytes of v, big-endian."""
+    cdef int i
+    for i in range(n):
+        p[i] = <uint8_t>(v >> (8 * (n - 1 - i)))
+
+
+cdef inline int _write_tagged(_Out* out, uint8_t tag, uint64_t v, int n) except -1:
+    cdef uint8_t* p = _reserve(out, 1 + n)
+    p[0] = tag
+    _store_be(p + 1, v, n)
+    return 0
+
+
+cdef int _pack_int(_Out* out, object obj) except -1:
+    cdef int overflow = 0
+    cdef long long v = PyLong_AsLongLongAndOverflow(obj, &overflow)
+    if overflow > 0:
+        return _write_tagged(out, 0xCF, PyLong_AsUnsignedLongLong(obj), 8)
+    if overflow < 0:
+        raise OverflowError("msgpack pack: int too small for int64")
+    if 0 <= v <= 0x7F or -32 <= v < 0:
+        _reserve(out, 1)[0] = <uint8_t>v
+    elif v > 0:
+        if v <= 0xFF:
+            _write_tagged(out, 0xCC, <uint64_t>v, 1)
+        elif v <= 0xFFFF:
+            _write_tagged(out, 0xCD, <uint64_t>v, 2)
+        elif v <= 0xFFFFFFFF:
+            _write_tagged(out, 0xCE, <uint64_t>v, 4)
         else:
-            ptr[0] = 0xCF
-            ptr[1] = (uval >> 56) & 0xFF
-            ptr[2] = (uval >> 48) & 0xFF
-            ptr[3] = (uval >> 40) & 0xFF
-            ptr[4] = (uval >> 32) & 0xFF
-            ptr[5] = (uval >> 24) & 0xFF
-            ptr[6] = (uval >> 16) & 0xFF
-            ptr[7] = (uval >> 8) & 0xFF
-            ptr[8] = uval & 0xFF
+            _write_tagged(out, 0xCF, <uint64_t>v, 8)
+    elif v >= -0x80:
+        _write_tagged(out, 0xD0, <uint64_t>v, 1)
+    elif v >= -0x8000:
+        _write_tagged(out, 0xD1, <uint64_t>v, 2)
+    elif v >= -0x80000000:
+        _write_tagged(out, 0xD2, <uint64_t>v, 4)
     else:
-        if ival >= -0x80:
-            ptr[0] = 0xD0
-            ptr[1] = <uint8_t>((256 + ival) & 0xFF)
-        elif ival >= -0x8000:
-            uval = <uint64_t>(0x10000 + ival) & 0xFFFF
-            ptr[0] = 0xD1
-            ptr[1] = (uval >> 8) & 0xFF
-            ptr[2] = uval & 0xFF
-        elif ival >= -0x80000000:
-            uval = <uint64_t>(0x100000000 + ival) & 0xFFFFFFFF
-            ptr[0] = 0xD2
-            ptr[1] = (uval >> 24) & 0xFF
-            ptr[2] = (uval >> 16) & 0xFF
-            ptr[3] = (uval >> 8) & 0xFF
-            ptr[4] = uval & 0xFF
-        else:
-            uval = <uint64_t>(0x10000000000000000 + ival) & 0xFFFFFFFFFFFFFFFF
-            ptr[0] = 0xD3
-            ptr[1] = (uval >> 56) & 0xFF
-            ptr[2] = (uval >> 48) & 0xFF
-            ptr[3] = (uval >> 40) & 0xFF
-            ptr[4] = (uval >> 32) & 0xFF
-            ptr[5] = (uval >> 24) & 0xFF
-            ptr[6] = (uval >> 16) & 0xFF
-            ptr[7] = (uval >> 8) & 0xFF
-            ptr[8] = uval & 0xFF
-
-
-cdef inline void _pack_int_optimized(object obj, bytearray buf) except *:
-    _pack_fused_int(<long long>obj, buf)
-
+        _write_tagged(out, 0xD3, <uint64_t>v, 8)
+    return 0
 
-# OPTIMIZATION: Single resize for str/bytes header+data
-cdef inline void _pack_str_or_bytes_combined(bytearray buf, const uint8_t* s_ptr, Py_ssize_t n) except *:
-    """Single resize: header + data together."""
-    cdef uint8_t* ptr
-    cdef Py_ssize_t old_size = len(buf)
-    cdef Py_ssize_t total
 
+cdef int _pack_raw(_Out* out, const char* s, Py_ssize_t n) except -1:
+    """str/bytes header and payload in one reservation."""
+    cdef uint8_t* p
     if n <= 31:
-        total = 1 + n
-        PyByteArray_Resize(buf, old_size + total)
-        ptr = <uint8_t*>PyByteArray_AS_STRING(buf) + old_size
-        ptr[0] = <uint8_t>(0xA0 | n)
-        memcpy(ptr + 1, s_ptr, n)
+        p = _reserve(out, 1 + n)
+        p[0] = <uint8_t>(0xA0 | n)
+        memcpy(p + 1, s, n)
     elif n <= 0xFFFF:
-        total = 3 + n
-        PyByteArray_Resize(buf, old_size + total)
-        ptr = <uint8_t*>PyByteArray_AS_STRING(buf) + old_size
-        ptr[0] = 0xDA
-        ptr[1] = (n >> 8) & 0xFF
-        ptr[2] = n & 0xFF
-        memcpy(ptr + 3, s_ptr, n)
+        p = _reserve(out, 3 + n)
+        p[0] = 0xDA
+        _store_be(p + 1, <uint64_t>n, 2)
+        memcpy(p + 3, s, n)
     else:
-        total = 5 + n
-        PyByteArray_Resize(buf, old_size + total)
-        ptr = <uint8_t*>PyByteArray_AS_STRING(buf) + old_size
-        ptr[0] = 0xDB
-        ptr[1] = (n >> 24) & 0xFF
-        ptr[2] = (n >> 16) & 0xFF
-        ptr[3] = (n >> 8) & 0xFF
-        ptr[4] = n & 0xFF
-        memcpy(ptr + 5, s_ptr, n)
+        p = _reserve(out, 5 + n)
+        p[0] = 0xDB
+        _store_be(p + 1, <uint64_t>n, 4)
+        memcpy(p + 5, s, n)
+    return 0
 
 
-# OPTIMIZATION: Direct header write for lists
-cdef inline void _write_list_header(bytearray buf, Py_ssize_t n) except *:
-    """Write list header with single resize."""
-    cdef uint8_t* ptr
-    cdef Py_ssize_t old_size
-
+cdef int _write_container_header(_Out* out, Py_ssize_t n, uint8_t fix, uint8_t tag16) except -1:
+    """fixarray/fixmap for n <= 15, else the 16-bit tag (32-bit is tag16 + 1)."""
     if n <= 15:
-        _append_byte(buf, <uint8_t>(0x90 | n))
+        _reserve(out, 1)[0] = <uint8_t>(fix | n)
     elif n <= 0xFFFF:
-        old_size = len(buf)
-        PyByteArray_Resize(buf, old_size + 3)
-        ptr = <uint8_t*>PyByteArray_AS_STRING(buf) + old_size
-        ptr[0] = 0xDC
-        ptr[1] = (n >> 8) & 0xFF
-        ptr[2] = n & 0xFF
+        _write_tagged(out, tag16, <uint64_t>n, 2)
     else:
-        old_size = len(buf)
-        PyByteArray_Resize(buf, old_size + 5)
-        ptr = <uint8_t*>PyByteArray_AS_STRING(buf) + old_size
-        ptr[0] = 0xDD
-        ptr[1] = (n >> 24) & 0xFF
-        ptr[2] = (n >> 16) & 0xFF
-        ptr[3] = (n >> 8) & 0xFF
-        ptr[4] = n & 0xFF
-
-
-# OPTIMIZATION: Direct header write for dicts  
-cdef inline void _write_dict_header(bytearray buf, Py_ssize_t n) except *:
-    """Write dict header with single resize."""
-    cdef uint8_t* ptr
-    cdef Py_ssize_t old_size
-
-    if n <= 15:
-        _append_byte(buf, <uint8_t>(0x80 | n))
-    elif n <= 0xFFFF:
-        old_size = len(buf)
-        PyByteArray_Resize(buf, old_size + 3)
-        ptr = <uint8_t*>PyByteArray_AS_STRING(buf) + old_size
-        ptr[0] = 0xDE
-        ptr[1] = (n >> 8) & 0xFF
-        ptr[2] = n & 0xFF
-    else:
-        old_size = len(buf)
-        PyByteArray_Resize(buf, old_size + 5)
-        ptr = <uint8_t*>PyByteArray_AS_STRING(buf) + old_size
-        ptr[0] = 0xDF
-        ptr[1] = (n >> 24) & 0xFF
-        ptr[2] = (n >> 16) & 0xFF
-        ptr[3] = (n >> 8) & 0xFF
-        ptr[4] = n & 0xFF
-
-
-cdef void _msgpack_pack_dict(dict obj, bytearray buf) except *:
-    """Pack dict using PyDict_Next."""
-    cdef Py_ssize_t n = len(obj)
-    cdef Py_ssize_t pos = 0
-    cdef PyObject* key_ptr = NULL
-    cdef PyObject* value_ptr = NULL
-    cdef object key, value
-
-    _write_dict_header(buf, n)
-
-    while PyDict_Next(obj, &pos, &key_ptr, &value_ptr):
-        key = <object>key_ptr
-        value = <object>value_ptr
-        _msgpack_pack_obj(key, buf)
-        _msgpack_pack_obj(value, buf)
+        _write_tagged(out, tag16 + 1, <uint64_t>n, 4)
+    return 0
 
 
-cdef void _msgpack_pack_list(object obj, bytearray buf) except *:
-    """Pack list/tuple with fast access."""
-    cdef Py_ssize_t n = len(obj)
-    cdef Py_ssize_t i
-
-    _write_list_header(buf, n)
-
-    # Fast path for lists
-    if _is_type(obj, LIST_TYPE):
+cdef int _msgpack_pack_obj(_Out* out, object obj) except -1:
+    cdef Py_ssize_t n, i, pos
+    cdef const char* s
+    cdef PyObject* key
+    cdef PyObject* value
+    if obj is None:
+        _reserve(out, 1)[0] = 0xC0
+    elif PyBool_Check(obj):
+        _reserve(out, 1)[0] = 0xC3 if obj is True else 0xC2
+    elif PyLong_CheckExact(obj):
+        _pack_int(out, obj)
+    elif PyUnicode_CheckExact(obj):
+        # UTF-8 form is cached on the str; no temporary bytes object.
+        s = PyUnicode_AsUTF8AndSize(obj, &n)
+        _pack_raw(out, s, n)
+    elif PyBytes_CheckExact(obj):
+        _pack_raw(out, PyBytes_AS_STRING(obj), PyBytes_GET_SIZE(obj))
+    elif PyByteArray_CheckExact(obj):
+        _pack_raw(out, PyByteArray_AS_STRING(obj), PyByteArray_GET_SIZE(obj))
+    elif PyList_CheckExact(obj):
+        n = PyList_GET_SIZE(obj)
+        _write_container_header(out, n, 0x90, 0xDC)
         for i in range(n):
-            _msgpack_pack_obj(<object>PyList_GET_ITEM(obj, i), buf)
+            _msgpack_pack_obj(out, <object>PyList_GET_ITEM(obj, i))
+    elif PyTuple_CheckExact(obj):
+        n = PyTuple_GET_SIZE(obj)
+        _write_container_header(out, n, 0x90, 0xDC)
+        for i in range(n):
+            _msgpack_pack_obj(out, <object>PyTuple_GET_ITEM(obj, i))
+    elif PyDict_CheckExact(obj):
+        _write_container_header(out, len(obj), 0x80, 0xDE)
+        pos = 0
+        while PyDict_Next(obj, &pos, &key, &value):
+            _msgpack_pack_obj(out, <object>key)
+            _msgpack_pack_obj(out, <object>value)
     else:
-        # Tuple or other
-        for item in obj:
-            _msgpack_pack_obj(item, buf)
-
-
-cdef void _msgpack_pack_obj(object obj, bytearray buf) except *:
-    cdef bytes s
-    cdef const uint8_t* s_ptr
-    cdef Py_ssize_t n
-
-    if obj is None:
-        _append_byte(buf, 0xC0)
-        return
-    
-    # Bool before int (bool is int subclass)
-    if _is_type(obj, BOOL_TYPE):
-        _append_byte(buf, 0xC3 if obj else 0xC2)
-        return
-    
-    if _is_type(obj, INT_TYPE):
-        _pack_int_optimized(obj, buf)
-        return
-    
-    if _is_type(obj, STR_TYPE):
-        s = obj.encode("utf-8")
-        n = PyBytes_GET_SIZE(s)
-        s_ptr = <const uint8_t*>PyBytes_AS_STRING(s)
-        _pack_str_or_bytes_combined(buf, s_ptr, n)
-        return
-    
-    if _is_type(obj, BYTES_TYPE) or _is_type(obj, BYTEARRAY_TYPE):
-        s = bytes(obj)
-        n = PyBytes_GET_SIZE(s)
-        s_ptr = <const uint8_t*>PyBytes_AS_STRING(s)
-        _pack_str_or_bytes_combined(buf, s_ptr, n)
-        return
-    
-    if _is_type(obj, LIST_TYPE) or _is_type(obj, TUPLE_TYPE):
-        _msgpack_pack_list(obj, buf)
-        return
-    
-    if _is_type(obj, DICT_TYPE):
-        _msgpack_pack_dict(obj, buf)
-        return
-    
-    raise TypeError(f"msgpack pack: unsupported type {type(obj)}")
+        raise TypeError(f"msgpack pack: unsupported type {type(obj)}")
+    return 0
 
 
 cpdef bytes msgpack_pack(object obj):
     """
     Pack obj to msgpack bytes.
-    
-    Optimizations:
-    - Single resize for string/bytes header+data
-    - Fast PyDict_Next and PyList_GET_ITEM iteration
-    - Fused types for integer packing
-    - Direct header writes for containers
-    
+
+    Dispatches on exact type and writes straight into the result bytes object,
+    preallocated to 256 bytes and doubled when full, then trimmed to length:
+    no final copy and no oversized result.
+
     Supports: dict, list, tuple, str, bytes, bytearray, int, bool, None
     Preserves dict order.
     """
-    cdef bytearray buf = bytearray()
-    _msgpack_pack_obj(obj, buf)
-    return bytes(buf)
+    cdef _Out out
+    cdef bytes result
+    out.buf = _new_bytes(NULL, _INITIAL_SIZE)
+    out.p = <uint8_t*>PyBytes_AS_STRING(<object>out.buf)
+    out.len = 0
+    out.cap = _INITIAL_SIZE
+    try:
+        _msgpack_pack_obj(&out, obj)
+        _PyBytes_Resize(&out.buf, out.len)
+        result = <bytes>out.buf
+    finally:
+        Py_XDECREF(out.buf)
+    return result
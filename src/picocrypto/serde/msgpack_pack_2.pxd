@@ -0,0 +1,4 @@
+# cython: language_level=3
+"""Declarations for picocrypto.serde.msgpack_pack_2."""
+
+cpdef bytes msgpack_pack(object obj)
@@ -0,0 +1,5 @@
+"""Stub for picocrypto.serde.msgpack_pack_2."""
+
+__all__: tuple[str, ...] = ("msgpack_pack",)
+
+def msgpack_pack(obj: object) -> bytes: ...
@@ -0,0 +1,28 @@
+"""msgpack pack into a raw PyMem buffer. Same output as msgpack_pack."""
+
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from cpython.mem cimport PyMem_Free
+
+from .msgpack_pack cimport _msgpack_pack_obj, _Out
+
+
+cpdef bytes msgpack_pack(object obj):
+    """
+    Pack obj to msgpack bytes.
+
+    Runs the msgpack_pack encoders over a PyMem buffer (no bytearray resizes)
+    and copies it into the result once. str is encoded via its cached UTF-8 form.
+
+    Supports: dict, list, tuple, str, bytes, bytearray, int, bool, None
+    Preserves dict order.
+    """
+    cdef _Out out
+    out.buf = NULL
+    out.p = NULL
+    out.len = 0
+    out.cap = 0
+    try:
+        _msgpack_pack_obj(&out, obj)
+        return PyBytes_FromStringAndSize(<char*>out.p, out.len)
+    finally:
+        PyMem_Free(out.p)
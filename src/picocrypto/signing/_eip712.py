@@ -4,6 +4,8 @@ EIP-712 typed-data hashing. Matches eth_account encode_typed_data for API compat
 
 from __future__ import annotations
 
+import functools
+
 from ..hashes import keccak256
 
 _EIP712_SOLIDITY_TYPES = frozenset(
@@ -147,6 +149,22 @@ def _eip712_encode_type(type_name: str, types: dict[str, list[dict[str, str]]])
 
 def _eip712_hash_type(type_name: str, types: dict[str, list[dict[str, str]]]) -> bytes:
     """Keccak-256 of encoded type string (type hash)."""
+    types_key = tuple(
+        (tn, tuple((f["name"], f["type"]) for f in fields))
+        for tn, fields in types.items()
+    )
+    return _eip712_type_hash(type_name, types_key)
+
+
+@functools.lru_cache(maxsize=64)
+def _eip712_type_hash(
+    type_name: str, types_key: tuple[tuple[str, tuple[tuple[str, str], ...]], ...]
+) -> bytes:
+    """Type hash from the hashable form of types built by _eip712_hash_type."""
+    types = {
+        tn: [{"name": name, "type": type_} for name, type_ in fields]
+        for tn, fields in types_key
+    }
     return keccak256(_eip712_encode_type(type_name, types).encode("utf-8"))
 
 
@@ -213,13 +231,14 @@ def _eip712_encode_data(
     data: dict[str, object],
 ) -> bytes:
     """Encode struct data as type_hash + concatenated 32-byte field encodings."""
-    out = bytearray(_eip712_hash_type(type_name, types))
+    parts = [_eip712_hash_type(type_name, types)]
     for field in types[type_name]:
-        enc = _eip712_encode_field(
-            types, field["name"], field["type"], data.get(field["name"])
+        parts.append(
+            _eip712_encode_field(
+                types, field["name"], field["type"], data.get(field["name"])
+            )
         )
-        out += enc
-    return bytes(out)
+    return b"".join(parts)
 
 
 def _eip712_hash_struct(
@@ -251,6 +270,12 @@ def _eip712_hash_domain_typed(domain_data: dict[str, object]) -> bytes:
     return _eip712_hash_struct("EIP712Domain", domain_types, domain_data)
 
 
+@functools.lru_cache(maxsize=64)
+def _eip712_domain_separator(domain_items: tuple[tuple[str, object], ...]) -> bytes:
+    """_eip712_hash_domain_typed cached on the domain's items."""
+    return _eip712_hash_domain_typed(dict(domain_items))
+
+
 def eip712_hash_full_message(full_message: dict) -> bytes:
     """
     EIP-712 hash to sign from full_message (domain, types, primaryType, message).
@@ -267,7 +292,10 @@ def eip712_hash_full_message(full_message: dict) -> bytes:
     types = full_message["types"]
     primary_type = full_message["primaryType"]
     message = full_message["message"]
-    domain_sep = _eip712_hash_domain_typed(domain)
+    try:
+        domain_sep = _eip712_domain_separator(tuple(domain.items()))
+    except TypeError:  # unhashable domain value: not cacheable
+        domain_sep = _eip712_hash_domain_typed(domain)
     struct_hash = _eip712_hash_struct(primary_type, types, message)
     return keccak256(b"\x19\x01" + domain_sep + struct_hash)
 
@@ -281,25 +309,43 @@ _AGENT_TYPEHASH = keccak256(b"Agent(string source,bytes32 connectionId)")
 
 
 def _eip712_hash_domain(domain: dict) -> bytes:
-    enc = bytearray()
-    enc += keccak256(domain["name"].encode("utf-8"))
-    enc += keccak256(domain["version"].encode("utf-8"))
-    enc += int(domain["chainId"]).to_bytes(32, "big")
     addr = domain["verifyingContract"]
     if isinstance(addr, str):
         addr = addr[2:] if addr.startswith("0x") else addr
         addr = bytes.fromhex(addr)
-    enc += addr.rjust(32, b"\x00")
-    return keccak256(_EIP712_DOMAIN_TYPEHASH + bytes(enc))
+    return keccak256(
+        b"".join(
+            (
+                _EIP712_DOMAIN_TYPEHASH,
+                keccak256(domain["name"].encode("utf-8")),
+                keccak256(domain["version"].encode("utf-8")),
+                int(domain["chainId"]).to_bytes(32, "big"),
+                addr.rjust(32, b"\x00"),
+            )
+        )
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _eip712_agent_domain_separator(
+    domain_items: tuple[tuple[str, object], ...],
+) -> bytes:
+    """_eip712_hash_domain cached on the domain's items."""
+    return _eip712_hash_domain(dict(domain_items))
 
 
 def _eip712_hash_agent(message: dict) -> bytes:
-    enc = bytearray()
-    enc += keccak256(message["source"].encode("utf-8"))
     conn = message["connectionId"]
     conn = conn if isinstance(conn, bytes) else bytes(conn)
-    enc += conn.ljust(32, b"\x00")[:32]
-    return keccak256(_AGENT_TYPEHASH + bytes(enc))
+    return keccak256(
+        b"".join(
+            (
+                _AGENT_TYPEHASH,
+                keccak256(message["source"].encode("utf-8")),
+                conn.ljust(32, b"\x00")[:32],
+            )
+        )
+    )
 
 
 def eip712_hash_agent_message(domain: dict, source: str, connection_id: bytes) -> bytes:
@@ -314,7 +360,10 @@ def eip712_hash_agent_message(domain: dict, source: str, connection_id: bytes) -
     Returns:
         32-byte hash to sign.
     """
-    domain_sep = _eip712_hash_domain(domain)
+    try:
+        domain_sep = _eip712_agent_domain_separator(tuple(domain.items()))
+    except TypeError:  # unhashable domain value: not cacheable
+        domain_sep = _eip712_hash_domain(domain)
     msg_hash = _eip712_hash_agent({"source": source, "connectionId": connection_id})
     return keccak256(b"\x19\x01" + domain_sep + msg_hash)
 
@@ -5,6 +5,14 @@ from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
 from ..curves cimport recover_pubkey, sign_recoverable
 
 
+cdef extern from "Python.h":
+    # int <-> fixed-width big-endian bytes (3.13+) without an intermediate bytes object.
+    Py_ssize_t PyLong_AsNativeBytes(object v, void* buf, Py_ssize_t n, int flags) except -1
+    object PyLong_FromUnsignedNativeBytes(const void* buf, size_t n, int flags)
+    enum:
+        Py_ASNATIVEBYTES_BIG_ENDIAN
+        Py_ASNATIVEBYTES_UNSIGNED_BUFFER
+
 cdef extern from "openssl/sha.h":
     unsigned char* SHA256(const unsigned char *data, size_t count, unsigned char *md)
 
@@ -30,16 +38,15 @@ cpdef bytes bip137_sign_message(bytes privkey, bytes message):
     cdef int header
     cdef unsigned char sig[65]
     cdef unsigned char b64_buf[92]
-    cdef int i
     cdef int b64_len
+    cdef int flags = Py_ASNATIVEBYTES_BIG_ENDIAN | Py_ASNATIVEBYTES_UNSIGNED_BUFFER
     r, s, v = sign_recoverable(privkey, msg_hash)
     recid = v - 27
     header = (32 + recid) if recid < 3 else 31
     sig[0] = header
-    for i in range(32):
-        sig[1 + i] = (r >> (8 * (31 - i))) & 0xFF
-    for i in range(32):
-        sig[33 + i] = (s >> (8 * (31 - i))) & 0xFF
+    # r, s < n < 2**256, so both fit their 32-byte slots.
+    PyLong_AsNativeBytes(r, &sig[1], 32, flags)
+    PyLong_AsNativeBytes(s, &sig[33], 32, flags)
     b64_len = EVP_EncodeBlock(b64_buf, sig, 65)
     return PyBytes_FromStringAndSize(<char*>b64_buf, b64_len)
 
@@ -67,8 +74,8 @@ cpdef bint bip137_verify_message(bytes message, object signature_b64, bytes pubk
     if dec_len < 65:
         return False
     recid = sig[0] & 0x03
-    r = int.from_bytes(PyBytes_FromStringAndSize(<char*>&sig[1], 32), "big")
-    s = int.from_bytes(PyBytes_FromStringAndSize(<char*>&sig[33], 32), "big")
+    r = PyLong_FromUnsignedNativeBytes(&sig[1], 32, Py_ASNATIVEBYTES_BIG_ENDIAN)
+    s = PyLong_FromUnsignedNativeBytes(&sig[33], 32, Py_ASNATIVEBYTES_BIG_ENDIAN)
     msg_hash = bip137_signed_message_hash(message)
     try:
         recovered = recover_pubkey(msg_hash, r, s, recid)
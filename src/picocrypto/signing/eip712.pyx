@@ -1,6 +1,22 @@
 """EIP-712 typed-data hashing. Cython implementation (used by default)."""
 
-from ..hashes cimport keccak256
+from cpython.bytearray cimport PyByteArray_AS_STRING
+from cpython.bytes cimport (
+    PyBytes_AS_STRING,
+    PyBytes_FromStringAndSize,
+    PyBytes_GET_SIZE,
+)
+from libc.string cimport memcpy, memset
+
+from ..hashes cimport (
+    _keccak256,
+    _keccak256_final,
+    _keccak256_init,
+    _keccak256_update,
+    _keccak256_x4,
+    _Keccak256Ctx,
+    keccak256,
+)
 
 _EIP712_SOLIDITY_TYPES = frozenset(
     {
@@ -48,8 +64,40 @@ cdef str _eip712_encode_type(str type_name, dict types):
     return "".join(out)
 
 
-cdef bytes _eip712_hash_type(str type_name, dict types):
-    return keccak256(_eip712_encode_type(type_name, types).encode("utf-8"))
+cdef bytes _eip712_coerce_bytes(object value):
+    if not isinstance(value, bytes):
+        if isinstance(value, str):
+            value = bytes.fromhex(value[2:]) if value.startswith("0x") else value.encode("utf-8")
+        else:
+            value = (value or 0).to_bytes(32, "big") if isinstance(value, int) else bytes(value)
+    return bytes(value)
+
+
+cdef bytes _eip712_dynamic_value(str type_, object value):
+    """Preimage of a non-null string/bytes field; its encoding is keccak256 of this."""
+    if type_ == "bytes":
+        return _eip712_coerce_bytes(value)
+    return value.encode("utf-8") if isinstance(value, str) else bytes(value)
+
+
+cdef void _eip712_hash_leaves(list leaves, list slots, bytearray out) except *:
+    """Write keccak256(leaves[i]) to out[slots[i]:slots[i] + 32], four leaves per batch."""
+    cdef const unsigned char* data[4]
+    cdef size_t lens[4]
+    cdef unsigned char* dst[4]
+    cdef unsigned char* base = <unsigned char*>PyByteArray_AS_STRING(out)
+    cdef Py_ssize_t n = len(leaves)
+    cdef Py_ssize_t i, j
+    cdef int count
+    cdef bytes leaf
+    for i in range(0, n, 4):
+        count = <int>min(4, n - i)
+        for j in range(count):
+            leaf = <bytes>leaves[i + j]
+            data[j] = <const unsigned char*>PyBytes_AS_STRING(leaf)
+            lens[j] = <size_t>PyBytes_GET_SIZE(leaf)
+            dst[j] = base + <Py_ssize_t>slots[i + j]
+        _keccak256_x4(data, lens, dst, count)
 
 
 cdef bytes _eip712_encode_field(dict types, str name, str type_, object value):
@@ -66,19 +114,10 @@ cdef bytes _eip712_encode_field(dict types, str name, str type_, object value):
         falsy = {"False", "false", "0"}
         val = bool(value and value not in falsy)
         return (1 if val else 0).to_bytes(32, "big")
+    if type_ == "bytes" or type_ == "string":
+        return keccak256(_eip712_dynamic_value(type_, value))
     if type_.startswith("bytes"):
-        if not isinstance(value, bytes):
-            if isinstance(value, str):
-                value = bytes.fromhex(value[2:]) if value.startswith("0x") else value.encode("utf-8")
-            else:
-                value = (value or 0).to_bytes(32, "big") if isinstance(value, int) else bytes(value)
-        value = bytes(value)
-        if type_ == "bytes":
-            return keccak256(value)
-        return value.ljust(32, b"\x00")[:32]
-    if type_ == "string":
-        b = value.encode("utf-8") if isinstance(value, str) else bytes(value)
-        return keccak256(b)
+        return _eip712_coerce_bytes(value).ljust(32, b"\x00")[:32]
     if type_.startswith(("int", "uint")):
         if isinstance(value, str):
             value = int(value, 16 if value.startswith("0x") else 10)
@@ -95,21 +134,80 @@ cdef bytes _eip712_encode_field(dict types, str name, str type_, object value):
     raise ValueError(f"Unsupported EIP-712 type {type_!r}")
 
 
-cdef bytes _eip712_encode_data(str type_name, dict types, dict data):
-    cdef list fields = types[type_name]
-    cdef int n = len(fields)
-    cdef bytearray out = bytearray(32 + 32 * n)
-    cdef int i
-    out[0:32] = _eip712_hash_type(type_name, types)
-    for i in range(n):
-        out[32 * (i + 1) : 32 * (i + 2)] = _eip712_encode_field(
-            types, fields[i]["name"], fields[i]["type"], data.get(fields[i]["name"])
-        )
-    return bytes(out)
+cdef bytes _eip712_digest(const unsigned char* data, size_t n):
+    cdef unsigned char out[32]
+    _keccak256(data, n, out)
+    return PyBytes_FromStringAndSize(<char*>out, 32)
+
+
+cdef bytes _eip712_digest_prefixed(bytes domain_sep, bytes struct_hash):
+    """keccak256(0x19 0x01 || domain_sep || struct_hash) without building the preimage."""
+    cdef unsigned char buf[66]
+    buf[0] = 0x19
+    buf[1] = 0x01
+    memcpy(&buf[2], PyBytes_AS_STRING(domain_sep), 32)
+    memcpy(&buf[34], PyBytes_AS_STRING(struct_hash), 32)
+    return _eip712_digest(buf, 66)
+
+
+# Type hashes and domain separators by schema, so a batch of messages under one
+# domain/types pays for them once. First in, first out past _EIP712_CACHE_MAX.
+cdef dict _type_hash_cache = {}
+cdef dict _domain_sep_cache = {}
+cdef Py_ssize_t _EIP712_CACHE_MAX = 64
+
+cdef void _eip712_cache_put(dict cache, object key, bytes value):
+    if len(cache) >= _EIP712_CACHE_MAX:
+        cache.pop(next(iter(cache)), None)
+    cache[key] = value
+
+
+cdef bytes _eip712_type_hash(str type_name, dict types):
+    """keccak256(encodeType(type_name)), cached on the type name and field lists."""
+    key = (
+        type_name,
+        tuple((tn, tuple((f["name"], f["type"]) for f in fields)) for tn, fields in types.items()),
+    )
+    cdef bytes h = _type_hash_cache.get(key)
+    if h is None:
+        h = keccak256(_eip712_encode_type(type_name, types).encode("utf-8"))
+        _eip712_cache_put(_type_hash_cache, key, h)
+    return h
 
 
 cdef bytes _eip712_hash_struct(str type_name, dict types, dict data):
-    return keccak256(_eip712_encode_data(type_name, types, data))
+    """keccak256(typeHash || enc(field_1) || ...), each word absorbed as it is produced."""
+    cdef list fields = types[type_name]
+    cdef Py_ssize_t n = len(fields)
+    cdef Py_ssize_t i
+    cdef Py_ssize_t k = 0
+    cdef list values = [data.get(f["name"]) for f in fields]
+    cdef list dynamic = [False] * n
+    # String/bytes field hashes are independent: batch them.
+    cdef list leaves = []
+    for i in range(n):
+        type_ = fields[i]["type"]
+        if values[i] is not None and (type_ == "string" or type_ == "bytes") and type_ not in types:
+            leaves.append(_eip712_dynamic_value(type_, values[i]))
+            dynamic[i] = True
+    cdef bytearray leaf_hashes = bytearray(32 * len(leaves))
+    _eip712_hash_leaves(leaves, list(range(0, 32 * len(leaves), 32)), leaf_hashes)
+    cdef const unsigned char* leaf = <const unsigned char*>PyByteArray_AS_STRING(leaf_hashes)
+    cdef bytes type_hash = _eip712_type_hash(type_name, types)
+    cdef _Keccak256Ctx ctx
+    cdef unsigned char digest[32]
+    cdef bytes word
+    _keccak256_init(&ctx)
+    _keccak256_update(&ctx, <const unsigned char*>PyBytes_AS_STRING(type_hash), 32)
+    for i in range(n):
+        if dynamic[i]:
+            _keccak256_update(&ctx, leaf + 32 * k, 32)
+            k += 1
+        else:
+            word = _eip712_encode_field(types, fields[i]["name"], fields[i]["type"], values[i])
+            _keccak256_update(&ctx, <const unsigned char*>PyBytes_AS_STRING(word), <size_t>PyBytes_GET_SIZE(word))
+    _keccak256_final(&ctx, digest)
+    return PyBytes_FromStringAndSize(<char*>digest, 32)
 
 
 cdef bytes _eip712_hash_domain_typed(dict domain_data):
@@ -132,9 +230,9 @@ cpdef bytes eip712_hash_full_message(object full_message):
     types = full_message["types"]
     primary_type = full_message["primaryType"]
     message = full_message["message"]
-    domain_sep = _eip712_hash_domain_typed(domain)
+    domain_sep = _eip712_domain_separator(domain, False)
     struct_hash = _eip712_hash_struct(primary_type, types, message)
-    return keccak256(b"\x19\x01" + domain_sep + struct_hash)
+    return _eip712_digest_prefixed(domain_sep, struct_hash)
 
 
 # Legacy (Agent)
@@ -145,25 +243,53 @@ _AGENT_TYPEHASH = keccak256(b"Agent(string source,bytes32 connectionId)")
 
 
 cdef bytes _eip712_hash_domain(dict domain):
-    enc = (
-        keccak256(domain["name"].encode("utf-8"))
-        + keccak256(domain["version"].encode("utf-8"))
-        + int(domain["chainId"]).to_bytes(32, "big")
+    """keccak256(typeHash || H(name) || H(version) || chainId || verifyingContract)."""
+    cdef bytearray enc = bytearray(160)
+    enc[0:32] = _EIP712_DOMAIN_TYPEHASH
+    # H(name) and H(version) are independent: one batched call.
+    _eip712_hash_leaves(
+        [domain["name"].encode("utf-8"), domain["version"].encode("utf-8")], [32, 64], enc
     )
+    enc[96:128] = int(domain["chainId"]).to_bytes(32, "big")
     addr = domain["verifyingContract"]
     if isinstance(addr, str):
         addr = addr[2:] if addr.startswith("0x") else addr
         addr = bytes.fromhex(addr)
-    enc = enc + addr.rjust(32, b"\x00")
-    return keccak256(_EIP712_DOMAIN_TYPEHASH + enc)
+    enc[128:160] = addr.rjust(32, b"\x00")
+    return _eip712_digest(<const unsigned char*>PyByteArray_AS_STRING(enc), len(enc))
+
+
+cdef bytes _eip712_domain_separator(dict domain, bint legacy):
+    """Domain separator, cached on the domain's items (uncached if a value is unhashable)."""
+    cdef bytes sep
+    key = (legacy, tuple(domain.items()))
+    try:
+        sep = _domain_sep_cache.get(key)
+    except TypeError:
+        key = None
+        sep = None
+    if sep is None:
+        sep = _eip712_hash_domain(domain) if legacy else _eip712_hash_domain_typed(domain)
+        if key is not None:
+            _eip712_cache_put(_domain_sep_cache, key, sep)
+    return sep
 
 
 cdef bytes _eip712_hash_agent(str source, bytes connection_id):
-    enc = _AGENT_TYPEHASH + keccak256(source.encode("utf-8")) + connection_id.ljust(32, b"\x00")[:32]
-    return keccak256(enc)
+    cdef unsigned char enc[96]
+    cdef bytes src = source.encode("utf-8")
+    cdef Py_ssize_t n = min(PyBytes_GET_SIZE(connection_id), 32)
+    memcpy(enc, PyBytes_AS_STRING(<bytes>_AGENT_TYPEHASH), 32)
+    _keccak256(<const unsigned char*>PyBytes_AS_STRING(src), <size_t>PyBytes_GET_SIZE(src), &enc[32])
+    memset(&enc[64], 0, 32)
+    memcpy(&enc[64], PyBytes_AS_STRING(connection_id), n)
+    return _eip712_digest(enc, 96)
 
 
 cpdef bytes eip712_hash_agent_message(object domain, str source, bytes connection_id):
-    domain_sep = _eip712_hash_domain(domain)
+    # cpdef arguments cannot be declared "not None"; connection_id is read raw.
+    if connection_id is None:
+        raise TypeError("eip712_hash_agent_message: connection_id must be bytes, not None")
+    domain_sep = _eip712_domain_separator(domain, True)
     msg_hash = _eip712_hash_agent(source, connection_id)
-    return keccak256(b"\x19\x01" + domain_sep + msg_hash)
+    return _eip712_digest_prefixed(domain_sep, msg_hash)
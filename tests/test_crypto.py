@@ -3,20 +3,25 @@
 import pytest
 
 from picocrypto import (
+    batch_privkey_to_pubkey,
     bip137_sign_message,
     bip137_signed_message_hash,
     bip137_verify_message,
+    ed25519_clear_cache,
     ed25519_public_key,
     ed25519_sign,
+    ed25519_sign_many,
     ed25519_verify,
     eip712_hash_agent_message,
     eip712_hash_full_message,
     keccak256,
+    keccak256_batch,
     msgpack_pack,
     privkey_to_address,
     privkey_to_pubkey,
     recover_pubkey,
     sign_recoverable,
+    sign_recoverable_mv,
 )
 
 KECCAK256_EMPTY = bytes.fromhex(
@@ -33,10 +38,84 @@ def test_keccak256_output_length() -> None:
     assert len(keccak256(b"x" * 200)) == 32
 
 
+def test_keccak256_rejects_none() -> None:
+    with pytest.raises(TypeError):
+        keccak256(None)
+    with pytest.raises(TypeError):
+        keccak256_batch([b"ok", None])
+
+
 def test_keccak256_deterministic() -> None:
     assert keccak256(b"same input") == keccak256(b"same input")
 
 
+def test_keccak256_rate_boundary() -> None:
+    # 135 bytes pads with a single 0x81 byte; 136 bytes needs a full padding block.
+    assert keccak256(b"x" * 135) == bytes.fromhex(
+        "16570bdb055e663ea1cb57ac6f09194f4bc7b7070847971fc0b86710366dc34f"
+    )
+    assert keccak256(b"x" * 136) == bytes.fromhex(
+        "50da8ef3747b7a7f01d08563aa11c72a2a668563fb928adc6e8d2a1ab4e36096"
+    )
+
+
+def test_keccak256_pure_python_matches() -> None:
+    from picocrypto.hashes import _keccak, _keccak_interleaved
+
+    for n in (0, 1, 32, 135, 136, 137, 300):
+        data = bytes(range(256)) * 2
+        assert _keccak.keccak256(data[:n]) == keccak256(data[:n])
+        assert _keccak_interleaved.keccak256(data[:n]) == keccak256(data[:n])
+
+
+def test_keccak256_pycryptodome_matches() -> None:
+    pytest.importorskip("Crypto.Hash.keccak")
+    from picocrypto.hashes import _keccak_pycryptodome
+
+    for n in (0, 1, 135, 136, 300):
+        data = bytes(range(256)) * 2
+        assert _keccak_pycryptodome.keccak256(data[:n]) == keccak256(data[:n])
+
+
+def test_keccak256_batch() -> None:
+    # Mixed lengths across and past the rate, plus a partial group of four.
+    data = bytes(range(256)) * 2
+    msgs = [data[:n] for n in (0, 1, 32, 135, 136, 137, 300)]
+    assert keccak256_batch(msgs) == [keccak256(m) for m in msgs]
+    assert keccak256_batch([]) == []
+    with pytest.raises(TypeError):
+        keccak256_batch([b"ok", "not bytes"])
+
+
+def test_sha512_matches_hashlib() -> None:
+    import hashlib
+
+    from picocrypto.hashes.sha512 import sha512
+
+    for n in (0, 1, 111, 112, 128, 300):
+        data = bytes(range(256)) * 2
+        assert sha512(data[:n]) == hashlib.sha512(data[:n]).digest()
+    with pytest.raises(TypeError):
+        sha512(None)
+
+
+def test_hmac_sha256_matches_hmac() -> None:
+    import hashlib
+    import hmac
+
+    from picocrypto.hashes.hmac_sha256 import hmac_sha256
+
+    data = bytes(range(256))
+    for key in (b"", b"k" * 32, b"k" * 64, b"k" * 65):
+        for n in (0, 1, 97, 256):
+            expected = hmac.new(key, data[:n], hashlib.sha256).digest()
+            assert hmac_sha256(key, data[:n]) == expected
+    with pytest.raises(TypeError):
+        hmac_sha256(None, data)
+    with pytest.raises(TypeError):
+        hmac_sha256(b"k", None)
+
+
 def test_privkey_to_pubkey() -> None:
     priv = bytes(31) + bytes([1])
     pub = privkey_to_pubkey(priv)
@@ -44,6 +123,15 @@ def test_privkey_to_pubkey() -> None:
     assert pub[0] == 0x04
 
 
+def test_batch_privkey_to_pubkey() -> None:
+    privs = [bytes(31) + bytes([i]) for i in range(1, 6)] + [b"\x7f" * 32]
+    batch = batch_privkey_to_pubkey(b"".join(privs))
+    assert batch == b"".join(privkey_to_pubkey(p) for p in privs)
+    assert batch_privkey_to_pubkey(b"") == b""
+    with pytest.raises(ValueError):
+        batch_privkey_to_pubkey(bytes(32))
+
+
 def test_privkey_to_address() -> None:
     priv = bytes(31) + bytes([1])
     addr = privkey_to_address(priv)
@@ -59,6 +147,32 @@ def test_sign_recoverable() -> None:
     assert v in (27, 28)
 
 
+def test_sign_recoverable_rfc6979() -> None:
+    # RFC 6979 nonce: privkey 1, sha256(b"Satoshi Nakamoto"); k = 8f8a276c...
+    import hashlib
+
+    msg_hash = hashlib.sha256(b"Satoshi Nakamoto").digest()
+    r, s, _ = sign_recoverable(bytes(31) + bytes([1]), msg_hash)
+    assert r == 0x934B1EA10A4B3C1757E2B0C017D0B6143CE3C9A7E6A4A49860D7A6AB210EE3D8
+    assert s == 0x2442CE9D2B916064108014783E923EC36B49743E2FFA1C4496F01A512AAFD9E5
+
+
+def test_sign_recoverable_mv() -> None:
+    priv = bytes(31) + bytes([1])
+    msg_hash = keccak256(b"message to sign")
+    expected = sign_recoverable(priv, msg_hash)
+    assert sign_recoverable_mv(memoryview(priv), memoryview(msg_hash)) == expected
+    assert sign_recoverable_mv(bytearray(priv), msg_hash) == expected
+    with pytest.raises(ValueError):
+        sign_recoverable_mv(priv[:31], msg_hash)
+    with pytest.raises(ValueError):
+        sign_recoverable_mv(bytes(32), msg_hash)
+    with pytest.raises(TypeError):
+        sign_recoverable_mv(None, msg_hash)
+    with pytest.raises(TypeError):
+        sign_recoverable_mv(priv, None)
+
+
 def test_recover_pubkey() -> None:
     priv = bytes(31) + bytes([1])
     msg_hash = keccak256(b"message to sign")
@@ -71,6 +185,18 @@ def test_recover_pubkey() -> None:
     assert recovered == expected_pub
 
 
+def test_sign_recoverable_v_recovers_signer() -> None:
+    # v comes from the parity of k*G; both parities and many keys must round-trip.
+    seen = set()
+    for i in range(32):
+        priv = keccak256(b"key" + bytes([i]))
+        msg_hash = keccak256(b"msg" + bytes([i]))
+        r, s, v = sign_recoverable(priv, msg_hash)
+        seen.add(v)
+        assert recover_pubkey(msg_hash, r, s, v - 27) == privkey_to_pubkey(priv)
+    assert seen == {27, 28}
+
+
 def test_eip712_hash_full_message() -> None:
     full = {
         "domain": {
@@ -91,6 +217,24 @@ def test_eip712_hash_full_message() -> None:
     assert len(eip712_hash_full_message(full)) == 32
 
 
+def test_eip712_hash_full_message_schema_cache() -> None:
+    full = {
+        "domain": {"name": "Test", "version": "1", "chainId": 1},
+        "types": {"Mail": [{"name": "contents", "type": "string"}]},
+        "primaryType": "Mail",
+        "message": {"contents": "hello"},
+    }
+    first = eip712_hash_full_message(full)
+    assert eip712_hash_full_message(full) == first
+    # Cached type hashes and domain separators follow edits to the schema.
+    full["types"]["Mail"][0]["name"] = "body"
+    full["message"] = {"body": "hello"}
+    renamed = eip712_hash_full_message(full)
+    assert renamed != first
+    full["domain"]["chainId"] = 2
+    assert eip712_hash_full_message(full) not in (first, renamed)
+
+
 def test_eip712_hash_agent_message() -> None:
     domain = {
         "name": "A",
@@ -99,6 +243,8 @@ def test_eip712_hash_agent_message() -> None:
         "verifyingContract": "0x" + "00" * 20,
     }
     assert len(eip712_hash_agent_message(domain, "0x" + "11" * 20, bytes(32))) == 32
+    with pytest.raises(TypeError):
+        eip712_hash_agent_message(domain, "0x" + "11" * 20, None)
 
 
 ED25519_TEST1_SECRET = bytes.fromhex(
@@ -124,6 +270,40 @@ def test_ed25519_sign_verify() -> None:
     assert ed25519_verify(ED25519_TEST1_MSG, sig, ED25519_TEST1_PUBLIC) is True
 
 
+def test_ed25519_rejects_none() -> None:
+    seed = bytes(32)
+    pk = ed25519_public_key(seed)
+    sig = ed25519_sign(b"", seed)
+    with pytest.raises(TypeError):
+        ed25519_verify(None, sig, pk)
+    with pytest.raises(TypeError):
+        ed25519_verify(b"", None, pk)
+    with pytest.raises(TypeError):
+        ed25519_verify(b"", sig, None)
+    with pytest.raises(TypeError):
+        ed25519_sign(None, seed)
+    with pytest.raises(TypeError):
+        ed25519_sign(b"", None)
+    with pytest.raises(TypeError):
+        ed25519_public_key(None)
+
+
+def test_ed25519_sign_many() -> None:
+    msgs = [ED25519_TEST1_MSG, b"a", b"b" * 300]
+    sigs = ed25519_sign_many(msgs, ED25519_TEST1_SECRET)
+    assert sigs == [ed25519_sign(m, ED25519_TEST1_SECRET) for m in msgs]
+    assert sigs[0] == ED25519_TEST1_SIG
+    assert ed25519_sign_many([], ED25519_TEST1_SECRET) == []
+
+
+def test_ed25519_sign_cached_seed() -> None:
+    assert ed25519_sign(b"a", ED25519_TEST1_SECRET) == ed25519_sign(
+        b"a", ED25519_TEST1_SECRET
+    )
+    ed25519_clear_cache()
+    assert ed25519_sign(ED25519_TEST1_MSG, ED25519_TEST1_SECRET) == ED25519_TEST1_SIG
+
+
 def test_ed25519_verify_rejects_tampered() -> None:
     assert ed25519_verify(b"x", ED25519_TEST1_SIG, ED25519_TEST1_PUBLIC) is False
     assert (
@@ -155,6 +335,30 @@ def test_msgpack_pack_int() -> None:
     assert msgpack_pack(-1) == bytes([0xFF])
 
 
+def test_msgpack_pack_int_bounds() -> None:
+    from picocrypto.serde import _msgpack_pack
+
+    for pack in (msgpack_pack, _msgpack_pack.msgpack_pack):
+        assert pack(2**64 - 1) == b"\xcf" + b"\xff" * 8
+        assert pack(-(2**63)) == b"\xd3\x80" + bytes(7)
+        with pytest.raises(OverflowError):
+            pack(2**64)
+        with pytest.raises(OverflowError):
+            pack(-(2**63) - 1)
+
+
+def test_msgpack_pack_reentrant() -> None:
+    from picocrypto.serde import _msgpack_pack
+
+    class S(str):
+        def encode(self, *args, **kwargs):
+            _msgpack_pack.msgpack_pack(["nested"])
+            return super().encode(*args, **kwargs)
+
+    payload = ["abc", S("x"), "tail"]
+    assert _msgpack_pack.msgpack_pack(payload) == msgpack_pack(["abc", "x", "tail"])
+
+
 def test_msgpack_pack_str() -> None:
     packed = msgpack_pack("hello")
     assert packed[0] == 0xA0 | 5
@@ -165,3 +369,25 @@ def test_msgpack_pack_dict() -> None:
     packed = msgpack_pack({"a": 1, "b": 2})
     assert len(packed) > 0
     assert packed[0] == 0x80 | 2  # fixmap 2
+
+
+def test_msgpack_pack_implementations_match() -> None:
+    from collections import OrderedDict
+
+    from picocrypto.serde import _msgpack_pack, msgpack_pack_2
+
+    assert _msgpack_pack.msgpack_pack(OrderedDict(a=1)) == msgpack_pack({"a": 1})
+
+    payload = {
+        "n": [0, 1, -1, -33, 200, 70000, 2**40, -(2**40), True, False, None],
+        "s": ["", "x" * 40, b"raw"],
+        "t": (1, {"k": "v"}),
+    }
+    assert _msgpack_pack.msgpack_pack(payload) == msgpack_pack(payload)
+    assert msgpack_pack_2.msgpack_pack(payload) == msgpack_pack(payload)
+    big = {"l": list(range(300)), "s": "é" * 40000, "m": {str(i): i for i in range(20)}}
+    assert msgpack_pack_2.msgpack_pack(big) == msgpack_pack(big)
+    with pytest.raises(TypeError):
+        _msgpack_pack.msgpack_pack(1.5)
+    with pytest.raises(TypeError):
+        msgpack_pack_2.msgpack_pack(1.5)
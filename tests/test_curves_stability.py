@@ -37,11 +37,12 @@ SECP_PUB_EXPECTED = bytes.fromhex(
     "483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8"
 )
 SECP_ADDR_EXPECTED = "0x7d6e99bb8abf8cc013bb0e912d0b176596fe7b88"
+# RFC 6979 nonce; checked against an independent HMAC-SHA256 / ECDSA implementation.
 SECP_R_EXPECTED = (
-    2780594367940990599170980534274032790046949652926240393108138259367820360119
+    113314520270595272476500100837055013075311022281728155983237188553441380337196
 )
 SECP_S_EXPECTED = (
-    14011065033942443886443251798395993059168771109101043339243150874103607391952
+    56082008016091150822823725308791617884826609152963161886376887541220444131753
 )
 SECP_V_EXPECTED = 28
 